@@ -62,7 +62,8 @@ message(STATUS "Generating ${OUT_FILE}")
 execute_process(
   COMMAND
     ${PYTHON_EXECUTABLE} ${CTYPESGEN_PY} --cpp ${CTYPESFLAGS}
-    --no-embed-preamble --strip-build-path ${RUNTIME_GISBASE} ${INC_HEADERS}
+    --no-embed-preamble --lazy-symbols --strip-build-path ${RUNTIME_GISBASE}
+    ${INC_HEADERS}
     ${LIBRARIES} ${DEFINES} -o ${OUT_FILE} ${HEADERS}
   OUTPUT_VARIABLE ctypesgen_OV
   ERROR_VARIABLE ctypesgen_EV
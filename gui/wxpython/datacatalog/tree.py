@@ -22,7 +22,6 @@ for details.
 import os
 import re
 import copy
-from multiprocessing import Process, Queue, cpu_count
 
 import wx
 
@@ -67,74 +66,13 @@ from grass.pydispatch.signal import Signal
 import grass.script as gs
 from grass.script import gisenv
 from grass.grassdb.data import map_exists
+from grass.grassdb.scanner import MapsetScanner, list_mapsets
 from grass.grassdb.checks import (
     get_mapset_owner,
     is_mapset_locked,
     is_different_mapset_owner,
     is_first_time_user,
 )
-from grass.exceptions import CalledModuleError
-
-
-def getLocationTree(gisdbase, location, queue, mapsets=None, lazy=False):
-    """Creates dictionary with mapsets, elements, layers for given location.
-    Returns tuple with the dictionary and error (or None)"""
-    tmp_gisrc_file, env = gs.create_environment(gisdbase, location, "PERMANENT")
-    env["GRASS_SKIP_MAPSET_OWNER_CHECK"] = "1"
-
-    maps_dict = {}
-    elements = ["raster", "raster_3d", "vector"]
-    try:
-        if not mapsets:
-            mapsets = gs.read_command(
-                "g.mapsets", flags="l", separator="comma", quiet=True, env=env
-            ).strip()
-    except CalledModuleError:
-        queue.put(
-            (
-                maps_dict,
-                _("Failed to read mapsets from project <{l}>.").format(l=location),
-            )
-        )
-        gs.try_remove(tmp_gisrc_file)
-        return
-    else:
-        mapsets = mapsets.split(",")
-        Debug.msg(4, "Project <{0}>: {1} mapsets found".format(location, len(mapsets)))
-        for each in mapsets:
-            maps_dict[each] = []
-    if lazy:
-        queue.put((maps_dict, None))
-        return
-    try:
-        maplist = gs.read_command(
-            "g.list",
-            flags="mt",
-            type=elements,
-            mapset=",".join(mapsets),
-            quiet=True,
-            env=env,
-        ).strip()
-    except CalledModuleError:
-        queue.put(
-            (
-                maps_dict,
-                _("Failed to read maps from project <{l}>.").format(l=location),
-            )
-        )
-        gs.try_remove(tmp_gisrc_file)
-        return
-    else:
-        # fill dictionary
-        listOfMaps = maplist.splitlines()
-        Debug.msg(4, "Project <{0}>: {1} maps found".format(location, len(listOfMaps)))
-        for each in listOfMaps:
-            ltype, wholename = each.split("/")
-            name, mapset = wholename.split("@", maxsplit=1)
-            maps_dict[mapset].append({"name": name, "type": ltype})
-
-    queue.put((maps_dict, None))
-    gs.try_remove(tmp_gisrc_file)
 
 
 class NameEntryDialog(TextEntryDialog):
@@ -247,6 +185,8 @@ class DataCatalogTree(TreeView):
         ]
         self._initImages()
         self.thread = gThread()
+        # lists maps by reading mapset directories, remembers them
+        self._scanner = MapsetScanner()
 
         self._resetSelectVariables()
         self._resetCopyVariables()
@@ -379,103 +319,69 @@ class DataCatalogTree(TreeView):
         )
         UserSettings.SaveToFile(grassdbSettings)
 
+    def _mapsetNodeData(self, grassdb, location, mapset):
+        mapset_path = os.path.join(grassdb, location, mapset)
+        return {
+            "type": "mapset",
+            "name": mapset,
+            "lock": is_mapset_locked(mapset_path),
+            "current": False,
+            "is_different_owner": is_different_mapset_owner(mapset_path),
+            "owner": get_mapset_owner(mapset_path),
+        }
+
     def _reloadMapsetNode(self, mapset_node):
         """Recursively reload the model of a specific mapset node"""
         if mapset_node.children:
             del mapset_node.children[:]
 
-        q = Queue()
-        p = Process(
-            target=getLocationTree,
-            args=(
-                mapset_node.parent.parent.data["name"],
-                mapset_node.parent.data["name"],
-                q,
-                mapset_node.data["name"],
-            ),
+        mapset_path = os.path.join(
+            mapset_node.parent.parent.data["name"],
+            mapset_node.parent.data["name"],
+            mapset_node.data["name"],
         )
-        p.start()
-        maps, error = q.get()
-        self._populateMapsetItem(mapset_node, maps[mapset_node.data["name"]])
+        self._populateMapsetItem(mapset_node, self._scanner.scan_mapset(mapset_path))
         self._orig_model = copy.deepcopy(self._model)
-        return error
 
     def _reloadLocationNode(self, location_node):
         """Recursively reload the model of a specific location node"""
         if location_node.children:
             del location_node.children[:]
 
-        q = Queue()
-        p = Process(
-            target=getLocationTree,
-            args=(
-                location_node.parent.data["name"],
-                location_node.data["name"],
-                q,
-                None,
-            ),
-        )
-        p.start()
-        maps, error = q.get()
-
+        grassdb = location_node.parent.data["name"]
+        location = location_node.data["name"]
+        maps = self._scanner.scan_location(os.path.join(grassdb, location))
         for mapset in maps:
-            mapset_path = os.path.join(
-                location_node.parent.data["name"], location_node.data["name"], mapset
-            )
-
             mapset_node = self._model.AppendNode(
                 parent=location_node,
-                data={
-                    "type": "mapset",
-                    "name": mapset,
-                    "current": False,
-                    "lock": is_mapset_locked(mapset_path),
-                    "is_different_owner": is_different_mapset_owner(mapset_path),
-                    "owner": get_mapset_owner(mapset_path),
-                },
+                data=self._mapsetNodeData(grassdb, location, mapset),
             )
             self._populateMapsetItem(mapset_node, maps[mapset])
         self._model.SortChildren(location_node)
         self._orig_model = copy.deepcopy(self._model)
-        return error
 
     def _lazyReloadGrassDBNode(self, grassdb_node):
         genv = gisenv()
         if grassdb_node.children:
             del grassdb_node.children[:]
         all_location_nodes = []
-        errors = []
         current_mapset_node = None
-        locations = GetListOfLocations(grassdb_node.data["name"])
+        grassdb = grassdb_node.data["name"]
+        locations = GetListOfLocations(grassdb)
         for location in locations:
             loc_node = self._model.AppendNode(
                 parent=grassdb_node, data={"type": "location", "name": location}
             )
             all_location_nodes.append(loc_node)
-            q = Queue()
-            getLocationTree(grassdb_node.data["name"], location, q, lazy=True)
-            maps, error = q.get()
-            if error:
-                errors.append(error)
-            for key in sorted(maps.keys()):
-                mapset_path = os.path.join(
-                    loc_node.parent.data["name"], loc_node.data["name"], key
-                )
+            for mapset in list_mapsets(os.path.join(grassdb, location)):
                 mapset_node = self._model.AppendNode(
                     parent=loc_node,
-                    data={
-                        "type": "mapset",
-                        "name": key,
-                        "lock": is_mapset_locked(mapset_path),
-                        "current": False,
-                        "is_different_owner": is_different_mapset_owner(mapset_path),
-                        "owner": get_mapset_owner(mapset_path),
-                    },
+                    data=self._mapsetNodeData(grassdb, location, mapset),
                 )
                 if (
-                    grassdb_node.data["name"] == genv["GISDBASE"]
+                    grassdb == genv["GISDBASE"]
                     and location == genv["LOCATION_NAME"]
-                    and key == genv["MAPSET"]
+                    and mapset == genv["MAPSET"]
                 ):
                     current_mapset_node = mapset_node
         if current_mapset_node:
@@ -484,97 +390,36 @@ class DataCatalogTree(TreeView):
             self._model.SortChildren(node)
         self._model.SortChildren(grassdb_node)
         self._orig_model = copy.deepcopy(self._model)
-        return errors
+        return []
 
     def _reloadGrassDBNode(self, grassdb_node):
         """Recursively reload the model of a specific grassdb node.
-        Runs reloading locations in parallel."""
+        Reads mapsets of all locations in parallel, only mapsets which
+        changed since the last reload are read again."""
         if grassdb_node.children:
             del grassdb_node.children[:]
-        locations = GetListOfLocations(grassdb_node.data["name"])
-
-        loc_count = proc_count = 0
-        queue_list = []
-        proc_list = []
-        loc_list = []
-        try:
-            nprocs = max(1, cpu_count() - 1)
-        except NotImplementedError:
-            nprocs = 1
+        grassdb = grassdb_node.data["name"]
+        locations = GetListOfLocations(grassdb)
+        Debug.msg(3, "Scanning {0} projects in <{1}>".format(len(locations), grassdb))
 
-        results = {}
-        errors = []
-        location_nodes = []
-        all_location_nodes = []
-        nlocations = len(locations)
+        results = self._scanner.scan_grassdb(grassdb, locations)
         for location in locations:
-            results[location] = {}
-            varloc = self._model.AppendNode(
+            location_node = self._model.AppendNode(
                 parent=grassdb_node, data={"type": "location", "name": location}
             )
-            location_nodes.append(varloc)
-            all_location_nodes.append(varloc)
-            loc_count += 1
-
-            Debug.msg(
-                3,
-                "Scanning project <{0}> ({1}/{2})".format(
-                    location, loc_count, nlocations
-                ),
-            )
-
-            q = Queue()
-            p = Process(
-                target=getLocationTree, args=(grassdb_node.data["name"], location, q)
-            )
-            p.start()
-
-            queue_list.append(q)
-            proc_list.append(p)
-            loc_list.append(location)
-
-            proc_count += 1
-            # Wait for all running processes
-            if proc_count == nprocs or loc_count == nlocations:
-                Debug.msg(4, "Process subresults")
-                for i in range(len(loc_list)):
-                    maps, error = queue_list[i].get()
-                    proc_list[i].join()
-                    if error:
-                        errors.append(error)
-
-                    for key in sorted(maps.keys()):
-                        mapset_path = os.path.join(
-                            location_nodes[i].parent.data["name"],
-                            location_nodes[i].data["name"],
-                            key,
-                        )
-                        mapset_node = self._model.AppendNode(
-                            parent=location_nodes[i],
-                            data={
-                                "type": "mapset",
-                                "name": key,
-                                "lock": is_mapset_locked(mapset_path),
-                                "current": False,
-                                "is_different_owner": is_different_mapset_owner(
-                                    mapset_path
-                                ),
-                                "owner": get_mapset_owner(mapset_path),
-                            },
-                        )
-                        self._populateMapsetItem(mapset_node, maps[key])
-
-                proc_count = 0
-                proc_list = []
-                queue_list = []
-                loc_list = []
-                location_nodes = []
+            maps = results[location]
+            Debug.msg(4, "Project <{0}>: {1} mapsets found".format(location, len(maps)))
+            for mapset in sorted(maps.keys()):
+                mapset_node = self._model.AppendNode(
+                    parent=location_node,
+                    data=self._mapsetNodeData(grassdb, location, mapset),
+                )
+                self._populateMapsetItem(mapset_node, maps[mapset])
+            self._model.SortChildren(location_node)
 
-        for node in all_location_nodes:
-            self._model.SortChildren(node)
         self._model.SortChildren(grassdb_node)
         self._orig_model = copy.deepcopy(self._model)
-        return errors
+        return []
 
     def _reloadTreeItems(self, full=False):
         """Updates grass databases, locations, mapsets and layers in the tree.
@@ -632,6 +477,8 @@ class DataCatalogTree(TreeView):
             location=os.path.basename(location_path),
             mapset=os.path.basename(mapset_path),
         )
+        # maps in the mapset changed, read them again
+        self._scanner.invalidate(mapset_path)
         if node:
             self._reloadMapsetNode(node)
             self.RefreshNode(node, recursive=True)
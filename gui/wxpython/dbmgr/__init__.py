@@ -5,4 +5,5 @@ all = [
     "manager",
     "base",
     "dialogs",
+    "pager",
 ]
@@ -59,6 +59,7 @@ from core.utils import ListOfCatsToRange
 from gui_core.dialogs import CreateNewVector
 from gui_core.widgets import GNotebook
 from dbmgr.vinfo import VectorDBInfo, GetUnicodeValue, CreateDbInfoDesc, GetDbEncoding
+from dbmgr.pager import AttributePager, ConnectDatabase, PagedCatsMap, PagedDataMap
 from core.debug import Debug
 from dbmgr.dialogs import ModifyTableRecord, AddColumnDialog
 from core.settings import UserSettings
@@ -108,6 +109,7 @@ class VirtualAttributeList(
         self.fieldCalc = None
         self.fieldStats = None
         self.columns = {}  # <- LoadData()
+        self.pager = None  # <- LoadData()
 
         self.sqlFilter = {}
 
@@ -210,9 +212,104 @@ class VirtualAttributeList(
         except ValueError:
             keyId = -1
 
-        # read data
-        # FIXME: Max. number of rows, while the GUI is still usable
+        order = None
+        if self.pager:
+            # keep sorting when data are reloaded
+            order = (self.pager.orderColumn, self.pager.ascending)
+            self.pager.Close()
+            self.pager = None
+
+        # rows of tables in SQLite and PostgreSQL databases are read on
+        # demand when they are displayed, other tables are read at once
+        connection = None
+        if not sql and keyColumn != "OGC_FID":
+            connection = ConnectDatabase(
+                self.mapDBInfo.layers[layer]["driver"],
+                self.mapDBInfo.layers[layer]["database"],
+            )
+
+        if connection:
+            self.sqlFilter = {"where": where}
+            self._setColumns(columns)
+            self.pager = AttributePager(
+                connection, tableName, keyColumn, columns, where=where
+            )
+            if order and order[0] in columns:
+                self.pager.SetOrder(*order)
+            try:
+                count = self.pager.GetCount()
+            except Exception as e:
+                self.pager.Close()
+                self.pager = None
+                raise GException(
+                    _("Unable to read the table <{table}>: {error}").format(
+                        table=tableName, error=e
+                    )
+                )
+            self.itemDataMap = PagedDataMap(self.pager)
+            self.itemIndexMap = range(count)
+            self.itemCatsMap = PagedCatsMap(self.pager)
+            self.SetItemCount(count)
+        elif self._readData(layer, tableName, columns, keyId, where, sql) is None:
+            return None
+
+        if where:
+            item = -1
+            while True:
+                item = self.GetNextItem(item)
+                if item == -1:
+                    break
+                self.SetItemState(item, wx.LIST_STATE_SELECTED, wx.LIST_STATE_SELECTED)
+
+        i = 0
+        for col in columns:
+            width = self.columns[col]["length"] * 6  # FIXME
+            width = max(width, 60)
+            width = min(width, 300)
+            self.SetColumnWidth(col=i, width=width)
+            i += 1
+
+        self.SendSizeEvent()
+
+        self.log.write(_("Number of loaded records: %d") % self.GetItemCount())
+
+        return keyId
+
+    def _setColumns(self, columns):
+        """Remove all items and set list columns"""
+        self.DeleteAllItems()
+
+        # self.ClearAll()
+        for i in range(self.GetColumnCount()):
+            self.DeleteColumn(0)
+
+        i = 0
+        info = wx.ListItem()
+        if globalvar.wxPythonPhoenix:
+            info.Mask = wx.LIST_MASK_TEXT | wx.LIST_MASK_IMAGE | wx.LIST_MASK_FORMAT
+            info.Image = -1
+            info.Format = 0
+        else:
+            info.m_mask = wx.LIST_MASK_TEXT | wx.LIST_MASK_IMAGE | wx.LIST_MASK_FORMAT
+            info.m_image = -1
+            info.m_format = 0
+        for column in columns:
+            if globalvar.wxPythonPhoenix:
+                info.Text = column
+                self.InsertColumn(i, info)
+            else:
+                info.m_text = column
+                self.InsertColumnInfo(i, info)
+            i += 1
+            if i >= 256:
+                self.log.write(_("Can display only 256 columns."))
 
+    def _readData(self, layer, tableName, columns, keyId, where=None, sql=None):
+        """Read all rows of the table using v.db.select or db.select
+
+        :return: number of rows
+        :return: None on error
+        """
         # stdout can be very large, do not use PIPE, redirect to temp file
         # TODO: more effective way should be implemented...
 
@@ -255,34 +352,7 @@ class VirtualAttributeList(
             self.itemIndexMap = []
             self.itemCatsMap = {}
 
-            self.DeleteAllItems()
-
-            # self.ClearAll()
-            for i in range(self.GetColumnCount()):
-                self.DeleteColumn(0)
-
-            i = 0
-            info = wx.ListItem()
-            if globalvar.wxPythonPhoenix:
-                info.Mask = wx.LIST_MASK_TEXT | wx.LIST_MASK_IMAGE | wx.LIST_MASK_FORMAT
-                info.Image = -1
-                info.Format = 0
-            else:
-                info.m_mask = (
-                    wx.LIST_MASK_TEXT | wx.LIST_MASK_IMAGE | wx.LIST_MASK_FORMAT
-                )
-                info.m_image = -1
-                info.m_format = 0
-            for column in columns:
-                if globalvar.wxPythonPhoenix:
-                    info.Text = column
-                    self.InsertColumn(i, info)
-                else:
-                    info.m_text = column
-                    self.InsertColumnInfo(i, info)
-                i += 1
-                if i >= 256:
-                    self.log.write(_("Can display only 256 columns."))
+            self._setColumns(columns)
 
             i = 0
             outFile.seek(0)
@@ -354,27 +424,7 @@ class VirtualAttributeList(
 
             self.SetItemCount(i)
 
-        if where:
-            item = -1
-            while True:
-                item = self.GetNextItem(item)
-                if item == -1:
-                    break
-                self.SetItemState(item, wx.LIST_STATE_SELECTED, wx.LIST_STATE_SELECTED)
-
-        i = 0
-        for col in columns:
-            width = self.columns[col]["length"] * 6  # FIXME
-            width = max(width, 60)
-            width = min(width, 300)
-            self.SetColumnWidth(col=i, width=width)
-            i += 1
-
-        self.SendSizeEvent()
-
-        self.log.write(_("Number of loaded records: %d") % self.GetItemCount())
-
-        return keyId
+        return i
 
     def AddDataRow(self, i, record, columns, keyId):
         """Add row to the data list"""
@@ -690,9 +740,15 @@ class VirtualAttributeList(
     def SortItems(self, sorter=cmp):
         """Sort items"""
         wx.BeginBusyCursor()
-        items = list(self.itemDataMap.keys())
-        items.sort(key=functools.cmp_to_key(self.Sorter))
-        self.itemIndexMap = items
+        if self.pager:
+            # rows are sorted by the database
+            self.pager.SetOrder(
+                self.GetColumn(self._col).GetText(), self._colSortFlag[self._col]
+            )
+        else:
+            items = list(self.itemDataMap.keys())
+            items.sort(key=functools.cmp_to_key(self.Sorter))
+            self.itemIndexMap = items
 
         # redraw the list
         self.Refresh()
@@ -1559,11 +1615,12 @@ class DbMgrBrowsePage(DbMgrNotebookBase):
                             idx = i - 1 if missingKey else i
 
                             if column["ctype"] != str:
-                                tlist.itemDataMap[item][idx] = column["ctype"](
-                                    values[i]
-                                )
+                                value = column["ctype"](values[i])
                             else:  # -> string
-                                tlist.itemDataMap[item][idx] = values[i]
+                                value = values[i]
+                            # rows read by pager are read again after update
+                            if not tlist.pager:
+                                tlist.itemDataMap[item][idx] = value
                         except ValueError:
                             raise ValueError(
                                 _("Value '%(value)s' needs to be entered as %(type)s.")
@@ -1593,6 +1650,8 @@ class DbMgrBrowsePage(DbMgrNotebookBase):
                     % (table, ",".join(updateList), keyColumn, cat)
                 )
                 self.ApplyCommands(self.listOfCommands, self.listOfSQLStatements)
+                if tlist.pager:
+                    tlist.pager.InvalidateRow(item)
 
             tlist.Update()
 
@@ -1611,7 +1670,9 @@ class DbMgrBrowsePage(DbMgrNotebookBase):
             columnName.append(tlist.GetColumn(i).GetText())
 
         # maximal category number
-        if len(tlist.itemCatsMap.values()) > 0:
+        if tlist.pager:
+            maxCat = tlist.pager.GetMaxCat()
+        elif len(tlist.itemCatsMap.values()) > 0:
             maxCat = max(tlist.itemCatsMap.values())
         else:
             maxCat = 0  # starting category '1'
@@ -1654,7 +1715,11 @@ class DbMgrBrowsePage(DbMgrNotebookBase):
                 cat = -1
 
             try:
-                if cat in tlist.itemCatsMap.values():
+                if (
+                    tlist.pager.HasCat(cat)
+                    if tlist.pager
+                    else cat in tlist.itemCatsMap.values()
+                ):
                     raise ValueError(
                         _("Record with category number %d already exists in the table.")
                         % cat
@@ -1715,12 +1780,15 @@ class DbMgrBrowsePage(DbMgrNotebookBase):
                 del values[0]
 
             # add new item to the tlist
-            index = max(tlist.itemIndexMap) + 1 if len(tlist.itemIndexMap) > 0 else 0
+            if not tlist.pager:
+                index = (
+                    max(tlist.itemIndexMap) + 1 if len(tlist.itemIndexMap) > 0 else 0
+                )
 
-            tlist.itemIndexMap.append(index)
-            tlist.itemDataMap[index] = values
-            tlist.itemCatsMap[index] = cat
-            tlist.SetItemCount(tlist.GetItemCount() + 1)
+                tlist.itemIndexMap.append(index)
+                tlist.itemDataMap[index] = values
+                tlist.itemCatsMap[index] = cat
+                tlist.SetItemCount(tlist.GetItemCount() + 1)
 
             self.listOfSQLStatements.append(
                 "INSERT INTO %s (%s) VALUES(%s)"
@@ -1728,6 +1796,9 @@ class DbMgrBrowsePage(DbMgrNotebookBase):
             )
 
             self.ApplyCommands(self.listOfCommands, self.listOfSQLStatements)
+            if tlist.pager:
+                # read the new row from the database
+                tlist.Update()
 
     def OnDataItemDelete(self, event):
         """Delete selected item(s) from the tlist (layer/category pair)"""
@@ -1766,6 +1837,13 @@ class DbMgrBrowsePage(DbMgrNotebookBase):
                 self.listOfSQLStatements = []
                 return False
 
+        if dlist.pager:
+            self.ApplyCommands(self.listOfCommands, self.listOfSQLStatements)
+            # deselect items, rows are read again from the database
+            dlist.SetItemState(-1, 0, wx.LIST_STATE_SELECTED | wx.LIST_STATE_FOCUSED)
+            dlist.Update()
+            return True
+
         # restore maps
         i = 0
         indexTemp = copy.copy(dlist.itemIndexMap)
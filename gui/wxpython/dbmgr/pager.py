@@ -0,0 +1,302 @@
+"""
+@package dbmgr.pager
+
+@brief On demand reading of attribute tables in pages
+
+List of classes:
+ - pager::AttributePager
+ - pager::PagedDataMap
+ - pager::PagedCatsMap
+
+Rows are read directly from SQLite or PostgreSQL databases only when
+they are displayed. This module does not depend on wxPython.
+
+(C) 2025 by the GRASS Development Team
+
+This program is free software under the GNU General Public License
+(>=v2). Read the file COPYING that comes with GRASS for details.
+"""
+
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from grass.script.vector import vector_db_connect
+
+
+def ConnectDatabase(driver, database):
+    """Connect to the database of an attribute table
+
+    Connections are read-only and in autocommit mode, so they do not keep
+    tables locked for modules changing them.
+
+    :param driver: database driver
+    :param database: database name (with substituted variables)
+
+    :return: DB-API connection
+    :return: None when the driver is not supported or connection failed
+    """
+    return vector_db_connect(driver, database, readonly=True, autocommit=True)
+
+
+def FormatValue(value):
+    """Format value as db.select does
+
+    >>> FormatValue(None), FormatValue(2), FormatValue(0.1), FormatValue("a")
+    ('', '2', '0.1', 'a')
+    """
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return "%.15g" % value
+    if isinstance(value, bytes):
+        return value.decode(errors="replace")
+    return str(value)
+
+
+class AttributePager:
+    """Read rows of an attribute table in pages
+
+    Pages are read when a row of the page is requested and the most
+    recently used pages are kept in memory. When the rows are ordered
+    by the key column (the default), pages are read using keyset
+    pagination (``WHERE key > last key of previous page``), which is fast
+    also at the end of large tables. Keys of the first rows of pages
+    are remembered, so pages removed from memory are read again the
+    same way. Rows ordered by other columns are read using ``OFFSET``.
+
+    Sorting and filtering are done by the database using ``ORDER BY``
+    and ``WHERE``.
+
+    >>> import sqlite3
+    >>> connection = sqlite3.connect(":memory:")
+    >>> _ = connection.execute("CREATE TABLE t (cat integer, name text)")
+    >>> _ = connection.executemany(
+    ...     "INSERT INTO t VALUES (?, ?)", [(i, "n%d" % i) for i in range(1, 11)]
+    ... )
+    >>> pager = AttributePager(
+    ...     connection, "t", "cat", ["cat", "name"], pageSize=3, maxPages=2
+    ... )
+    >>> pager.GetCount()
+    10
+    >>> pager.GetRow(9), pager.GetCat(4)
+    (['10', 'n10'], 5)
+    >>> pager.SetOrder("name", ascending=False)
+    >>> [pager.GetRow(i)[1] for i in range(3)]
+    ['n9', 'n8', 'n7']
+    >>> pager.SetWhere("cat > 8")
+    >>> pager.GetCount(), pager.GetMaxCat()
+    (2, 10)
+    """
+
+    def __init__(
+        self, connection, table, key, columns, where=None, pageSize=500, maxPages=20
+    ):
+        """
+        :param connection: DB-API connection, see ConnectDatabase()
+        :param table: table name
+        :param key: name of key column
+        :param columns: list of displayed columns
+        :param where: SQL WHERE condition or None
+        :param pageSize: number of rows in a page
+        :param maxPages: number of pages kept in memory
+        """
+        self.connection = connection
+        self.table = table
+        self.key = key
+        self.columns = list(columns)
+        self.pageSize = pageSize
+        self.maxPages = maxPages
+
+        self.where = where
+        self.orderColumn = key
+        self.ascending = True
+        self.Reset()
+
+    def Reset(self):
+        """Forget read rows, e.g. after the table was modified"""
+        self._pages = OrderedDict()
+        self._bookmarks = {}
+        self._count = None
+
+    def InvalidateRow(self, index):
+        """Forget the row, so that it is read again after it was modified
+
+        When the rows are ordered by the key column and not filtered,
+        only the page with the row is read again. Otherwise, the modified
+        values may move the row to another page or filter it out,
+        so all rows are read again.
+        """
+        if self.orderColumn == self.key and not self.where:
+            self._pages.pop(index // self.pageSize, None)
+        else:
+            self.Reset()
+
+    def Close(self):
+        """Close the connection"""
+        self.Reset()
+        self.connection.close()
+
+    def SetWhere(self, where):
+        """Set SQL WHERE condition limiting the rows"""
+        self.where = where
+        self.Reset()
+
+    def SetOrder(self, column, ascending=True):
+        """Order rows by the column, rows with the same value by key"""
+        self.orderColumn = column
+        self.ascending = ascending
+        self.Reset()
+
+    def _execute(self, sql):
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(sql)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def _whereClause(self, condition=None):
+        conditions = [c for c in (self.where, condition) if c]
+        if not conditions:
+            return ""
+        return " WHERE " + " AND ".join("(%s)" % c for c in conditions)
+
+    def _orderClause(self):
+        direction = "ASC" if self.ascending else "DESC"
+        if self.orderColumn == self.key:
+            return ' ORDER BY "%s" %s' % (self.key, direction)
+        return ' ORDER BY "%s" %s, "%s" %s' % (
+            self.orderColumn,
+            direction,
+            self.key,
+            direction,
+        )
+
+    def GetCount(self):
+        """Get number of rows"""
+        if self._count is None:
+            self._count = self._execute(
+                "SELECT COUNT(*) FROM %s%s" % (self.table, self._whereClause())
+            )[0][0]
+        return self._count
+
+    def GetMaxCat(self):
+        """Get maximal category in the table, 0 for empty table"""
+        result = self._execute('SELECT MAX("%s") FROM %s' % (self.key, self.table))[0][
+            0
+        ]
+        return result or 0
+
+    def HasCat(self, cat):
+        """Check if the table contains a row with the category"""
+        return bool(
+            self._execute(
+                'SELECT 1 FROM %s WHERE "%s" = %d' % (self.table, self.key, cat)
+            )
+        )
+
+    def _readPage(self, page):
+        """Read rows of the page, each row ends with its key"""
+        select = "SELECT %s FROM %s" % (
+            ",".join('"%s"' % column for column in [*self.columns, self.key]),
+            self.table,
+        )
+        limit = " LIMIT %d" % self.pageSize
+        if self.orderColumn != self.key:
+            return self._execute(
+                select
+                + self._whereClause()
+                + self._orderClause()
+                + limit
+                + " OFFSET %d" % (page * self.pageSize)
+            )
+
+        operator = ">" if self.ascending else "<"
+        if page == 0:
+            condition = None
+        elif self._pages.get(page - 1):
+            condition = '"%s" %s %d' % (
+                self.key,
+                operator,
+                self._pages[page - 1][-1][1],
+            )
+        else:
+            if page not in self._bookmarks:
+                result = self._execute(
+                    'SELECT "%s" FROM %s' % (self.key, self.table)
+                    + self._whereClause()
+                    + self._orderClause()
+                    + " LIMIT 1 OFFSET %d" % (page * self.pageSize)
+                )
+                if not result:
+                    return []
+                self._bookmarks[page] = result[0][0]
+            condition = '"%s" %s= %d' % (self.key, operator, self._bookmarks[page])
+        return self._execute(
+            select + self._whereClause(condition) + self._orderClause() + limit
+        )
+
+    def _getPage(self, page):
+        """Get page as list of (formatted values, key) pairs"""
+        rows = self._pages.get(page)
+        if rows is not None:
+            self._pages.move_to_end(page)
+            return rows
+        records = self._readPage(page)
+        if records and self.orderColumn == self.key:
+            self._bookmarks[page] = records[0][-1]
+        rows = [
+            ([FormatValue(value) for value in record[:-1]], record[-1])
+            for record in records
+        ]
+        self._pages[page] = rows
+        while len(self._pages) > self.maxPages:
+            self._pages.popitem(last=False)
+        return rows
+
+    def _getRow(self, index):
+        page, offset = divmod(index, self.pageSize)
+        rows = self._getPage(page)
+        if offset >= len(rows):
+            raise IndexError(index)
+        return rows[offset]
+
+    def GetRow(self, index):
+        """Get values of displayed columns of the row formatted as strings"""
+        return self._getRow(index)[0]
+
+    def GetCat(self, index):
+        """Get key (category) of the row"""
+        return self._getRow(index)[1]
+
+
+class PagedDataMap(Mapping):
+    """Values of rows by row index read on demand by AttributePager
+
+    Replaces dictionary of all values of VirtualAttributeList.
+    """
+
+    def __init__(self, pager):
+        self.pager = pager
+
+    def __getitem__(self, index):
+        try:
+            return self.pager.GetRow(index)
+        except IndexError:
+            raise KeyError(index)
+
+    def __iter__(self):
+        return iter(range(len(self)))
+
+    def __len__(self):
+        return self.pager.GetCount()
+
+
+class PagedCatsMap(PagedDataMap):
+    """Categories of rows by row index read on demand by AttributePager"""
+
+    def __getitem__(self, index):
+        try:
+            return self.pager.GetCat(index)
+        except IndexError:
+            raise KeyError(index)
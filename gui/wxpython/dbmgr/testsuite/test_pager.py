@@ -0,0 +1,102 @@
+"""Test on demand reading of attribute tables in pages"""
+
+import sqlite3
+
+from grass.gunittest.case import TestCase
+from grass.gunittest.main import test
+from grass.script.setup import set_gui_path
+
+
+class TestAttributePager(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        set_gui_path()
+        from dbmgr.pager import AttributePager, PagedCatsMap, PagedDataMap
+
+        cls.AttributePager = AttributePager
+        cls.PagedCatsMap = PagedCatsMap
+        cls.PagedDataMap = PagedDataMap
+
+    def setUp(self):
+        connection = sqlite3.connect(":memory:")
+        self.connection = connection
+        connection.execute("CREATE TABLE t (cat integer, value double, name text)")
+        connection.executemany(
+            "INSERT INTO t VALUES (?, ?, ?)",
+            [
+                (cat, None if cat % 10 == 0 else cat / 4, "n%04d" % (1000 - cat))
+                for cat in range(1, 1001)
+            ],
+        )
+        self.queries = []
+        connection.set_trace_callback(self.queries.append)
+        self.pager = self.AttributePager(
+            connection,
+            "t",
+            "cat",
+            ["cat", "value", "name"],
+            pageSize=100,
+            maxPages=3,
+        )
+
+    def tearDown(self):
+        self.pager.Close()
+
+    def test_rows(self):
+        """Rows are formatted as db.select formats them"""
+        self.assertEqual(self.pager.GetCount(), 1000)
+        self.assertEqual(self.pager.GetRow(0), ["1", "0.25", "n0999"])
+        self.assertEqual(self.pager.GetRow(9), ["10", "", "n0990"])
+        self.assertEqual(self.pager.GetCat(999), 1000)
+        with self.assertRaises(IndexError):
+            self.pager.GetRow(1000)
+
+    def test_pages_read_on_demand(self):
+        """Only pages with requested rows are read and kept in memory"""
+        self.pager.GetRow(550)
+        self.pager.GetRow(551)
+        self.assertEqual(len(self.queries), 2)  # bookmark, page
+        for index in range(0, 1000, 100):
+            self.assertEqual(self.pager.GetCat(index), index + 1)
+        self.assertLessEqual(len(self.pager._pages), 3)
+
+    def test_keyset_pagination(self):
+        """Pages following a read page are read without OFFSET"""
+        self.pager.GetRow(0)
+        self.pager.GetRow(100)
+        self.assertNotIn("OFFSET", " ".join(self.queries))
+
+    def test_order_where(self):
+        """Sorting and filtering are done by the database"""
+        self.pager.SetOrder("name")
+        self.assertEqual(self.pager.GetCat(0), 1000)
+        self.pager.SetOrder("cat", ascending=False)
+        self.assertEqual(self.pager.GetCat(150), 850)
+        self.pager.SetWhere("value > 100")
+        self.assertEqual(self.pager.GetCount(), 600 - 60)
+        self.assertEqual(self.pager.GetCat(0), 1000 - 1)
+        self.assertEqual(self.pager.GetMaxCat(), 1000)
+        self.assertTrue(self.pager.HasCat(10))
+        self.assertFalse(self.pager.HasCat(1001))
+
+    def test_maps(self):
+        """Maps replacing the dictionaries of the list read rows on demand"""
+        data = self.PagedDataMap(self.pager)
+        cats = self.PagedCatsMap(self.pager)
+        self.assertEqual(len(data), 1000)
+        self.assertEqual(data[1][0], "2")
+        self.assertEqual(cats[1], 2)
+        self.assertEqual(max(cats.values()), 1000)
+
+    def test_invalidate_row(self):
+        """Modified row is read again"""
+        self.assertEqual(self.pager.GetRow(150), ["151", "37.75", "n0849"])
+        self.connection.execute("UPDATE t SET name = 'new' WHERE cat = 151")
+        self.assertEqual(self.pager.GetRow(150)[2], "n0849")
+        self.pager.InvalidateRow(150)
+        self.assertEqual(self.pager.GetRow(150), ["151", "37.75", "new"])
+        self.assertEqual(self.pager.GetRow(149), ["150", "", "n0850"])
+
+
+if __name__ == "__main__":
+    test()
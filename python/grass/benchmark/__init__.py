@@ -24,6 +24,7 @@ exceptions originating in the CLI code result in *sys.exit* with an error messag
 traceback. Messages and other user-visible texts in this package are not translatable.
 """
 
+from .compare import compare_results, compare_results_from_files
 from .plots import nprocs_plot, num_cells_plot
 from .results import (
     join_results,
@@ -39,6 +40,8 @@ __all__ = [
     "benchmark_nprocs",
     "benchmark_resolutions",
     "benchmark_single",
+    "compare_results",
+    "compare_results_from_files",
     "join_results",
     "join_results_from_files",
     "load_results",
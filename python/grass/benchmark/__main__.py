@@ -13,7 +13,9 @@
 
 """The main file for executing using python -m"""
 
+import sys
+
 from grass.benchmark.app import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
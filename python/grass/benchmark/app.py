@@ -18,12 +18,14 @@ import sys
 from pathlib import Path
 
 from grass.benchmark import (
+    compare_results_from_files,
     join_results_from_files,
     load_results_from_file,
     nprocs_plot,
     num_cells_plot,
     save_results_to_file,
 )
+from grass.benchmark.compare import METRICS
 
 
 class CliUsageError(ValueError):
@@ -81,6 +83,46 @@ def plot_cells_cli(args):
     )
 
 
+def compare_results_cli(args):
+    """Translate CLI parser result to API calls.
+
+    Prints the comparison and returns 1 if there is a regression, 0 otherwise.
+    """
+    if not 0 < args.alpha < 1:
+        msg = f"Significance level needs to be between 0 and 1, not {args.alpha}"
+        raise CliUsageError(msg)
+    comparisons = compare_results_from_files(
+        args.baseline,
+        args.candidate,
+        metrics=args.metrics,
+        threshold=args.threshold,
+        alpha=args.alpha,
+    )
+    if not comparisons:
+        msg = "No benchmarks with the same label to compare"
+        raise CliUsageError(msg)
+    units = {"max_rss": "MB"}
+    for comparison in comparisons:
+        name = comparison.label
+        if comparison.parameter:
+            name = f"{name} ({comparison.parameter}: {comparison.value})"
+        unit = units.get(comparison.metric, "s")
+        if comparison.status == "unavailable":
+            print(f"{name} - {comparison.metric}: not available")
+            continue
+        print(
+            f"{name} - {comparison.metric}: {comparison.baseline:.4g}{unit}"
+            f" -> {comparison.candidate:.4g}{unit}"
+            f" ({comparison.change:+.1f}%, p={comparison.p_value:.3g})"
+            f" {comparison.status}"
+        )
+    regressions = [item for item in comparisons if item.status == "regression"]
+    if regressions:
+        print(f"Found {len(regressions)} regression(s) over {args.threshold}%")
+        return 1
+    return 0
+
+
 def get_executable_name():
     """Get name of the executable and module.
 
@@ -157,6 +199,45 @@ def add_results_subcommand(parent_subparsers):
     join.set_defaults(handler=join_results_cli)
 
 
+def add_compare_subcommand(parent_subparsers):
+    """Add compare subcommand."""
+    compare = add_subcommand_parser(
+        parent_subparsers,
+        "compare",
+        description=(
+            "Compare two result files and report regressions"
+            " (exits with non-zero return code when there is a regression)"
+        ),
+    )
+    compare.add_argument(
+        "baseline", help="File with baseline results", metavar="baseline_file"
+    )
+    compare.add_argument(
+        "candidate", help="File with results to compare", metavar="candidate_file"
+    )
+    compare.add_argument(
+        "--metrics",
+        help="Metrics to compare",
+        nargs="+",
+        default=["time"],
+        choices=list(METRICS),
+    )
+    compare.add_argument(
+        "--threshold",
+        help="Smallest change in percent considered a regression",
+        type=float,
+        default=5,
+        metavar="percent",
+    )
+    compare.add_argument(
+        "--alpha",
+        help="Significance level of the test of repeated runs",
+        type=float,
+        default=0.05,
+    )
+    compare.set_defaults(handler=compare_results_cli)
+
+
 def add_plot_io_arguments(parser):
     """Add input and output arguments to *parser*."""
     parser.add_argument(
@@ -229,20 +310,24 @@ def define_arguments():
 
     add_results_subcommand(subparsers)
     add_plot_subcommand(subparsers)
+    add_compare_subcommand(subparsers)
 
     return parser
 
 
 def main(args=None):
-    """Define and parse command line parameters then run the appropriate handler."""
+    """Define and parse command line parameters then run the appropriate handler.
+
+    Returns return code of the handler (None for handlers without one).
+    """
     parser = define_arguments()
     args = parser.parse_args(args)
     try:
-        args.handler(args)
+        return args.handler(args)
     except CliUsageError as error:
         # Report a usage error and exit.
         sys.exit(f"ERROR: {error}")
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
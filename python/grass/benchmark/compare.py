@@ -0,0 +1,207 @@
+# MODULE:    grass.benchmark
+#
+# AUTHOR(S): GRASS Development Team
+#
+# PURPOSE:   Benchmarking for GRASS modules
+#
+# COPYRIGHT: (C) 2025 by the GRASS Development Team
+#
+#            This program is free software under the GNU General Public
+#            License (>=v2). Read the file COPYING that comes with GRASS
+#            for details.
+
+
+"""Comparison of benchmark results"""
+
+import itertools
+import math
+import random
+from types import SimpleNamespace
+
+from .results import load_results_from_file
+
+# Metric name and attribute with values for each run
+METRICS = {
+    "time": "all_times",
+    "user_time": "all_user_times",
+    "system_time": "all_system_times",
+    "max_rss": "all_max_rss",
+}
+
+# Maximum number of permutations for the exact test,
+# also the number of random permutations used when there are more.
+MAX_PERMUTATIONS = 20000
+
+
+def permutation_test(baseline, candidate, max_permutations=MAX_PERMUTATIONS):
+    """Test if values in *candidate* are greater than in *baseline*.
+
+    Uses one-sided permutation test of difference of means. All permutations
+    are evaluated when their number is at most *max_permutations*, otherwise
+    the given number of random permutations is used (with a fixed seed,
+    so the result is reproducible).
+
+    Returns p-value, i.e., probability of a difference of means at least
+    as large as the observed one when both samples come from the same
+    distribution.
+
+    >>> permutation_test([1.0, 1.1, 0.9], [2.0, 2.1, 1.9])
+    0.05
+    >>> permutation_test([1.0, 1.1, 0.9], [1.0, 1.1, 0.9])
+    0.7
+    >>> permutation_test([1.0], [2.0])
+    0.5
+    """
+    values = list(baseline) + list(candidate)
+    size = len(candidate)
+    total = sum(values)
+
+    def difference(candidate_sum):
+        return candidate_sum / size - (total - candidate_sum) / (len(values) - size)
+
+    # Small tolerance to count permutations equal to the observed one reliably.
+    observed = difference(sum(candidate)) - 1e-12 * max(abs(total), 1)
+    if math.comb(len(values), size) <= max_permutations:
+        differences = [
+            difference(sum(combination))
+            for combination in itertools.combinations(values, size)
+        ]
+        return sum(value >= observed for value in differences) / len(differences)
+    generator = random.Random(0)
+    count = 0
+    for unused in range(max_permutations):
+        if difference(sum(generator.sample(values, size))) >= observed:
+            count += 1
+    return (count + 1) / (max_permutations + 1)
+
+
+def _results_list(results):
+    """Get list of results from results structure or list"""
+    if hasattr(results, "results"):
+        return results.results
+    return results
+
+
+def _measurements(result):
+    """Get values of metrics for each benchmark in the result.
+
+    Returns a dictionary where the key is a tuple with label, name of
+    the varied parameter and its value (both None for a single benchmark),
+    and the value is a dictionary with a list of values for each metric.
+    """
+    for parameter in ("nprocs", "resolutions"):
+        if hasattr(result, parameter):
+            break
+    else:
+        parameter = None
+
+    def values_for_each_run(metric):
+        values = getattr(result, METRICS[metric], None)
+        if values is None and metric == "time":
+            # Without all times, use the average as the only value available.
+            values = [[item] for item in result.times] if parameter else [result.time]
+        return values
+
+    metrics = {
+        metric: values
+        for metric in METRICS
+        if (values := values_for_each_run(metric)) is not None
+    }
+    if not parameter:
+        return {(result.label, None, None): metrics}
+    return {
+        (result.label, parameter, value): {
+            metric: values[index] for metric, values in metrics.items()
+        }
+        for index, value in enumerate(getattr(result, parameter))
+    }
+
+
+def compare_results(baseline, candidate, metrics=("time",), threshold=5, alpha=0.05):
+    """Compare two sets of benchmark results.
+
+    *baseline* and *candidate* are lists of results or results structures
+    (see :func:`grass.benchmark.load_results`). Benchmarks are matched
+    by label and by the *nprocs* or *resolutions* value if present.
+    Benchmarks which are not in both sets are not compared.
+
+    For each of *metrics* (*time*, *user_time*, *system_time*, *max_rss*),
+    the difference of means is computed as a percentage of the baseline mean.
+    A change is considered a regression (or an improvement) when it is
+    greater than *threshold* percent and statistically significant, i.e.,
+    the p-value of the one-sided permutation test is at most *alpha*.
+    Values from all repeated runs are used for the test, so at least three
+    runs of each benchmark are needed to detect a change with the default
+    *alpha*.
+
+    Returns a list of objects with attributes *label*, *parameter*
+    (*nprocs*, *resolutions*, or None), *value* (value of the parameter),
+    *metric*, *baseline* and *candidate* (means), *change*
+    (in percent), *p_value*, and *status* which is
+    one of ``"regression"``, ``"improvement"``, ``"unchanged"``, or
+    ``"unavailable"`` when the metric was not measured.
+    """
+    baseline_measurements = {}
+    for result in _results_list(baseline):
+        baseline_measurements.update(_measurements(result))
+    candidate_measurements = {}
+    for result in _results_list(candidate):
+        candidate_measurements.update(_measurements(result))
+
+    comparisons = []
+    for key, baseline_values in baseline_measurements.items():
+        if key not in candidate_measurements:
+            continue
+        candidate_values = candidate_measurements[key]
+        label, parameter, value = key
+        for metric in metrics:
+            comparison = SimpleNamespace(
+                label=label,
+                parameter=parameter,
+                value=value,
+                metric=metric,
+                baseline=None,
+                candidate=None,
+                change=None,
+                p_value=None,
+                status="unavailable",
+            )
+            comparisons.append(comparison)
+            old = baseline_values.get(metric)
+            new = candidate_values.get(metric)
+            if not old or not new or None in old or None in new:
+                continue
+            comparison.baseline = sum(old) / len(old)
+            comparison.candidate = sum(new) / len(new)
+            if comparison.candidate >= comparison.baseline:
+                comparison.p_value = permutation_test(old, new)
+            else:
+                comparison.p_value = permutation_test(new, old)
+            significant = comparison.p_value <= alpha
+            if comparison.baseline:
+                comparison.change = (
+                    100
+                    * (comparison.candidate - comparison.baseline)
+                    / comparison.baseline
+                )
+            else:
+                comparison.change = 0 if not comparison.candidate else math.inf
+            if significant and comparison.change > threshold:
+                comparison.status = "regression"
+            elif significant and comparison.change < -threshold:
+                comparison.status = "improvement"
+            else:
+                comparison.status = "unchanged"
+    return comparisons
+
+
+def compare_results_from_files(baseline_filename, candidate_filename, **kwargs):
+    """Compare results from two files.
+
+    See :func:`compare_results` for details.
+    """
+    return compare_results(
+        load_results_from_file(baseline_filename),
+        load_results_from_file(candidate_filename),
+        **kwargs,
+    )
@@ -14,14 +14,187 @@
 
 """Basic functions for benchmarking modules"""
 
+import os
 import random
 import shutil
+import threading
+import time
+from pathlib import Path
 from types import SimpleNamespace
 
 import grass.script as gs
 
+try:
+    import resource
+except ImportError:
+    # Not available on MS Windows.
+    resource = None
 
-def benchmark_single(module, label, repeat=5):
+
+# Interval in seconds for sampling memory when no profile is requested
+MEMORY_SAMPLE_INTERVAL = 0.01
+
+
+def _children_usage():
+    """Get CPU time used by all terminated child processes of this process.
+
+    Returns an object with *user_time* and *system_time* in seconds,
+    or None if the information is not available.
+    """
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return SimpleNamespace(user_time=usage.ru_utime, system_time=usage.ru_stime)
+
+
+def _process_tree_usage(pid):
+    """Get total memory and CPU time of all descendants of a process.
+
+    Uses the proc file system, so it works only on Linux.
+    Returns resident set size in MB and CPU time (user and system) in seconds.
+    """
+    rss = 0
+    cpu_time = 0
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    clock_ticks = os.sysconf("SC_CLK_TCK")
+    to_visit = [pid]
+    while to_visit:
+        process = to_visit.pop()
+        process_dir = Path("/proc", str(process))
+        try:
+            for task in (process_dir / "task").iterdir():
+                children = (task / "children").read_text().split()
+                to_visit.extend(int(child) for child in children)
+            if process == pid:
+                continue
+            rss += int((process_dir / "statm").read_text().split()[1]) * page_size
+            # Fields after the executable name which can contain spaces.
+            fields = (process_dir / "stat").read_text().rsplit(")", 1)[1].split()
+            cpu_time += (int(fields[11]) + int(fields[12])) / clock_ticks
+        except (OSError, IndexError, ValueError):
+            # The process has just finished.
+            continue
+    return rss / (1024 * 1024), cpu_time
+
+
+class _ProcessTreeSampler(threading.Thread):
+    """Periodically record memory and CPU time used by child processes.
+
+    Each sample is a list with time from the start in seconds, resident set size
+    in MB, and CPU time in seconds, all summed for all running descendants.
+    Samples are recorded only on Linux.
+    """
+
+    def __init__(self, interval):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.samples = []
+        self._stop_event = threading.Event()
+
+    @property
+    def max_rss(self):
+        """Peak of sampled resident set size in MB
+
+        None if no child processes were sampled (e.g., not on Linux).
+        """
+        return max((sample[1] for sample in self.samples), default=0) or None
+
+    def run(self):
+        start = time.perf_counter()
+        if not Path("/proc", str(os.getpid()), "task").is_dir():
+            return
+        while True:
+            rss, cpu_time = _process_tree_usage(os.getpid())
+            self.samples.append(
+                [
+                    round(time.perf_counter() - start, 3),
+                    round(rss, 3),
+                    round(cpu_time, 3),
+                ]
+            )
+            if self._stop_event.wait(self.interval):
+                break
+
+    def stop(self):
+        """Stop sampling and wait for the thread to end"""
+        self._stop_event.set()
+        self.join()
+
+
+def _run_measured(module, sample_interval=None):
+    """Run the module and measure resources used by its processes.
+
+    Returns an object with *user_time* and *system_time* (CPU time in seconds
+    used by the child processes during the run), *max_rss* (peak resident set
+    size in MB of all child processes running at the same time during the run),
+    and *profile* (list of samples, see :class:`_ProcessTreeSampler`, or None
+    when *sample_interval* is not set).
+    Values which are not available on the platform are None.
+
+    The memory is sampled (in *sample_interval* or in MEMORY_SAMPLE_INTERVAL),
+    so *max_rss* is available only on Linux and short peaks may be missed.
+    """
+    sampler = _ProcessTreeSampler(sample_interval or MEMORY_SAMPLE_INTERVAL)
+    sampler.start()
+    before = _children_usage()
+    try:
+        module.run()
+    finally:
+        after = _children_usage()
+        sampler.stop()
+    return SimpleNamespace(
+        user_time=after.user_time - before.user_time if before else None,
+        system_time=after.system_time - before.system_time if before else None,
+        max_rss=sampler.max_rss,
+        profile=sampler.samples if sample_interval else None,
+    )
+
+
+def _mean(values):
+    """Return average of values or None if some values are not available"""
+    if not values or None in values:
+        return None
+    return sum(values) / len(values)
+
+
+def _usage_result(usages):
+    """Summarize resource usage from repeated runs of one benchmark.
+
+    Returns a dictionary with average *user_time* and *system_time*,
+    *max_rss* as the maximum of all runs, and all the values per run.
+    The *profiles* key is present only if profiles were recorded.
+    """
+    all_max_rss = [usage.max_rss for usage in usages]
+    result = {
+        "all_user_times": [usage.user_time for usage in usages],
+        "user_time": _mean([usage.user_time for usage in usages]),
+        "all_system_times": [usage.system_time for usage in usages],
+        "system_time": _mean([usage.system_time for usage in usages]),
+        "all_max_rss": all_max_rss,
+        "max_rss": None if None in all_max_rss else max(all_max_rss, default=None),
+    }
+    if any(usage.profile is not None for usage in usages):
+        result["profiles"] = [usage.profile for usage in usages]
+    return result
+
+
+def _usage_results(usages_per_value):
+    """Summarize resource usage for benchmarks with multiple parameter values.
+
+    Same as :func:`_usage_result`, but with a list of values for each key,
+    and with plural *user_times* and *system_times* for averages
+    following the naming of *times* and *all_times*.
+    """
+    summaries = [_usage_result(usages) for usages in usages_per_value]
+    plurals = {"user_time": "user_times", "system_time": "system_times"}
+    keys = {key for summary in summaries for key in summary}
+    return {
+        plurals.get(key, key): [summary.get(key) for summary in summaries]
+        for key in sorted(keys)
+    }
+
+
+def benchmark_single(module, label, repeat=5, sample_interval=None):
     """Benchmark module as is without changing anything.
 
     *module* is an instance of PyGRASS Module class or any object which
@@ -32,10 +205,19 @@ def benchmark_single(module, label, repeat=5):
 
     *repeat* sets how many times the each run is repeated.
     *label* is a text to add to the result (for user-facing display).
+    When *sample_interval* is set, memory and CPU time of the running child
+    processes are sampled in the given interval in seconds (only on Linux).
 
     Returns an object with attributes *time* (an average execution time),
     *all_times* (list of measured execution times),
     and *label* (the provided parameter as is).
+    Resources used by the child processes are in attributes *user_time* and
+    *system_time* (average CPU times), *max_rss* (the highest peak resident set
+    size in MB), and *all_user_times*, *all_system_times*, and *all_max_rss*
+    (values for each run). CPU times are None where not available (MS Windows)
+    and memory is measured only on Linux.
+    The *profiles* attribute contains a list of samples for each run when
+    *sample_interval* is set. See :func:`_run_measured` for details.
     """
     term_size = shutil.get_terminal_size()
     if hasattr(module, "get_bash"):
@@ -48,8 +230,9 @@ def benchmark_single(module, label, repeat=5):
     print("\u2500" * term_size.columns)
     time_sum = 0
     measured_times = []
+    measured_usage = []
     for _ in range(repeat):
-        module.run()
+        measured_usage.append(_run_measured(module, sample_interval))
         print(f"{module.time}s")
         time_sum += module.time
         measured_times.append(module.time)
@@ -65,10 +248,13 @@ def benchmark_single(module, label, repeat=5):
         all_times=measured_times,
         time=avg,
         label=label,
+        **_usage_result(measured_usage),
     )
 
 
-def benchmark_nprocs(module, label, max_nprocs, repeat=5, shuffle=True):
+def benchmark_nprocs(
+    module, label, max_nprocs, repeat=5, shuffle=True, sample_interval=None
+):
     """Benchmark module using values of nprocs up to *max_nprocs*.
 
     *module* is an instance of PyGRASS Module class or any object which
@@ -87,11 +273,15 @@ def benchmark_nprocs(module, label, max_nprocs, repeat=5, shuffle=True):
 
     *label* is a text to add to the result (for user-facing display).
     Optional *nprocs* is passed to the module if present.
+    For *sample_interval*, see :func:`benchmark_single`.
 
     Returns an object with attributes *times* (list of average execution times),
     *all_times* (list of lists of measured execution times),
     *efficiency* (parallel efficiency), *nprocs* (list of *nprocs* values used),
     and *label* (the provided parameter as is).
+    Resources used are in attributes as in :func:`benchmark_single`
+    except that they contain a list with an item for each *nprocs* value
+    and that the average CPU times are in *user_times* and *system_times*.
     """
     term_size = shutil.get_terminal_size()
     if hasattr(module, "get_bash"):
@@ -109,15 +299,19 @@ def benchmark_nprocs(module, label, max_nprocs, repeat=5, shuffle=True):
     if shuffle:
         random.shuffle(nprocs_list_shuffled)
     times = {}
+    usages = {}
     print("\u2500" * term_size.columns)
     for nprocs in nprocs_list_shuffled:
         module.update(nprocs=nprocs)
-        module.run()
+        usage = _run_measured(module, sample_interval)
         print(f"Run with {nprocs} thread(s) took {module.time}s\n")
         if nprocs in times:
             times[nprocs] += [module.time]
+            usages[nprocs] += [usage]
         else:
             times[nprocs] = [module.time]
+            usages[nprocs] = [usage]
+    vars(result).update(_usage_results([usages[nprocs] for nprocs in sorted(times)]))
     for nprocs in sorted(times):
         avg = sum(times[nprocs]) / repeat
         result.times.append(avg)
@@ -138,7 +332,9 @@ def benchmark_nprocs(module, label, max_nprocs, repeat=5, shuffle=True):
     return result
 
 
-def benchmark_resolutions(module, resolutions, label, repeat=5, nprocs=None):
+def benchmark_resolutions(
+    module, resolutions, label, repeat=5, nprocs=None, sample_interval=None
+):
     """Benchmark module using different resolutions.
 
     *module* is an instance of PyGRASS Module class or any object
@@ -153,11 +349,13 @@ def benchmark_resolutions(module, resolutions, label, repeat=5, nprocs=None):
     *label* is a text to add to the result (for user-facing display).
     Optional *nprocs* is passed to the module if present
     (the called module does not have to support nprocs parameter).
+    For *sample_interval*, see :func:`benchmark_single`.
 
     Returns an object with attributes *times* (list of average execution times),
     *all_times* (list of lists of measured execution times), *resolutions*
     (the provided parameter as is), *cells* (number of cells in the region),
     and *label* (the provided parameter as is).
+    Resources used are in attributes as in :func:`benchmark_nprocs`.
     """
     term_size = shutil.get_terminal_size()
     if hasattr(module, "get_bash"):
@@ -167,6 +365,7 @@ def benchmark_resolutions(module, resolutions, label, repeat=5, nprocs=None):
 
     avg_times = []
     all_times = []
+    all_usages = []
     n_cells = []
     for resolution in resolutions:
         gs.run_command("g.region", res=resolution)
@@ -176,10 +375,11 @@ def benchmark_resolutions(module, resolutions, label, repeat=5, nprocs=None):
         print(f"Benchmark with resolution {resolution}...\n")
         time_sum = 0
         measured_times = []
+        measured_usage = []
         for _ in range(repeat):
             if nprocs:
                 module.update(nprocs=nprocs)
-            module.run()
+            measured_usage.append(_run_measured(module, sample_interval))
             print(f"{module.time}s")
             time_sum += module.time
             measured_times.append(module.time)
@@ -187,6 +387,7 @@ def benchmark_resolutions(module, resolutions, label, repeat=5, nprocs=None):
         avg = time_sum / repeat
         avg_times.append(avg)
         all_times.append(measured_times)
+        all_usages.append(measured_usage)
         print(f"\nResult - {avg}s")
 
     return SimpleNamespace(
@@ -195,4 +396,5 @@ def benchmark_resolutions(module, resolutions, label, repeat=5, nprocs=None):
         resolutions=resolutions,
         cells=n_cells,
         label=label,
+        **_usage_results(all_usages),
     )
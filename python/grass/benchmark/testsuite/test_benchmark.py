@@ -12,6 +12,10 @@
 
 """Basic tests of grass.benchmark"""
 
+import subprocess
+import sys
+import time
+import unittest
 from pathlib import Path
 from subprocess import DEVNULL
 from types import SimpleNamespace
@@ -20,6 +24,7 @@ from grass.benchmark import (
     benchmark_resolutions,
     benchmark_nprocs,
     benchmark_single,
+    compare_results,
     join_results,
     load_results,
     load_results_from_file,
@@ -32,6 +37,29 @@ from grass.gunittest.main import test
 from grass.pygrass.modules import Module
 
 
+class MemoryModule:
+    """Object with the module interface running a process allocating memory"""
+
+    def __init__(self, megabytes):
+        self.megabytes = megabytes
+        self.time = None
+
+    def update(self, nprocs):
+        self.megabytes = nprocs
+
+    def run(self):
+        start = time.time()
+        code = (
+            f"import time; data = bytearray({self.megabytes} * 1024 * 1024);"
+            " data[::4096] = bytes(len(data[::4096])); time.sleep(0.2)"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+        self.time = time.time() - start
+
+    def __str__(self):
+        return f"allocate {self.megabytes} MB"
+
+
 class TestBenchmarksRun(TestCase):
     """Tests that functions for benchmarking can run"""
 
@@ -81,8 +109,36 @@ class TestBenchmarksRun(TestCase):
             self.assertTrue(hasattr(result, "time"))
             self.assertTrue(hasattr(result, "label"))
             self.assertEqual(len(result.all_times), repeat)
+            self.assertEqual(len(result.all_user_times), repeat)
+            self.assertEqual(len(result.all_system_times), repeat)
+            self.assertEqual(len(result.all_max_rss), repeat)
+            self.assertTrue(hasattr(result, "max_rss"))
+            self.assertFalse(hasattr(result, "profiles"))
         self.assertEqual(results[0].label, label)
 
+    def test_single_profile(self):
+        """Test that single benchmark records profiles when requested"""
+        repeat = 2
+        result = benchmark_single(
+            module=Module("r.univar", map="elevation", stdout_=DEVNULL, run_=False),
+            label="Standard output",
+            repeat=repeat,
+            sample_interval=0.01,
+        )
+        self.assertEqual(len(result.profiles), repeat)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "memory sampled on Linux")
+    def test_max_rss_per_run(self):
+        """Test that memory is measured for each run, not as maximum so far"""
+        large = benchmark_single(MemoryModule(200), label="Large", repeat=1)
+        small = benchmark_single(MemoryModule(10), label="Small", repeat=1)
+        self.assertGreater(large.max_rss, 200)
+        self.assertLess(small.max_rss, 100)
+        result = benchmark_nprocs(
+            MemoryModule(0), label="Memory", max_nprocs=2, repeat=1, shuffle=False
+        )
+        self.assertLess(result.max_rss[0], 100)
+
     def test_nprocs(self):
         """Test that benchmark function runs for nprocs"""
         label = "Standard output"
@@ -108,6 +164,10 @@ class TestBenchmarksRun(TestCase):
             self.assertTrue(hasattr(result, "efficiency"))
             self.assertTrue(hasattr(result, "label"))
             self.assertEqual(len(result.all_times), repeat)
+            self.assertEqual(len(result.user_times), len(result.nprocs))
+            self.assertEqual(len(result.system_times), len(result.nprocs))
+            self.assertEqual(len(result.max_rss), len(result.nprocs))
+            self.assertEqual(len(result.all_user_times[0]), repeat)
         self.assertEqual(results[0].label, label)
 
 
@@ -169,5 +229,68 @@ class TestBenchmarkResults(TestCase):
         self.assertEqual(len(new_results), 3)
 
 
+class TestCompareResults(TestCase):
+    """Tests that comparison of results finds regressions"""
+
+    baseline = [
+        SimpleNamespace(
+            nprocs=[1, 2],
+            times=[1, 0.5],
+            all_times=[[1, 1.02, 0.98, 1.01, 0.99], [0.5, 0.51, 0.49, 0.5, 0.5]],
+            all_max_rss=[[10, 10, 10], [12, 12, 12]],
+            label="Test 1",
+        ),
+        SimpleNamespace(time=2, all_times=[2, 2.1, 1.9], label="Test 2"),
+    ]
+    candidate = [
+        SimpleNamespace(
+            nprocs=[1, 2],
+            times=[1, 0.6],
+            all_times=[[1, 1.01, 0.99, 1, 1], [0.6, 0.61, 0.59, 0.6, 0.6]],
+            all_max_rss=[[10, 10, 10], [15, 15, 15]],
+            label="Test 1",
+        ),
+        SimpleNamespace(time=1, all_times=[1, 1.1, 0.9], label="Test 2"),
+    ]
+
+    def test_regression(self):
+        """Test that significant increase in time is a regression"""
+        comparisons = compare_results(self.baseline, self.candidate)
+        statuses = {(item.label, item.value): item.status for item in comparisons}
+        self.assertEqual(
+            statuses,
+            {
+                ("Test 1", 1): "unchanged",
+                ("Test 1", 2): "regression",
+                ("Test 2", None): "improvement",
+            },
+        )
+
+    def test_threshold(self):
+        """Test that changes under threshold are not regressions"""
+        comparisons = compare_results(self.baseline, self.candidate, threshold=25)
+        self.assertNotIn("regression", [item.status for item in comparisons])
+
+    def test_single_run(self):
+        """Test that change with one run of each is not significant"""
+        baseline = [SimpleNamespace(time=1, all_times=[1], label="Test")]
+        candidate = [SimpleNamespace(time=2, all_times=[2], label="Test")]
+        (comparison,) = compare_results(baseline, candidate)
+        self.assertEqual(comparison.status, "unchanged")
+        self.assertAlmostEqual(comparison.change, 100)
+
+    def test_memory(self):
+        """Test that memory is compared and missing metrics are reported"""
+        comparisons = compare_results(
+            self.baseline, self.candidate, metrics=["max_rss", "user_time"]
+        )
+        statuses = {
+            (item.label, item.value, item.metric): item.status for item in comparisons
+        }
+        self.assertEqual(statuses[("Test 1", 2, "max_rss")], "regression")
+        self.assertEqual(statuses[("Test 1", 2, "user_time")], "unavailable")
+        self.assertEqual(statuses[("Test 2", None, "max_rss")], "unavailable")
+
+
 if __name__ == "__main__":
     test()
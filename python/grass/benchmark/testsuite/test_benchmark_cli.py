@@ -15,6 +15,7 @@
 import sys
 from pathlib import Path
 from subprocess import DEVNULL
+from types import SimpleNamespace
 
 import grass
 from grass.benchmark import (
@@ -39,6 +40,51 @@ def remove_file(path):
         Path(path).unlink(missing_ok=True)
 
 
+class TestBenchmarkCompareCLI(TestCase):
+    """Tests that compare CLI reports regressions in return code"""
+
+    baseline_filename = "compare_test_baseline.json"
+    candidate_filename = "compare_test_candidate.json"
+
+    def setUp(self):
+        """Create result files"""
+        save_results_to_file(
+            [SimpleNamespace(time=1, all_times=[1, 1.1, 0.9], label="Test")],
+            self.baseline_filename,
+        )
+        save_results_to_file(
+            [SimpleNamespace(time=2, all_times=[2, 2.1, 1.9], label="Test")],
+            self.candidate_filename,
+        )
+
+    def tearDown(self):
+        """Remove test files"""
+        remove_file(self.baseline_filename)
+        remove_file(self.candidate_filename)
+
+    def test_regression(self):
+        """Test that regression gives non-zero return code"""
+        self.assertEqual(
+            benchmark_main(
+                ["compare", self.baseline_filename, self.candidate_filename]
+            ),
+            1,
+        )
+
+    def test_no_regression(self):
+        """Test that improvement and the same results give zero return code"""
+        self.assertEqual(
+            benchmark_main(
+                ["compare", self.candidate_filename, self.baseline_filename]
+            ),
+            0,
+        )
+        self.assertEqual(
+            benchmark_main(["compare", self.baseline_filename, self.baseline_filename]),
+            0,
+        )
+
+
 class TestBenchmarkCLI(TestCase):
     """Tests that benchmarkin CLI works"""
 
@@ -0,0 +1,192 @@
+"""
+Listing of maps in a GRASS Spatial Database without running modules
+
+Maps are listed by reading the element directories of mapsets, which is
+what g.list does, so large databases with many projects can be listed
+without starting a session for each project.
+
+Usage:
+
+.. code-block:: python
+
+    from grass.grassdb.scanner import MapsetScanner
+
+    scanner = MapsetScanner()
+    projects = scanner.scan_grassdb("/home/user/grassdata")
+    # after maps in a mapset changed, only the changed mapset is read again
+    projects = scanner.scan_grassdb("/home/user/grassdata")
+
+(C) 2025 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from grass.grassdb.checks import get_list_of_locations
+
+#: Map types listed by the scanner and their element directories,
+#: in the order used by g.list
+ELEMENTS = (("raster", "cell"), ("raster_3d", "grid3"), ("vector", "vector"))
+
+
+def list_mapsets(location_path: str | os.PathLike[str]) -> list[str]:
+    """Return sorted names of mapsets in a location (project)
+
+    A mapset is a directory which contains the WIND file, as for
+    g.mapsets -l.
+    """
+    try:
+        entries = os.scandir(location_path)
+    except OSError:
+        return []
+    with entries:
+        mapsets = [
+            entry.name
+            for entry in entries
+            if os.path.isfile(os.path.join(entry.path, "WIND"))
+        ]
+    return sorted(mapsets)
+
+
+def _list_element(path):
+    try:
+        with os.scandir(path) as entries:
+            return sorted(entry.name for entry in entries if entry.name[0] != ".")
+    except OSError:
+        return []
+
+
+def _mapset_signature(mapset_path):
+    """Return modification times of element directories of the mapset
+
+    Adding, removing or renaming a map changes the modification time
+    of its element directory.
+    """
+    signature = []
+    for unused, directory in ELEMENTS:
+        try:
+            signature.append(Path(mapset_path, directory).stat().st_mtime_ns)
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def list_mapset_maps(mapset_path: str | os.PathLike[str]) -> list[dict]:
+    """Return maps in a mapset as a list of dictionaries with name and type
+
+    >>> list_mapset_maps("/nonexistent/path")
+    []
+    """
+    maps = []
+    for map_type, directory in ELEMENTS:
+        maps.extend(
+            {"name": name, "type": map_type}
+            for name in _list_element(os.path.join(mapset_path, directory))
+        )
+    return maps
+
+
+class MapsetScanner:
+    """List maps in mapsets and remember them
+
+    Maps of a mapset are read again only when modification times of its
+    element directories changed or when the mapset was invalidated,
+    e.g., after a file system event in the mapset. Mapsets are read in
+    parallel threads.
+
+    :param nprocs: number of threads reading mapsets,
+                   None for the default of ThreadPoolExecutor
+    """
+
+    def __init__(self, nprocs: int | None = None):
+        self.nprocs = nprocs
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def invalidate(self, path: str | os.PathLike[str]) -> None:
+        """Forget maps of the mapset containing the path
+
+        :param path: path to a mapset, to its element directory or to a file
+                     or directory in an element directory as reported by
+                     file system events
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            for mapset_path in list(self._cache):
+                if path == mapset_path or path.startswith(mapset_path + os.sep):
+                    del self._cache[mapset_path]
+
+    def clear(self) -> None:
+        """Forget all mapsets"""
+        with self._lock:
+            self._cache.clear()
+
+    def scan_mapset(self, mapset_path: str | os.PathLike[str]) -> list[dict]:
+        """Return maps in the mapset, see :func:`list_mapset_maps`"""
+        mapset_path = os.path.abspath(mapset_path)
+        signature = _mapset_signature(mapset_path)
+        with self._lock:
+            cached = self._cache.get(mapset_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+        maps = list_mapset_maps(mapset_path)
+        with self._lock:
+            self._cache[mapset_path] = (signature, maps)
+        return maps
+
+    def scan_location(
+        self, location_path: str | os.PathLike[str], mapsets: list[str] | None = None
+    ) -> dict[str, list[dict]]:
+        """Return maps in mapsets of a location (project)
+
+        :param location_path: path to the location
+        :param mapsets: names of mapsets, None for all mapsets in the location
+        :return: dictionary with a list of maps for each mapset
+        """
+        if mapsets is None:
+            mapsets = list_mapsets(location_path)
+        paths = [os.path.join(location_path, mapset) for mapset in mapsets]
+        with ThreadPoolExecutor(max_workers=self.nprocs) as executor:
+            return dict(zip(mapsets, executor.map(self.scan_mapset, paths)))
+
+    def scan_grassdb(
+        self, grassdb: str | os.PathLike[str], locations: list[str] | None = None
+    ) -> dict[str, dict[str, list[dict]]]:
+        """Return maps in all mapsets of locations (projects) in the database
+
+        All mapsets of all locations are read by one pool of threads.
+
+        :param grassdb: path to the GRASS database
+        :param locations: names of locations, None for all locations
+        :return: dictionary with dictionary of mapsets for each location
+        """
+        if locations is None:
+            locations = get_list_of_locations(grassdb)
+        with ThreadPoolExecutor(max_workers=self.nprocs) as executor:
+            location_mapsets = dict(
+                zip(
+                    locations,
+                    executor.map(
+                        list_mapsets,
+                        [os.path.join(grassdb, location) for location in locations],
+                    ),
+                )
+            )
+            futures = {
+                (location, mapset): executor.submit(
+                    self.scan_mapset, os.path.join(grassdb, location, mapset)
+                )
+                for location, mapsets in location_mapsets.items()
+                for mapset in mapsets
+            }
+            result = {location: {} for location in locations}
+            for (location, mapset), future in futures.items():
+                result[location][mapset] = future.result()
+        return result
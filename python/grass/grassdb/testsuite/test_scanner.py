@@ -0,0 +1,109 @@
+# MODULE:    Test of grass.grassdb.scanner
+#
+# PURPOSE:   Test of listing maps by reading mapset directories
+#
+# COPYRIGHT: (C) 2025 by the GRASS Development Team
+#
+#            This program is free software under the GNU General Public
+#            License (>=v2). Read the file COPYING that comes with GRASS
+#            for details.
+
+"""Tests of grass.grassdb.scanner"""
+
+import os
+import tempfile
+from pathlib import Path
+
+from grass.grassdb.scanner import MapsetScanner, list_mapset_maps, list_mapsets
+from grass.gunittest.case import TestCase
+from grass.gunittest.gmodules import call_module
+from grass.gunittest.main import test
+
+
+def create_mapset(path, rasters=(), vectors=()):
+    """Create mapset directories with WIND file and maps"""
+    path.mkdir(parents=True)
+    (path / "WIND").write_text("")
+    (path / "cell").mkdir()
+    for name in rasters:
+        (path / "cell" / name).write_text("")
+    (path / "vector").mkdir()
+    for name in vectors:
+        (path / "vector" / name).mkdir()
+
+
+class TestScanner(TestCase):
+    """Test listing of maps in an artificial database"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.grassdb = Path(self.tmp_dir.name)
+        create_mapset(self.grassdb / "loc_a" / "PERMANENT", rasters=["r2", "r1"])
+        create_mapset(self.grassdb / "loc_a" / "user", vectors=["v1"])
+        create_mapset(self.grassdb / "loc_b" / "PERMANENT", rasters=[".hidden"])
+        (self.grassdb / "loc_a" / "not_mapset").mkdir()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_list_mapsets(self):
+        """Only directories with WIND file are mapsets"""
+        self.assertEqual(list_mapsets(self.grassdb / "loc_a"), ["PERMANENT", "user"])
+
+    def test_list_maps(self):
+        """Maps are sorted by type and name, hidden files are skipped"""
+        self.assertEqual(
+            list_mapset_maps(self.grassdb / "loc_a" / "PERMANENT"),
+            [{"name": "r1", "type": "raster"}, {"name": "r2", "type": "raster"}],
+        )
+        self.assertEqual(list_mapset_maps(self.grassdb / "loc_b" / "PERMANENT"), [])
+
+    def test_scan_grassdb(self):
+        """All locations and mapsets are listed"""
+        result = MapsetScanner(nprocs=2).scan_grassdb(self.grassdb)
+        self.assertEqual(sorted(result), ["loc_a", "loc_b"])
+        self.assertEqual(sorted(result["loc_a"]), ["PERMANENT", "user"])
+        self.assertEqual(result["loc_a"]["user"], [{"name": "v1", "type": "vector"}])
+
+    def test_cache(self):
+        """Unchanged mapsets are not read again"""
+        scanner = MapsetScanner()
+        mapset = self.grassdb / "loc_a" / "PERMANENT"
+        first = scanner.scan_mapset(mapset)
+        self.assertIs(scanner.scan_mapset(mapset), first)
+        (mapset / "cell" / "r3").write_text("")
+        # make sure modification time changes on file systems with low precision
+        os.utime(mapset / "cell", ns=(0, 0))
+        self.assertEqual(len(scanner.scan_mapset(mapset)), 3)
+
+    def test_invalidate(self):
+        """Invalidated mapsets are read again"""
+        scanner = MapsetScanner()
+        mapset = self.grassdb / "loc_a" / "user"
+        first = scanner.scan_mapset(mapset)
+        scanner.invalidate(mapset / "vector" / "v1")
+        self.assertIsNot(scanner.scan_mapset(mapset), first)
+        self.assertEqual(scanner.scan_mapset(mapset), first)
+
+
+class TestScannerWithCurrent(TestCase):
+    """Test that the scanner lists the same maps as g.list"""
+
+    def test_same_as_g_list(self):
+        db_path = call_module("g.gisenv", get="GISDBASE").strip()
+        loc_name = call_module("g.gisenv", get="LOCATION_NAME").strip()
+        mapset_name = call_module("g.gisenv", get="MAPSET").strip()
+        maps = MapsetScanner().scan_location(
+            os.path.join(db_path, loc_name), [mapset_name]
+        )[mapset_name]
+        listed = call_module(
+            "g.list", flags="t", type="raster,raster_3d,vector", mapset=mapset_name
+        ).splitlines()
+        self.assertEqual(
+            sorted("%s/%s" % (item["type"], item["name"]) for item in maps),
+            sorted(listed),
+        )
+
+
+if __name__ == "__main__":
+    test()
@@ -12,11 +12,13 @@ for details.
 from __future__ import annotations
 
 import collections
+import datetime as dt
 import os
 from pathlib import Path
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING
 
 
@@ -70,6 +72,61 @@ def update_keyval_file(filename, module, returncode):
     return keyval
 
 
+def read_test_durations(results_dir: StrPath) -> dict[tuple[str, str], float]:
+    """Read durations of test files from a key-value report of a previous run
+
+    Returns a dictionary with durations in seconds where keys are tuples
+    with tested directory and name of the test file.
+    Returns an empty dictionary when there is no usable report.
+    """
+    filename = os.path.join(results_dir, "test_keyvalue_result.txt")
+    try:
+        summary = text_to_keyvalue(Path(filename).read_text(encoding="utf-8"), sep="=")
+    except (OSError, ValueError):
+        return {}
+
+    def as_list(value):
+        # one item is not parsed as a list
+        return value if isinstance(value, list) else [value]
+
+    try:
+        names = as_list(summary["names"])
+        tested_dirs = as_list(summary["tested_dirs"])
+        times = as_list(summary["files_times"])
+    except KeyError:
+        return {}
+    if not len(names) == len(tested_dirs) == len(times):
+        return {}
+    return {
+        (str(tested_dir), str(name)): float(time)
+        for tested_dir, name, time in zip(tested_dirs, names, times)
+    }
+
+
+def copy_data_file(src: str, dst: str) -> None:
+    """Copy a file so that the copy shares data with the source where possible
+
+    On Linux, the data are copied by the kernel, which creates a copy-on-write
+    clone on file systems supporting it (e.g., Btrfs or XFS), so the file is not
+    duplicated until it is modified. Otherwise, the file is copied as usual.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as source, open(dst, "wb") as target:
+                size = os.fstat(source.fileno()).st_size
+                while size > 0:
+                    copied = os.copy_file_range(source.fileno(), target.fileno(), size)
+                    if not copied:
+                        break
+                    size -= copied
+            if size == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
 class GrassTestFilesInvoker:
     """A class used to invoke test files and create the main report"""
 
@@ -86,6 +143,8 @@ class GrassTestFilesInvoker:
         testsuite_dir: str = "testsuite",
         file_anonymizer=None,
         timeout: float | None = None,
+        jobs: int = 1,
+        durations: dict[tuple[str, str], float] | None = None,
     ):
         """
 
@@ -96,6 +155,10 @@ class GrassTestFilesInvoker:
             should be removed before the tests start
             (advantageous when the previous run left everything behind)
         :param float timeout: maximum duration of one test in seconds
+        :param int jobs: number of test files executed at the same time
+        :param dict durations: durations of test files from a previous run
+            (see :func:`read_test_durations`) used to start the longest
+            test files first when running in parallel
         """
         self.start_dir = start_dir
         self.clean_mapsets: bool = clean_mapsets
@@ -112,6 +175,8 @@ class GrassTestFilesInvoker:
             self._file_anonymizer = file_anonymizer
 
         self.timeout: float | None = timeout
+        self.jobs: int = max(1, jobs)
+        self.durations = durations or {}
 
     def _create_mapset(self, gisdbase, location, module) -> tuple[str, str]:
         """Create mapset according to information in module.
@@ -143,18 +208,89 @@ class GrassTestFilesInvoker:
     ) -> None:
         """Run one test file."""
         self.testsuite_dirs[module.tested_dir].append(module.name)
+        self.reporter.start_file_test(module)
+        unused_start_time, result = self._execute_test_module(
+            module=module,
+            results_dir=results_dir,
+            gisdbase=gisdbase,
+            location=location,
+            timeout=timeout,
+        )
+        self.reporter.end_file_test(**result)
+
+    def _run_test_modules_in_parallel(
+        self,
+        modules,
+        results_dir: StrPath,
+        gisdbase,
+        location,
+        timeout: float | None,
+    ) -> None:
+        """Run test files in parallel, each in its own mapset.
+
+        Test files which took the longest in the previous run are started
+        first (files without a recorded duration are started before them).
+        Results are passed to the reporter in the order in which the files
+        were discovered as soon as all preceding files are finished,
+        so the reports are the same as for sequential execution.
+        """
+        for module in modules:
+            self.testsuite_dirs[module.tested_dir].append(module.name)
+
+        def duration(index):
+            module = modules[index]
+            return self.durations.get((module.tested_dir, module.name), float("inf"))
+
+        order = sorted(range(len(modules)), key=duration, reverse=True)
+        results = {}
+        next_index = 0
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            futures = {
+                executor.submit(
+                    self._execute_test_module,
+                    module=modules[index],
+                    results_dir=results_dir,
+                    gisdbase=gisdbase,
+                    location=location,
+                    timeout=timeout,
+                ): index
+                for index in order
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                while next_index in results:
+                    start_time, result = results.pop(next_index)
+                    self.reporter.start_file_test(
+                        modules[next_index], start_time=start_time
+                    )
+                    self.reporter.end_file_test(**result)
+                    next_index += 1
+
+    def _execute_test_module(
+        self, module, results_dir: StrPath, gisdbase, location, timeout: float | None
+    ) -> tuple[dt.datetime, dict]:
+        """Execute one test file in a new mapset.
+
+        Does not use the reporter, so it can run in parallel with other files.
+
+        :returns: start time and arguments for the end_file_test() method
+            of the reporter
+        """
+        start_time = dt.datetime.now()
         cwd: str = os.path.join(results_dir, module.tested_dir, module.name)
+        ensure_dir(os.path.abspath(cwd))
         data_dir: str = os.path.join(module.file_dir, "data")
         if os.path.exists(data_dir):
-            # TODO: link dir instead of copy tree and remove link afterwads
-            # (removing is good because of testsuite dir in samplecode)
+            # Files are copied rather than linked, so that tests can modify
+            # them without changing the source data. Where the file system
+            # supports it, the copies share the data until they are modified.
             # TODO: use different dir name in samplecode and test if it works
             shutil.copytree(
                 data_dir,
                 os.path.join(cwd, "data"),
                 ignore=shutil.ignore_patterns("*.svn*"),
+                copy_function=copy_data_file,
             )
-        ensure_dir(os.path.abspath(cwd))
         # TODO: put this to constructor and copy here again
         env = os.environ.copy()
         mapset, mapset_dir = self._create_mapset(gisdbase, location, module)
@@ -172,7 +308,6 @@ class GrassTestFilesInvoker:
         stdout_path = os.path.join(cwd, "stdout.txt")
         stderr_path = os.path.join(cwd, "stderr.txt")
 
-        self.reporter.start_file_test(module)
         # TODO: we might clean the directory here before test if non-empty
 
         if module.file_type == "py":
@@ -262,15 +397,16 @@ class GrassTestFilesInvoker:
             module=module,
             returncode=returncode,
         )
-        self.reporter.end_file_test(
-            module=module,
-            cwd=cwd,
-            returncode=returncode,
-            stdout=stdout_path,
-            stderr=stderr_path,
-            test_summary=test_summary,
-            timed_out=timed_out,
-        )
+        result = {
+            "module": module,
+            "cwd": cwd,
+            "returncode": returncode,
+            "stdout": stdout_path,
+            "stderr": stderr_path,
+            "test_summary": test_summary,
+            "timed_out": timed_out,
+            "end_time": dt.datetime.now(),
+        }
         # TODO: add some try-except or with for better error handling
         os.remove(gisrc)
         # TODO: only if clean up
@@ -284,6 +420,7 @@ class GrassTestFilesInvoker:
                 # time ignore errors if something happens. (More file can appear
                 # later on if the processes are still running.)
                 shutil.rmtree(mapset_dir, ignore_errors=True)
+        return start_time, result
 
     def run_in_location(
         self, gisdbase, location, location_type, results_dir: StrPath, exclude
@@ -330,14 +467,23 @@ class GrassTestFilesInvoker:
         )
 
         self.reporter.start(results_dir)
-        for module in modules:
-            self._run_test_module(
-                module=module,
+        if self.jobs > 1:
+            self._run_test_modules_in_parallel(
+                modules=modules,
                 results_dir=results_dir,
                 gisdbase=gisdbase,
                 location=location,
                 timeout=self.timeout,
             )
+        else:
+            for module in modules:
+                self._run_test_module(
+                    module=module,
+                    results_dir=results_dir,
+                    gisdbase=gisdbase,
+                    location=location,
+                    timeout=self.timeout,
+                )
         self.reporter.finish()
 
         # TODO: move this to some (new?) reporter
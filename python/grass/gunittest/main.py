@@ -27,7 +27,7 @@ from .runner import (
     TextTestResult,
     _WritelnDecorator,
 )
-from .invoker import GrassTestFilesInvoker
+from .invoker import GrassTestFilesInvoker, read_test_durations
 from .utils import silent_rmtree
 from .reporters import FileAnonymizer
 
@@ -215,6 +215,18 @@ def main():
             " than this will result in a non-zero return code; values 0-100)"
         ),
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        dest="jobs",
+        action="store",
+        default=None,
+        type=int,
+        help=(
+            "Number of test files to run at the same time"
+            " (default: jobs from the configuration file or 1)"
+        ),
+    )
     parser.add_argument(
         "--config",
         dest="config",
@@ -240,6 +252,8 @@ def main():
             f" does not exist in GRASS Database <{gisdbase}>\n"
         )
     results_dir = args.output
+    # durations from the previous run determine order of parallel execution
+    durations = read_test_durations(results_dir)
     silent_rmtree(results_dir)  # TODO: too brute force?
 
     start_dir = "."
@@ -249,11 +263,16 @@ def main():
         config = get_config(start_directory=start_dir, config_file=args.config)
     except OSError as error:
         return f"Error reading configuration: {error}"
+    jobs = args.jobs if args.jobs is not None else config.getint("jobs", 1)
+    if jobs < 1:
+        return f"Number of jobs must be a positive integer, not {jobs}"
 
     invoker = GrassTestFilesInvoker(
         start_dir=start_dir,
         file_anonymizer=FileAnonymizer(paths_to_remove=[abs_start_dir]),
         timeout=config.getfloat("timeout", None),
+        jobs=jobs,
+        durations=durations,
     )
     # TODO: remove also results dir from files
     # as an enhancement
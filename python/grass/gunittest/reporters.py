@@ -356,10 +356,10 @@ class GrassTestFilesMultiReporter:
                 else:
                     raise
 
-    def start_file_test(self, module) -> None:
+    def start_file_test(self, module, start_time=None) -> None:
         for reporter in self.reporters:
             try:
-                reporter.start_file_test(module)
+                reporter.start_file_test(module, start_time=start_time)
             except AttributeError:
                 if self.forgiving:
                     pass
@@ -425,14 +425,19 @@ class GrassTestFilesCountingReporter:
             self.file_pass_per = None
             self.file_fail_per = None
 
-    def start_file_test(self, module) -> None:
-        self.file_start_time = datetime.datetime.now()
+    def start_file_test(self, module, start_time=None) -> None:
+        """Start test of one file
+
+        :param start_time: time when the test started if it was not just now,
+            e.g., when the test was running in parallel with other tests
+        """
+        self.file_start_time = start_time or datetime.datetime.now()
         self._start_file_test_called = True
         self.test_files += 1
 
-    def end_file_test(self, returncode, **kwargs) -> None:
+    def end_file_test(self, returncode, end_time=None, **kwargs) -> None:
         assert self._start_file_test_called
-        self.file_end_time = datetime.datetime.now()
+        self.file_end_time = end_time or datetime.datetime.now()
         self.file_time = self.file_end_time - self.file_start_time
         if returncode:
             self.files_fail += 1
@@ -648,12 +653,20 @@ class GrassTestFilesHtmlReporter(GrassTestFilesCountingReporter):
         )
         self.main_index.close()
 
-    def start_file_test(self, module):
-        super().start_file_test(module)
+    def start_file_test(self, module, start_time=None):
+        super().start_file_test(module, start_time=start_time)
         self.main_index.flush()  # to get previous lines to the report
 
     def end_file_test(
-        self, module, cwd, returncode, stdout, stderr, test_summary, timed_out=None
+        self,
+        module,
+        cwd,
+        returncode,
+        stdout,
+        stderr,
+        test_summary,
+        timed_out=None,
+        end_time=None,
     ):
         super().end_file_test(
             module=module,
@@ -662,6 +675,7 @@ class GrassTestFilesHtmlReporter(GrassTestFilesCountingReporter):
             stdout=stdout,
             stderr=stderr,
             timed_out=timed_out,
+            end_time=end_time,
         )
         # considering others according to total is OK when we more or less
         # know that input data make sense (total >= errors + failures)
@@ -854,6 +868,7 @@ class GrassTestFilesKeyValueReporter(GrassTestFilesCountingReporter):
         self.names = []
         self.tested_dirs = []
         self.files_returncodes = []
+        self.files_times = []
 
         # sets (no size specified)
         self.modules = set()
@@ -874,6 +889,10 @@ class GrassTestFilesKeyValueReporter(GrassTestFilesCountingReporter):
             "tested_dirs": self.tested_dirs,
             # TODO: we don't have a general mechanism for storing any type in text
             "files_returncodes": [str(item) for item in self.files_returncodes],
+            # duration of each file in seconds (used to order the next run)
+            "files_times": [
+                str(round(item.total_seconds(), 3)) for item in self.files_times
+            ],
             # let's use seconds as a universal time delta format
             # (there is no standard way how to store time delta as string)
             "time": self.main_time.total_seconds(),
@@ -900,7 +919,15 @@ class GrassTestFilesKeyValueReporter(GrassTestFilesCountingReporter):
         Path(summary_filename).write_text(text, encoding="utf-8")
 
     def end_file_test(
-        self, module, cwd, returncode, stdout, stderr, test_summary, timed_out=None
+        self,
+        module,
+        cwd,
+        returncode,
+        stdout,
+        stderr,
+        test_summary,
+        timed_out=None,
+        end_time=None,
     ):
         super().end_file_test(
             module=module,
@@ -909,6 +936,7 @@ class GrassTestFilesKeyValueReporter(GrassTestFilesCountingReporter):
             stdout=stdout,
             stderr=stderr,
             timed_out=timed_out,
+            end_time=end_time,
         )
         # TODO: considering others according to total, OK?
         # here we are using 0 for total but HTML reporter is using None
@@ -941,6 +969,7 @@ class GrassTestFilesKeyValueReporter(GrassTestFilesCountingReporter):
             self.total += total
 
         self.files_returncodes.append(returncode)
+        self.files_times.append(self.file_time)
 
         self.tested_dirs.append(module.tested_dir)
         self.names.append(module.name)
@@ -983,14 +1012,22 @@ class GrassTestFilesTextReporter(GrassTestFilesCountingReporter):
         )
         self._stream.write(summary_sentence)
 
-    def start_file_test(self, module):
-        super().start_file_test(module)
+    def start_file_test(self, module, start_time=None):
+        super().start_file_test(module, start_time=start_time)
         self._stream.write("Running {file}...\n".format(file=module.file_path))
         # get the above line and all previous ones to the report
         self._stream.flush()
 
     def end_file_test(
-        self, module, cwd, returncode, stdout, stderr, test_summary, timed_out=None
+        self,
+        module,
+        cwd,
+        returncode,
+        stdout,
+        stderr,
+        test_summary,
+        timed_out=None,
+        end_time=None,
     ):
         super().end_file_test(
             module=module,
@@ -999,6 +1036,7 @@ class GrassTestFilesTextReporter(GrassTestFilesCountingReporter):
             stdout=stdout,
             stderr=stderr,
             timed_out=timed_out,
+            end_time=end_time,
         )
 
         if returncode:
@@ -0,0 +1,173 @@
+"""
+Tests of running test files by the invoker
+
+(C) 2025 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import grass.script as gs
+
+from grass.gunittest.case import TestCase
+from grass.gunittest.main import test
+from grass.gunittest.checkers import text_to_keyvalue
+from grass.gunittest.invoker import (
+    GrassTestFilesInvoker,
+    copy_data_file,
+    read_test_durations,
+)
+from grass.gunittest.utils import silent_rmtree
+
+TEST_FILE = """\
+import os
+with open(os.path.join("data", "input.txt")) as file:
+    assert file.read() == "input"
+# writing to data directory must not change the source data
+with open(os.path.join("data", "output.txt"), "w") as file:
+    file.write("{name}")
+with open(os.path.join("data", "input.txt"), "w") as file:
+    file.write("{name}")
+raise SystemExit({returncode})
+"""
+
+
+class TestReadTestDurations(TestCase):
+    def setUp(self):
+        self.results_dir = tempfile.TemporaryDirectory()
+        self.filename = Path(self.results_dir.name) / "test_keyvalue_result.txt"
+
+    def tearDown(self):
+        self.results_dir.cleanup()
+
+    def test_durations(self):
+        """Durations are read for each tested directory and name"""
+        self.filename.write_text(
+            "names=test_a,test_b\n"
+            "tested_dirs=raster/r.a,raster/r.b\n"
+            "files_times=1.5,20\n"
+        )
+        self.assertEqual(
+            read_test_durations(self.results_dir.name),
+            {("raster/r.a", "test_a"): 1.5, ("raster/r.b", "test_b"): 20.0},
+        )
+
+    def test_one_file(self):
+        """Durations are read when there is only one file"""
+        self.filename.write_text(
+            "names=test_a\ntested_dirs=raster/r.a\nfiles_times=1.5\n"
+        )
+        self.assertEqual(
+            read_test_durations(self.results_dir.name),
+            {("raster/r.a", "test_a"): 1.5},
+        )
+
+    def test_no_times(self):
+        """Report without durations gives no durations"""
+        self.filename.write_text("names=test_a\ntested_dirs=raster/r.a\n")
+        self.assertEqual(read_test_durations(self.results_dir.name), {})
+
+    def test_no_report(self):
+        """Missing report gives no durations"""
+        self.assertEqual(read_test_durations(self.results_dir.name), {})
+
+
+class TestParallelInvoker(TestCase):
+    names = ["test_d", "test_c", "test_b", "test_a"]
+
+    # relative paths, so that results are not placed to the start directory
+    start_dir = "invoker_test_src"
+    results_dir = "invoker_test_results"
+
+    def setUp(self):
+        testsuite_dir = os.path.join(self.start_dir, "module", "testsuite")
+        self.data_dir = os.path.join(testsuite_dir, "data")
+        os.makedirs(self.data_dir)
+        Path(self.data_dir, "input.txt").write_text("input")
+        for name in self.names:
+            Path(testsuite_dir, f"{name}.py").write_text(
+                TEST_FILE.format(name=name, returncode=int(name == "test_c"))
+            )
+
+    def tearDown(self):
+        silent_rmtree(self.start_dir)
+        silent_rmtree(self.results_dir)
+
+    def run_tests(self, jobs, durations=None):
+        env = gs.gisenv()
+        invoker = GrassTestFilesInvoker(
+            start_dir=self.start_dir, jobs=jobs, durations=durations
+        )
+        return invoker.run_in_location(
+            gisdbase=env["GISDBASE"],
+            location=env["LOCATION_NAME"],
+            location_type="nc",
+            results_dir=self.results_dir,
+            exclude=[],
+        )
+
+    def test_parallel_report(self):
+        """Files are reported in the order of discovery"""
+        durations = {
+            (os.path.join(self.start_dir, "module"), name): index
+            for index, name in enumerate(self.names)
+        }
+        reporter = self.run_tests(jobs=3, durations=durations)
+        self.assertEqual(reporter.test_files, 4)
+        self.assertEqual(reporter.files_fail, 1)
+        summary = text_to_keyvalue(
+            Path(self.results_dir, "test_keyvalue_result.txt").read_text(), sep="="
+        )
+        self.assertEqual(summary["names"], sorted(self.names))
+        self.assertEqual(summary["files_returncodes"], [0, 0, 1, 0])
+        self.assertEqual(len(summary["files_times"]), 4)
+        self.assertEqual(
+            [path.name for path in Path(self.data_dir).iterdir()], ["input.txt"]
+        )
+        self.assertEqual(Path(self.data_dir, "input.txt").read_text(), "input")
+
+    def test_parallel_same_as_sequential(self):
+        """Parallel run gives the same summary as sequential run"""
+        ignored = ("files_times", "time", "timestamp")
+        self.run_tests(jobs=1)
+        filename = Path(self.results_dir, "test_keyvalue_result.txt")
+        sequential = text_to_keyvalue(filename.read_text(), sep="=")
+        durations = read_test_durations(self.results_dir)
+        self.assertEqual(len(durations), 4)
+        silent_rmtree(self.results_dir)
+        self.run_tests(jobs=4, durations=durations)
+        parallel = text_to_keyvalue(filename.read_text(), sep="=")
+        for key in ignored:
+            del sequential[key]
+            del parallel[key]
+        self.assertEqual(parallel, sequential)
+
+
+class TestCopyDataFile(TestCase):
+    def test_overwrite_copy(self):
+        """Overwriting the copy keeps the source unchanged"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src = Path(tmp_dir, "src.txt")
+            dst = Path(tmp_dir, "dst.txt")
+            src.write_text("data" * 1000)
+            copy_data_file(str(src), str(dst))
+            self.assertEqual(dst.read_text(), "data" * 1000)
+            dst.write_text("changed")
+            self.assertEqual(src.read_text(), "data" * 1000)
+
+    def test_empty_file(self):
+        """Empty file is copied"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src = Path(tmp_dir, "src.txt")
+            dst = Path(tmp_dir, "dst.txt")
+            src.write_text("")
+            copy_data_file(str(src), str(dst))
+            self.assertEqual(dst.read_text(), "")
+
+
+if __name__ == "__main__":
+    test()
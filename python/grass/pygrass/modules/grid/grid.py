@@ -1,7 +1,6 @@
 import contextlib
 import os
 import sys
-import multiprocessing as mltp
 import subprocess as sub
 import shutil as sht
 from math import ceil
@@ -18,7 +17,13 @@ from grass.pygrass.modules.grid.split import (
     split_region_tiles,
     split_region_in_overlapping_tiles,
 )
-from grass.pygrass.modules.grid.patch import rpatch_map, rpatch_map_r_patch_backend
+from grass.pygrass.modules.grid.patch import (
+    NumpyPatcher,
+    rpatch_map,
+    rpatch_map_numpy,
+    rpatch_map_r_patch_backend,
+)
+from grass.pygrass.modules.grid.schedule import TileScheduler, tile_cells
 
 
 def select(parms, ptype):
@@ -408,8 +413,14 @@ class GridModule:
     :type split: bool
     :param mapset_prefix: if specified created mapsets start with this prefix
     :type mapset_prefix: str
-    :param patch_backend: "r.patch", "RasterRow", or None for for default
+    :param patch_backend: "r.patch", "RasterRow", "numpy", or None for for default
     :type patch_backend: None or str
+    :param blend: feather the overlapping cells of tiles instead of trimming
+                  them, only with the "numpy" patch_backend
+    :type blend: bool
+    :param memory: maximum memory in MB estimated for tiles computed at
+                   the same time, None for no limit
+    :type memory: int
     :param run\\_: if False only instantiate the object
     :type run\\_: bool
     :param args: give all the parameters to the command
@@ -418,6 +429,13 @@ class GridModule:
     When patch_backend is None, the RasterRow method is used for patching the result.
     When patch_backend is "r.patch", r.patch is used with nprocs=processes.
     r.patch can only be used when overlap is 0.
+    When patch_backend is "numpy", whole tiles are copied with NumPy and every
+    row of tiles is patched as soon as its tiles are computed.
+
+    Tiles are computed starting from the largest ones. The memory of a tile
+    is estimated from its number of cells and the number of raster inputs
+    and outputs, with *memory* set, tiles are started only while the sum
+    of the estimates of running tiles stays below the limit.
 
     >>> grd = GridModule(
     ...     "r.slope.aspect",
@@ -456,6 +474,8 @@ class GridModule:
         out_prefix="",
         mapset_prefix=None,
         patch_backend=None,
+        blend=False,
+        memory=None,
         *args,
         **kargs,
     ):
@@ -476,9 +496,9 @@ class GridModule:
         # if overlap > 0, r.patch won't work properly
         if not patch_backend:
             self.patch_backend = "RasterRow"
-        elif patch_backend not in {"r.patch", "RasterRow"}:
+        elif patch_backend not in {"r.patch", "RasterRow", "numpy"}:
             raise RuntimeError(
-                _("Parameter patch_backend must be 'r.patch' or 'RasterRow'")
+                _("Parameter patch_backend must be 'r.patch', 'RasterRow' or 'numpy'")
             )
         elif patch_backend == "r.patch" and self.overlap:
             raise RuntimeError(
@@ -486,6 +506,10 @@ class GridModule:
             )
         else:
             self.patch_backend = patch_backend
+        if blend and self.patch_backend != "numpy":
+            raise RuntimeError(_("Blending of tiles requires patch_backend 'numpy'"))
+        self.blend = blend
+        self.memory = memory
         self.gisrc_src = os.environ["GISRC"]
         self.n_mset, self.gisrc_dst = None, None
         self.estimate_tile_size()
@@ -622,6 +646,54 @@ class GridModule:
                 )
         return works
 
+    def estimate_works(self):
+        """Return the estimated cost and memory in MB of every work
+        in the order of get_works"""
+        reg = Region()
+        rasters = list(select(self.module.inputs, "raster")) + list(
+            select(self.module.outputs, "raster")
+        )
+        costs = [tile_cells(box, reg) for box_row in self.bboxes for box in box_row]
+        # cells of double precision values in every raster map
+        memories = [cells * 8 * max(len(rasters), 1) / 1e6 for cells in costs]
+        return costs, memories
+
+    def run_works(self, works):
+        """Compute the tiles and yield the row and column of every finished tile
+
+        :param works: a list of parameters for cmd_exe function
+        :type works: list
+        """
+        ncols = len(self.bboxes[0])
+        if self.debug:
+            for index, wrk in enumerate(works):
+                cmd_exe(wrk)
+                yield divmod(index, ncols)
+        else:
+            costs, memories = self.estimate_works()
+            scheduler = TileScheduler(processes=self.processes, memory=self.memory)
+            for index in scheduler.run(cmd_exe, works, costs, memories):
+                yield divmod(index, ncols)
+
+    def numpy_patchers(self):
+        """Return a NumpyPatcher for every raster output"""
+        bboxes = split_region_tiles(width=self.width, height=self.height)
+        return [
+            NumpyPatcher(
+                raster=otm.value,
+                mset_str=self.msetstr,
+                bbox_list=bboxes,
+                overlap=self.overlap,
+                blend=self.blend,
+                overwrite=self.module.flags.overwrite,
+                start_row=self.start_row,
+                start_col=self.start_col,
+                prefix=self.out_prefix,
+            )
+            for otm in (self.module.outputs[key] for key in self.module.outputs)
+            if otm.typedesc == "raster" and otm.value
+        ]
+
     def define_mapset_inputs(self):
         """Add the mapset information to the input maps"""
         for inmap in self.module.inputs:
@@ -653,20 +725,24 @@ class GridModule:
         self.module.flags.overwrite = True
         self.define_mapset_inputs()
 
-        if self.debug:
-            for wrk in self.get_works():
-                cmd_exe(wrk)
-        else:
-            pool = mltp.Pool(processes=self.processes)
-            result = pool.map_async(cmd_exe, self.get_works())
-            result.wait()
-            pool.close()
-            pool.join()
-            if not result.successful():
-                raise RuntimeError(_("Execution of subprocesses was not successful"))
+        # tiles are patched while other tiles are computed
+        patchers = []
+        if patch and self.patch_backend == "numpy" and not self.move:
+            patchers = self.numpy_patchers()
+        try:
+            for row, col in self.run_works(self.get_works()):
+                for patcher in patchers:
+                    patcher.add(row, col)
+        except BaseException:
+            for patcher in patchers:
+                patcher.abort()
+            raise
 
         if patch:
-            if self.move:
+            if patchers:
+                for patcher in patchers:
+                    patcher.finish()
+            elif self.move:
                 os.environ["GISRC"] = self.gisrc_dst
                 self.n_mset.current()
                 self.patch()
@@ -715,7 +791,19 @@ class GridModule:
         for otmap in self.module.outputs:
             otm = self.module.outputs[otmap]
             if otm.typedesc == "raster" and otm.value:
-                if self.patch_backend == "RasterRow":
+                if self.patch_backend == "numpy":
+                    rpatch_map_numpy(
+                        raster=otm.value,
+                        mset_str=self.msetstr,
+                        bbox_list=bboxes,
+                        overwrite=self.module.flags.overwrite,
+                        start_row=self.start_row,
+                        start_col=self.start_col,
+                        prefix=self.out_prefix,
+                        overlap=self.overlap,
+                        blend=self.blend,
+                    )
+                elif self.patch_backend == "RasterRow":
                     rpatch_map(
                         raster=otm.value,
                         mapset=self.mset.name,
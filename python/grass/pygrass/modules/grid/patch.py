@@ -4,11 +4,26 @@ Created on Tue Apr  2 18:57:42 2013
 @author: pietro
 """
 
+import ctypes
+
+import numpy as np
+
+import grass.lib.gis as libgis
+import grass.lib.raster as libraster
 from grass.pygrass.gis.region import Region
 from grass.pygrass.raster import RasterRow
 from grass.pygrass.utils import coor2pixel
 from grass.pygrass.modules import Module
 
+# NumPy types of the raster map types
+_DTYPES = {
+    libraster.CELL_TYPE: np.dtype(np.int32),
+    libraster.FCELL_TYPE: np.dtype(np.float32),
+    libraster.DCELL_TYPE: np.dtype(np.float64),
+}
+# Value of null in CELL maps (smallest 32-bit integer)
+_CELL_NULL = np.iinfo(np.int32).min
+
 
 def get_start_end_index(bbox_list):
     """Convert a Bounding Box to a list of the index of
@@ -147,3 +162,324 @@ def rpatch_map_r_patch_backend(
         overwrite=overwrite,
         nprocs=processes,
     )
+
+
+def get_window(region, start_row, end_row, start_col, end_col):
+    """Return a window covering rows and columns of a region.
+
+    :param region: the region which is split
+    :type region: Region object
+    :param start_row: the first row
+    :type start_row: int
+    :param end_row: the row after the last row
+    :type end_row: int
+    :param start_col: the first column
+    :type start_col: int
+    :param end_col: the column after the last column
+    :type end_col: int
+    :returns: a Cell_head structure
+    """
+    window = libgis.Cell_head.from_buffer_copy(region.c_region)
+    window.north = region.north - start_row * region.nsres
+    window.south = region.north - end_row * region.nsres
+    window.west = region.west + start_col * region.ewres
+    window.east = region.west + end_col * region.ewres
+    window.rows = end_row - start_row
+    window.cols = end_col - start_col
+    libgis.G_adjust_Cell_head(ctypes.byref(window), 1, 1)
+    return window
+
+
+def _null_mask(array):
+    """Return a boolean array which is True for null cells"""
+    if array.dtype.kind == "f":
+        return np.isnan(array)
+    return array == _CELL_NULL
+
+
+def feather_weights(size, start, end, overlap, core_start, core_end):
+    """Return weights which decrease linearly in the overlap of a tile.
+
+    Weights of overlapping tiles sum up to one in the overlap. The weight
+    is one out of the overlap and on the sides which have no neighbor.
+
+    :param size: the number of cells of the region along the axis
+    :param start: the first cell read from the tile
+    :param end: the cell after the last cell read from the tile
+    :param overlap: the overlap between tiles
+    :param core_start: the first cell of the tile without overlap
+    :param core_end: the cell after the last cell of the tile without overlap
+
+    >>> feather_weights(10, 2, 8, 2, 4, 6)
+    array([0.125, 0.375, 0.625, 0.625, 0.375, 0.125])
+    """
+    cells = np.arange(start, end)
+    weights = np.ones(len(cells))
+    if overlap > 0:
+        if core_start > 0:
+            first = max(core_start - overlap, 0)
+            weights = np.minimum(weights, (cells - first + 0.5) / (2 * overlap))
+        if core_end < size:
+            last = min(core_end + overlap, size) - 1
+            weights = np.minimum(weights, (last - cells + 0.5) / (2 * overlap))
+    return np.clip(weights, 0, 1)
+
+
+class NumpyPatcher:
+    """Patch tiles into a raster map copying whole blocks with NumPy.
+
+    Every tile is read only in its own window and copied into an array
+    covering a band of tiles, i.e., a row of the tile grid. A band is
+    written as soon as all the tiles needed for it are added, so the
+    patching can run while other tiles are computed.
+
+    The overlap of tiles is trimmed, or with *blend*, the overlapping
+    cells are feathered: they are the weighted mean of the tiles where
+    the weight decreases linearly towards the tile edge.
+
+    :param raster: the name of the raster computed in every tile
+    :type raster: str
+    :param mset_str: the pattern of mapset names of the tiles
+    :type mset_str: str
+    :param bbox_list: the tiles as returned by split_region_tiles
+    :type bbox_list: list of lists of tuples
+    :param overlap: overlap between tiles, in pixel
+    :type overlap: int
+    :param blend: feather the overlapping cells instead of trimming them
+    :type blend: bool
+    :param region: the region of the output raster
+    :type region: Region object
+    :param overwrite: overwrite existing raster
+    :type overwrite: bool
+    :param start_row: the starting row of original raster
+    :type start_row: int
+    :param start_col: the starting column of original raster
+    :type start_col: int
+    :param prefix: the prefix of output raster
+    :type prefix: str
+    """
+
+    def __init__(
+        self,
+        raster,
+        mset_str,
+        bbox_list,
+        overlap=0,
+        blend=False,
+        region=None,
+        overwrite=False,
+        start_row=0,
+        start_col=0,
+        prefix="",
+    ):
+        self.raster = raster
+        self.mset_str = mset_str
+        self.bbox_list = bbox_list
+        self.overlap = overlap
+        self.blend = blend and overlap > 0
+        self.region = region or Region()
+        self.overwrite = overwrite
+        self.start_row = start_row
+        self.start_col = start_col
+        self.output = prefix + raster
+        self.done = [[False] * len(row) for row in bbox_list]
+        # number of neighboring bands reached by the overlap of tiles
+        self.reach = 0
+        if self.blend:
+            height = bbox_list[0][0][1] - bbox_list[0][0][0] + 1
+            self.reach = -(-overlap // height)
+        self.next_band = 0
+        self.mtype = None
+        self._fd = None
+
+    def _mapset(self, row, col):
+        return self.mset_str % (self.start_row + row, self.start_col + col)
+
+    def _read(self, row, col, start_row, end_row, start_col, end_col):
+        """Read a window of the raster computed in a tile"""
+        window = get_window(self.region, start_row, end_row, start_col, end_col)
+        libraster.Rast_set_input_window(ctypes.byref(window))
+        array = np.empty((end_row - start_row, end_col - start_col), self._dtype)
+        fd = libraster.Rast_open_old(self.raster, self._mapset(row, col))
+        try:
+            for irow in range(array.shape[0]):
+                libraster.Rast_get_row(
+                    fd, array[irow].ctypes.data_as(ctypes.c_void_p), irow, self.mtype
+                )
+        finally:
+            libraster.Rast_close(fd)
+        return array
+
+    def _open(self):
+        if not self.overwrite and libgis.G_find_raster2(self.output, libgis.G_mapset()):
+            msg = "Raster map <{0}> already exists and will be not overwritten"
+            raise RuntimeError(msg.format(self.output))
+        self.mtype = libraster.Rast_map_type(self.raster, self._mapset(0, 0))
+        self._dtype = _DTYPES[self.mtype]
+        libraster.Rast_set_output_window(self.region.byref())
+        self._fd = libraster.Rast_open_new(self.output, self.mtype)
+
+    def _band_ready(self, band):
+        """Return True if all the tiles needed to write the band are done"""
+        return all(all(self.done[row]) for row in self._bands(band))
+
+    def _bands(self, band):
+        """Return the bands with tiles overlapping the band"""
+        return range(
+            max(band - self.reach, 0), min(band + self.reach + 1, len(self.bbox_list))
+        )
+
+    def _trimmed_band(self, band):
+        """Return the band array copying the tiles without their overlap"""
+        start_row, end_row = self.bbox_list[band][0][:2]
+        array = np.empty((end_row - start_row + 1, self.region.cols), self._dtype)
+        for col, (r_start, r_end, c_start, c_end) in enumerate(self.bbox_list[band]):
+            array[:, c_start : c_end + 1] = self._read(
+                band, col, r_start, r_end + 1, c_start, c_end + 1
+            )
+        return array
+
+    def _blended_band(self, band):
+        """Return the band array as weighted mean of the overlapping tiles"""
+        start_row, end_row = self.bbox_list[band][0][:2]
+        end_row += 1
+        shape = (end_row - start_row, self.region.cols)
+        values = np.zeros(shape)
+        weights = np.zeros(shape)
+        rows, cols = self.region.rows, self.region.cols
+        for row in self._bands(band):
+            for col, (r_start, r_end, c_start, c_end) in enumerate(self.bbox_list[row]):
+                # intersection of the band with the tile including the overlap
+                top = max(r_start - self.overlap, start_row)
+                bottom = min(r_end + 1 + self.overlap, end_row, rows)
+                left = max(c_start - self.overlap, 0)
+                right = min(c_end + 1 + self.overlap, cols)
+                if top >= bottom:
+                    continue
+                tile = self._read(row, col, top, bottom, left, right)
+                weight = np.outer(
+                    feather_weights(
+                        rows, top, bottom, self.overlap, r_start, r_end + 1
+                    ),
+                    feather_weights(
+                        cols, left, right, self.overlap, c_start, c_end + 1
+                    ),
+                )
+                weight[_null_mask(tile)] = 0
+                window = np.s_[top - start_row : bottom - start_row, left:right]
+                values[window] += np.where(weight > 0, tile, 0) * weight
+                weights[window] += weight
+        nulls = weights == 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values /= weights
+        if self._dtype.kind != "f":
+            values = np.rint(values)
+        array = np.where(nulls, 0, values).astype(self._dtype)
+        # set the bit pattern of nulls
+        if self.mtype == libraster.CELL_TYPE:
+            array[nulls] = _CELL_NULL
+        elif self.mtype == libraster.FCELL_TYPE:
+            array.view(np.uint32)[nulls] = 0xFFFFFFFF
+        else:
+            array.view(np.uint64)[nulls] = 0xFFFFFFFFFFFFFFFF
+        return array
+
+    def _write_bands(self):
+        """Write all the bands which are ready"""
+        while self.next_band < len(self.bbox_list) and self._band_ready(self.next_band):
+            if self._fd is None:
+                self._open()
+            if self.blend:
+                array = self._blended_band(self.next_band)
+            else:
+                array = self._trimmed_band(self.next_band)
+            for row in array:
+                libraster.Rast_put_row(
+                    self._fd, row.ctypes.data_as(ctypes.c_void_p), self.mtype
+                )
+            self.next_band += 1
+
+    def add(self, row, col):
+        """Add a computed tile and write the bands which are ready
+
+        :param row: the row of the tile in the tile grid
+        :type row: int
+        :param col: the column of the tile in the tile grid
+        :type col: int
+        """
+        self.done[row][col] = True
+        self._write_bands()
+
+    def add_all(self):
+        """Add all tiles"""
+        for row, tiles in enumerate(self.done):
+            for col in range(len(tiles)):
+                tiles[col] = True
+        self._write_bands()
+
+    def finish(self):
+        """Close the output raster, all tiles must be added"""
+        if self.next_band < len(self.bbox_list):
+            self.abort()
+            msg = "Raster map <{0}> is incomplete, not all tiles were added"
+            raise RuntimeError(msg.format(self.output))
+        libraster.Rast_close(self._fd)
+        self._fd = None
+        libraster.Rast_unset_window()
+        history = libraster.History()
+        libraster.Rast_short_history(self.output, "raster", ctypes.byref(history))
+        libraster.Rast_write_history(self.output, ctypes.byref(history))
+
+    def abort(self):
+        """Discard the output raster"""
+        if self._fd is not None:
+            libraster.Rast_unopen(self._fd)
+            self._fd = None
+        libraster.Rast_unset_window()
+
+
+def rpatch_map_numpy(
+    raster,
+    mset_str,
+    bbox_list,
+    overwrite=False,
+    start_row=0,
+    start_col=0,
+    prefix="",
+    overlap=0,
+    blend=False,
+):
+    """Patch raster copying whole tiles with NumPy, see NumpyPatcher.
+
+    :param raster: the name of output raster
+    :type raster: str
+    :param mset_str:
+    :type mset_str: str
+    :param bbox_list: the tiles as returned by split_region_tiles
+    :type bbox_list: list of lists of tuples
+    :param overwrite: overwrite existing raster
+    :type overwrite: bool
+    :param start_row: the starting row of original raster
+    :type start_row: int
+    :param start_col: the starting column of original raster
+    :type start_col: int
+    :param prefix: the prefix of output raster
+    :type prefix: str
+    :param overlap: overlap between tiles, in pixel
+    :type overlap: int
+    :param blend: feather the overlapping cells instead of trimming them
+    :type blend: bool
+    """
+    patcher = NumpyPatcher(
+        raster,
+        mset_str,
+        bbox_list,
+        overlap=overlap,
+        blend=blend,
+        overwrite=overwrite,
+        start_row=start_row,
+        start_col=start_col,
+        prefix=prefix,
+    )
+    patcher.add_all()
+    patcher.finish()
@@ -0,0 +1,119 @@
+"""
+Scheduling of the tiles computed by GridModule
+
+(C) 2025 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+import multiprocessing as mltp
+import queue
+
+
+def tile_cells(bbox, region):
+    """Return the number of cells of a tile.
+
+    :param bbox: the bounding box of the tile
+    :type bbox: Bbox object
+    :param region: the region with the resolution
+    :type region: Region object
+
+    >>> from grass.pygrass.vector.basic import Bbox
+    >>> from collections import namedtuple
+    >>> Res = namedtuple("Res", "nsres ewres")
+    >>> tile_cells(Bbox(north=10, south=0, east=20, west=0), Res(1, 2))
+    100
+    """
+    rows = round((bbox.north - bbox.south) / region.nsres)
+    cols = round((bbox.east - bbox.west) / region.ewres)
+    return rows * cols
+
+
+class TileScheduler:
+    """Run works in a pool of processes, the most expensive works first,
+    limiting the memory used by works running at the same time.
+
+    Starting the most expensive tiles first avoids a long tile running
+    alone at the end. When the estimated memory of the next work would
+    exceed the limit, a smaller work which fits is started instead, and
+    if there is none, the scheduler waits until a running work finishes.
+    At least one work is always running.
+
+    :param processes: number of processes, None for the number of CPUs
+    :type processes: int
+    :param memory: maximum memory of works running at the same time
+                   in MB, None for no limit
+    :type memory: int
+
+    >>> scheduler = TileScheduler(processes=2, memory=100)
+    >>> scheduler.order([1, 3, 2, 3])
+    [1, 3, 2, 0]
+    """
+
+    def __init__(self, processes=None, memory=None):
+        self.processes = processes or mltp.cpu_count()
+        self.memory = memory
+
+    def order(self, costs):
+        """Return indices of works sorted by decreasing cost.
+
+        Works with the same cost keep their order.
+        """
+        return sorted(range(len(costs)), key=lambda index: -costs[index])
+
+    def _fits(self, used, memory, running):
+        return not running or self.memory is None or used + memory <= self.memory
+
+    def run(self, function, works, costs=None, memories=None):
+        """Run function for every work and yield indices of finished works.
+
+        :param function: function to run, it must be picklable
+        :param works: list of arguments of the function
+        :param costs: estimated cost of every work
+        :param memories: estimated memory of every work in MB
+        :returns: generator of indices of works in the order they finish
+        """
+        costs = costs or [1] * len(works)
+        memories = memories or [0] * len(works)
+        pending = self.order(costs)
+        finished = queue.Queue()
+        running = set()
+        used = 0
+
+        pool = mltp.Pool(processes=self.processes)
+        try:
+            while pending or running:
+                for index in list(pending):
+                    if len(running) >= self.processes:
+                        break
+                    if not self._fits(used, memories[index], running):
+                        continue
+                    pending.remove(index)
+                    running.add(index)
+                    used += memories[index]
+                    pool.apply_async(
+                        function,
+                        (works[index],),
+                        callback=lambda _result, index=index: finished.put(
+                            (index, None)
+                        ),
+                        error_callback=lambda error, index=index: finished.put(
+                            (index, error)
+                        ),
+                    )
+                index, error = finished.get()
+                running.remove(index)
+                used -= memories[index]
+                if error is not None:
+                    raise RuntimeError(
+                        _("Execution of subprocesses was not successful")
+                    ) from error
+                yield index
+        except BaseException:
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
@@ -1,9 +1,16 @@
+from collections import deque
+from copy import copy
+import heapq
 from multiprocessing import cpu_count, Process, Queue
+import queue
+from threading import Thread
 import time
+from typing import NamedTuple
 from xml.etree.ElementTree import fromstring
 
 from grass.exceptions import CalledModuleError, GrassError, ParameterError
 from grass.script.core import Popen, PIPE, use_temp_region, del_temp_region
+from grass.script.interface_cache import get_interface_cache
 from grass.script.utils import decode
 from .docstring import docstring_property
 from .parameter import Parameter
@@ -19,19 +26,61 @@ def _get_bash(self, *args, **kargs):
     return self.get_bash()
 
 
+class _Interface(NamedTuple):
+    """Parsed interface description shared by modules of the same executable"""
+
+    xml: bytes
+    attributes: dict
+    params: list
+    flags: list
+
+
+def _fetch_interface_description(cmd):
+    """Get the XML interface description by running the module"""
+    try:
+        # call the command with --interface-description
+        get_cmd_xml = Popen([cmd, "--interface-description"], stdout=PIPE)
+    except OSError as e:
+        print("OSError error({0}): {1}".format(e.errno, e.strerror))
+        str_err = "Error running: `%s --interface-description`."
+        raise GrassError(str_err % cmd) from e
+    # get the xml of the module
+    return get_cmd_xml.communicate()[0]
+
+
+def _parse_interface(xml):
+    """Parse the XML interface description into parameters and flags"""
+    # transform and parse the xml into an Element class:
+    # https://docs.python.org/library/xml.etree.elementtree.html
+    tree = fromstring(xml)
+    attributes = {
+        e.tag: GETFROMTAG[e.tag](e) for e in tree if e.tag not in {"parameter", "flag"}
+    }
+    return _Interface(
+        xml=xml,
+        attributes=attributes,
+        params=[Parameter(p) for p in tree.findall("parameter")],
+        flags=[Flag(f) for f in tree.findall("flag")],
+    )
+
+
 class ParallelModuleQueue:
     """This class is designed to run an arbitrary number of pygrass Module or
     MultiModule processes in parallel.
 
     Objects of type :py:class:`grass.pygrass.modules.Module` or
     :py:class:`grass.pygrass.modules.MultiModule` can be put into the
-    queue using :py:meth:`put` method. When the queue is full with the maximum
-    number of parallel processes it will wait for all processes to finish,
-    sets the stdout and stderr of the Module object and removes it
-    from the queue when its finished.
+    queue using :py:meth:`put` method. The queue keeps up to the maximum
+    number of parallel processes running: as soon as any process finishes,
+    the stdout and stderr of the Module object are set, it is removed
+    from the queue and its slot is used for the next process.
+    When all slots are occupied, :py:meth:`put` waits for the first process
+    to finish.
+
+    Optionally, modules can be held in a pending list (see *max_pending*)
+    and started in the order of their priority.
 
-    To finish the queue before the maximum number of parallel
-    processes was reached, call :py:meth:`wait`.
+    To wait for all the processes in the queue to finish, call :py:meth:`wait`.
 
     This class will raise a GrassError in case a Module process exits
     with a return code other than 0.
@@ -144,26 +193,18 @@ class ParallelModuleQueue:
         >>> mapcalc_list.append(new_mapcalc)
         >>> m = new_mapcalc(expression="test_pygrass_1 =1")
         >>> queue.put(m)
-        >>> queue.get_num_run_procs()
-        1
         >>> new_mapcalc = copy.deepcopy(mapcalc)
         >>> mapcalc_list.append(new_mapcalc)
         >>> m = new_mapcalc(expression="test_pygrass_2 =2")
         >>> queue.put(m)
-        >>> queue.get_num_run_procs()
-        2
         >>> new_mapcalc = copy.deepcopy(mapcalc)
         >>> mapcalc_list.append(new_mapcalc)
         >>> m = new_mapcalc(expression="test_pygrass_3 =3")
         >>> queue.put(m)
-        >>> queue.get_num_run_procs()
-        3
         >>> new_mapcalc = copy.deepcopy(mapcalc)
         >>> mapcalc_list.append(new_mapcalc)
         >>> m = new_mapcalc(expression="test_pygrass_4 =4")
         >>> queue.put(m)
-        >>> queue.get_num_run_procs()
-        4
         >>> queue.wait()
         >>> mapcalc_list = queue.get_finished_modules()
         >>> queue.get_num_run_procs()
@@ -187,28 +228,20 @@ class ParallelModuleQueue:
         >>> mapcalc_list.append(new_mapcalc)
         >>> m = new_mapcalc(expression="test_pygrass_1 =1")
         >>> queue.put(m)
-        >>> queue.get_num_run_procs()
-        1
         >>> new_mapcalc = copy.deepcopy(mapcalc)
         >>> mapcalc_list.append(new_mapcalc)
         >>> m = new_mapcalc(expression="test_pygrass_2 =2")
         >>> queue.put(m)
-        >>> queue.get_num_run_procs()
-        2
         >>> new_mapcalc = copy.deepcopy(mapcalc)
         >>> mapcalc_list.append(new_mapcalc)
         >>> m = new_mapcalc(expression="test_pygrass_3 =3")
-        >>> queue.put(
-        ...     m
-        ... )  # Now it will wait until all procs finish and set the counter back to 0
-        >>> queue.get_num_run_procs()
-        0
+        >>> queue.put(m)
         >>> new_mapcalc = copy.deepcopy(mapcalc)
         >>> mapcalc_list.append(new_mapcalc)
         >>> m = new_mapcalc(expression="test_pygrass_%i = %i" % (i, i))
-        >>> queue.put(m)
-        >>> queue.get_num_run_procs()
-        1
+        >>> queue.put(m)  # Now it will wait until one of the procs finishes
+        >>> queue.get_num_run_procs() <= queue.get_max_num_procs()
+        True
         >>> queue.wait()
         >>> mapcalc_list = queue.get_finished_modules()
         >>> queue.get_num_run_procs()
@@ -224,21 +257,36 @@ class ParallelModuleQueue:
 
     """  # noqa: E501
 
-    def __init__(self, nprocs=1):
+    def __init__(self, nprocs=1, max_pending=0, max_finished=None):
         """Constructor
 
         :param nprocs: The maximum number of Module processes that
                        can be run in parallel, default is 1, if None
                        then use all the available CPUs.
         :type nprocs: int
+        :param max_pending: The maximum number of modules which are held
+                            by the queue before they are started,
+                            :py:meth:`put` waits for a free slot when the limit
+                            is reached. Modules waiting to be started are run
+                            in the order of their priority.
+        :type max_pending: int
+        :param max_finished: The maximum number of finished modules kept
+                             for :py:meth:`get_finished_modules`, if None,
+                             all finished modules are kept.
+        :type max_finished: int
         """
         nprocs = int(nprocs) if nprocs else cpu_count()
         self._num_procs = nprocs
         self._list = nprocs * [None]
         self._proc_count = 0
-        self._finished_modules = []  # Store all processed modules in a list
-
-    def put(self, module):
+        self._max_pending = int(max_pending)
+        self._pending = []  # Heap of modules waiting for a free slot
+        self._pending_count = 0  # Keeps order of modules with the same priority
+        self._done = queue.Queue()  # Slots of modules which finished
+        # Store all processed modules
+        self._finished_modules = deque(maxlen=max_finished)
+
+    def put(self, module, priority=0):
         r"""Put the next Module or MultiModule object in the queue
 
         To run the Module objects in parallel the ``run_`` and ``finish_`` options
@@ -247,16 +295,60 @@ class ParallelModuleQueue:
         :param module: a preconfigured Module or MultiModule object that were configured
                        with ``run_`` and ``finish_`` set to False,
         :type module: Module or MultiModule object
+        :param priority: modules with higher priority are started first
+                         when there are modules waiting for a free slot
+        :type priority: int
         """
-        self._list[self._proc_count] = module
-        # Force that finish is False, otherwise the execution
-        # will not be parallel
-        self._list[self._proc_count].finish_ = False
-        self._list[self._proc_count].run()
-        self._proc_count += 1
-
-        if self._proc_count == self._num_procs:
-            self.wait()
+        heapq.heappush(self._pending, (-priority, self._pending_count, module))
+        self._pending_count += 1
+        self._start_pending()
+        while len(self._pending) > self._max_pending:
+            self._collect(block=True)
+            self._start_pending()
+
+    def _start_pending(self):
+        """Collect finished processes and start pending modules in free slots"""
+        self._collect(block=False)
+        while self._pending and self._proc_count < self._num_procs:
+            module = heapq.heappop(self._pending)[2]
+            slot = self._list.index(None)
+            self._list[slot] = module
+            # Force that finish is False, otherwise the execution
+            # will not be parallel
+            module.finish_ = False
+            module.run()
+            self._proc_count += 1
+            Thread(target=self._wait_for, args=(slot, module), daemon=True).start()
+
+    def _wait_for(self, slot, module):
+        """Wait for the module in a background thread and report the slot"""
+        try:
+            result = module.wait()
+        except Exception as error:  # noqa: BLE001
+            # The error is raised in the thread which collects the module.
+            self._done.put((slot, None, error))
+        else:
+            self._done.put((slot, result, None))
+
+    def _collect(self, block):
+        """Remove finished processes from their slots
+
+        :param block: wait for at least one process to finish
+        """
+        while self._proc_count:
+            try:
+                slot, result, error = self._done.get(block=block)
+            except queue.Empty:
+                return
+            block = False
+            self._list[slot] = None
+            self._proc_count -= 1
+            if error is not None:
+                raise error
+            if isinstance(result, Module):
+                self._finished_modules.append(result)
+            else:
+                self._finished_modules.extend(result)
 
     def get(self, num):
         """Get a Module object or list of Module objects from the queue
@@ -272,9 +364,8 @@ class ParallelModuleQueue:
 
     def get_num_run_procs(self):
         """Get the number of Module processes that are in the queue running
-        or finished
 
-        :returns: the number of Module processes running/finished in the queue
+        :returns: the number of Module processes running in the queue
         """
         return self._proc_count
 
@@ -293,35 +384,28 @@ class ParallelModuleQueue:
                        run in parallel
         :type nprocs: int
         """
-        self._num_procs = int(nprocs)
         self.wait()
+        self._num_procs = int(nprocs)
+        self._list = self._num_procs * [None]
 
     def get_finished_modules(self):
         """Return all finished processes that were run by this queue
 
+        When the queue was created with *max_finished*, only the most
+        recently finished modules are returned.
+
         :return: A list of Module objects
         """
-        return self._finished_modules
+        return list(self._finished_modules)
 
     def wait(self):
-        """Wait for all Module processes that are in the list to finish
+        """Wait for all Module processes that are in the queue to finish
         and set the modules stdout and stderr output options
-
-        :return: A list of modules that were run
         """
-        for proc in self._list:
-            if proc:
-                if isinstance(proc, Module):
-                    self._finished_modules.extend(
-                        [
-                            proc.wait(),
-                        ]
-                    )
-                else:
-                    self._finished_modules.extend(proc.wait())
-
-        self._list = self._num_procs * [None]
-        self._proc_count = 0
+        self._start_pending()
+        while self._proc_count:
+            self._collect(block=True)
+            self._start_pending()
 
 
 class Module:
@@ -561,27 +645,19 @@ class Module:
             msg = "Problem initializing the module {s}".format(s=cmd)
             raise GrassError(msg)
         self.name = cmd
-        try:
-            # call the command with --interface-description
-            get_cmd_xml = Popen([cmd, "--interface-description"], stdout=PIPE)
-        except OSError as e:
-            print("OSError error({0}): {1}".format(e.errno, e.strerror))
-            str_err = "Error running: `%s --interface-description`."
-            raise GrassError(str_err % self.name) from e
-        # get the xml of the module
-        self.xml = get_cmd_xml.communicate()[0]
-        # transform and parse the xml into an Element class:
-        # https://docs.python.org/library/xml.etree.elementtree.html
-        tree = fromstring(self.xml)
-
-        for e in tree:
-            if e.tag not in {"parameter", "flag"}:
-                self.__setattr__(e.tag, GETFROMTAG[e.tag](e))
+        # the parsed interface is shared by all instances of the same
+        # executable, so parameters and flags are copied
+        interface = get_interface_cache().get_parsed(
+            cmd, fetch=_fetch_interface_description, parse=_parse_interface
+        )
+        self.xml = interface.xml
+        for tag, value in interface.attributes.items():
+            self.__setattr__(tag, value)
 
         #
         # extract parameters from the xml
         #
-        self.params_list = [Parameter(p) for p in tree.findall("parameter")]
+        self.params_list = [copy(p) for p in interface.params]
         self.inputs = TypeDict(Parameter)
         self.outputs = TypeDict(Parameter)
         self.required = []
@@ -598,10 +674,9 @@ class Module:
         #
         # extract flags from the xml
         #
-        flags_list = [Flag(f) for f in tree.findall("flag")]
         self.flags = TypeDict(Flag)
-        for flag in flags_list:
-            self.flags[flag.name] = flag
+        for flag in interface.flags:
+            self.flags[flag.name] = copy(flag)
 
         #
         # Add new attributes to the class
@@ -220,6 +220,16 @@ class Parameter:
         else:
             self.input = True
 
+    def __copy__(self):
+        """Return a copy which shares the description but not the value"""
+        param = self.__class__.__new__(self.__class__)
+        param.__dict__.update(self.__dict__)
+        if isinstance(self._value, list):
+            param._value = list(self._value)
+        if isinstance(self._rawvalue, list):
+            param._rawvalue = list(self._rawvalue)
+        return param
+
     def _get_value(self):
         return self._value
 
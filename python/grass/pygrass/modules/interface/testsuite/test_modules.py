@@ -11,6 +11,7 @@ from grass.gunittest.case import TestCase
 from grass.gunittest.main import test
 
 from grass.script.core import get_commands
+from grass.script.interface_cache import get_interface_cache
 from grass.exceptions import ParameterError
 from grass.pygrass.modules.interface import Module
 
@@ -66,5 +67,25 @@ class TestModulesCheck(TestCase):
         self.assertIsNone(gextension.check())
 
 
+class TestModulesInterfaceCache(TestCase):
+    def test_instances_are_independent(self):
+        """Test that modules sharing a cached interface do not share values"""
+        first = Module("r.colors", run_=False)
+        second = Module("r.colors", run_=False)
+        first.inputs.map = "a"
+        first.flags.r = True
+        self.assertIsNone(second.inputs.map)
+        self.assertFalse(second.flags.r)
+        self.assertIsNot(first.inputs["map"], second.inputs["map"])
+
+    def test_cache_hit(self):
+        """Test that the second instance does not fetch the description"""
+        cache = get_interface_cache()
+        Module("r.info", run_=False)
+        misses = cache.misses
+        Module("r.info", run_=False)
+        self.assertEqual(cache.misses, misses)
+
+
 if __name__ == "__main__":
     test()
@@ -0,0 +1,70 @@
+"""Test scheduling of tiles in PyGRASS GridModule"""
+
+import os
+import time
+
+import pytest
+
+from grass.pygrass.modules.grid.schedule import TileScheduler
+
+
+def sleep(seconds):
+    """Work which takes the given time and fails for negative values"""
+    time.sleep(seconds)
+
+
+def test_order_by_decreasing_cost():
+    """The most expensive works are started first"""
+    assert TileScheduler().order([1, 5, 2, 5, 0]) == [1, 3, 2, 0, 4]
+
+
+def test_all_works_finish():
+    """Every work is run once"""
+    scheduler = TileScheduler(processes=2)
+    works = [0.01 * i for i in range(10)]
+    assert sorted(scheduler.run(sleep, works, costs=works)) == list(range(10))
+
+
+def record(work):
+    """Work which takes the given time and records when it ran"""
+    directory, index, seconds = work
+    start = time.time()
+    time.sleep(seconds)
+    with open(os.path.join(directory, f"{index}.txt"), "a") as file:
+        file.write(f"{start} {time.time()}\n")
+
+
+def test_memory_limit(tmp_path):
+    """Works running at the same time fit into memory, a large work runs alone"""
+    limit = 10
+    scheduler = TileScheduler(processes=3, memory=limit)
+    durations = [0.2, 0.05, 0.05, 0.05, 0.1, 0.05]
+    memories = [6, 6, 4, 20, 3, 3]
+    works = [(str(tmp_path), index, seconds) for index, seconds in enumerate(durations)]
+    finished = list(scheduler.run(record, works, costs=durations, memories=memories))
+    assert sorted(finished) == list(range(len(works)))
+    intervals = []
+    for index in range(len(works)):
+        lines = (tmp_path / f"{index}.txt").read_text().splitlines()
+        # every work runs exactly once
+        assert len(lines) == 1
+        start, end = map(float, lines[0].split())
+        intervals.append((start, end))
+    for index, (start, unused) in enumerate(intervals):
+        running = [
+            other
+            for other, (other_start, other_end) in enumerate(intervals)
+            if other_start <= start < other_end
+        ]
+        assert index in running
+        if memories[index] > limit:
+            assert running == [index]
+        else:
+            assert sum(memories[other] for other in running) <= limit
+
+
+def test_error():
+    """An error of a work stops the scheduler"""
+    scheduler = TileScheduler(processes=2)
+    with pytest.raises(RuntimeError):
+        list(scheduler.run(sleep, [0.01, -1, 0.01]))
@@ -170,7 +170,7 @@ def test_cleans(tmp_path, clean, surface):
 
 
 @xfail_mp_spawn
-@pytest.mark.parametrize("patch_backend", [None, "r.patch", "RasterRow"])
+@pytest.mark.parametrize("patch_backend", [None, "r.patch", "RasterRow", "numpy"])
 def test_patching_backend(tmp_path, patch_backend):
     """Check patching backend works"""
     project = tmp_path / "test"
@@ -207,6 +207,42 @@ def test_patching_backend(tmp_path, patch_backend):
         assert abs(mean - mean_ref) < 0.0001
 
 
+@xfail_mp_spawn
+@pytest.mark.parametrize("blend", [False, True])
+@pytest.mark.parametrize("memory", [None, 1])
+def test_numpy_patching_overlap(tmp_path, blend, memory):
+    """Check numpy backend with trimmed and blended overlaps"""
+    project = tmp_path / "test"
+    gs.create_project(project)
+    with gs.setup.init(project):
+        gs.run_command("g.region", s=0, n=50, w=0, e=50, res=1)
+        surface = "surface"
+        gs.run_command("r.surf.fractal", output=surface)
+        gs.run_command("r.slope.aspect", elevation=surface, slope="reference")
+
+        def run_grid_module():
+            grid = GridModule(
+                "r.slope.aspect",
+                width=10,
+                height=5,
+                overlap=2,
+                processes=max_processes(),
+                patch_backend="numpy",
+                blend=blend,
+                memory=memory,
+                elevation=surface,
+                slope="slope",
+            )
+            grid.run()
+
+        run_in_subprocess(run_grid_module)
+
+        info = gs.parse_command("r.univar", map="slope", flags="g")
+        reference = gs.parse_command("r.univar", map="reference", flags="g")
+        assert info["n"] == reference["n"]
+        assert float(info["mean"]) == pytest.approx(float(reference["mean"]))
+
+
 @xfail_mp_spawn
 @pytest.mark.parametrize(
     ("width", "height", "processes"),
@@ -0,0 +1,84 @@
+"""Test scheduling in PyGRASS ParallelModuleQueue"""
+
+import threading
+
+import pytest
+
+from grass.exceptions import CalledModuleError
+from grass.pygrass.modules import ParallelModuleQueue
+
+
+class FakeModule:
+    """Object with the interface of an asynchronous MultiModule
+
+    The process finishes when the *release* event is set.
+    """
+
+    def __init__(self, name, release=None, error=False, started=None):
+        self.name = name
+        self.finish_ = True
+        self.release = release
+        self.error = error
+        self.started = started
+
+    def run(self):
+        if self.started is not None:
+            self.started.append(self.name)
+
+    def wait(self):
+        if self.release is not None:
+            self.release.wait(timeout=10)
+        if self.error:
+            raise CalledModuleError(
+                module=self.name, code=self.name, returncode=1, errors=""
+            )
+        return [self]
+
+
+def test_slot_reused_while_other_process_runs():
+    """A finished process frees its slot while a slow process keeps running"""
+    slow_release = threading.Event()
+    queue = ParallelModuleQueue(nprocs=2)
+    slow = FakeModule("slow", release=slow_release)
+    queue.put(slow)
+    for i in range(5):
+        queue.put(FakeModule(f"fast_{i}"))
+    # All fast modules passed through the second slot.
+    assert not slow_release.is_set()
+    assert queue.get(0) is slow
+    slow_release.set()
+    queue.wait()
+    assert queue.get_num_run_procs() == 0
+    names = [module.name for module in queue.get_finished_modules()]
+    assert sorted(names) == sorted(["slow"] + [f"fast_{i}" for i in range(5)])
+
+
+def test_priority_order():
+    """Pending modules are started by priority"""
+    release = threading.Event()
+    started = []
+    queue = ParallelModuleQueue(nprocs=1, max_pending=10)
+    queue.put(FakeModule("first", release=release, started=started))
+    queue.put(FakeModule("low", started=started), priority=1)
+    queue.put(FakeModule("high", started=started), priority=5)
+    queue.put(FakeModule("default", started=started))
+    release.set()
+    queue.wait()
+    assert started == ["first", "high", "low", "default"]
+
+
+def test_bounded_finished_modules():
+    """Only the last finished modules are kept"""
+    queue = ParallelModuleQueue(nprocs=2, max_finished=3)
+    for i in range(10):
+        queue.put(FakeModule(str(i)))
+    queue.wait()
+    assert len(queue.get_finished_modules()) == 3
+
+
+def test_error_is_raised():
+    """Error of a module is raised when the queue collects it"""
+    queue = ParallelModuleQueue(nprocs=2)
+    queue.put(FakeModule("failing", error=True))
+    with pytest.raises(CalledModuleError):
+        queue.wait()
@@ -12,7 +12,6 @@ for details.
 
 import sys
 from ctypes import CFUNCTYPE, c_void_p
-from multiprocessing import Lock, Pipe, Process
 
 import grass.lib.gis as libgis
 from grass.exceptions import FatalError
@@ -244,18 +243,14 @@ test_raster_name = "data_provider_raster_map"
 class DataProvider(RPCServerBase):
     """Fast and exit-safe interface to PyGRASS data delivery functions"""
 
-    def __init__(self):
-        RPCServerBase.__init__(self)
+    server_target = staticmethod(data_provider_server)
 
-    def start_server(self):
-        """This function must be re-implemented in the subclasses"""
-        self.client_conn, self.server_conn = Pipe(True)
-        self.lock = Lock()
-        self.server = Process(
-            target=data_provider_server, args=(self.lock, self.server_conn)
-        )
-        self.server.daemon = True
-        self.server.start()
+    def __init__(self, nprocs=1):
+        """
+        :param nprocs: The number of server processes delivering data
+                       in get_raster_images_as_np()
+        """
+        RPCServerBase.__init__(self, nprocs=nprocs)
 
     def get_raster_image_as_np(self, name, mapset=None, extent=None, color="RGB"):
         """Return the attribute table of a vector map as dictionary.
@@ -322,6 +317,38 @@ class DataProvider(RPCServerBase):
         )
         return self.safe_receive("get_raster_image_as_np")
 
+    def get_raster_images_as_np(self, names, mapset=None, extent=None, color="RGB"):
+        """Return images of many raster maps as numpy arrays.
+
+        The requests are sent without waiting for each image and the
+        images are created in parallel if nprocs is larger than one.
+
+        See documentation of: get_raster_image_as_np
+
+        Usage:
+
+        .. code-block:: pycon
+
+            >>> provider = DataProvider(nprocs=2)
+            >>> images = provider.get_raster_images_as_np(
+            ...     [test_raster_name, test_raster_name, test_raster_name]
+            ... )
+            >>> [len(image) for image in images]
+            [64, 64, 64]
+            >>> provider.stop()
+
+        :param names: The list of names of existing raster maps
+        :returns: The list of images
+        """
+        return self.call_pipelined(
+            [
+                [RPCDefs.GET_RASTER_IMAGE_AS_NP, name, mapset, extent, color]
+                for name in names
+            ],
+            "get_raster_images_as_np",
+            read_only=True,
+        )
+
     def get_vector_table_as_dict(self, name, mapset=None, where=None):
         """Return the attribute table of a vector map as dictionary.
 
@@ -13,9 +13,12 @@ for details.
 from __future__ import annotations
 
 import logging
+import math
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from multiprocessing import Lock, Pipe, Process
 from typing import TYPE_CHECKING, NoReturn
 
@@ -28,6 +31,9 @@ if TYPE_CHECKING:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+#: Maximal number of pipelined requests waiting for their replies
+PIPELINE_WINDOW = 32
+
 
 ###############################################################################
 
@@ -53,10 +59,49 @@ def dummy_server(lock: _LockLike, conn: Connection) -> NoReturn:
                 raise Exception(msg)
 
 
+class ServerWorker:
+    """Server process of the worker pool of a RPC server
+
+    Workers run the same server function as the main server process and
+    serve read-only requests in parallel, see
+    :meth:`RPCServerBase.call_pipelined`.
+
+    :param target: The server function, e.g. dummy_server
+    """
+
+    def __init__(self, target) -> None:
+        self.client_conn, self.server_conn = Pipe(True)
+        self.lock = Lock()
+        self.threadLock = threading.Lock()
+        self.process = Process(target=target, args=(self.lock, self.server_conn))
+        self.process.daemon = True
+        self.process.start()
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def stop(self) -> None:
+        """Stop the worker process and close the pipe"""
+        if self.process.is_alive():
+            try:
+                self.client_conn.send([0])
+            except OSError:
+                pass
+            self.process.terminate()
+        self.client_conn.close()
+        self.server_conn.close()
+
+
 class RPCServerBase:
     """This is the base class for send and receive RPC server
     It uses a Pipe for IPC.
 
+    Requests which do not need the reply of the previous request can be
+    sent in one go with :meth:`call_pipelined`. When the server is created
+    with nprocs larger than one, read-only requests sent this way are
+    distributed among the main server and nprocs - 1 worker processes,
+    which are started on first use.
+
     .. code-block:: pycon
 
         >>> import grass.script as gscript
@@ -95,11 +140,20 @@ class RPCServerBase:
 
     """
 
-    def __init__(self) -> None:
+    #: The server function run in the server and worker processes
+    server_target = staticmethod(dummy_server)
+
+    def __init__(self, nprocs: int = 1) -> None:
+        """
+        :param nprocs: The number of server processes serving read-only
+                       requests sent by :meth:`call_pipelined`
+        """
         self.client_conn: Connection | None = None
         self.server_conn: Connection | None = None
         self.queue = None
         self.server = None
+        self.nprocs = max(nprocs, 1)
+        self.workers: list[ServerWorker] = []
         self.checkThread: threading.Thread | None = None
         self.threadLock = threading.Lock()
         self.start_server()
@@ -139,15 +193,31 @@ class RPCServerBase:
                     return
 
     def start_server(self):
-        """This function must be re-implemented in the subclasses"""
+        """Start the server process running server_target"""
         logger.debug("Start the libgis server")
 
         self.client_conn, self.server_conn = Pipe(True)
         self.lock = Lock()
-        self.server = Process(target=dummy_server, args=(self.lock, self.server_conn))
+        self.server = Process(
+            target=self.server_target, args=(self.lock, self.server_conn)
+        )
         self.server.daemon = True
         self.server.start()
 
+    def start_workers(self) -> list[ServerWorker]:
+        """Start the missing worker processes and return all workers"""
+        with self.threadLock:
+            while len(self.workers) < self.nprocs - 1:
+                self.workers.append(ServerWorker(self.server_target))
+            return list(self.workers)
+
+    def stop_workers(self) -> None:
+        """Stop all worker processes"""
+        with self.threadLock:
+            workers, self.workers = self.workers, []
+        for worker in workers:
+            worker.stop()
+
     def check_server(self):
         self._check_restart_server()
 
@@ -156,6 +226,12 @@ class RPCServerBase:
         logger.debug("Check libgis server restart")
 
         with self.threadLock:
+            # Closing the pipe of a killed worker stops waiting for its replies
+            for worker in self.workers:
+                if not worker.is_alive():
+                    worker.stop()
+            self.workers = [worker for worker in self.workers if worker.is_alive()]
+
             if self.server is not None and self.server.is_alive() is True:
                 return
             if self.client_conn is not None:
@@ -175,11 +251,21 @@ class RPCServerBase:
     def safe_receive(self, message):
         """Receive the data and throw a FatalError exception in case the server
         process was killed and the pipe was closed by the checker thread"""
+        return self._receive(self.client_conn, message)
+
+    @staticmethod
+    def _receive(conn, message, process=None):
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Receive message: %s", message)
 
         try:
-            ret = self.client_conn.recv()
+            # Pipes can be inherited by other processes, so a killed
+            # server process is not always noticed by recv()
+            while process is not None and not conn.poll(0.2):
+                if not process.is_alive():
+                    msg = "The server process was terminated"
+                    raise EOFError(msg)
+            ret = conn.recv()
             if isinstance(ret, FatalError):
                 raise ret
             return ret
@@ -188,6 +274,74 @@ class RPCServerBase:
             # the server process was killed
             raise FatalError("Exception raised: " + str(e) + " Message: " + message)
 
+    def call_pipelined(self, requests, message, read_only=False):
+        """Send requests without waiting for the reply of each request
+
+        The replies are received by a thread while the requests are sent,
+        so that neither the server nor the client wait for each other.
+        Read-only requests are split among the main server and the worker
+        processes if nprocs is larger than one.
+
+        :param requests: A list of requests, each a list starting with
+                         the function identifier
+        :param message: The message used in case of an error
+        :param read_only: True if the requests do not modify any data
+        :returns: The list of replies in the order of the requests
+        """
+        if not requests:
+            return []
+        self.check_server()
+        if not read_only or self.nprocs == 1 or len(requests) == 1:
+            return self._pipeline(self.client_conn, self.server, requests, message)
+
+        workers = [None, *self.start_workers()]
+        size = math.ceil(len(requests) / len(workers))
+        chunks = [
+            requests[start : start + size] for start in range(0, len(requests), size)
+        ]
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            replies = executor.map(
+                partial(self._call_worker, message=message), workers, chunks
+            )
+            return [reply for chunk in replies for reply in chunk]
+
+    def _call_worker(self, worker, requests, message):
+        if worker is None:
+            return self._pipeline(self.client_conn, self.server, requests, message)
+        with worker.threadLock:
+            return self._pipeline(worker.client_conn, worker.process, requests, message)
+
+    def _pipeline(self, conn, process, requests, message):
+        replies = []
+        errors = []
+        window = threading.Semaphore(PIPELINE_WINDOW)
+
+        def receive():
+            try:
+                for unused in requests:
+                    replies.append(self._receive(conn, message, process))
+                    window.release()
+            except FatalError as error:
+                errors.append(error)
+                window.release(len(requests))
+
+        receiver = threading.Thread(target=receive, daemon=True)
+        receiver.start()
+        try:
+            for request in requests:
+                window.acquire()
+                if errors:
+                    break
+                conn.send(request)
+        except OSError:
+            # The pipe was closed because the server process was killed,
+            # the receiver reports the error
+            pass
+        receiver.join()
+        if errors:
+            raise errors[0]
+        return replies
+
     def stop(self):
         """Stop the check thread, the libgis server and close the pipe
 
@@ -196,6 +350,7 @@ class RPCServerBase:
         logger.debug("Stop libgis server")
 
         self.stop_checker_thread()
+        self.stop_workers()
         if self.server is not None and self.server.is_alive():
             if self.client_conn is not None:
                 self.client_conn.send(
@@ -2,6 +2,7 @@ from os.path import join, exists
 import grass.lib.gis as libgis
 import ctypes
 
+import numpy as np
 
 # flake8: noqa: E402
 libgis.G_gisinit("")
@@ -14,6 +15,7 @@ from grass.pygrass.vector.geometry import (
     GEOOBJ as _GEOOBJ,
     read_line,
     read_next_line,
+    points_to_arrays,
     Area as _Area,
 )
 from grass.pygrass.vector.abstract import Info
@@ -250,6 +252,37 @@ class Vector(Info):
         path = join(loc.path(), self.mapset, "vector", self.name, "colr")
         return bool(exists(path))
 
+    @must_be_open
+    def prefetch_attributes(self, columns=None):
+        """Read the attribute table into memory for fast access of the
+        attributes of all features
+
+        The table is read with a single query instead of one query for
+        each feature. Changed attributes are kept in memory and written
+        to the table in one transaction by :meth:`flush_attributes`
+        or when the map is closed.
+
+        :param columns: the columns to read, None to read all columns
+        :type columns: list of str
+        :returns: the AttributeCache object or None if the map has no table
+
+        >>> test_vect = VectorTopo(test_vector_name)
+        >>> test_vect.open("r")
+        >>> cache = test_vect.prefetch_attributes(["name"])
+        >>> [feature.attrs["name"] for feature in test_vect.viter("points")]
+        ['point', 'point', 'point']
+        >>> test_vect.close()
+        """
+        if self.table is None:
+            return None
+        return self.table.prefetch(columns=columns)
+
+    @must_be_open
+    def flush_attributes(self):
+        """Write the attributes changed in memory to the table"""
+        if self.table is not None:
+            self.table.flush()
+
 
 # =============================================
 # VECTOR WITH TOPOLOGY
@@ -852,6 +885,77 @@ class VectorTopo(Vector):
 
         return wkb_list
 
+    @must_be_open
+    def features_to_arrays(self, bbox=None, feature_type="line", field=1):
+        """Return a generator of (id, cat, coordinates) triplets of all
+        features of type point, line, boundary or centroid,
+        optionally located in a specific bounding box.
+
+        The coordinates are arrays with shape (n, 2), or (n, 3) for 3D maps,
+        copied directly from the C structure without creating geometry objects.
+
+        :param bbox: The boundingbox to search for features,
+                     if bbox=None all features of the map are returned
+        :type bbox: grass.pygrass.vector.basic.Bbox
+
+        :param feature_type: The type of feature: 'point', 'line', 'boundary'
+                             or 'centroid'
+        :type feature_type: string
+
+        :param field: The category field
+        :type field: integer
+
+        .. code-block:: pycon
+
+         >>> test_vect = VectorTopo(test_vector_name)
+         >>> test_vect.open("r")
+         >>> for f_id, cat, coords in test_vect.features_to_arrays(feature_type="line"):
+         ...     print((f_id, cat, coords.shape))
+         (4, 2, (3, 2))
+         (5, 2, (3, 2))
+         (6, 2, (3, 2))
+         >>> test_vect.close()
+
+        """
+        supported = ["point", "line", "boundary", "centroid"]
+
+        if feature_type.lower() not in supported:
+            raise GrassError(
+                "Unsupported feature type <%s>, "
+                "supported are <%s>" % (feature_type, ",".join(supported))
+            )
+        gtype = VTYPE[feature_type.lower()]
+
+        if bbox is None:
+            ids = range(1, libvect.Vect_get_num_lines(self.c_mapinfo) + 1)
+        else:
+            bboxlist = self.find_by_bbox.geos(
+                bbox, type=feature_type.lower(), bboxlist_only=True
+            )
+            ids = bboxlist.ids if bboxlist else []
+
+        is2D = not self.is_3D()
+        c_points = libvect.Vect_new_line_struct()
+        c_cats = libvect.Vect_new_cats_struct()
+        cat = ctypes.c_int()
+
+        try:
+            for f_id in ids:
+                if bbox is None and (
+                    not libvect.Vect_line_alive(self.c_mapinfo, f_id)
+                    or libvect.Vect_get_line_type(self.c_mapinfo, f_id) != gtype
+                ):
+                    continue
+                if libvect.Vect_read_line(self.c_mapinfo, c_points, c_cats, f_id) < 0:
+                    raise GrassError(_("Unable to read line of feature %i") % f_id)
+                ok = libvect.Vect_cat_get(c_cats, field, ctypes.byref(cat))
+                pcat = None if ok < 1 else cat.value
+                coords = np.column_stack(points_to_arrays(c_points, is2D, copy=False))
+                yield f_id, pcat, coords
+        finally:
+            libvect.Vect_destroy_line_struct(c_points)
+            libvect.Vect_destroy_cats_struct(c_cats)
+
     @must_be_open
     def areas_to_wkb_list(self, bbox=None, field=1):
         """Return all features of type point, line, boundary or centroid
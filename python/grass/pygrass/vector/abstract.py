@@ -457,6 +457,7 @@ class Info:
         :type build: bool
         """
         if hasattr(self, "table") and self.table is not None:
+            self.table.clear_cache()
             self.table.conn.close()
         if self.is_open():
             if (
@@ -135,6 +135,83 @@ def get_xyz(pnt):
     return x, y, z
 
 
+def _double_array(c_array, n_points, owner=None):
+    """Return a NumPy view of a C array of doubles.
+
+    The view keeps a reference to *owner*, so the object owning the memory
+    is not destroyed while the view is used.
+    """
+    if n_points <= 0 or not c_array:
+        return np.empty(0, dtype=np.float64)
+    address = ctypes.cast(c_array, ctypes.c_void_p).value
+    buffer = (ctypes.c_double * n_points).from_address(address)
+    buffer._owner = owner
+    return np.frombuffer(buffer, dtype=np.float64)
+
+
+def points_to_arrays(c_points, is2D=True, copy=True, owner=None):
+    """Return the x, y and z coordinates of a line_pnts structure as arrays.
+
+    :param c_points: a pointer to a libvect.line_pnts structure
+    :param is2D: if True the z coordinates are not returned
+    :type is2D: bool
+    :param copy: if False the arrays are views of the C buffers, they
+                 are valid until points are added to or removed from
+                 the structure
+    :type copy: bool
+    :param owner: object owning the structure, it is kept alive by the views
+    :returns: a tuple with the x, y and, for 3D, z arrays
+
+    >>> line = Line([(0, 0), (1, 1), (2, 0)])
+    >>> points_to_arrays(line.c_points)
+    (array([0., 1., 2.]), array([0., 1., 0.]))
+
+    """
+    n_points = c_points.contents.n_points
+    axes = ("x", "y") if is2D else ("x", "y", "z")
+    arrays = tuple(
+        _double_array(getattr(c_points.contents, axis), n_points, owner)
+        for axis in axes
+    )
+    if copy:
+        return tuple(array.copy() for array in arrays)
+    return arrays
+
+
+def arrays_to_points(c_points, x, y, z=None):
+    """Replace the points of a line_pnts structure with coordinate arrays,
+    using the ``Vect_copy_xyz_to_pnts`` C function.
+
+    :param c_points: a pointer to a libvect.line_pnts structure
+    :param x: the x coordinates
+    :param y: the y coordinates
+    :param z: the z coordinates or None for 2D
+    """
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    if z is not None:
+        z = np.ascontiguousarray(z, dtype=np.float64)
+    if x.shape != y.shape or (z is not None and z.shape != x.shape):
+        msg = "The coordinate arrays must have the same length"
+        raise ValueError(msg)
+    libvect.Vect_reset_line(c_points)
+    if not len(x):
+        return
+    c_double_p = ctypes.POINTER(ctypes.c_double)
+    if (
+        libvect.Vect_copy_xyz_to_pnts(
+            c_points,
+            x.ctypes.data_as(c_double_p),
+            y.ctypes.data_as(c_double_p),
+            None if z is None else z.ctypes.data_as(c_double_p),
+            len(x),
+        )
+        < 0
+    ):
+        msg = "Unable to allocate memory for %d points" % len(x)
+        raise GrassError(msg)
+
+
 class Attrs:
     def __init__(self, cat, table, writeable=False):
         self._cat = None
@@ -167,14 +244,21 @@ class Attrs:
         ('point', 1.0)
         >>> test_vect.close()
 
+        The values are taken from the cache of the table, if the table
+        was read into memory with :meth:`Table.prefetch`.
         """
-        sqlcode = sql.SELECT_WHERE.format(
-            cols=(keys if np.isscalar(keys) else ", ".join(keys)),
-            tname=self.table.name,
-            condition=self.cond,
-        )
-        cur = self.table.execute(sqlcode)
-        results = cur.fetchone()
+        columns = (keys,) if np.isscalar(keys) else keys
+        cache = self._get_cache(columns)
+        if cache is not None:
+            results = cache.get(self.cat, columns)
+        else:
+            sqlcode = sql.SELECT_WHERE.format(
+                cols=", ".join(columns),
+                tname=self.table.name,
+                condition=self.cond,
+            )
+            cur = self.table.execute(sqlcode)
+            results = cur.fetchone()
         if results is not None:
             return results[0] if len(results) == 1 else results
 
@@ -199,6 +283,9 @@ class Attrs:
         >>> v1.attrs.table.conn.commit()
         >>> test_vect.close()
 
+        If the table was read into memory with :meth:`Table.prefetch`,
+        the values are changed in the cache and written to the table
+        by :meth:`commit`.
         """
         if not self.writeable:
             str_err = "You can only read the attributes if the map is in another mapset"
@@ -209,6 +296,10 @@ class Attrs:
         for key in keys:
             if key not in self.table.columns:
                 raise KeyError("Column: %s not in table" % key)
+        cache = self.table.cache
+        if cache is not None:
+            cache.set(self.cat, keys, values)
+            return
         # prepare the string using as paramstyle: qmark
         vals = ",".join(["%s=?" % k for k in keys])
         # "UPDATE {tname} SET {values} WHERE {condition};"
@@ -234,6 +325,9 @@ class Attrs:
          >>> test_vect.close()
 
         """
+        cache = self._get_cache(self.keys())
+        if cache is not None:
+            return cache.get(self.cat, self.keys())
         # SELECT {cols} FROM {tname} WHERE {condition}
         cur = self.table.execute(
             sql.SELECT_WHERE.format(
@@ -258,8 +352,16 @@ class Attrs:
 
     def commit(self):
         """Save the changes"""
+        self.table.flush()
         self.table.conn.commit()
 
+    def _get_cache(self, keys):
+        """Return the cache of the table if it contains the columns"""
+        cache = self.table.cache
+        if cache is not None and cache.has_columns(keys):
+            return cache
+        return None
+
 
 class Geo:
     """
@@ -623,7 +725,8 @@ class Point(Geo):
 
 
 class Line(Geo):
-    """Instantiate a new Line with a list of tuple, or with a list of Point. ::
+    """Instantiate a new Line with a list of tuple, with a list of Point,
+    or with an array of coordinates with shape (n, 2) or (n, 3). ::
 
         >>> line = Line([(0, 0), (1, 1), (2, 0), (1, -1)])
         >>> line  # doctest: +NORMALIZE_WHITESPACE
@@ -631,6 +734,8 @@ class Line(Geo):
               Point(1.000000, 1.000000),
               Point(2.000000, 0.000000),
               Point(1.000000, -1.000000)])
+        >>> Line(np.array([[0, 0], [1, 1]]))
+        Line([Point(0.000000, 0.000000), Point(1.000000, 1.000000)])
 
     ..
     """
@@ -640,7 +745,9 @@ class Line(Geo):
 
     def __init__(self, points=None, **kargs):
         super().__init__(**kargs)
-        if points is not None:
+        if isinstance(points, np.ndarray):
+            self.from_array(points)
+        elif points is not None:
             for pnt in points:
                 self.append(pnt)
 
@@ -1102,10 +1209,10 @@ class Line(Geo):
 
         ..
         """
-        return [pnt.coords() for pnt in iter(self)]
+        return [tuple(coords) for coords in self.to_array().tolist()]
 
     def to_array(self):
-        """Return an array of coordinates. ::
+        """Return an array of coordinates with shape (n, 2) or (n, 3). ::
 
             >>> line = Line([(0, 0), (1, 1), (2, 0), (1, -1)])
             >>> line.to_array()  # doctest: +NORMALIZE_WHITESPACE
@@ -1116,7 +1223,56 @@ class Line(Geo):
 
         ..
         """
-        return np.array(self.to_list())
+        return np.column_stack(self.to_arrays(copy=False))
+
+    def to_arrays(self, copy=True):
+        """Return a tuple with the arrays of the x, y and, for 3D, z coordinates.
+
+        :param copy: if False return views of the C buffers of the line
+                     instead of copies; changing a view changes the line,
+                     the views must not be used after points are added
+                     to or removed from the line
+        :type copy: bool
+
+        .. code-block:: pycon
+
+            >>> line = Line([(0, 0), (1, 1), (2, 0)])
+            >>> x, y = line.to_arrays(copy=False)
+            >>> x
+            array([0., 1., 2.])
+            >>> x += 10
+            >>> line[0]
+            Point(10.000000, 0.000000)
+
+        """
+        return points_to_arrays(self.c_points, self.is2D, copy=copy, owner=self)
+
+    def from_array(self, array):
+        """Replace the points of the line with an array of coordinates.
+
+        :param array: the coordinates with shape (n, 2) or (n, 3)
+        :type array: numpy.ndarray
+
+        .. code-block:: pycon
+
+            >>> line = Line()
+            >>> line.from_array(np.array([[0, 0], [1, 1], [1, 2]]))
+            >>> line  # doctest: +NORMALIZE_WHITESPACE
+            Line([Point(0.000000, 0.000000),
+                  Point(1.000000, 1.000000),
+                  Point(1.000000, 2.000000)])
+
+        """
+        array = np.asarray(array, dtype=np.float64)
+        if array.ndim != 2 or array.shape[1] not in {2, 3}:
+            msg = "Expected an array with shape (n, 2) or (n, 3), got {0}"
+            raise ValueError(msg.format(array.shape))
+        arrays_to_points(
+            self.c_points,
+            array[:, 0],
+            array[:, 1],
+            array[:, 2] if array.shape[1] == 3 else None,
+        )
 
     def to_wkt_p(self):
         """Return a Well Known Text string of the line. ::
@@ -1516,6 +1672,10 @@ class Isle(Geo):
         libvect.Vect_get_isle_points(self.c_mapinfo, self.id, line.c_points)
         return line
 
+    def to_array(self):
+        """Return an array with the coordinates of the isle ring"""
+        return self.points().to_array()
+
     def to_wkt(self):
         """Return a Well Known Text string of the isle.
 
@@ -1667,6 +1827,23 @@ class Area(Geo):
         libvect.Vect_get_area_points(self.c_mapinfo, self.id, line.c_points)
         return line
 
+    def to_array(self):
+        """Return an array with the coordinates of the outer ring"""
+        return self.points().to_array()
+
+    @mapinfo_must_be_set
+    def rings_to_arrays(self):
+        """Return a list of coordinate arrays, the first is the outer ring
+        followed by the rings of the isles of the area.
+        """
+        line = Line(is2D=self.is2D)
+        rings = [self.points(line).to_array()]
+        for i in range(self.num_isles()):
+            isle_id = libvect.Vect_get_area_isle(self.c_mapinfo, self.id, i)
+            libvect.Vect_get_isle_points(self.c_mapinfo, isle_id, line.c_points)
+            rings.append(line.to_array())
+        return rings
+
     @mapinfo_must_be_set
     def centroid(self):
         """Return the centroid
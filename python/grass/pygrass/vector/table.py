@@ -1061,6 +1061,208 @@ class DBlinks:
         return libvect.Vect_get_field_number(self.c_mapinfo, name)
 
 
+def _numpy_dtype(ctype):
+    """Return the NumPy type used for a column of the given SQL type
+
+    >>> _numpy_dtype("INTEGER"), _numpy_dtype("int4")
+    (<class 'numpy.int64'>, <class 'numpy.int64'>)
+    >>> _numpy_dtype("DOUBLE PRECISION"), _numpy_dtype("float8")
+    (<class 'numpy.float64'>, <class 'numpy.float64'>)
+    >>> _numpy_dtype("TEXT")
+    <class 'object'>
+    """
+    ctype = ctype.upper()
+    if "INT" in ctype and "INTERVAL" not in ctype:
+        return np.int64
+    if any(name in ctype for name in ("DOUBLE", "REAL", "FLOAT", "NUMERIC", "DECIMAL")):
+        return np.float64
+    return object
+
+
+def _column_array(values, ctype):
+    """Return the values of a column as NumPy array
+
+    Numeric columns with NULL values are returned as masked arrays.
+
+    >>> _column_array([1, 2, 3], "INTEGER")
+    array([1, 2, 3])
+    >>> _column_array([1.5, None], "REAL")
+    masked_array(data=[1.5, --],
+                 mask=[False,  True],
+           fill_value=1e+20)
+    >>> _column_array(["a", None], "TEXT")
+    array(['a', None], dtype=object)
+    """
+    dtype = _numpy_dtype(ctype)
+    if dtype is object:
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+    mask = [value is None for value in values]
+    if any(mask):
+        data = [0 if value is None else value for value in values]
+        return np.ma.masked_array(np.array(data, dtype=dtype), mask=mask)
+    return np.array(values, dtype=dtype)
+
+
+class AttributeCache:
+    """Columnar in-memory copy of an attribute table
+
+    All rows of the table, or of a subset of the columns, are read with
+    a single query. The values are stored per column together with an
+    index from the category to the row, so that the attributes of
+    a feature can be read without a query to the database.
+    Changed values are stored in the cache and written to the table
+    by :meth:`flush` in one transaction.
+
+    >>> import sqlite3
+    >>> from grass.pygrass.vector.table import get_path
+    >>> path = "$GISDBASE/$LOCATION_NAME/$MAPSET/sqlite/sqlite.db"
+    >>> table = Table(name=test_vector_name, connection=sqlite3.connect(get_path(path)))
+    >>> cache = AttributeCache(table, columns=["name"])
+    >>> len(cache)
+    3
+    >>> cache.get(2, ("name",))
+    ('line',)
+    >>> cache.set(2, ("name",), ("new_line",))
+    >>> cache.get(2, ("name",))
+    ('new_line',)
+    >>> cache.n_pending()
+    1
+    >>> cache.set(2, ("name",), ("line",))
+    >>> cache.flush()
+    >>> cache.n_pending()
+    0
+    """
+
+    def __init__(self, table, columns=None):
+        """Read the table into memory
+
+        :param table: the attribute table
+        :type table: Table object
+        :param columns: the columns to read, None to read all columns
+        :type columns: list of str
+        """
+        self.table = table
+        self.key = table.key
+        names = table.columns.names()
+        self.columns = list(columns) if columns else list(names)
+        for column in self.columns:
+            if column not in names:
+                raise KeyError("Column: %s not in table" % column)
+        if self.key not in self.columns:
+            self.columns.insert(0, self.key)
+        self._data = {}
+        self._index = {}
+        self._pending = {}
+        self.load()
+
+    def __repr__(self):
+        return "AttributeCache(%r, columns=%r)" % (self.table.name, self.columns)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, cat):
+        return cat in self._index
+
+    def load(self):
+        """Read the cached columns from the table, discarding changes which
+        were not written to the table"""
+        cur = self.table.execute(
+            sql.SELECT.format(cols=", ".join(self.columns), tname=self.table.name)
+        )
+        rows = cur.fetchall()
+        cur.close()
+        columns = list(zip(*rows)) if rows else [()] * len(self.columns)
+        self._data = {name: list(values) for name, values in zip(self.columns, columns)}
+        self._index = {cat: row for row, cat in enumerate(self._data[self.key])}
+        self._pending = {}
+
+    def has_columns(self, keys):
+        """Return True if all the columns are in the cache
+
+        :param keys: the column names
+        :type keys: list of str
+        """
+        return all(key in self._data for key in keys)
+
+    def get(self, cat, keys):
+        """Return the values of the columns for a category
+
+        :param cat: the category
+        :type cat: int
+        :param keys: the column names
+        :type keys: list of str
+        :returns: tuple of values or None if the category is not in the table
+        """
+        row = self._index.get(cat)
+        if row is None:
+            return None
+        return tuple(self._data[key][row] for key in keys)
+
+    def set(self, cat, keys, values):
+        """Change the values of the columns for a category
+
+        The values are written to the table by :meth:`flush`.
+
+        :param cat: the category
+        :type cat: int
+        :param keys: the column names
+        :type keys: list of str
+        :param values: the new values
+        :type values: list
+        """
+        changes = self._pending.setdefault(cat, {})
+        row = self._index.get(cat)
+        for key, value in zip(keys, values):
+            changes[key] = value
+            if row is not None and key in self._data:
+                self._data[key][row] = value
+
+    def n_pending(self):
+        """Return the number of categories with changes not written to
+        the table"""
+        return len(self._pending)
+
+    def flush(self):
+        """Write all changed values to the table in one transaction"""
+        if not self._pending:
+            return
+        # Categories with changes in the same columns are updated together.
+        updates = {}
+        for cat, changes in self._pending.items():
+            keys = tuple(changes.keys())
+            updates.setdefault(keys, []).append([*(changes[key] for key in keys), cat])
+        cur = self.table.conn.cursor()
+        try:
+            for keys, values in updates.items():
+                sqlcode = sql.UPDATE_WHERE.format(
+                    tname=self.table.name,
+                    values=",".join(["%s=?" % key for key in keys]),
+                    condition="%s=?" % self.key,
+                )
+                cur.executemany(sqlcode, values)
+            self.table.conn.commit()
+        except Exception:
+            self.table.conn.rollback()
+            raise
+        finally:
+            cur.close()
+        self._pending = {}
+
+    def to_numpy(self, columns=None):
+        """Return the cached columns as NumPy arrays
+
+        :param columns: the column names, None for all cached columns
+        :type columns: list of str
+        :returns: dictionary with column names as keys and arrays as values
+        """
+        columns = self.columns if columns is None else columns
+        types = self.table.columns
+        return {name: _column_array(self._data[name], types[name]) for name in columns}
+
+
 class Table:
     """
 
@@ -1105,6 +1307,7 @@ class Table:
         self.key = key
         self.columns = Columns(self.name, self.conn, self.key)
         self.filters = Filters(self.name)
+        self.cache = None
 
     def __repr__(self):
         """
@@ -1211,6 +1414,106 @@ class Table:
                 "SQL error: %s" % (sqlc, values, str(exc))
             )
 
+    def prefetch(self, columns=None):
+        """Read the table into memory and use it for the feature attributes
+
+        Until :meth:`clear_cache` is called, the attributes of the features
+        which use this table are read from the cache and changed values are
+        kept in memory until :meth:`flush` writes them in one transaction.
+
+        :param columns: the columns to read, None to read all columns
+        :type columns: list of str
+        :returns: the AttributeCache object
+        """
+        self.cache = AttributeCache(self, columns=columns)
+        return self.cache
+
+    def flush(self):
+        """Write changes stored in the cache to the table"""
+        if self.cache is not None:
+            self.cache.flush()
+
+    def clear_cache(self, flush=True):
+        """Stop using the cache for the feature attributes
+
+        :param flush: True to write changes stored in the cache to the table
+        :type flush: bool
+        """
+        if flush:
+            self.flush()
+        self.cache = None
+
+    def _select_columns(self, columns=None, where=None):
+        """Return a cursor with the selected columns and their names"""
+        names = list(columns) if columns else self.columns.names()
+        cols = ", ".join(names)
+        if where:
+            sqlcode = sql.SELECT_WHERE.format(
+                cols=cols, tname=self.name, condition=where
+            )
+        else:
+            sqlcode = sql.SELECT.format(cols=cols, tname=self.name)
+        return self.execute(sqlcode), names
+
+    def to_numpy(self, columns=None, where=None):
+        """Return the table as NumPy arrays, one for each column
+
+        Integer and floating point columns are converted to arrays of
+        the same type, masked arrays are used when a column contains NULL
+        values. Other columns are returned as arrays of objects.
+
+        :param columns: the column names, None for all columns
+        :type columns: list of str
+        :param where: an optional SQL condition to select the rows
+        :type where: str
+        :returns: dictionary with column names as keys and arrays as values
+
+        >>> import sqlite3
+        >>> from grass.pygrass.vector.table import get_path
+        >>> path = "$GISDBASE/$LOCATION_NAME/$MAPSET/sqlite/sqlite.db"
+        >>> tab_sqlite = Table(
+        ...     name=test_vector_name, connection=sqlite3.connect(get_path(path))
+        ... )
+        >>> arrays = tab_sqlite.to_numpy(["cat", "value"])
+        >>> arrays["cat"]
+        array([1, 2, 3])
+        >>> arrays["value"]
+        array([1., 2., 3.])
+        """
+        cur, names = self._select_columns(columns, where)
+        rows = cur.fetchall()
+        cur.close()
+        values = list(zip(*rows)) if rows else [()] * len(names)
+        return {
+            name: _column_array(list(column), self.columns[name])
+            for name, column in zip(names, values)
+        }
+
+    def record_batches(self, size=10000, columns=None, where=None):
+        """Iterate over the table in batches of rows as NumPy arrays
+
+        :param size: the maximal number of rows in a batch
+        :type size: int
+        :param columns: the column names, None for all columns
+        :type columns: list of str
+        :param where: an optional SQL condition to select the rows
+        :type where: str
+        :returns: generator of dictionaries with column names as keys
+                  and arrays as values
+        """
+        cur, names = self._select_columns(columns, where)
+        try:
+            while True:
+                rows = cur.fetchmany(size)
+                if not rows:
+                    break
+                yield {
+                    name: _column_array(list(column), self.columns[name])
+                    for name, column in zip(names, zip(*rows))
+                }
+        finally:
+            cur.close()
+
     def exist(self, cursor=None):
         """Return True if the table already exists in the DB, False otherwise
 
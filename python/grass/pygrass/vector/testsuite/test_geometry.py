@@ -173,6 +173,35 @@ class LineTestCase(TestCase):
         self.assertEqual(1, bbox.east)
         self.assertEqual(0, bbox.west)
 
+    def test_to_array(self):
+        """Test to_array and to_list methods"""
+        line = Line([(0, 0), (1, 1), (2, 0)])
+        np.testing.assert_array_equal(line.to_array(), [[0, 0], [1, 1], [2, 0]])
+        self.assertListEqual(line.to_list(), [(0, 0), (1, 1), (2, 0)])
+        self.assertEqual(Line().to_array().shape, (0, 2))
+
+    def test_to_arrays_view(self):
+        """Test that views share the memory of the line"""
+        line = Line([(0, 0), (1, 1)])
+        x, y = line.to_arrays(copy=False)
+        y[1] = 5
+        self.assertTupleEqual(line[1].coords(), (1, 5))
+        x, y = line.to_arrays()
+        y[1] = 10
+        self.assertTupleEqual(line[1].coords(), (1, 5))
+
+    def test_from_array(self):
+        """Test creation of a line from an array"""
+        coords = np.array([[0, 0, 1], [1, 1, 2], [2, 0, 3]])
+        line = Line(coords, is2D=False)
+        self.assertEqual(len(line), 3)
+        np.testing.assert_array_equal(line.to_array(), coords)
+        line.from_array(coords[:2, :2])
+        self.assertEqual(len(line), 2)
+        self.assertTupleEqual(line[1].coords(), (1, 1, 0))
+        with self.assertRaises(ValueError):
+            line.from_array(np.zeros((3, 4)))
+
     def test_nodes(self):
         """Test nodes method"""
 
@@ -314,6 +343,14 @@ class AreaTestCase(TestCase):
         area = Area(v_id=1, c_mapinfo=self.c_mapinfo)
         self.assertEqual(str(area.bbox()), "Bbox(4.0, 0.0, 4.0, 0.0)")
 
+    def test_rings_to_arrays(self):
+        """Test coordinate arrays of the outer ring and the isles"""
+        area = Area(v_id=1, c_mapinfo=self.c_mapinfo)
+        outer, isle = area.rings_to_arrays()
+        np.testing.assert_array_equal(outer, area.to_array())
+        self.assertEqual(outer.shape, (8, 2))
+        np.testing.assert_array_equal(isle, [[1, 1], [3, 1], [3, 3], [1, 3], [1, 1]])
+
     def test_centroid(self):
         """Test centroid access"""
         area = Area(v_id=1, c_mapinfo=self.c_mapinfo)
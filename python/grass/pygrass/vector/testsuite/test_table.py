@@ -216,5 +216,65 @@ class TableUpdateTestCase(DBconnection, TestCase):
         self.assertTupleEqual(vals, cur.fetchone())
 
 
+class TableCacheTestCase(DBconnection, TestCase):
+    def setUp(self):
+        """Create a table with known values"""
+        self.table = self.create_not_empty_table(
+            values=[
+                (1, 10, 0.5, "a"),
+                (2, 20, None, "b"),
+                (3, 30, 1.5, None),
+            ]
+        )
+        self.cols = self.table.columns
+
+    def test_prefetch(self):
+        """Test reading values from the cache"""
+        cache = self.table.prefetch(["cint", "ctxt"])
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.columns, ["cat", "cint", "ctxt"])
+        self.assertTupleEqual(cache.get(2, ("ctxt", "cint")), ("b", 20))
+        self.assertIsNone(cache.get(4, ("cint",)))
+        self.assertTrue(cache.has_columns(("cint",)))
+        self.assertFalse(cache.has_columns(("creal",)))
+
+    def test_buffered_update(self):
+        """Test that changes are written to the table by flush"""
+        cache = self.table.prefetch()
+        cache.set(1, ("cint",), (11,))
+        cache.set(3, ("cint", "ctxt"), (33, "c"))
+        self.assertTupleEqual(cache.get(3, ("cint", "ctxt")), (33, "c"))
+        self.assertEqual(cache.n_pending(), 2)
+        cur = self.connection.cursor()
+        sqlquery = "SELECT cint, ctxt FROM %s ORDER BY cat"
+        cur.execute(sqlquery % self.tname)
+        self.assertListEqual(cur.fetchall(), [(10, "a"), (20, "b"), (30, None)])
+        self.table.clear_cache()
+        self.assertIsNone(self.table.cache)
+        cur.execute(sqlquery % self.tname)
+        self.assertListEqual(cur.fetchall(), [(11, "a"), (20, "b"), (33, "c")])
+
+    def test_to_numpy(self):
+        """Test conversion of columns to NumPy arrays"""
+        arrays = self.table.to_numpy()
+        self.assertListEqual(list(arrays), ["cat", "cint", "creal", "ctxt"])
+        np.testing.assert_array_equal(arrays["cint"], [10, 20, 30])
+        self.assertEqual(arrays["cint"].dtype, np.int64)
+        self.assertTrue(np.ma.is_masked(arrays["creal"]))
+        self.assertListEqual(arrays["creal"].mask.tolist(), [False, True, False])
+        self.assertListEqual(arrays["ctxt"].tolist(), ["a", "b", None])
+        arrays = self.table.to_numpy(["cat"], where="cint > 15")
+        np.testing.assert_array_equal(arrays["cat"], [2, 3])
+        cache = self.table.prefetch(["cint"])
+        np.testing.assert_array_equal(cache.to_numpy(["cint"])["cint"], [10, 20, 30])
+
+    def test_record_batches(self):
+        """Test iteration over batches of rows"""
+        batches = list(self.table.record_batches(size=2, columns=["cat", "cint"]))
+        self.assertEqual(len(batches), 2)
+        np.testing.assert_array_equal(batches[0]["cat"], [1, 2])
+        np.testing.assert_array_equal(batches[1]["cint"], [30])
+
+
 if __name__ == "__main__":
     test()
@@ -53,6 +53,19 @@ class VectorTopoTestCase(TestCase):
 
             self.vect.close()
 
+    def test_features_to_arrays(self):
+        """Test the coordinate arrays of all features of a type"""
+        with VectorTopo(self.tmpname, mode="r") as vect:
+            result = list(vect.features_to_arrays(feature_type="line"))
+            self.assertListEqual([f_id for f_id, cat, coords in result], [4, 5, 6])
+            for f_id, cat, coords in result:
+                self.assertEqual(cat, 2)
+                self.assertListEqual(
+                    [tuple(row) for row in coords.tolist()], vect.read(f_id).to_list()
+                )
+            points = list(vect.features_to_arrays(feature_type="point"))
+            self.assertEqual(len(points), vect.number_of("points"))
+
     def test_getitem_raise(self):
         """Test that getitem raise a value error if the key is not
         an integer or a slice"""
@@ -1,119 +1,254 @@
 """Python interface to launch GRASS modules in scripts"""
 
-from . import setup
-from .core import (
-    PIPE,
-    Popen,
-    call,
-    compare_key_value_text_files,
-    create_environment,
-    create_location,
-    create_project,
-    debug,
-    debug_level,
-    del_temp_region,
-    error,
-    exec_command,
-    fatal,
-    feed_command,
-    find_file,
-    find_program,
-    get_capture_stderr,
-    get_commands,
-    get_raise_on_error,
-    get_real_command,
-    gisenv,
-    handle_errors,
-    info,
-    legal_name,
-    list_grouped,
-    list_pairs,
-    list_strings,
-    locn_is_latlong,
-    make_command,
-    mapsets,
-    message,
-    named_colors,
-    overwrite,
-    parse_color,
-    parse_command,
-    parser,
-    percent,
-    pipe_command,
-    popen_args_command,
-    read_command,
-    region,
-    region_env,
-    run_command,
-    sanitize_mapset_environment,
-    set_capture_stderr,
-    set_raise_on_error,
-    start_command,
-    tempdir,
-    tempfile,
-    tempname,
-    use_temp_region,
-    verbose,
-    verbosity,
-    version,
-    warning,
-    write_command,
-)
-from .db import (
-    db_begin_transaction,
-    db_commit_transaction,
-    db_connection,
-    db_describe,
-    db_select,
-    db_table_exist,
-    db_table_in_vector,
-)
-from .imagery import group_to_dict
-from .raster import (
-    mapcalc,
-    mapcalc_start,
-    raster_history,
-    raster_info,
-    raster_what,
-    MaskManager,
-    RegionManager,
-    RegionManagerEnv,
-)
-from .raster3d import mapcalc3d, raster3d_info
-from .utils import (
-    KeyValue,
-    append_node_pid,
-    append_random,
-    append_uuid,
-    basename,
-    clock,
-    decode,
-    diff_files,
-    encode,
-    float_or_dms,
-    get_lib_path,
-    get_num_suffix,
-    legalize_vector_name,
-    natural_sort,
-    naturally_sorted,
-    parse_key_val,
-    separator,
-    set_path,
-    split,
-    text_to_string,
-    try_remove,
-    try_rmdir,
-)
-from .vector import (
-    vector_columns,
-    vector_db,
-    vector_db_select,
-    vector_history,
-    vector_info,
-    vector_info_topo,
-    vector_layer_db,
-    vector_what,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import setup
+    from .core import (
+        PIPE,
+        Popen,
+        call,
+        compare_key_value_text_files,
+        create_environment,
+        create_location,
+        create_project,
+        debug,
+        debug_level,
+        del_temp_region,
+        error,
+        exec_command,
+        fatal,
+        feed_command,
+        find_file,
+        find_program,
+        get_capture_stderr,
+        get_commands,
+        get_raise_on_error,
+        get_real_command,
+        gisenv,
+        handle_errors,
+        info,
+        legal_name,
+        list_grouped,
+        list_pairs,
+        list_strings,
+        locn_is_latlong,
+        make_command,
+        mapsets,
+        message,
+        named_colors,
+        overwrite,
+        parse_color,
+        parse_command,
+        parser,
+        percent,
+        pipe_command,
+        popen_args_command,
+        read_command,
+        region,
+        region_env,
+        run_command,
+        sanitize_mapset_environment,
+        set_capture_stderr,
+        set_raise_on_error,
+        start_command,
+        tempdir,
+        tempfile,
+        tempname,
+        use_temp_region,
+        verbose,
+        verbosity,
+        version,
+        warning,
+        write_command,
+    )
+    from .db import (
+        db_begin_transaction,
+        db_commit_transaction,
+        db_connection,
+        db_describe,
+        db_select,
+        db_table_exist,
+        db_table_in_vector,
+    )
+    from .imagery import group_to_dict
+    from .raster import (
+        mapcalc,
+        mapcalc_start,
+        raster_history,
+        raster_info,
+        raster_what,
+        raster_what_array,
+        MaskManager,
+        RegionManager,
+        RegionManagerEnv,
+    )
+    from .raster3d import mapcalc3d, raster3d_info
+    from .utils import (
+        KeyValue,
+        append_node_pid,
+        append_random,
+        append_uuid,
+        basename,
+        clock,
+        decode,
+        diff_files,
+        encode,
+        float_or_dms,
+        get_lib_path,
+        get_num_suffix,
+        legalize_vector_name,
+        natural_sort,
+        naturally_sorted,
+        parse_key_val,
+        separator,
+        set_path,
+        split,
+        text_to_string,
+        try_remove,
+        try_rmdir,
+    )
+    from .vector import (
+        vector_columns,
+        vector_db,
+        vector_db_connect,
+        vector_db_select,
+        vector_db_select_arrays,
+        vector_db_select_batches,
+        vector_history,
+        vector_info,
+        vector_info_topo,
+        vector_layer_db,
+        vector_what,
+    )
+
+# Submodules are imported when one of their names is accessed for the first
+# time (PEP 562), so that importing the package stays cheap.
+_lazy_imports = {
+    "core": (
+        "PIPE",
+        "Popen",
+        "call",
+        "compare_key_value_text_files",
+        "create_environment",
+        "create_location",
+        "create_project",
+        "debug",
+        "debug_level",
+        "del_temp_region",
+        "error",
+        "exec_command",
+        "fatal",
+        "feed_command",
+        "find_file",
+        "find_program",
+        "get_capture_stderr",
+        "get_commands",
+        "get_raise_on_error",
+        "get_real_command",
+        "gisenv",
+        "handle_errors",
+        "info",
+        "legal_name",
+        "list_grouped",
+        "list_pairs",
+        "list_strings",
+        "locn_is_latlong",
+        "make_command",
+        "mapsets",
+        "message",
+        "named_colors",
+        "overwrite",
+        "parse_color",
+        "parse_command",
+        "parser",
+        "percent",
+        "pipe_command",
+        "popen_args_command",
+        "read_command",
+        "region",
+        "region_env",
+        "run_command",
+        "sanitize_mapset_environment",
+        "set_capture_stderr",
+        "set_raise_on_error",
+        "start_command",
+        "tempdir",
+        "tempfile",
+        "tempname",
+        "use_temp_region",
+        "verbose",
+        "verbosity",
+        "version",
+        "warning",
+        "write_command",
+    ),
+    "db": (
+        "db_begin_transaction",
+        "db_commit_transaction",
+        "db_connection",
+        "db_describe",
+        "db_select",
+        "db_table_exist",
+        "db_table_in_vector",
+    ),
+    "imagery": ("group_to_dict",),
+    "raster": (
+        "mapcalc",
+        "mapcalc_start",
+        "raster_history",
+        "raster_info",
+        "raster_what",
+        "raster_what_array",
+        "MaskManager",
+        "RegionManager",
+        "RegionManagerEnv",
+    ),
+    "raster3d": ("mapcalc3d", "raster3d_info"),
+    "utils": (
+        "KeyValue",
+        "append_node_pid",
+        "append_random",
+        "append_uuid",
+        "basename",
+        "clock",
+        "decode",
+        "diff_files",
+        "encode",
+        "float_or_dms",
+        "get_lib_path",
+        "get_num_suffix",
+        "legalize_vector_name",
+        "natural_sort",
+        "naturally_sorted",
+        "parse_key_val",
+        "separator",
+        "set_path",
+        "split",
+        "text_to_string",
+        "try_remove",
+        "try_rmdir",
+    ),
+    "vector": (
+        "vector_columns",
+        "vector_db",
+        "vector_db_connect",
+        "vector_db_select",
+        "vector_db_select_arrays",
+        "vector_db_select_batches",
+        "vector_history",
+        "vector_info",
+        "vector_info_topo",
+        "vector_layer_db",
+        "vector_what",
+    ),
+}
+_lazy_names = {
+    name: module for module, names in _lazy_imports.items() for name in names
+}
 
 __all__ = [
     "PIPE",
@@ -189,6 +324,7 @@ __all__ = [
     "raster_history",
     "raster_info",
     "raster_what",
+    "raster_what_array",
     "read_command",
     "region",
     "region_env",
@@ -210,7 +346,10 @@ __all__ = [
     "use_temp_region",
     "vector_columns",
     "vector_db",
+    "vector_db_connect",
     "vector_db_select",
+    "vector_db_select_arrays",
+    "vector_db_select_batches",
     "vector_history",
     "vector_info",
     "vector_info_topo",
@@ -222,3 +361,24 @@ __all__ = [
     "warning",
     "write_command",
 ]
+
+
+def __getattr__(name):
+    """Import names and submodules on first access"""
+    module = _lazy_names.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f".{module}", __name__), name)
+        globals()[name] = value
+        return value
+    if not name.startswith("__"):
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -107,6 +107,9 @@ for details.
 .. sectionauthor:: Glynn Clements
 """
 
+import ctypes
+import os
+
 import numpy as np
 
 from .utils import try_remove
@@ -125,17 +128,215 @@ class _tempfile:
         try_remove(self.filename)
 
 
+###############################################################################
+
+# Value of null in CELL maps (smallest 32-bit integer)
+_CELL_NULL = np.iinfo(np.int32).min
+
+
+def _c_libraries(env=None):
+    """Get initialized GIS and Raster libraries for direct access to raster maps
+
+    Returns None if the libraries are not available or when *env* points to
+    a different session than the one of this process (the C libraries can be
+    initialized only once per process).
+    """
+    gisrc = os.environ.get("GISRC")
+    if env is not None and env.get("GISRC") != gisrc:
+        return None
+    if _c_libraries.gisrc is not None and _c_libraries.gisrc != gisrc:
+        # initialized for another session
+        return None
+    try:
+        # pylint: disable=import-outside-toplevel
+        import grass.lib.gis as libgis
+        import grass.lib.raster as libraster
+    except (ImportError, OSError):
+        return None
+    if _c_libraries.gisrc is None:
+        libgis.G_gisinit("grass.script.array")
+        _c_libraries.gisrc = gisrc
+    return libgis, libraster
+
+
+_c_libraries.gisrc = None
+
+
+def _set_c_window(libgis, libraster, reg):
+    """Set the raster window of this process to the region *reg*
+
+    The region is taken from the g.region output rather than from the C
+    library, because the C library reads the region only once per process.
+    """
+    window = libraster.struct_Cell_head()
+    libgis.G_get_window(ctypes.byref(window))
+    window.north = reg["n"]
+    window.south = reg["s"]
+    window.east = reg["e"]
+    window.west = reg["w"]
+    window.rows = reg["rows"]
+    window.cols = reg["cols"]
+    libgis.G_adjust_Cell_head(ctypes.byref(window), 1, 1)
+    libraster.Rast_set_window(ctypes.byref(window))
+
+
+def _null_value(null, dtype):
+    """Get value which represents nulls in an array of *dtype*
+
+    Nulls are zeros by default as in r.out.bin, "nan" can be used
+    for floating point arrays.
+    """
+    if null is None:
+        return 0
+    if isinstance(null, str):
+        if null.lower() == "nan":
+            return np.nan if np.dtype(dtype).kind == "f" else 0
+        return float(null)
+    return null
+
+
+def _row_type(libraster, dtype):
+    """Get GRASS raster type and NumPy type of a row buffer for *dtype*"""
+    dtype = np.dtype(dtype)
+    if dtype.kind == "f":
+        if dtype == np.float32:
+            return libraster.FCELL_TYPE, np.dtype(np.float32)
+        return libraster.DCELL_TYPE, np.dtype(np.float64)
+    if dtype.kind in "biu":
+        return libraster.CELL_TYPE, np.dtype(np.int32)
+    raise ValueError(_("Invalid kind <%s>") % dtype.kind)
+
+
+def _read_direct(out, mapname, null, reg, env=None):
+    """Read raster map into a preallocated 2D array using the C library
+
+    Rows are read directly into the array memory when the array type
+    matches the raster type used by the C library, otherwise through
+    a single row buffer.
+
+    :return: True if the map was read, False if the direct access is not possible
+    """
+    libraries = _c_libraries(env)
+    if libraries is None:
+        return False
+    libgis, libraster = libraries
+    name, mapset = (mapname.split("@", 1) + [""])[:2]
+    if not libgis.G_find_raster2(name, mapset):
+        # Let the tool report the error.
+        return False
+
+    _set_c_window(libgis, libraster, reg)
+    gtype, row_dtype = _row_type(libraster, out.dtype)
+    null_value = _null_value(null, out.dtype)
+    in_place = out.dtype == row_dtype and out.flags.c_contiguous
+    row_buffer = None if in_place else np.empty(out.shape[1], dtype=row_dtype)
+
+    fd = libraster.Rast_open_old(name, mapset)
+    try:
+        for row in range(out.shape[0]):
+            buffer = out[row] if in_place else row_buffer
+            libraster.Rast_get_row(
+                fd, buffer.ctypes.data_as(ctypes.c_void_p), row, gtype
+            )
+            if gtype == libraster.CELL_TYPE:
+                nulls = buffer == _CELL_NULL
+            else:
+                nulls = np.isnan(buffer)
+            if not in_place:
+                out[row] = buffer
+            if np.any(nulls):
+                out[row][nulls] = null_value
+    finally:
+        libraster.Rast_close(fd)
+    return True
+
+
+def _write_direct(data, mapname, title, null, overwrite, quiet, reg, env=None):
+    """Write a 2D array into a raster map using the C library
+
+    Cells with NaN and cells equal to *null* are written as nulls.
+    Progress is reported as by r.in.bin unless *quiet* is True.
+
+    :return: True if the map was written, False if the direct access is not possible
+    """
+    libraries = _c_libraries(env)
+    if libraries is None:
+        return False
+    libgis, libraster = libraries
+    if "@" in mapname or libgis.G_legal_filename(mapname) < 0:
+        # Let the tool report the error.
+        return False
+    if overwrite is None:
+        overwrite = gcore.overwrite()
+    if not overwrite and libgis.G_find_raster2(mapname, libgis.G_mapset()):
+        # Let the tool report the error.
+        return False
+
+    _set_c_window(libgis, libraster, reg)
+    gtype, row_dtype = _row_type(libraster, data.dtype)
+    if null is not None and not (isinstance(null, str) and null.lower() == "nan"):
+        null = float(null)
+    else:
+        null = None
+    row_buffer = np.empty(data.shape[1], dtype=row_dtype)
+    # bit pattern of nulls in the row buffer
+    if gtype == libraster.CELL_TYPE:
+        null_bits = row_buffer.view(np.int32), _CELL_NULL
+    elif gtype == libraster.FCELL_TYPE:
+        null_bits = row_buffer.view(np.uint32), np.uint32(0xFFFFFFFF)
+    else:
+        null_bits = row_buffer.view(np.uint64), np.uint64(0xFFFFFFFFFFFFFFFF)
+
+    verbosity = libgis.G_verbose()
+    if quiet:
+        libgis.G_set_verbose(0)
+    fd = libraster.Rast_open_new(mapname, gtype)
+    try:
+        for index, row in enumerate(data):
+            libgis.G_percent(index, data.shape[0], 2)
+            nulls = np.isnan(row) if data.dtype.kind == "f" else None
+            if null is not None:
+                equal = row == null
+                nulls = equal if nulls is None else nulls | equal
+            row_buffer[:] = np.nan_to_num(row) if nulls is not None else row
+            if nulls is not None:
+                null_bits[0][nulls] = null_bits[1]
+            libraster.Rast_put_row(
+                fd, row_buffer.ctypes.data_as(ctypes.c_void_p), gtype
+            )
+        libgis.G_percent(1, 1, 1)
+    finally:
+        libraster.Rast_close(fd)
+        libgis.G_set_verbose(verbosity)
+
+    if title:
+        libraster.Rast_put_cell_title(mapname, title)
+    history = libraster.struct_History()
+    libraster.Rast_short_history(mapname, "raster", ctypes.byref(history))
+    libraster.Rast_write_history(mapname, ctypes.byref(history))
+    return True
+
+
 ###############################################################################
 
 
 class array(np.memmap):
     # pylint: disable-next=signature-differs; W0222
-    def __new__(cls, mapname=None, null=None, dtype=np.double, env=None):
+    def __new__(cls, mapname=None, null=None, dtype=np.double, env=None, direct=False):
         """Define new numpy array
 
+        When *direct* is True, the raster map is read in this process
+        using the raster C library directly into the array memory.
+        If the C library cannot be used (e.g., when *env* points to a different
+        session), the map is exported by r.out.bin. Note that a fatal error
+        in the C library (e.g., a corrupted raster map) terminates the whole
+        Python process, so the direct access needs to be requested explicitly.
+
         :param cls:
+        :param null: value used for null cells (default: 0, "nan" for NaN)
         :param dtype: data type (default: numpy.double)
         :param env: environment
+        :param bool direct: True to read the map using the C library
         """
         reg = gcore.region(env=env)
         r = reg["rows"]
@@ -143,6 +344,10 @@ class array(np.memmap):
         shape = (r, c)
 
         tempfile = _tempfile(env)
+        if mapname and direct and _c_libraries(env) is not None:
+            self = cls._from_tempfile(tempfile, dtype, shape, env, direct)
+            if _read_direct(self, mapname, null, reg, env=env):
+                return self
         if mapname:
             kind = np.dtype(dtype).kind
             size = np.dtype(dtype).itemsize
@@ -169,6 +374,10 @@ class array(np.memmap):
                 env=env,
             )
 
+        return cls._from_tempfile(tempfile, dtype, shape, env, direct)
+
+    @classmethod
+    def _from_tempfile(cls, tempfile, dtype, shape, env, direct):
         self = np.memmap.__new__(
             cls, filename=tempfile.filename, dtype=dtype, mode="r+", shape=shape
         )
@@ -176,15 +385,24 @@ class array(np.memmap):
         self.tempfile = tempfile
         self.filename = tempfile.filename
         self._env = env
+        self._direct = direct
         return self
 
-    def write(self, mapname, title=None, null=None, overwrite=None, quiet=None):
+    def write(
+        self, mapname, title=None, null=None, overwrite=None, quiet=None, direct=None
+    ):
         """Write array into raster map
 
+        When *direct* is True (or it was set to True when creating
+        the array), the array is written using the raster C library in this
+        process. Cells with NaN are written as nulls. The r.in.bin tool is used
+        otherwise and when the C library cannot be used.
+
         :param str mapname: name for raster map
         :param str title: title for raster map
         :param null: null value
         :param bool overwrite: True for overwriting existing raster maps
+        :param bool direct: True to write the map using the C library
 
         :return: 0 on success
         :return: non-zero code on failure
@@ -207,11 +425,18 @@ class array(np.memmap):
         else:
             raise ValueError(_("Invalid kind <%s>") % kind)
 
+        reg = gcore.region(env=self._env)
+
+        if direct is None:
+            direct = getattr(self, "_direct", False)
+        if direct and _write_direct(
+            self, mapname, title, null, overwrite, quiet, reg, env=self._env
+        ):
+            return 0
+
         # ensure all array content is written to the file
         self.flush()
 
-        reg = gcore.region(env=self._env)
-
         try:
             gcore.run_command(
                 "r.in.bin",
@@ -0,0 +1,293 @@
+"""
+Cache of interface descriptions of GRASS tools
+
+Running ``<tool> --interface-description`` starts a new process and
+produces an XML document which then needs to be parsed. Code which creates
+many tool objects (e.g., :py:class:`grass.pygrass.modules.Module` in the
+temporal framework) pays this cost repeatedly although the description of
+a given executable does not change.
+
+The cache stores the XML per executable in memory for the whole process
+and optionally on disk so that it is shared between processes. The cache
+key is the resolved path of the executable, its modification time,
+the GRASS version and the locale settings, so the cache entry is invalidated
+when the tool or GRASS is rebuilt and the description is not shared between
+languages. Parsed structures can be memoized as well and callers
+are expected to copy them before modifying them.
+
+Usage:
+
+::
+
+    from grass.script.interface_cache import get_interface_cache
+
+    cache = get_interface_cache()
+    xml = cache.get("r.info", fetch=get_xml)
+    print(cache.hits, cache.misses)
+
+The on-disk cache is stored in the directory given by the
+``GRASS_INTERFACE_CACHE_DIR`` environment variable. When the variable is set
+to an empty string, only the in-memory cache is used.
+
+(C) 2025 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+CACHE_DIR_VARIABLE = "GRASS_INTERFACE_CACHE_DIR"
+
+# Variables which determine the language of the descriptions
+LOCALE_VARIABLES = ("GRASS_LANG", "LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG")
+
+
+@cache
+def _grass_version(gisbase: str | None) -> str:
+    """Get GRASS version from the installation without running g.version"""
+    if not gisbase:
+        return ""
+    try:
+        with open(os.path.join(gisbase, "etc", "VERSIONNUMBER")) as version_file:
+            return version_file.read().strip()
+    except OSError:
+        return ""
+
+
+def user_cache_directory(env: dict | None = None) -> str | None:
+    """Get the GRASS directory in the user cache directory
+
+    :param env: environment (defaults to ``os.environ``)
+    :return: path to the directory or None when it cannot be determined
+    """
+    if env is None:
+        env = os.environ
+    if sys.platform == "win32":
+        base = env.get("LOCALAPPDATA")
+        if not base:
+            return None
+        return os.path.join(base, "GRASS", "cache")
+    base = env.get("XDG_CACHE_HOME")
+    if not base:
+        home = env.get("HOME")
+        if not home:
+            return None
+        base = os.path.join(home, ".cache")
+    return os.path.join(base, "grass")
+
+
+def default_cache_directory(env: dict | None = None) -> str | None:
+    """Get the directory for the on-disk cache of interface descriptions
+
+    The directory is given by the ``GRASS_INTERFACE_CACHE_DIR`` variable.
+    If the variable is not set, a directory in the user cache directory is used.
+
+    :param env: environment (defaults to ``os.environ``)
+    :return: path to the directory or None when the on-disk cache is disabled
+    """
+    if env is None:
+        env = os.environ
+    if CACHE_DIR_VARIABLE in env:
+        return env[CACHE_DIR_VARIABLE] or None
+    base = user_cache_directory(env)
+    if not base:
+        return None
+    return os.path.join(base, "interface")
+
+
+class InterfaceCache:
+    """Process-wide and on-disk cache of tool interface descriptions
+
+    :param directory: directory for the on-disk cache,
+                      None to use only the in-memory cache
+    """
+
+    def __init__(self, directory: str | None = None):
+        self.directory = directory
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._descriptions: dict[tuple, bytes] = {}
+        self._parsed: dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def key(self, cmd: str, env: dict | None = None) -> tuple | None:
+        """Get cache key for a tool
+
+        The key consists of the full path to the executable, its modification
+        time, the GRASS version and the values of the locale variables
+        because the descriptions are translated.
+
+        :param cmd: tool name or path to the executable
+        :param env: environment used to find the executable
+        :return: key as a tuple or None when the executable cannot be found
+        """
+        if env is None:
+            env = os.environ
+        path = shutil.which(cmd, path=env.get("PATH"))
+        if not path:
+            return None
+        path = os.path.realpath(path)
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return None
+        return (
+            path,
+            stat.st_mtime_ns,
+            stat.st_size,
+            _grass_version(env.get("GISBASE")),
+            tuple(env.get(name, "") for name in LOCALE_VARIABLES),
+        )
+
+    def _disk_path(self, key: tuple) -> str:
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + ".xml")
+
+    def _read_disk(self, key: tuple) -> bytes | None:
+        if not self.directory:
+            return None
+        try:
+            with open(self._disk_path(key), "rb") as cache_file:
+                return cache_file.read()
+        except OSError:
+            return None
+
+    def _write_disk(self, key: tuple, description: bytes) -> None:
+        if not self.directory:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file first, so that concurrent processes
+            # never read a partially written file.
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as cache_file:
+                cache_file.write(description)
+            Path(tmp_name).replace(self._disk_path(key))
+        except OSError:
+            # The on-disk cache is only an optimization.
+            pass
+
+    def get(
+        self, cmd: str, fetch: Callable[[str], bytes], env: dict | None = None
+    ) -> bytes:
+        """Get interface description of a tool
+
+        :param cmd: tool name or path to the executable
+        :param fetch: function which obtains the description for *cmd*
+                      when it is not cached
+        :param env: environment used to find the executable
+        :return: interface description (XML) as bytes
+        """
+        key = self.key(cmd, env=env)
+        if key is None:
+            with self._lock:
+                self.misses += 1
+            return fetch(cmd)
+        with self._lock:
+            description = self._descriptions.get(key)
+            if description is not None:
+                self.hits += 1
+                return description
+        description = self._read_disk(key)
+        if description:
+            with self._lock:
+                self.disk_hits += 1
+                self._descriptions[key] = description
+            return description
+        description = fetch(cmd)
+        with self._lock:
+            self.misses += 1
+            if not description:
+                # Empty output means the tool failed, so it is not cached.
+                return description
+            self._descriptions[key] = description
+        self._write_disk(key, description)
+        return description
+
+    def get_parsed(
+        self,
+        cmd: str,
+        fetch: Callable[[str], bytes],
+        parse: Callable[[bytes], object],
+        env: dict | None = None,
+    ) -> object:
+        """Get parsed interface description of a tool
+
+        The result of *parse* is stored in memory and the same object is
+        returned for subsequent calls, so callers need to copy it before
+        modifying it. Results are stored separately for each *parse* function.
+
+        :param cmd: tool name or path to the executable
+        :param fetch: function which obtains the description for *cmd*
+        :param parse: function which creates the parsed structure from XML
+        :param env: environment used to find the executable
+        """
+        key = self.key(cmd, env=env)
+        if key is None:
+            return parse(self.get(cmd, fetch=fetch, env=env))
+        parsed_key = (*key, parse)
+        with self._lock:
+            if parsed_key in self._parsed:
+                self.hits += 1
+                return self._parsed[parsed_key]
+        parsed = parse(self.get(cmd, fetch=fetch, env=env))
+        with self._lock:
+            self._parsed[parsed_key] = parsed
+        return parsed
+
+    def stats(self) -> dict[str, int]:
+        """Get cache counters
+
+        :return: dictionary with number of hits, disk hits, and misses
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._descriptions),
+            }
+
+    def clear(self, disk: bool = False) -> None:
+        """Remove all cached entries and reset counters
+
+        :param disk: also remove files from the on-disk cache
+        """
+        with self._lock:
+            self._descriptions.clear()
+            self._parsed.clear()
+            self.hits = self.disk_hits = self.misses = 0
+        if disk and self.directory and os.path.isdir(self.directory):
+            for path in Path(self.directory).glob("*.xml"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_interface_cache() -> InterfaceCache:
+    """Get the process-wide interface description cache"""
+    global _cache  # pylint: disable=global-statement
+    with _cache_lock:
+        if _cache is None:
+            _cache = InterfaceCache(directory=default_cache_directory())
+        return _cache
@@ -34,8 +34,10 @@ from .core import (
     region_env,
     write_command,
     feed_command,
+    handle_errors,
     warning,
     fatal,
+    PIPE,
 )
 from grass.exceptions import CalledModuleError
 from .utils import (
@@ -219,6 +221,22 @@ def mapcalc_start(
     return p
 
 
+def _read_what(map_list, points, env=None, **kwargs):
+    """Run r.what with points given on standard input and return its output
+
+    :param list map_list: list of map names
+    :param str points: lines with easting, northing and optional label
+    :param env: environment
+    :param kwargs: other parameters of r.what
+    """
+    kwargs.update(map=",".join(map_list), quiet=True, env=env)
+    process = feed_command("r.what", stdout=PIPE, stderr=PIPE, **kwargs)
+    stdout, stderr = process.communicate(points)
+    return handle_errors(
+        process.poll(), stdout, ["r.what"], kwargs, stderr=stderr, env=env
+    )
+
+
 def raster_what(map, coord, env=None, localized=False):
     """Interface to r.what
 
@@ -233,22 +251,22 @@ def raster_what(map, coord, env=None, localized=False):
 
     coord_list = []
     if isinstance(coord, tuple):
-        coord_list.append("%f,%f" % (coord[0], coord[1]))
+        coord_list.append("%f %f" % (coord[0], coord[1]))
     else:
         for e, n in coord:
-            coord_list.append("%f,%f" % (e, n))
+            coord_list.append("%f %f" % (e, n))
 
     sep = "|"
     # separator '|' not included in command
     # because | is causing problems on Windows
     # change separator?
-    ret = read_command(
-        "r.what",
+    # coordinates are passed on standard input to avoid command line
+    # length limits
+    ret = _read_what(
+        map_list,
+        "\n".join(coord_list) + "\n",
         flags="rf",
-        map=",".join(map_list),
-        coordinates=",".join(coord_list),
         null=_("No data"),
-        quiet=True,
         env=env,
     )
     data = []
@@ -271,6 +289,72 @@ def raster_what(map, coord, env=None, localized=False):
     return data
 
 
+def raster_what_array(map, coord, env=None, chunk_size=50000, nprocs=1):
+    """Query values of raster maps at many points using r.what
+
+    Coordinates are passed to r.what on standard input in chunks, so the
+    number of points is not limited by the length of the command line.
+    With *nprocs* greater than 1, chunks are queried by several r.what
+    processes running at the same time.
+
+    >>> values = raster_what_array("elevation", [[640000, 228000], [0, 0]])
+    >>> values["elevation"]  # doctest: +SKIP
+    array([102.47967529,          nan])
+
+    :param map: the map name or a list of map names
+    :param coord: array of shape (n, 2) with easting and northing of points
+    :param env: environment
+    :param int chunk_size: number of points queried by one r.what process
+    :param int nprocs: number of r.what processes running at the same time
+    :return: NumPy structured array with a float field for each map,
+             null values and points outside of the computational region
+             are NaN
+    :raises ValueError: when a map is listed more than once
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    import numpy as np
+
+    map_list = [map] if isinstance(map, (bytes, str)) else list(map)
+    if len(set(map_list)) != len(map_list):
+        # fields of the structured array are named by maps
+        duplicates = sorted({name for name in map_list if map_list.count(name) > 1})
+        msg = f"Raster maps can be listed only once, duplicate: {', '.join(duplicates)}"
+        raise ValueError(msg)
+    coord = np.asarray(coord, dtype=np.float64).reshape(-1, 2)
+    values = np.full(len(coord), np.nan, dtype=[(name, "f8") for name in map_list])
+    if not len(coord) or not map_list:
+        return values
+
+    def query(start):
+        chunk = coord[start : start + chunk_size]
+        # point index is used as label to match output lines to points
+        points = "".join(
+            "%.17g %.17g %d\n" % (e, n, start + i) for i, (e, n) in enumerate(chunk)
+        )
+        ret = _read_what(map_list, points, null="nan", env=env)
+        if not ret.strip():
+            return
+        result = np.loadtxt(
+            ret.splitlines(),
+            delimiter="|",
+            usecols=range(2, 3 + len(map_list)),
+            ndmin=2,
+        )
+        for i, name in enumerate(map_list):
+            values[name][result[:, 0].astype(np.int64)] = result[:, i + 1]
+
+    starts = range(0, len(coord), chunk_size)
+    if nprocs > 1 and len(starts) > 1:
+        with ThreadPoolExecutor(max_workers=nprocs) as executor:
+            # consume results to raise exceptions from the workers
+            list(executor.map(query, starts))
+    else:
+        for start in starts:
+            query(start)
+    return values
+
+
 class MaskManager:
     """Context manager for setting and managing 2D raster mask.
 
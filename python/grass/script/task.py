@@ -19,6 +19,7 @@ for details.
 .. sectionauthor:: Martin Landa <landa.martin gmail.com>
 """
 
+import copy
 import os
 import re
 import sys
@@ -28,6 +29,7 @@ from xml.parsers import expat
 from grass.exceptions import ScriptError
 from .utils import decode, split
 from .core import Popen, PIPE, get_real_command
+from .interface_cache import get_interface_cache
 
 ETREE_EXCEPTIONS = (ET.ParseError, expat.ExpatError)
 
@@ -435,12 +437,8 @@ def convert_xml_to_utf8(xml_text):
     return p.sub(b'encoding="utf-8"', xml_text_utf8)
 
 
-def get_interface_description(cmd):
-    """Returns the XML description for the GRASS cmd (force text encoding to
-    "utf-8").
-
-    The DTD must be located in $GISBASE/gui/xml/grass-interface.dtd,
-    otherwise the parser will not succeed.
+def _fetch_interface_description(cmd):
+    """Run the command to get its XML description (converted to "utf-8")
 
     :param cmd: command (name of GRASS module)
     :raises ~grass.exceptions.ScriptError:
@@ -489,7 +487,30 @@ def get_interface_description(cmd):
             ).format(cmd=cmd, det=e)
         )
 
-    desc = convert_xml_to_utf8(cmdout)
+    return convert_xml_to_utf8(cmdout)
+
+
+def get_interface_description(cmd):
+    """Returns the XML description for the GRASS cmd (force text encoding to
+    "utf-8").
+
+    The DTD must be located in $GISBASE/gui/xml/grass-interface.dtd,
+    otherwise the parser will not succeed.
+
+    The description is cached per executable, see
+    :py:mod:`grass.script.interface_cache`.
+
+    :param cmd: command (name of GRASS module)
+    :raises ~grass.exceptions.ScriptError:
+        When unable to fetch the interface description for a command.
+    """
+    return _add_dtd_path(
+        get_interface_cache().get(cmd, fetch=_fetch_interface_description)
+    )
+
+
+def _add_dtd_path(desc):
+    """Point the XML description to the DTD in the GRASS installation"""
     return desc.replace(
         b"grass-interface.dtd",
         os.path.join(os.getenv("GISBASE"), "gui", "xml", "grass-interface.dtd").encode(
@@ -498,6 +519,21 @@ def get_interface_description(cmd):
     )
 
 
+def _parse_task(desc):
+    """Create grassTask from XML description as stored in the cache"""
+    return processTask(ET.fromstring(_add_dtd_path(desc))).get_task()
+
+
+def _copy_task(task):
+    """Copy grassTask so that its parameters and flags can be modified"""
+    new_task = copy.copy(task)
+    new_task.params = [param.copy() for param in task.params]
+    new_task.flags = [flag.copy() for flag in task.flags]
+    new_task.keywords = list(task.keywords)
+    new_task.blackList = copy.deepcopy(task.blackList)
+    return new_task
+
+
 def parse_interface(name, parser=processTask, blackList=None):
     """Parse interface of given GRASS module
 
@@ -512,14 +548,22 @@ def parse_interface(name, parser=processTask, blackList=None):
         When the interface description of a module cannot be parsed.
     """
     try:
-        tree = ET.fromstring(get_interface_description(name))
+        if parser is processTask and blackList is None:
+            # The parsed task is shared through the cache, so work on a copy.
+            task = _copy_task(
+                get_interface_cache().get_parsed(
+                    name, fetch=_fetch_interface_description, parse=_parse_task
+                )
+            )
+        else:
+            tree = ET.fromstring(get_interface_description(name))
+            task = parser(tree, blackList=blackList).get_task()
     except ETREE_EXCEPTIONS as error:
         raise ScriptError(
             _("Cannot parse interface description of <{name}> module: {error}").format(
                 name=name, error=error
             )
         )
-    task = parser(tree, blackList=blackList).get_task()
     # if name from interface is different than the originally
     # provided name, then the provided name is likely a full path needed
     # to actually run the module later
@@ -0,0 +1,78 @@
+"""Tests of grass.script.array"""
+
+import os
+
+import numpy as np
+import pytest
+
+import grass.script as gs
+from grass.exceptions import CalledModuleError
+from grass.script import array as garray
+
+
+@pytest.fixture
+def session_with_nulls(tmp_path, monkeypatch):
+    """Active session with a map with nulls, patching env vars directly.
+
+    The direct access through the C library uses the process environment."""
+    project = tmp_path / "xy_test"
+    gs.create_project(project)
+    with gs.setup.init(project, env=os.environ.copy()) as session:
+        for key, value in session.env.items():
+            monkeypatch.setenv(key, value)
+        gs.run_command("g.region", rows=3, cols=4)
+        gs.mapcalc("data = if(row() == 2 && col() == 3, null(), row() + col() / 10.)")
+        yield session
+
+
+def test_direct_read_matches_tool(session_with_nulls):
+    """Direct read gives the same result as r.out.bin"""
+    direct = garray.array("data", direct=True)
+    exported = garray.array("data")
+    np.testing.assert_array_equal(direct, exported)
+    assert direct[1, 2] == 0
+    with_nan = garray.array("data", null="nan", direct=True)
+    assert np.isnan(with_nan[1, 2])
+    assert np.count_nonzero(np.isnan(with_nan)) == 1
+
+
+def test_direct_write_nulls(session_with_nulls):
+    """NaN is written as null and the map can be read back"""
+    data = garray.array("data", null="nan", dtype=np.float32, direct=True)
+    assert data.write("copy", title="Copy of data") == 0
+    info = gs.raster_info("copy")
+    assert info["datatype"] == "FCELL"
+    assert info["title"] == "Copy of data"
+    univar = gs.parse_command("r.univar", map="copy", flags="g")
+    assert int(univar["null_cells"]) == 1
+    copy = garray.array("copy", null="nan", dtype=np.float32, direct=True)
+    np.testing.assert_array_equal(np.isnan(copy), np.isnan(data))
+
+
+def test_integer_write(session_with_nulls):
+    """Integer arrays are written as CELL maps with null value"""
+    data = garray.array(dtype=np.int32)
+    data[:] = 5
+    data[0, 0] = -1
+    assert data.write("integers", null=-1, direct=True) == 0
+    assert gs.raster_info("integers")["datatype"] == "CELL"
+    univar = gs.parse_command("r.univar", map="integers", flags="g")
+    assert int(univar["null_cells"]) == 1
+
+
+def test_direct_invalid_names(session_with_nulls):
+    """Invalid names are reported by the tools, not by the C library"""
+    with pytest.raises(CalledModuleError):
+        garray.array("does_not_exist", direct=True)
+    data = garray.array(direct=True)
+    assert data.write("not a valid name") == 1
+
+
+def test_direct_write_quiet(session_with_nulls, capfd):
+    """Progress is not reported when writing quietly"""
+    data = garray.array(direct=True)
+    data[:] = 1
+    capfd.readouterr()
+    assert data.write("quiet_copy", quiet=True) == 0
+    assert not capfd.readouterr().err
+    assert gs.raster_info("quiet_copy")["max"] == 1
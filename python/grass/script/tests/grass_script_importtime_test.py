@@ -0,0 +1,64 @@
+"""Test how much is imported at startup of tools using grass.script"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+
+def imported_modules(code):
+    """Run code in a new interpreter and return names of imported modules"""
+    code += "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    stdout = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(stdout.splitlines()[-1])
+
+
+def test_import_package():
+    """Importing the package does not import its submodules"""
+    modules = imported_modules("import grass.script")
+    assert "grass.script" in modules
+    assert not [name for name in modules if name.startswith("grass.script.")]
+    assert "numpy" not in modules
+
+
+@pytest.mark.parametrize(
+    "names",
+    [
+        # r.mapcalc.simple
+        ["parser", "run_command", "fatal"],
+        # g.extension-like tools
+        ["parser", "read_command", "parse_command", "warning", "tempfile"],
+    ],
+)
+def test_tool_imports(names):
+    """Tools using only core functions do not import other submodules"""
+    code = "import grass.script as gs\n" + "\n".join(f"gs.{name}" for name in names)
+    modules = imported_modules(code)
+    assert "grass.script.core" in modules
+    for module in (
+        "numpy",
+        "grass.script.array",
+        "grass.script.db",
+        "grass.script.raster",
+        "grass.script.raster3d",
+        "grass.script.setup",
+        "grass.script.vector",
+    ):
+        assert module not in modules
+
+
+def test_names_unchanged():
+    """All names in __all__ are available and star import works"""
+    import grass.script as gs
+
+    namespace = {}
+    exec("from grass.script import *", namespace)  # noqa: S102
+    for name in gs.__all__:
+        assert name in namespace
+        assert getattr(gs, name) is namespace[name]
+    assert gs.core.run_command is gs.run_command
+    with pytest.raises(AttributeError):
+        gs.no_such_function  # noqa: B018
@@ -0,0 +1,134 @@
+"""Tests of grass.script.interface_cache"""
+
+import os
+import sys
+
+import pytest
+
+from grass.script.interface_cache import InterfaceCache, default_cache_directory
+
+XML = b'<?xml version="1.0" encoding="UTF-8"?><task name="x.fake"></task>'
+
+
+@pytest.fixture
+def fake_tool(tmp_path, monkeypatch):
+    """Create an executable on PATH and return its path"""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    tool = bin_dir / "x.fake"
+    tool.write_text("#!/bin/sh\necho fake\n")
+    tool.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir), prepend=os.pathsep)
+    return tool
+
+
+class Fetcher:
+    """Fetch function which counts how many times it was called"""
+
+    def __init__(self, description=XML):
+        self.calls = 0
+        self.description = description
+
+    def __call__(self, cmd):
+        self.calls += 1
+        return self.description
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a shell script as a tool")
+def test_memory_hits(fake_tool):
+    """Description is fetched only once per process"""
+    cache = InterfaceCache()
+    fetch = Fetcher()
+    assert cache.get("x.fake", fetch=fetch) == XML
+    assert cache.get("x.fake", fetch=fetch) == XML
+    assert fetch.calls == 1
+    assert cache.misses == 1
+    assert cache.hits == 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a shell script as a tool")
+def test_disk_hits(fake_tool, tmp_path):
+    """Description stored on disk is used by another cache instance"""
+    directory = tmp_path / "cache"
+    fetch = Fetcher()
+    InterfaceCache(directory=str(directory)).get("x.fake", fetch=fetch)
+    cache = InterfaceCache(directory=str(directory))
+    assert cache.get("x.fake", fetch=fetch) == XML
+    assert fetch.calls == 1
+    assert cache.stats()["disk_hits"] == 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a shell script as a tool")
+def test_modified_executable_invalidates(fake_tool):
+    """Change of the executable leads to a new fetch"""
+    cache = InterfaceCache()
+    fetch = Fetcher()
+    cache.get("x.fake", fetch=fetch)
+    stat = fake_tool.stat()
+    os.utime(fake_tool, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cache.get("x.fake", fetch=fetch)
+    assert fetch.calls == 2
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a shell script as a tool")
+def test_parsed_is_memoized(fake_tool):
+    """Parse function is called once for the same executable"""
+    cache = InterfaceCache()
+    fetch = Fetcher()
+    parsed = cache.get_parsed("x.fake", fetch=fetch, parse=len)
+    assert parsed == len(XML)
+    assert cache.get_parsed("x.fake", fetch=fetch, parse=len) == parsed
+    assert fetch.calls == 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a shell script as a tool")
+def test_locale_in_key(fake_tool, tmp_path, monkeypatch):
+    """Description is cached separately for each language"""
+    cache = InterfaceCache(directory=str(tmp_path / "cache"))
+    fetch = Fetcher()
+    monkeypatch.setenv("LC_ALL", "C")
+    cache.get("x.fake", fetch=fetch)
+    monkeypatch.setenv("LC_ALL", "de_DE.UTF-8")
+    cache.get("x.fake", fetch=fetch)
+    assert fetch.calls == 2
+    assert cache.get("x.fake", fetch=fetch, env={**os.environ, "LC_ALL": "C"}) == XML
+    assert fetch.calls == 2
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a shell script as a tool")
+def test_empty_output_not_cached(fake_tool, tmp_path):
+    """Empty output of a failed tool is not stored"""
+    directory = tmp_path / "cache"
+    cache = InterfaceCache(directory=str(directory))
+    assert cache.get("x.fake", fetch=Fetcher(b"")) == b""
+    assert cache.stats()["entries"] == 0
+    assert not directory.exists() or not list(directory.iterdir())
+    fetch = Fetcher()
+    assert cache.get("x.fake", fetch=fetch) == XML
+    assert fetch.calls == 1
+
+
+def test_unknown_executable_not_cached():
+    """Tools which cannot be found are always fetched"""
+    cache = InterfaceCache()
+    fetch = Fetcher()
+    cache.get("x.does.not.exist", fetch=fetch)
+    cache.get("x.does.not.exist", fetch=fetch)
+    assert fetch.calls == 2
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a shell script as a tool")
+def test_clear_resets_counters(fake_tool, tmp_path):
+    """Clearing the cache removes entries and counters"""
+    cache = InterfaceCache(directory=str(tmp_path / "cache"))
+    cache.get("x.fake", fetch=Fetcher())
+    cache.clear(disk=True)
+    assert cache.stats() == {"hits": 0, "disk_hits": 0, "misses": 0, "entries": 0}
+    assert not list((tmp_path / "cache").iterdir())
+
+
+def test_cache_directory_variable():
+    """Empty variable disables the on-disk cache"""
+    assert default_cache_directory({"GRASS_INTERFACE_CACHE_DIR": ""}) is None
+    assert default_cache_directory({"GRASS_INTERFACE_CACHE_DIR": "/x"}) == "/x"
@@ -0,0 +1,85 @@
+"""Test typed columnar reading of vector attributes"""
+
+import numpy as np
+import pytest
+
+import grass.script as gs
+
+
+@pytest.fixture
+def points(empty_session):
+    """Vector map with points and an attribute table with a NULL value"""
+    env = empty_session.env
+    gs.write_command(
+        "v.in.ascii",
+        input="-",
+        output="points",
+        columns="cat integer, value double precision, count integer, name text",
+        cat=1,
+        x=2,
+        y=3,
+        stdin="1|0|0|0.5|10|a\n2|1|1|1.5||b\n3|2|2|2.5|30|c\n",
+        separator="pipe",
+        env=env,
+    )
+    return env
+
+
+def test_arrays(points):
+    """Columns are returned as typed arrays"""
+    data = gs.vector_db_select_arrays("points", env=points)
+    assert data["cat"].tolist() == [1, 2, 3]
+    assert data["cat"].dtype == np.int64
+    assert data["value"].tolist() == [0.5, 1.5, 2.5]
+    assert data["name"].tolist() == ["a", "b", "c"]
+    assert isinstance(data["count"], np.ma.MaskedArray)
+    assert data["count"].mask.tolist() == [False, True, False]
+
+
+def test_columns_where(points):
+    """Only selected columns and rows are returned"""
+    data = gs.vector_db_select_arrays(
+        "points", columns=["cat", "value"], where="cat > 1", env=points
+    )
+    assert list(data.keys()) == ["cat", "value"]
+    assert data["cat"].tolist() == [2, 3]
+
+
+def test_batches(points):
+    """Batches together contain all rows"""
+    batches = list(gs.vector_db_select_batches("points", size=2, env=points))
+    assert [len(batch["cat"]) for batch in batches] == [2, 1]
+    assert np.concatenate([batch["value"] for batch in batches]).tolist() == [
+        0.5,
+        1.5,
+        2.5,
+    ]
+
+
+def test_same_as_vector_db_select(points):
+    """Values are the same as values from vector_db_select"""
+    expected = gs.vector_db_select("points", env=points)
+    data = gs.vector_db_select_arrays("points", env=points)
+    assert list(data.keys()) == expected["columns"]
+    for index, cat in enumerate(data["cat"]):
+        assert float(expected["values"][cat][1]) == data["value"][index]
+
+
+def test_batches_ordered_by_key(empty_session):
+    """Batches are ordered by the key column, not by the order of insertion"""
+    env = empty_session.env
+    gs.write_command(
+        "v.in.ascii",
+        input="-",
+        output="unordered",
+        columns="cat integer, value double precision",
+        cat=1,
+        x=2,
+        y=3,
+        stdin="3|0|0|3.5\n1|1|1|1.5\n2|2|2|2.5\n",
+        separator="pipe",
+        env=env,
+    )
+    batches = list(gs.vector_db_select_batches("unordered", size=2, env=env))
+    assert [batch["cat"].tolist() for batch in batches] == [[1, 2], [3]]
+    assert batches[0]["value"].tolist() == [1.5, 2.5]
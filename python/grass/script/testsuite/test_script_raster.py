@@ -4,6 +4,8 @@ Created on Thu Feb 18 09:42:23 2016
 @author: lucadelu
 """
 
+import math
+
 from grass.gunittest.case import TestCase
 from grass.gunittest.main import test
 
@@ -14,16 +16,23 @@ class TestRaster(TestCase):
     """Test raster functions"""
 
     raster = "testrasterscript"
+    raster2 = "testrasterscript2"
 
     @classmethod
     def setUpClass(cls):
         cls.region = gs.region()
         cls.coords = (cls.region["e"] - 1, cls.region["n"] - 1)
         cls.runModule("r.mapcalc", expression="testrasterscript = 100", overwrite=True)
+        cls.runModule("r.mapcalc", expression="testrasterscript2 = 200", overwrite=True)
 
     @classmethod
     def tearDownClass(cls):
-        cls.runModule("g.remove", type="raster", name="testrasterscript", flags="f")
+        cls.runModule(
+            "g.remove",
+            type="raster",
+            name="testrasterscript,testrasterscript2",
+            flags="f",
+        )
 
     def test_raster_what(self):
         res = gs.raster_what(self.raster, [self.coords])[0]
@@ -32,6 +41,32 @@ class TestRaster(TestCase):
         res = gs.raster_what(self.raster, [self.coords], localized=True)[0]
         self.assertEqual(int(res[self.raster][_("value")]), 100)
 
+    def test_raster_what_array(self):
+        outside = (self.region["e"] + 1, self.region["n"] - 1)
+        res = gs.raster_what_array(
+            [self.raster, self.raster2], [self.coords, outside, self.coords]
+        )
+        self.assertEqual(res.dtype.names, (self.raster, self.raster2))
+        self.assertEqual(res[self.raster][0], 100)
+        self.assertTrue(math.isnan(res[self.raster][1]))
+        self.assertEqual(res[self.raster][2], 100)
+        self.assertEqual(res[self.raster2][0], 200)
+        self.assertTrue(math.isnan(res[self.raster2][1]))
+
+    def test_raster_what_array_duplicate(self):
+        with self.assertRaises(ValueError):
+            gs.raster_what_array([self.raster, self.raster], [self.coords])
+
+    def test_raster_what_array_chunks(self):
+        coords = [
+            (self.region["w"] + i * self.region["ewres"], self.coords[1])
+            for i in range(10)
+        ]
+        expected = gs.raster_what_array(self.raster, coords)
+        for nprocs in (1, 3):
+            res = gs.raster_what_array(self.raster, coords, chunk_size=3, nprocs=nprocs)
+            self.assertEqual(res.tolist(), expected.tolist())
+
     def test_raster_info(self):
         res = gs.raster_info(self.raster)
         self.assertEqual(str(res["cols"]), str(self.region["cols"]))
@@ -307,6 +307,240 @@ def vector_db_select(map, layer=1, env=None, **kwargs):
     return {"columns": columns, "values": values}
 
 
+def _numpy_dtype(ctype):
+    """Return the NumPy type used for a column of the given SQL type
+
+    >>> _numpy_dtype("INTEGER"), _numpy_dtype("int4")
+    ('int64', 'int64')
+    >>> _numpy_dtype("DOUBLE PRECISION"), _numpy_dtype("TEXT")
+    ('float64', 'object')
+    """
+    ctype = ctype.upper()
+    if "INT" in ctype and "INTERVAL" not in ctype:
+        return "int64"
+    if any(name in ctype for name in ("DOUBLE", "REAL", "FLOAT", "NUMERIC", "DECIMAL")):
+        return "float64"
+    return "object"
+
+
+def _column_array(values, ctype, null=None):
+    """Return the values of a column as NumPy array
+
+    Numeric columns with NULL values are returned as masked arrays.
+
+    :param values: sequence of values
+    :param str ctype: SQL type of the column
+    :param null: value representing NULL in *values*
+    """
+    import numpy as np
+
+    dtype = _numpy_dtype(ctype)
+    if dtype == "object":
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+    mask = [value is None or value == null for value in values]
+    if any(mask):
+        data = [0 if masked else value for value, masked in zip(values, mask)]
+        return np.ma.masked_array(np.array(data, dtype=dtype), mask=mask)
+    return np.array(values, dtype=dtype)
+
+
+def vector_db_connect(driver, database, readonly=True, autocommit=False, timeout=5.0):
+    """Connect directly to the database of a vector map layer using DB-API
+
+    Only SQLite and PostgreSQL (with psycopg2 installed) are supported.
+    Other drivers need to be accessed using the database tools
+    (e.g., *db.select* or *v.db.select*).
+
+    :Example:
+      .. code-block:: pycon
+
+        >>> link = vector_db("geology")[1]
+        >>> connection = vector_db_connect(link["driver"], link["database"])
+        >>> cursor = connection.cursor()
+        >>> _ = cursor.execute("SELECT cat FROM %s WHERE cat = 1" % link["table"])
+        >>> cursor.fetchone()
+        (1,)
+        >>> connection.close()
+
+    :param str driver: database driver
+    :param str database: database name (with substituted variables)
+    :param bool readonly: open SQLite database in read-only mode
+    :param bool autocommit: use autocommit mode, so that the connection does
+                            not keep tables locked for other processes
+    :param float timeout: how long to wait for a locked SQLite database (seconds)
+
+    :return: DB-API connection or None when the driver is not supported
+             or the connection failed
+    """
+    if driver == "sqlite":
+        import sqlite3
+        from pathlib import Path
+
+        kwargs = {"timeout": timeout}
+        if autocommit:
+            kwargs["isolation_level"] = None
+        try:
+            if readonly:
+                return sqlite3.connect(
+                    Path(database).as_uri() + "?mode=ro", uri=True, **kwargs
+                )
+            return sqlite3.connect(database, **kwargs)
+        except (sqlite3.Error, ValueError) as error:
+            debug("Cannot connect to database <%s>: %s" % (database, error))
+            return None
+    if driver == "pg":
+        try:
+            import psycopg2
+        except ImportError:
+            return None
+        try:
+            connection = psycopg2.connect(" ".join(database.split(",")))
+        except psycopg2.Error as error:
+            debug("Cannot connect to database <%s>: %s" % (database, error))
+            return None
+        connection.autocommit = autocommit
+        return connection
+    return None
+
+
+def vector_db_select_batches(
+    map, layer=1, columns=None, where=None, size=100000, env=None
+):
+    """Get attribute data of a vector map layer in batches of rows.
+
+    Tables in SQLite and PostgreSQL (with psycopg2 installed) databases
+    are queried directly, other tables are read using *v.db.select*.
+    Rows are ordered by the key column of the layer.
+    Values are typed according to the column types: integer and
+    floating point columns are NumPy arrays of int64 and float64 (masked
+    arrays when they contain NULL values), other columns are arrays of
+    Python objects.
+
+    :Example:
+      .. code-block:: pycon
+
+        >>> batches = vector_db_select_batches("geology", size=1000)
+        >>> batch = next(batches)
+        >>> len(batch["cat"]), batch["cat"].dtype, batch["SHAPE_area"].dtype
+        (1000, dtype('int64'), dtype('float64'))
+
+    :param str map: map name
+    :param int layer: layer number
+    :param columns: list of column names, None for all columns
+    :param str where: SQL WHERE condition
+    :param int size: maximum number of rows in one batch
+    :param env: environment
+
+    :return: generator of dictionaries with an array for each column
+    """
+    try:
+        link = vector_db(map=map, env=env)[layer]
+    except KeyError:
+        error(
+            _("Missing layer %(layer)d in vector map <%(map)s>")
+            % {"layer": layer, "map": map},
+            env=env,
+        )
+        return
+    if isinstance(columns, str):
+        columns = columns.split(",")
+    types = {
+        name.lower(): column["type"]
+        for name, column in vector_columns(map, layer=layer, env=env).items()
+    }
+
+    connection = vector_db_connect(link["driver"], link["database"])
+    if connection is None:
+        debug("Reading attributes of <%s> using v.db.select" % map, env=env)
+        kwargs = {"where": where} if where else {}
+        if columns:
+            kwargs["columns"] = ",".join(columns)
+        try:
+            data = parse_command(
+                "v.db.select", map=map, layer=layer, env=env, format="csv", **kwargs
+            )
+        except CalledModuleError:
+            error(_("vector_db_select_batches() failed"), env=env)
+            return
+        if not data:
+            return
+        names = list(data[0].keys())
+        for start in range(0, len(data), size):
+            records = data[start : start + size]
+            yield {
+                name: _column_array(
+                    [record[name] for record in records],
+                    types.get(name.lower(), ""),
+                    null="",
+                )
+                for name in names
+            }
+        return
+
+    sql = "SELECT %s FROM %s" % (",".join(columns) if columns else "*", link["table"])
+    if where:
+        sql += " WHERE %s" % where
+    # order by the key column, so that the batches are stable
+    sql += " ORDER BY %s" % link["key"]
+    try:
+        cursor = connection.cursor()
+        cursor.execute(sql)
+        names = [description[0] for description in cursor.description]
+        while True:
+            rows = cursor.fetchmany(size)
+            if not rows:
+                break
+            yield {
+                name: _column_array(values, types.get(name.lower(), ""))
+                for name, values in zip(names, zip(*rows))
+            }
+    finally:
+        connection.close()
+
+
+def vector_db_select_arrays(map, layer=1, columns=None, where=None, env=None):
+    """Get attribute data of a vector map layer as NumPy arrays.
+
+    See :func:`vector_db_select_batches` for the details.
+
+    :Example:
+      .. code-block:: pycon
+
+        >>> data = vector_db_select_arrays("geology", columns=["cat", "GEO_NAME"])
+        >>> data["cat"][:3]
+        array([1, 2, 3])
+        >>> data["GEO_NAME"][2]
+        'Zml'
+
+    :param str map: map name
+    :param int layer: layer number
+    :param columns: list of column names, None for all columns
+    :param str where: SQL WHERE condition
+    :param env: environment
+
+    :return: dictionary with an array for each column
+    """
+    import numpy as np
+
+    batches = list(
+        vector_db_select_batches(
+            map, layer=layer, columns=columns, where=where, size=1000000, env=env
+        )
+    )
+    if len(batches) == 1:
+        return batches[0]
+    result = {}
+    for name in batches[0] if batches else []:
+        arrays = [batch[name] for batch in batches]
+        if any(isinstance(array, np.ma.MaskedArray) for array in arrays):
+            result[name] = np.ma.concatenate(arrays)
+        else:
+            result[name] = np.concatenate(arrays)
+    return result
+
+
 json = None
 orderedDict = None
 
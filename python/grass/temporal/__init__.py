@@ -1,195 +1,418 @@
-from .abstract_dataset import (
-    AbstractDataset,
-    AbstractDatasetComparisonKeyEndTime,
-    AbstractDatasetComparisonKeyStartTime,
-)
-from .abstract_map_dataset import AbstractMapDataset
-from .abstract_space_time_dataset import AbstractSpaceTimeDataset
-from .aggregation import aggregate_by_topology, aggregate_raster_maps, collect_map_names
-from .base import (
-    AbstractSTDSRegister,
-    DatasetBase,
-    DictSQLSerializer,
-    Raster3DBase,
-    Raster3DSTDSRegister,
-    RasterBase,
-    RasterSTDSRegister,
-    SQLDatabaseInterface,
-    STDSBase,
-    STR3DSBase,
-    STRDSBase,
-    STVDSBase,
-    VectorBase,
-    VectorSTDSRegister,
-)
-from .c_libraries_interface import CLibrariesInterface, RPCDefs, c_library_server
-from .core import (
-    DBConnection,
-    SQLDatabaseInterfaceConnection,
-    create_temporal_database,
-    get_available_temporal_mapsets,
-    get_current_gisdbase,
-    get_current_location,
-    get_current_mapset,
-    get_database_info_string,
-    get_enable_mapset_check,
-    get_enable_timestamp_write,
-    get_raise_on_error,
-    get_sql_template_path,
-    get_tgis_backend,
-    get_tgis_c_library_interface,
-    get_tgis_database,
-    get_tgis_database_string,
-    get_tgis_db_version,
-    get_tgis_db_version_from_metadata,
-    get_tgis_dbmi_paramstyle,
-    get_tgis_message_interface,
-    get_tgis_metadata,
-    get_tgis_version,
-    init,
-    init_dbif,
-    profile_function,
-    set_raise_on_error,
-    stop_subprocesses,
-    upgrade_temporal_database,
-)
-from .datetime_math import (
-    adjust_datetime_to_granularity,
-    check_datetime_string,
-    compute_datetime_delta,
-    create_numeric_suffix,
-    create_suffix_from_datetime,
-    create_time_suffix,
-    datetime_to_grass_datetime_string,
-    decrement_datetime_by_string,
-    increment_datetime_by_string,
-    modify_datetime,
-    modify_datetime_by_string,
-    relative_time_to_time_delta,
-    relative_time_to_time_delta_seconds,
-    string_to_datetime,
-    time_delta_to_relative_time,
-    time_delta_to_relative_time_seconds,
-)
-from .extract import (
-    extract_dataset,
-    run_mapcalc2d,
-    run_mapcalc3d,
-    run_vector_extraction,
-)
-from .factory import dataset_factory
-from .gui_support import tlist, tlist_grouped
-from .list_stds import get_dataset_list, list_maps_of_stds
-from .mapcalc import dataset_mapcalculator
-from .metadata import (
-    Raster3DMetadata,
-    RasterMetadata,
-    RasterMetadataBase,
-    STDSMetadataBase,
-    STDSRasterMetadataBase,
-    STR3DSMetadata,
-    STRDSMetadata,
-    STVDSMetadata,
-    VectorMetadata,
-)
-from .open_stds import (
-    check_new_map_dataset,
-    check_new_stds,
-    open_new_map_dataset,
-    open_new_stds,
-    open_old_stds,
-)
-from .register import (
-    assign_valid_time_to_map,
-    register_map_object_list,
-    register_maps_in_space_time_dataset,
-)
-from .sampling import sample_stds_by_stds_topology
-from .space_time_datasets import (
-    Raster3DDataset,
-    RasterDataset,
-    SpaceTimeRaster3DDataset,
-    SpaceTimeRasterDataset,
-    SpaceTimeVectorDataset,
-    VectorDataset,
-)
-from .spatial_extent import (
-    Raster3DSpatialExtent,
-    RasterSpatialExtent,
-    SpatialExtent,
-    STR3DSSpatialExtent,
-    STRDSSpatialExtent,
-    STVDSSpatialExtent,
-    VectorSpatialExtent,
-)
-from .spatial_topology_dataset_connector import SpatialTopologyDatasetConnector
-from .spatio_temporal_relationships import (
-    SpatioTemporalTopologyBuilder,
-    count_temporal_topology_relationships,
-    create_temporal_relation_sql_where_statement,
-    print_spatio_temporal_topology_relationships,
-    print_temporal_topology_relationships,
-    set_spatial_relationship,
-    set_temporal_relationship,
-)
-from .stds_export import export_stds
-from .stds_import import import_stds
-from .temporal_algebra import (
-    FatalError,
-    GlobalTemporalVar,
-    TemporalAlgebraLexer,
-    TemporalAlgebraParser,
-)
-from .temporal_extent import (
-    AbsoluteTemporalExtent,
-    Raster3DAbsoluteTime,
-    Raster3DRelativeTime,
-    RasterAbsoluteTime,
-    RasterRelativeTime,
-    RelativeTemporalExtent,
-    STDSAbsoluteTime,
-    STDSRelativeTime,
-    STR3DSAbsoluteTime,
-    STR3DSRelativeTime,
-    STRDSAbsoluteTime,
-    STRDSRelativeTime,
-    STVDSAbsoluteTime,
-    STVDSRelativeTime,
-    TemporalExtent,
-    VectorAbsoluteTime,
-    VectorRelativeTime,
-)
-from .temporal_granularity import (
-    check_granularity_string,
-    compute_absolute_time_granularity,
-    compute_common_absolute_time_granularity,
-    compute_common_absolute_time_granularity_simple,
-    compute_common_relative_time_granularity,
-    compute_relative_time_granularity,
-    gcd,
-    gcd_list,
-    get_time_tuple_function,
-    gran_plural_unit,
-    gran_singular_unit,
-    gran_to_gran,
-)
-from .temporal_operator import TemporalOperatorLexer, TemporalOperatorParser
-from .temporal_raster3d_algebra import TemporalRaster3DAlgebraParser
-from .temporal_raster_algebra import TemporalRasterAlgebraParser
-from .temporal_raster_base_algebra import (
-    TemporalRasterAlgebraLexer,
-    TemporalRasterBaseAlgebraParser,
-)
-from .temporal_topology_dataset_connector import TemporalTopologyDatasetConnector
-from .temporal_vector_algebra import (
-    TemporalVectorAlgebraLexer,
-    TemporalVectorAlgebraParser,
-)
-from .univar_statistics import (
-    compute_univar_stats,
-    print_gridded_dataset_univar_statistics,
-    print_vector_dataset_univar_statistics,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .abstract_dataset import (
+        AbstractDataset,
+        AbstractDatasetComparisonKeyEndTime,
+        AbstractDatasetComparisonKeyStartTime,
+    )
+    from .abstract_map_dataset import AbstractMapDataset
+    from .abstract_space_time_dataset import AbstractSpaceTimeDataset
+    from .aggregation import (
+        aggregate_by_topology,
+        aggregate_raster_maps,
+        collect_map_names,
+    )
+    from .base import (
+        AbstractSTDSRegister,
+        DatasetBase,
+        DictSQLSerializer,
+        Raster3DBase,
+        Raster3DSTDSRegister,
+        RasterBase,
+        RasterSTDSRegister,
+        SQLDatabaseInterface,
+        STDSBase,
+        STR3DSBase,
+        STRDSBase,
+        STVDSBase,
+        VectorBase,
+        VectorSTDSRegister,
+    )
+    from .c_libraries_interface import CLibrariesInterface, RPCDefs, c_library_server
+    from .core import (
+        DBConnection,
+        SQLDatabaseInterfaceConnection,
+        SQLStatementBatch,
+        create_temporal_database,
+        get_available_temporal_mapsets,
+        get_current_gisdbase,
+        get_current_location,
+        get_current_mapset,
+        get_database_info_string,
+        get_enable_mapset_check,
+        get_enable_timestamp_write,
+        get_raise_on_error,
+        get_sql_template_path,
+        get_tgis_backend,
+        get_tgis_c_library_interface,
+        get_tgis_database,
+        get_tgis_database_string,
+        get_tgis_db_version,
+        get_tgis_db_version_from_metadata,
+        get_tgis_dbmi_paramstyle,
+        get_tgis_message_interface,
+        get_tgis_metadata,
+        get_tgis_version,
+        init,
+        init_dbif,
+        profile_function,
+        set_raise_on_error,
+        stop_subprocesses,
+        upgrade_temporal_database,
+    )
+    from .datetime_math import (
+        adjust_datetime_to_granularity,
+        check_datetime_string,
+        compute_datetime_delta,
+        create_numeric_suffix,
+        create_suffix_from_datetime,
+        create_time_suffix,
+        datetime_to_grass_datetime_string,
+        decrement_datetime_by_string,
+        increment_datetime_by_string,
+        modify_datetime,
+        modify_datetime_by_string,
+        relative_time_to_time_delta,
+        relative_time_to_time_delta_seconds,
+        string_to_datetime,
+        time_delta_to_relative_time,
+        time_delta_to_relative_time_seconds,
+    )
+    from .extract import (
+        extract_dataset,
+        run_mapcalc2d,
+        run_mapcalc3d,
+        run_vector_extraction,
+    )
+    from .factory import dataset_factory
+    from .gui_support import tlist, tlist_grouped
+    from .list_stds import get_dataset_list, list_maps_of_stds
+    from .mapcalc import dataset_mapcalculator
+    from .metadata import (
+        Raster3DMetadata,
+        RasterMetadata,
+        RasterMetadataBase,
+        STDSMetadataBase,
+        STDSRasterMetadataBase,
+        STR3DSMetadata,
+        STRDSMetadata,
+        STVDSMetadata,
+        VectorMetadata,
+    )
+    from .open_stds import (
+        check_new_map_dataset,
+        check_new_stds,
+        open_new_map_dataset,
+        open_new_stds,
+        open_old_stds,
+    )
+    from .point_sampling import PointSampler
+    from .register import (
+        assign_valid_time_to_map,
+        register_map_object_list,
+        register_maps_in_space_time_dataset,
+    )
+    from .sampling import sample_stds_by_stds_topology
+    from .space_time_datasets import (
+        Raster3DDataset,
+        RasterDataset,
+        SpaceTimeRaster3DDataset,
+        SpaceTimeRasterDataset,
+        SpaceTimeVectorDataset,
+        VectorDataset,
+    )
+    from .spatial_extent import (
+        Raster3DSpatialExtent,
+        RasterSpatialExtent,
+        SpatialExtent,
+        STR3DSSpatialExtent,
+        STRDSSpatialExtent,
+        STVDSSpatialExtent,
+        VectorSpatialExtent,
+    )
+    from .spatial_topology_dataset_connector import SpatialTopologyDatasetConnector
+    from .spatio_temporal_relationships import (
+        SpatioTemporalTopologyBuilder,
+        count_temporal_topology_relationships,
+        create_temporal_relation_sql_where_statement,
+        print_spatio_temporal_topology_relationships,
+        print_temporal_topology_relationships,
+        set_spatial_relationship,
+        set_temporal_relationship,
+    )
+    from .stds_export import export_stds
+    from .stds_import import import_stds
+    from .temporal_algebra import (
+        FatalError,
+        GlobalTemporalVar,
+        TemporalAlgebraLexer,
+        TemporalAlgebraParser,
+    )
+    from .temporal_extent import (
+        AbsoluteTemporalExtent,
+        Raster3DAbsoluteTime,
+        Raster3DRelativeTime,
+        RasterAbsoluteTime,
+        RasterRelativeTime,
+        RelativeTemporalExtent,
+        STDSAbsoluteTime,
+        STDSRelativeTime,
+        STR3DSAbsoluteTime,
+        STR3DSRelativeTime,
+        STRDSAbsoluteTime,
+        STRDSRelativeTime,
+        STVDSAbsoluteTime,
+        STVDSRelativeTime,
+        TemporalExtent,
+        VectorAbsoluteTime,
+        VectorRelativeTime,
+    )
+    from .temporal_granularity import (
+        check_granularity_string,
+        compute_absolute_time_granularity,
+        compute_common_absolute_time_granularity,
+        compute_common_absolute_time_granularity_simple,
+        compute_common_relative_time_granularity,
+        compute_relative_time_granularity,
+        gcd,
+        gcd_list,
+        get_time_tuple_function,
+        gran_plural_unit,
+        gran_singular_unit,
+        gran_to_gran,
+    )
+    from .temporal_operator import TemporalOperatorLexer, TemporalOperatorParser
+    from .temporal_raster3d_algebra import TemporalRaster3DAlgebraParser
+    from .temporal_raster_algebra import TemporalRasterAlgebraParser
+    from .temporal_raster_base_algebra import (
+        TemporalRasterAlgebraLexer,
+        TemporalRasterBaseAlgebraParser,
+    )
+    from .temporal_topology_dataset_connector import TemporalTopologyDatasetConnector
+    from .temporal_vector_algebra import (
+        TemporalVectorAlgebraLexer,
+        TemporalVectorAlgebraParser,
+    )
+    from .univar_statistics import (
+        RasterUnivarStatistics,
+        compute_raster_univar_stats,
+        compute_univar_stats,
+        print_gridded_dataset_univar_statistics,
+        print_vector_dataset_univar_statistics,
+    )
+
+# Submodules are imported when one of their names is accessed for the first
+# time (PEP 562), so that tools do not import e.g. the algebra parsers
+# when they only open a space time dataset.
+_lazy_imports = {
+    "abstract_dataset": (
+        "AbstractDataset",
+        "AbstractDatasetComparisonKeyEndTime",
+        "AbstractDatasetComparisonKeyStartTime",
+    ),
+    "abstract_map_dataset": ("AbstractMapDataset",),
+    "abstract_space_time_dataset": ("AbstractSpaceTimeDataset",),
+    "aggregation": (
+        "aggregate_by_topology",
+        "aggregate_raster_maps",
+        "collect_map_names",
+    ),
+    "base": (
+        "AbstractSTDSRegister",
+        "DatasetBase",
+        "DictSQLSerializer",
+        "Raster3DBase",
+        "Raster3DSTDSRegister",
+        "RasterBase",
+        "RasterSTDSRegister",
+        "SQLDatabaseInterface",
+        "STDSBase",
+        "STR3DSBase",
+        "STRDSBase",
+        "STVDSBase",
+        "VectorBase",
+        "VectorSTDSRegister",
+    ),
+    "c_libraries_interface": ("CLibrariesInterface", "RPCDefs", "c_library_server"),
+    "core": (
+        "DBConnection",
+        "SQLDatabaseInterfaceConnection",
+        "SQLStatementBatch",
+        "create_temporal_database",
+        "get_available_temporal_mapsets",
+        "get_current_gisdbase",
+        "get_current_location",
+        "get_current_mapset",
+        "get_database_info_string",
+        "get_enable_mapset_check",
+        "get_enable_timestamp_write",
+        "get_raise_on_error",
+        "get_sql_template_path",
+        "get_tgis_backend",
+        "get_tgis_c_library_interface",
+        "get_tgis_database",
+        "get_tgis_database_string",
+        "get_tgis_db_version",
+        "get_tgis_db_version_from_metadata",
+        "get_tgis_dbmi_paramstyle",
+        "get_tgis_message_interface",
+        "get_tgis_metadata",
+        "get_tgis_version",
+        "init",
+        "init_dbif",
+        "profile_function",
+        "set_raise_on_error",
+        "stop_subprocesses",
+        "upgrade_temporal_database",
+    ),
+    "datetime_math": (
+        "adjust_datetime_to_granularity",
+        "check_datetime_string",
+        "compute_datetime_delta",
+        "create_numeric_suffix",
+        "create_suffix_from_datetime",
+        "create_time_suffix",
+        "datetime_to_grass_datetime_string",
+        "decrement_datetime_by_string",
+        "increment_datetime_by_string",
+        "modify_datetime",
+        "modify_datetime_by_string",
+        "relative_time_to_time_delta",
+        "relative_time_to_time_delta_seconds",
+        "string_to_datetime",
+        "time_delta_to_relative_time",
+        "time_delta_to_relative_time_seconds",
+    ),
+    "extract": (
+        "extract_dataset",
+        "run_mapcalc2d",
+        "run_mapcalc3d",
+        "run_vector_extraction",
+    ),
+    "factory": ("dataset_factory",),
+    "gui_support": ("tlist", "tlist_grouped"),
+    "list_stds": ("get_dataset_list", "list_maps_of_stds"),
+    "mapcalc": ("dataset_mapcalculator",),
+    "metadata": (
+        "Raster3DMetadata",
+        "RasterMetadata",
+        "RasterMetadataBase",
+        "STDSMetadataBase",
+        "STDSRasterMetadataBase",
+        "STR3DSMetadata",
+        "STRDSMetadata",
+        "STVDSMetadata",
+        "VectorMetadata",
+    ),
+    "open_stds": (
+        "check_new_map_dataset",
+        "check_new_stds",
+        "open_new_map_dataset",
+        "open_new_stds",
+        "open_old_stds",
+    ),
+    "point_sampling": ("PointSampler",),
+    "register": (
+        "assign_valid_time_to_map",
+        "register_map_object_list",
+        "register_maps_in_space_time_dataset",
+    ),
+    "sampling": ("sample_stds_by_stds_topology",),
+    "space_time_datasets": (
+        "Raster3DDataset",
+        "RasterDataset",
+        "SpaceTimeRaster3DDataset",
+        "SpaceTimeRasterDataset",
+        "SpaceTimeVectorDataset",
+        "VectorDataset",
+    ),
+    "spatial_extent": (
+        "Raster3DSpatialExtent",
+        "RasterSpatialExtent",
+        "SpatialExtent",
+        "STR3DSSpatialExtent",
+        "STRDSSpatialExtent",
+        "STVDSSpatialExtent",
+        "VectorSpatialExtent",
+    ),
+    "spatial_topology_dataset_connector": ("SpatialTopologyDatasetConnector",),
+    "spatio_temporal_relationships": (
+        "SpatioTemporalTopologyBuilder",
+        "count_temporal_topology_relationships",
+        "create_temporal_relation_sql_where_statement",
+        "print_spatio_temporal_topology_relationships",
+        "print_temporal_topology_relationships",
+        "set_spatial_relationship",
+        "set_temporal_relationship",
+    ),
+    "stds_export": ("export_stds",),
+    "stds_import": ("import_stds",),
+    "temporal_algebra": (
+        "FatalError",
+        "GlobalTemporalVar",
+        "TemporalAlgebraLexer",
+        "TemporalAlgebraParser",
+    ),
+    "temporal_extent": (
+        "AbsoluteTemporalExtent",
+        "Raster3DAbsoluteTime",
+        "Raster3DRelativeTime",
+        "RasterAbsoluteTime",
+        "RasterRelativeTime",
+        "RelativeTemporalExtent",
+        "STDSAbsoluteTime",
+        "STDSRelativeTime",
+        "STR3DSAbsoluteTime",
+        "STR3DSRelativeTime",
+        "STRDSAbsoluteTime",
+        "STRDSRelativeTime",
+        "STVDSAbsoluteTime",
+        "STVDSRelativeTime",
+        "TemporalExtent",
+        "VectorAbsoluteTime",
+        "VectorRelativeTime",
+    ),
+    "temporal_granularity": (
+        "check_granularity_string",
+        "compute_absolute_time_granularity",
+        "compute_common_absolute_time_granularity",
+        "compute_common_absolute_time_granularity_simple",
+        "compute_common_relative_time_granularity",
+        "compute_relative_time_granularity",
+        "gcd",
+        "gcd_list",
+        "get_time_tuple_function",
+        "gran_plural_unit",
+        "gran_singular_unit",
+        "gran_to_gran",
+    ),
+    "temporal_operator": ("TemporalOperatorLexer", "TemporalOperatorParser"),
+    "temporal_raster3d_algebra": ("TemporalRaster3DAlgebraParser",),
+    "temporal_raster_algebra": ("TemporalRasterAlgebraParser",),
+    "temporal_raster_base_algebra": (
+        "TemporalRasterAlgebraLexer",
+        "TemporalRasterBaseAlgebraParser",
+    ),
+    "temporal_topology_dataset_connector": ("TemporalTopologyDatasetConnector",),
+    "temporal_vector_algebra": (
+        "TemporalVectorAlgebraLexer",
+        "TemporalVectorAlgebraParser",
+    ),
+    "univar_statistics": (
+        "RasterUnivarStatistics",
+        "compute_raster_univar_stats",
+        "compute_univar_stats",
+        "print_gridded_dataset_univar_statistics",
+        "print_vector_dataset_univar_statistics",
+    ),
+}
+_lazy_names = {
+    name: module for module, names in _lazy_imports.items() for name in names
+}
 
 __all__ = [
     "AbsoluteTemporalExtent",
@@ -205,6 +428,7 @@ __all__ = [
     "DictSQLSerializer",
     "FatalError",
     "GlobalTemporalVar",
+    "PointSampler",
     "RPCDefs",
     "Raster3DAbsoluteTime",
     "Raster3DBase",
@@ -221,9 +445,11 @@ __all__ = [
     "RasterRelativeTime",
     "RasterSTDSRegister",
     "RasterSpatialExtent",
+    "RasterUnivarStatistics",
     "RelativeTemporalExtent",
     "SQLDatabaseInterface",
     "SQLDatabaseInterfaceConnection",
+    "SQLStatementBatch",
     "STDSAbsoluteTime",
     "STDSBase",
     "STDSMetadataBase",
@@ -284,6 +510,7 @@ __all__ = [
     "compute_common_absolute_time_granularity_simple",
     "compute_common_relative_time_granularity",
     "compute_datetime_delta",
+    "compute_raster_univar_stats",
     "compute_relative_time_granularity",
     "compute_univar_stats",
     "count_temporal_topology_relationships",
@@ -358,3 +585,24 @@ __all__ = [
     "tlist_grouped",
     "upgrade_temporal_database",
 ]
+
+
+def __getattr__(name):
+    """Import names and submodules on first access"""
+    module = _lazy_names.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f".{module}", __name__), name)
+        globals()[name] = value
+        return value
+    if not name.startswith("__"):
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
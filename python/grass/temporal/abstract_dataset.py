@@ -14,7 +14,12 @@ from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
 
-from .core import get_current_mapset, get_tgis_message_interface, init_dbif
+from .core import (
+    SQLStatementBatch,
+    get_current_mapset,
+    get_tgis_message_interface,
+    init_dbif,
+)
 from .spatial_topology_dataset_connector import SpatialTopologyDatasetConnector
 from .temporal_topology_dataset_connector import TemporalTopologyDatasetConnector
 
@@ -401,8 +406,8 @@ class AbstractDataset(
         :param execute: If True the SQL statements will be executed.
                         If False the prepared SQL statements are returned
                         and must be executed by the caller.
-        :return: The SQL insert statement in case execute=False, or an
-                 empty string otherwise
+        :return: The SQL insert statements as SQLStatementBatch in case
+                 execute=False, or an empty string otherwise
         """
 
         # it must be possible to insert a map from a different
@@ -417,12 +422,7 @@ class AbstractDataset(
         mapset = get_current_mapset()
 
         # Build the INSERT SQL statement
-        statement = self.base.get_insert_statement_mogrified(dbif)
-        statement += self.temporal_extent.get_insert_statement_mogrified(dbif)
-        statement += self.spatial_extent.get_insert_statement_mogrified(dbif)
-        statement += self.metadata.get_insert_statement_mogrified(dbif)
-        if self.is_stds() is False:
-            statement += self.stds_register.get_insert_statement_mogrified(dbif)
+        statement = SQLStatementBatch(self.get_insert_statements())
 
         self.msgr.debug(2, "insert with %s" % statement)
         if execute:
@@ -436,6 +436,24 @@ class AbstractDataset(
             dbif.close()
         return statement
 
+    def get_insert_statements(self):
+        """Return the INSERT statements of all tables of this dataset
+
+        The statements of datasets of the same type differ only in the
+        arguments, hence they can be grouped and executed with executemany.
+
+        :return: A list of (sql, args) tuples in database specific style
+        """
+        statements = [
+            self.base.get_insert_statement(),
+            self.temporal_extent.get_insert_statement(),
+            self.spatial_extent.get_insert_statement(),
+            self.metadata.get_insert_statement(),
+        ]
+        if self.is_stds() is False:
+            statements.append(self.stds_register.get_insert_statement())
+        return statements
+
     def update(self, dbif=None, execute: bool = True, ident=None):
         """Update the dataset entry in the database from the internal structure
         excluding None variables
@@ -445,8 +463,8 @@ class AbstractDataset(
                         If False the prepared SQL statements are returned
                         and must be executed by the caller.
         :param ident: The identifier to be updated, useful for renaming
-        :return: The SQL update statement in case execute=False, or an
-                 empty string otherwise
+        :return: The SQL update statements as SQLStatementBatch in case
+                 execute=False, or an empty string otherwise
         """
 
         dbif, connection_state_changed = init_dbif(dbif)
@@ -479,8 +497,8 @@ class AbstractDataset(
                         If False the prepared SQL statements are returned
                         and must be executed by the caller.
         :param ident: The identifier to be updated, useful for renaming
-        :return: The SQL update statement in case execute=False, or an
-                 empty string otherwise
+        :return: The SQL update statements as SQLStatementBatch in case
+                 execute=False, or an empty string otherwise
         """
 
         dbif, connection_state_changed = init_dbif(dbif)
@@ -127,6 +127,11 @@ class AbstractMapDataset(AbstractDataset):
         """Load the content of this object from the grass
         file system based database"""
 
+    @abstractmethod
+    def load_from_info(self, history, info, semantic_label=None):
+        """Load the content of this object from map history and map
+        info which were read from the grass file system based database"""
+
     def _convert_timestamp(self):
         """Convert the valid time into a grass datetime library
         compatible timestamp string
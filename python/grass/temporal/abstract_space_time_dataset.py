@@ -23,6 +23,7 @@ from grass.exceptions import FatalError
 
 from .abstract_dataset import AbstractDataset, AbstractDatasetComparisonKeyStartTime
 from .core import (
+    SQLStatementBatch,
     get_current_mapset,
     get_sql_template_path,
     get_tgis_db_version_from_metadata,
@@ -2497,73 +2498,17 @@ class AbstractSpaceTimeDataset(AbstractDataset):
 
         return is_registered
 
-    def register_map(self, map, dbif=None) -> bool:
-        """Register a map in the space time dataset.
+    def _check_map_for_registration(self, map) -> bool:
+        """Check the time of a map that should be registered in this
+        space time dataset
 
-        This method takes care of the registration of a map
-        in a space time dataset.
-
-        In case the map is already registered this function
-        will break with a warning and return False.
+        In case no map has been registered yet, the relative time unit of
+        this dataset is set from the map.
 
         :param map: The AbstractMapDataset object that should be registered
-        :param dbif: The database interface to be used
-        :return: True if success, False otherwise
-
-        :raises ~grass.exceptions.FatalError:
-            This method raises a :exc:`~grass.exceptions.FatalError` exception
-            in case of a fatal error
+        :return: True if the relative time unit of this dataset was set,
+                 False otherwise
         """
-
-        # only modify database in current mapset
-        mapset = get_current_mapset()
-
-        if self.get_mapset() != get_current_mapset():
-            self.msgr.fatal(
-                _(
-                    "Unable to register map in dataset <%(ds)s> of "
-                    "type %(type)s. The mapset of the database does "
-                    "not match the current mapset"
-                )
-                % {"ds": self.get_id(), "type": self.get_type()}
-            )
-
-        dbif, connection_state_changed = init_dbif(dbif)
-
-        if map.is_in_db(dbif, mapset=self.get_mapset()) is False:
-            dbif.close()
-            self.msgr.fatal(
-                _(
-                    "Only a map that was inserted in the temporal "
-                    "database can be registered in a space time "
-                    "dataset"
-                )
-            )
-
-        if map.get_layer():
-            self.msgr.debug(
-                1,
-                "Register %s map <%s> with layer %s in space "
-                "time %s dataset <%s>"
-                % (
-                    map.get_type(),
-                    map.get_map_id(),
-                    map.get_layer(),
-                    map.get_type(),
-                    self.get_id(),
-                ),
-            )
-        else:
-            self.msgr.debug(
-                1,
-                "Register %s map <%s> in space time %s "
-                "dataset <%s>"
-                % (map.get_type(), map.get_map_id(), map.get_type(), self.get_id()),
-            )
-
-        # First select all data from the database in the current mapset
-        map.select(dbif, mapset=mapset)
-
         if not map.check_for_correct_time():
             if map.get_layer():
                 self.msgr.fatal(
@@ -2574,16 +2519,11 @@ class AbstractSpaceTimeDataset(AbstractDataset):
                 self.msgr.fatal(_("Map <%s> has invalid time") % (map.get_map_id()))
 
         # Get basic info
-        map_id = map.base.get_id()
         map_rel_time_unit = map.get_relative_time_unit()
         map_ttype = map.get_temporal_type()
 
-        stds_mapset = self.base.get_mapset()
-        stds_register_table = self.get_map_register()
         stds_ttype = self.get_temporal_type()
-
-        # The gathered SQL statements are stored here
-        statement = ""
+        unit_changed = False
 
         # Check temporal types
         if stds_ttype != map_ttype:
@@ -2620,7 +2560,7 @@ class AbstractSpaceTimeDataset(AbstractDataset):
             and self.is_time_relative()
         ):
             self.set_relative_time_unit(map_rel_time_unit)
-            statement += self.relative_time.get_update_all_statement_mogrified(dbif)
+            unit_changed = True
 
             self.msgr.debug(
                 1,
@@ -2654,6 +2594,87 @@ class AbstractSpaceTimeDataset(AbstractDataset):
                     % {"id": self.get_id(), "map": map.get_map_id()}
                 )
 
+        return unit_changed
+
+    def register_map(self, map, dbif=None) -> bool:
+        """Register a map in the space time dataset.
+
+        This method takes care of the registration of a map
+        in a space time dataset.
+
+        In case the map is already registered this function
+        will break with a warning and return False.
+
+        :param map: The AbstractMapDataset object that should be registered
+        :param dbif: The database interface to be used
+        :return: True if success, False otherwise
+
+        :raises ~grass.exceptions.FatalError:
+            This method raises a :exc:`~grass.exceptions.FatalError` exception
+            in case of a fatal error
+        """
+
+        # only modify database in current mapset
+        mapset = get_current_mapset()
+
+        if self.get_mapset() != get_current_mapset():
+            self.msgr.fatal(
+                _(
+                    "Unable to register map in dataset <%(ds)s> of "
+                    "type %(type)s. The mapset of the database does "
+                    "not match the current mapset"
+                )
+                % {"ds": self.get_id(), "type": self.get_type()}
+            )
+
+        dbif, connection_state_changed = init_dbif(dbif)
+
+        if map.is_in_db(dbif, mapset=self.get_mapset()) is False:
+            dbif.close()
+            self.msgr.fatal(
+                _(
+                    "Only a map that was inserted in the temporal "
+                    "database can be registered in a space time "
+                    "dataset"
+                )
+            )
+
+        if map.get_layer():
+            self.msgr.debug(
+                1,
+                "Register %s map <%s> with layer %s in space "
+                "time %s dataset <%s>"
+                % (
+                    map.get_type(),
+                    map.get_map_id(),
+                    map.get_layer(),
+                    map.get_type(),
+                    self.get_id(),
+                ),
+            )
+        else:
+            self.msgr.debug(
+                1,
+                "Register %s map <%s> in space time %s "
+                "dataset <%s>"
+                % (map.get_type(), map.get_map_id(), map.get_type(), self.get_id()),
+            )
+
+        # First select all data from the database in the current mapset
+        map.select(dbif, mapset=mapset)
+
+        # Get basic info
+        map_id = map.base.get_id()
+
+        stds_mapset = self.base.get_mapset()
+        stds_register_table = self.get_map_register()
+
+        # The gathered SQL statements are stored here
+        statement = ""
+
+        if self._check_map_for_registration(map):
+            statement += self.relative_time.get_update_all_statement_mogrified(dbif)
+
         if stds_mapset != mapset:
             dbif.close()
             self.msgr.fatal(
@@ -2684,7 +2705,7 @@ class AbstractSpaceTimeDataset(AbstractDataset):
         else:
             sql = "INSERT INTO " + stds_register_table + " (id) " + "VALUES (%s);\n"
 
-        statement += dbif.mogrify_sql_statement((sql, (map_id,)))
+        statement += SQLStatementBatch([(sql, (map_id,))])
 
         # Now execute the insert transaction
         # only databases in the current mapset can be modified
@@ -2698,6 +2719,141 @@ class AbstractSpaceTimeDataset(AbstractDataset):
 
         return True
 
+    def register_maps(self, maps, dbif=None) -> int:
+        """Register many maps in the space time dataset.
+
+        This is the bulk version of :meth:`register_map`. The maps must
+        have been inserted in the temporal database and their content must
+        be loaded, the database is not queried for each map. The
+        registration state is checked and the register tables are modified
+        with a few statements for all maps. Maps which are already
+        registered are skipped with a warning.
+
+        The space time dataset is not updated, call
+        :meth:`update_from_registered_maps` afterwards.
+
+        :param maps: A list of AbstractMapDataset objects that should be
+                     registered
+        :param dbif: The database interface to be used
+        :return: The number of registered maps
+
+        :raises ~grass.exceptions.FatalError:
+            This method raises a :exc:`~grass.exceptions.FatalError` exception
+            in case of a fatal error
+        """
+
+        # only modify database in current mapset
+        mapset = get_current_mapset()
+
+        if self.get_mapset() != mapset:
+            self.msgr.fatal(
+                _(
+                    "Unable to register map in dataset <%(ds)s> of "
+                    "type %(type)s. The mapset of the database does "
+                    "not match the current mapset"
+                )
+                % {"ds": self.get_id(), "type": self.get_type()}
+            )
+
+        if not maps:
+            return 0
+
+        dbif, connection_state_changed = init_dbif(dbif)
+
+        # Remove duplicates but keep the order
+        maps = list({map.get_id(): map for map in maps}.values())
+        map_ids = [map.get_id() for map in maps]
+
+        base_table = maps[0].base.get_table_name()
+        in_db = {row[0] for row in dbif.select_by_ids(base_table, map_ids)}
+        if len(in_db) != len(map_ids):
+            dbif.close()
+            self.msgr.fatal(
+                _(
+                    "Only a map that was inserted in the temporal "
+                    "database can be registered in a space time "
+                    "dataset"
+                )
+            )
+
+        stds_register_table = self.get_map_register()
+        registered = {
+            row[0] for row in dbif.select_by_ids(stds_register_table, map_ids)
+        }
+
+        batches = []
+        new_maps = []
+        for map in maps:
+            if map.get_id() in registered:
+                if map.get_layer() is not None:
+                    self.msgr.warning(
+                        _("Map <%(map)s> with layer %(l)s is already registered.")
+                        % {"map": map.get_map_id(), "l": map.get_layer()}
+                    )
+                else:
+                    self.msgr.warning(
+                        _("Map <%s> is already registered.") % (map.get_map_id())
+                    )
+                continue
+
+            if self._check_map_for_registration(map):
+                sql, args = self.relative_time.get_update_all_statement()
+                batches.append((sql, [args]))
+            new_maps.append(map)
+            # The counter is used to detect the first registered map
+            self.map_counter += 1
+
+        if not new_maps:
+            if connection_state_changed:
+                dbif.close()
+            return 0
+
+        # Register the stds in the stds register table column of the maps
+        map_register_table = new_maps[0].stds_register.get_table_name()
+        registered_stds = {
+            row[0]: row[1]
+            for row in dbif.select_by_ids(
+                map_register_table,
+                [map.get_id() for map in new_maps],
+                columns="id, registered_stds",
+            )
+        }
+
+        stds_id = self.base.get_id()
+        register_args = []
+        for map in new_maps:
+            datasets = registered_stds.get(map.get_id())
+            datasets = datasets.split(",") if datasets else []
+            if stds_id in datasets:
+                continue
+            datasets.append(stds_id)
+            map.stds_register.set_registered_stds(",".join(datasets))
+            register_args.append((",".join(datasets), map.get_id()))
+
+        placeholder = "?" if dbif.get_dbmi().paramstyle == "qmark" else "%s"
+        batches.append(
+            (
+                "UPDATE %s SET registered_stds = %s WHERE id = %s"
+                % (map_register_table, placeholder, placeholder),
+                register_args,
+            )
+        )
+        # Now put the map ids in the stds map register table
+        batches.append(
+            (
+                "INSERT INTO %s (id) VALUES (%s)" % (stds_register_table, placeholder),
+                [(map.get_id(),) for map in new_maps],
+            )
+        )
+
+        # only databases in the current mapset can be modified
+        dbif.execute_batches(batches, mapset=mapset)
+
+        if connection_state_changed:
+            dbif.close()
+
+        return len(new_maps)
+
     def unregister_map(self, map, dbif=None, execute: bool = True):
         """Unregister a map from the space time dataset.
 
@@ -2769,7 +2925,7 @@ class AbstractSpaceTimeDataset(AbstractDataset):
             else:
                 sql = "DELETE FROM " + stds_register_table + " WHERE id = %s;\n"
 
-            statement += dbif.mogrify_sql_statement((sql, (map.get_id(),)))
+            statement += SQLStatementBatch([(sql, (map.get_id(),))])
 
         if execute:
             dbif.execute_transaction(statement, mapset=mapset)
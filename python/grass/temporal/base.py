@@ -31,6 +31,7 @@ from datetime import datetime
 
 from .core import (
     SQLDatabaseInterfaceConnection,
+    SQLStatementBatch,
     get_current_mapset,
     get_tgis_dbmi_paramstyle,
     get_tgis_message_interface,
@@ -229,19 +230,19 @@ class SQLDatabaseInterface(DictSQLSerializer):
         >>> t.get_select_statement()
         ("SELECT  creation_time  , mapset  , name  , creator  FROM raster WHERE id = 'soil@PERMANENT';\\n", ())
         >>> t.get_select_statement_mogrified()
-        "SELECT  creation_time  , mapset  , name  , creator  FROM raster WHERE id = 'soil@PERMANENT';\\n"
+        SQLStatementBatch([("SELECT  creation_time  , mapset  , name  , creator  FROM raster WHERE id = 'soil@PERMANENT';\\n", ())])
         >>> t.get_insert_statement()
         ('INSERT INTO raster ( creation_time  ,mapset  ,name  ,creator ) VALUES (? ,? ,? ,?) ;\\n', (datetime.datetime(2001, 1, 1, 0, 0), 'PERMANENT', 'soil', 'soeren'))
         >>> t.get_insert_statement_mogrified()
-        "INSERT INTO raster ( creation_time  ,mapset  ,name  ,creator ) VALUES ('2001-01-01 00:00:00' ,'PERMANENT' ,'soil' ,'soeren') ;\\n"
+        SQLStatementBatch([('INSERT INTO raster ( creation_time  ,mapset  ,name  ,creator ) VALUES (? ,? ,? ,?) ;\\n', (datetime.datetime(2001, 1, 1, 0, 0), 'PERMANENT', 'soil', 'soeren'))])
         >>> t.get_update_statement()
         ("UPDATE raster SET  creation_time = ?  ,mapset = ?  ,name = ?  ,creator = ? WHERE id = 'soil@PERMANENT';\\n", (datetime.datetime(2001, 1, 1, 0, 0), 'PERMANENT', 'soil', 'soeren'))
         >>> t.get_update_statement_mogrified()
-        "UPDATE raster SET  creation_time = '2001-01-01 00:00:00'  ,mapset = 'PERMANENT'  ,name = 'soil'  ,creator = 'soeren' WHERE id = 'soil@PERMANENT';\\n"
+        SQLStatementBatch([("UPDATE raster SET  creation_time = ?  ,mapset = ?  ,name = ?  ,creator = ? WHERE id = 'soil@PERMANENT';\\n", (datetime.datetime(2001, 1, 1, 0, 0), 'PERMANENT', 'soil', 'soeren'))])
         >>> t.get_update_all_statement()
         ("UPDATE raster SET  creation_time = ?  ,mapset = ?  ,name = ?  ,creator = ? WHERE id = 'soil@PERMANENT';\\n", (datetime.datetime(2001, 1, 1, 0, 0), 'PERMANENT', 'soil', 'soeren'))
         >>> t.get_update_all_statement_mogrified()
-        "UPDATE raster SET  creation_time = '2001-01-01 00:00:00'  ,mapset = 'PERMANENT'  ,name = 'soil'  ,creator = 'soeren' WHERE id = 'soil@PERMANENT';\\n"
+        SQLStatementBatch([("UPDATE raster SET  creation_time = ?  ,mapset = ?  ,name = ?  ,creator = ? WHERE id = 'soil@PERMANENT';\\n", (datetime.datetime(2001, 1, 1, 0, 0), 'PERMANENT', 'soil', 'soeren'))])
 
     """  # noqa: E501
 
@@ -360,18 +361,13 @@ class SQLDatabaseInterface(DictSQLSerializer):
         )
 
     def get_select_statement_mogrified(self, dbif=None):
-        """Return the select statement as mogrified string
+        """Return the select statement as batch of SQL statements with
+        arguments
 
-        :param dbif: The database interface to be used,
-                     if None a temporary connection will be established
-        :return: The SELECT string
+        :param dbif: Unused, kept for backward compatibility
+        :return: The SELECT statement as SQLStatementBatch
         """
-        if not dbif:
-            dbif = SQLDatabaseInterfaceConnection()
-
-        return dbif.mogrify_sql_statement(
-            self.get_select_statement(), mapset=self.mapset
-        )
+        return SQLStatementBatch([self.get_select_statement()])
 
     def select(self, dbif=None, mapset=None) -> bool:
         """Select the content from the temporal database and store it
@@ -426,19 +422,16 @@ class SQLDatabaseInterface(DictSQLSerializer):
         return self.serialize("INSERT", self.get_table_name())
 
     def get_insert_statement_mogrified(self, dbif=None):
-        """Return the insert statement as mogrified string
+        """Return the insert statement as batch of SQL statements with
+        arguments
 
-        :param dbif: The database interface to be used,
-                     if None a temporary connection will be established
-        :return: The INSERT string
-        """
-        if not dbif:
-            dbif = SQLDatabaseInterfaceConnection()
+        The batch is executed with native parameter binding by
+        execute_transaction() of the database interface.
 
-        # mapset must be the mapset of the temporal database
-        # not of the map
-        mapset = get_current_mapset()
-        return dbif.mogrify_sql_statement(self.get_insert_statement(), mapset=mapset)
+        :param dbif: Unused, kept for backward compatibility
+        :return: The INSERT statement as SQLStatementBatch
+        """
+        return SQLStatementBatch([self.get_insert_statement()])
 
     def insert(self, dbif=None) -> None:
         """Serialize the content of this object and store it in the temporal
@@ -478,23 +471,14 @@ class SQLDatabaseInterface(DictSQLSerializer):
         )
 
     def get_update_statement_mogrified(self, dbif=None, ident=None):
-        """Return the update statement as mogrified string
+        """Return the update statement as batch of SQL statements with
+        arguments
 
-        :param dbif: The database interface to be used,
-                     if None a temporary connection will be established
+        :param dbif: Unused, kept for backward compatibility
         :param ident: The identifier to be updated, useful for renaming
-        :return: The UPDATE string
+        :return: The UPDATE statement as SQLStatementBatch
         """
-
-        # use the temporal database in the current mapset
-        mapset = get_current_mapset()
-
-        if not dbif:
-            dbif = SQLDatabaseInterfaceConnection()
-
-        return dbif.mogrify_sql_statement(
-            self.get_update_statement(ident), mapset=mapset
-        )
+        return SQLStatementBatch([self.get_update_statement(ident)])
 
     def update(self, dbif=None, ident=None) -> None:
         """Serialize the content of this object and update it in the temporal
@@ -542,17 +526,14 @@ class SQLDatabaseInterface(DictSQLSerializer):
         )
 
     def get_update_all_statement_mogrified(self, dbif=None, ident=None):
-        """Return the update all statement as mogrified string
+        """Return the update all statement as batch of SQL statements with
+        arguments
 
-        :param dbif: The database interface to be used,
-                     if None a temporary connection will be established
+        :param dbif: Unused, kept for backward compatibility
         :param ident: The identifier to be updated, useful for renaming
-        :return: The UPDATE string
+        :return: The UPDATE statement as SQLStatementBatch
         """
-        if not dbif:
-            dbif = SQLDatabaseInterfaceConnection()
-
-        return dbif.mogrify_sql_statement(self.get_update_all_statement(ident))
+        return SQLStatementBatch([self.get_update_all_statement(ident)])
 
     def update_all(self, dbif=None, ident=None) -> None:
         """Serialize the content of this object, including None objects,
@@ -0,0 +1,98 @@
+"""Benchmarking of the construction of the temporal algebra parsers
+
+Compares building the parsers with PLY, which computes the LALR tables
+each time, with the parser cache in memory and on disk.
+Run in a GRASS session with an initialized temporal database.
+"""
+
+import tempfile
+import time
+
+import grass.temporal as tgis
+from grass.temporal.parser_cache import ParserCache
+from grass.temporal.ply import yacc
+
+
+class TimeMeasurer:
+    def __init__(self):
+        self._time = None
+        self._start = None
+
+    @property
+    def time(self):
+        return self._time
+
+    def start(self):
+        self._start = time.perf_counter()
+
+    def stop(self):
+        self._time = time.perf_counter() - self._start
+
+
+class PlyBenchmark(TimeMeasurer):
+    def run(self, parser):
+        self.start()
+        yacc.yacc(module=parser, debug=False)
+        self.stop()
+
+
+class MemoryCacheBenchmark(TimeMeasurer):
+    def __init__(self):
+        super().__init__()
+        self.cache = ParserCache()
+
+    def run(self, parser):
+        self.start()
+        self.cache.tables(parser).parser(parser)
+        self.stop()
+
+
+class DiskCacheBenchmark(TimeMeasurer):
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+
+    def run(self, parser):
+        # A new cache instance behaves like a new process.
+        cache = ParserCache(directory=self.directory)
+        self.start()
+        cache.tables(parser).parser(parser)
+        self.stop()
+
+
+def benchmark(measurer, parser, repeat):
+    # The first run fills the cache.
+    measurer.run(parser)
+    times = []
+    for _ in range(repeat):
+        measurer.run(parser)
+        times.append(measurer.time)
+    return min(times)
+
+
+def main():
+    tgis.init()
+    parsers = {
+        "temporal": tgis.TemporalAlgebraParser(run=False),
+        "raster": tgis.TemporalRasterAlgebraParser(run=False),
+        "raster3d": tgis.TemporalRaster3DAlgebraParser(run=False),
+        "vector": tgis.TemporalVectorAlgebraParser(run=False),
+        "operator": tgis.TemporalOperatorParser(),
+    }
+    repeat = 5
+    with tempfile.TemporaryDirectory() as directory:
+        measurers = {
+            "PLY": PlyBenchmark(),
+            "memory cache": MemoryCacheBenchmark(),
+            "disk cache": DiskCacheBenchmark(directory),
+        }
+        print(f"{'grammar':<10}" + "".join(f"{name:>16}" for name in measurers))
+        for name, parser in parsers.items():
+            times = [
+                benchmark(measurer, parser, repeat) for measurer in measurers.values()
+            ]
+            print(f"{name:<10}" + "".join(f"{value:>15.4f}s" for value in times))
+
+
+if __name__ == "__main__":
+    main()
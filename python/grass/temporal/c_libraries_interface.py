@@ -16,7 +16,7 @@ import logging
 import sys
 from ctypes import CFUNCTYPE, POINTER, byref, c_int, c_void_p, cast
 from datetime import datetime
-from multiprocessing import Lock, Pipe, Process
+from functools import partial
 from typing import TYPE_CHECKING, Any, Literal
 
 import grass.lib.date as libdate
@@ -41,6 +41,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+#: Maximal number of maps in a single batch request
+BATCH_SIZE = 100
+
 ###############################################################################
 
 
@@ -65,6 +68,8 @@ class RPCDefs:
     READ_SEMANTIC_LABEL = 16
     REMOVE_SEMANTIC_LABEL = 17
     READ_MAP_HISTORY = 18
+    READ_MAP_INFO_BATCH = 19
+    BATCH = 20
     G_FATAL_ERROR = 49
 
     TYPE_RASTER = 0
@@ -675,6 +680,72 @@ def _read_map_info(lock: _LockLike, conn: Connection, data) -> None:
 ###############################################################################
 
 
+def _read_map_info_batch(lock: _LockLike, conn: Connection, data) -> None:
+    """Read existence, history, metadata, timestamp and semantic label of
+    many maps and send the result in a single message
+
+    The value to be sent via pipe is a list with one entry per map. The
+    entry is None in case the map does not exist, otherwise it is a
+    dictionary with the keys "history" and "info" (the key value pairs
+    of the map history and map specific metadata), "timestamp" (None in
+    case the map has no timestamp, otherwise the tuple sent by
+    _read_timestamp) and "semantic_label" (raster maps only).
+
+    :param lock: A multiprocessing.Lock instance
+    :param conn: A multiprocessing.connection.Connection object obtained from
+                 multiprocessing.Pipe used to send the result
+    :param data: The list of data entries [function_id, maptype, maps],
+                 maps is a list of (name, mapset, layer) tuples
+    """
+    result = []
+    try:
+        maptype = data[1]
+        for name, mapset, layer in data[2]:
+            if maptype == RPCDefs.TYPE_RASTER:
+                found = libgis.G_find_raster(name, mapset)
+            elif maptype == RPCDefs.TYPE_VECTOR:
+                found = libgis.G_find_vector(name, mapset)
+            elif maptype == RPCDefs.TYPE_RASTER3D:
+                found = libgis.G_find_raster3d(name, mapset)
+            else:
+                found = None
+            if not found:
+                result.append(None)
+                continue
+
+            record = {"timestamp": None, "semantic_label": None}
+            ts = libgis.TimeStamp()
+            if maptype == RPCDefs.TYPE_RASTER:
+                record["history"] = _read_raster_history(name, mapset)
+                record["info"] = _read_raster_info(name, mapset)
+                if libgis.G_has_raster_timestamp(name, mapset) == 1:
+                    check = libgis.G_read_raster_timestamp(name, mapset, byref(ts))
+                    record["timestamp"] = (check, _convert_timestamp_from_grass(ts))
+                ret = libraster.Rast_read_semantic_label(name, mapset)
+                if ret:
+                    record["semantic_label"] = decode(ret)
+            elif maptype == RPCDefs.TYPE_VECTOR:
+                record["history"] = _read_vector_history(name, mapset)
+                record["info"] = _read_vector_info(name, mapset)
+                if libgis.G_has_vector_timestamp(name, layer, mapset) == 1:
+                    check = libgis.G_read_vector_timestamp(
+                        name, layer, mapset, byref(ts)
+                    )
+                    record["timestamp"] = (check, _convert_timestamp_from_grass(ts))
+            else:
+                record["history"] = _read_raster3d_history(name, mapset)
+                record["info"] = _read_raster3d_info(name, mapset)
+                if libgis.G_has_raster3d_timestamp(name, mapset) == 1:
+                    check = libgis.G_read_raster3d_timestamp(name, mapset, byref(ts))
+                    record["timestamp"] = (check, _convert_timestamp_from_grass(ts))
+            result.append(record)
+    finally:
+        conn.send(result)
+
+
+###############################################################################
+
+
 def _read_raster_info(name, mapset):
     """Read the raster map info from the file system and store the content
     into a dictionary
@@ -1176,6 +1247,41 @@ def _convert_timestamp_from_grass(ts):
 ###############################################################################
 
 
+class _ReplyCollector:
+    """Collects the replies of the requests of a batch instead of sending them"""
+
+    def __init__(self) -> None:
+        self.replies = []
+
+    def send(self, obj) -> None:
+        self.replies.append(obj)
+
+
+def _batch(functions, lock: _LockLike, conn: Connection, data) -> None:
+    """Run many requests and send their replies in a single message
+
+    The value to be sent via pipe is the list of the values the requests
+    would send one by one, None for not allowed requests.
+
+    :param functions: The function array of the server
+    :param lock: A multiprocessing.Lock instance
+    :param conn: A multiprocessing.connection.Connection object obtained from
+                 multiprocessing.Pipe used to send the replies
+    :param data: The list of data entries [function_id, requests], requests
+                 is a list of requests except STOP and BATCH requests
+    """
+    collector = _ReplyCollector()
+    for request in data[1]:
+        if request[0] in {RPCDefs.STOP, RPCDefs.BATCH}:
+            collector.send(None)
+            continue
+        functions[request[0]](lock, collector, request)
+    conn.send(collector.replies)
+
+
+###############################################################################
+
+
 def _stop(lock: _LockLike, conn: Connection, data) -> None:
     libgis.G_debug(1, "Stop C-interface server")
     conn.close()
@@ -1235,6 +1341,8 @@ def c_library_server(lock: _LockLike, conn: Connection) -> None:
     functions[RPCDefs.READ_SEMANTIC_LABEL] = _read_semantic_label
     functions[RPCDefs.REMOVE_SEMANTIC_LABEL] = _remove_semantic_label
     functions[RPCDefs.READ_MAP_HISTORY] = _read_map_history
+    functions[RPCDefs.READ_MAP_INFO_BATCH] = _read_map_info_batch
+    functions[RPCDefs.BATCH] = partial(_batch, functions)
     functions[RPCDefs.G_FATAL_ERROR] = _fatal_error
 
     libgis.G_gisinit("c_library_server")
@@ -1432,6 +1540,22 @@ class CLibrariesInterface(RPCServerBase):
         >>> ciface.has_vector_timestamp("test", tgis.get_current_mapset())
         True
 
+        # Batch requests
+        >>> mapset = tgis.get_current_mapset()
+        >>> ciface.map_exists_batch(
+        ...     tgis.RPCDefs.TYPE_RASTER, [("test", mapset), ("no_such_map", mapset)]
+        ... )
+        [True, False]
+        >>> ciface.write_timestamp_batch(
+        ...     tgis.RPCDefs.TYPE_RASTER, [("test", mapset, None, "12 Mar 1995")]
+        ... )
+        [1]
+        >>> pool = tgis.CLibrariesInterface(nprocs=2)
+        >>> infos = pool.read_raster_info_batch([("test", mapset)] * 250)
+        >>> len(infos), infos[0]["timestamp"] == infos[-1]["timestamp"]
+        (250, True)
+        >>> pool.stop()
+
         >>> ciface.get_driver_name()
         'sqlite'
         >>> ciface.get_database_name().split("/")[-1]
@@ -1467,17 +1591,76 @@ class CLibrariesInterface(RPCServerBase):
 
     """  # noqa: E501
 
-    def __init__(self) -> None:
-        RPCServerBase.__init__(self)
+    server_target = staticmethod(c_library_server)
+
+    def __init__(self, nprocs: int = 1) -> None:
+        """
+        :param nprocs: The number of server processes reading map metadata
+                       in batch methods
+        """
+        RPCServerBase.__init__(self, nprocs=nprocs)
+
+    def _call_batch(self, requests, message, read_only=False):
+        """Send the requests in batches without waiting for the replies of
+        each batch and return the replies of all requests"""
+        batches = [
+            [RPCDefs.BATCH, requests[start : start + BATCH_SIZE]]
+            for start in range(0, len(requests), BATCH_SIZE)
+        ]
+        replies = self.call_pipelined(batches, message, read_only=read_only)
+        return [reply for batch in replies for reply in batch]
+
+    def _read_map_info_batch(self, maptype, maps, message):
+        requests = [
+            [
+                RPCDefs.READ_MAP_INFO_BATCH,
+                maptype,
+                maps[start : start + BATCH_SIZE],
+                None,
+                None,
+            ]
+            for start in range(0, len(maps), BATCH_SIZE)
+        ]
+        replies = self.call_pipelined(requests, message, read_only=True)
+        return [record for reply in replies for record in reply]
 
-    def start_server(self) -> None:
-        self.client_conn, self.server_conn = Pipe(True)
-        self.lock = Lock()
-        self.server = Process(
-            target=c_library_server, args=(self.lock, self.server_conn)
+    def map_exists_batch(self, maptype, maps):
+        """Check if maps exist in the spatial database with batch requests
+
+        :param maptype: The type of the maps, RPCDefs.TYPE_RASTER,
+                        RPCDefs.TYPE_RASTER3D or RPCDefs.TYPE_VECTOR
+        :param maps: A list of (name, mapset) tuples
+        :returns: A list of True or False for each map
+        """
+        return self._call_batch(
+            [
+                [RPCDefs.MAP_EXISTS, maptype, name, mapset, None]
+                for name, mapset in maps
+            ],
+            "map_exists_batch",
+            read_only=True,
+        )
+
+    def write_timestamp_batch(self, maptype, maps):
+        """Write file based timestamps of maps with batch requests
+
+        .. note::
+            Only timestamps of maps from the current mapset can written.
+
+        :param maptype: The type of the maps, RPCDefs.TYPE_RASTER,
+                        RPCDefs.TYPE_RASTER3D or RPCDefs.TYPE_VECTOR
+        :param maps: A list of (name, mapset, layer, timestring) tuples,
+                     layer is used for vector maps only
+        :returns: A list with the return value of G_write_*_timestamp
+                  for each map
+        """
+        return self._call_batch(
+            [
+                [RPCDefs.WRITE_TIMESTAMP, maptype, name, mapset, layer, timestring]
+                for name, mapset, layer, timestring in maps
+            ],
+            "write_timestamp_batch",
         )
-        self.server.daemon = True
-        self.server.start()
 
     def raster_map_exists(self, name, mapset):
         """Check if a raster map exists in the spatial database
@@ -1507,6 +1690,23 @@ class CLibrariesInterface(RPCServerBase):
         )
         return self.safe_receive("read_raster_info")
 
+    def read_raster_info_batch(self, maps):
+        """Read existence, history, metadata and timestamps of many raster
+        maps with batch requests
+
+        The batches are read in parallel if nprocs is larger than one.
+
+        :param maps: A list of (name, mapset) tuples
+        :returns: A list with one entry per map, None in case the map does
+                  not exist, otherwise a dictionary with the keys "history",
+                  "info", "timestamp" and "semantic_label"
+        """
+        return self._read_map_info_batch(
+            RPCDefs.TYPE_RASTER,
+            [(name, mapset, None) for name, mapset in maps],
+            "read_raster_info_batch",
+        )
+
     def read_raster_full_info(self, name, mapset):
         """Read raster info, history and cats using PyGRASS RasterRow
         and return a dictionary. Colors should be supported in the
@@ -1697,6 +1897,23 @@ class CLibrariesInterface(RPCServerBase):
         )
         return self.safe_receive("read_raster3d_info")
 
+    def read_raster3d_info_batch(self, maps):
+        """Read existence, history, metadata and timestamps of many 3D raster
+        maps with batch requests
+
+        The batches are read in parallel if nprocs is larger than one.
+
+        :param maps: A list of (name, mapset) tuples
+        :returns: A list with one entry per map, None in case the map does
+                  not exist, otherwise a dictionary with the keys "history",
+                  "info", "timestamp" and "semantic_label"
+        """
+        return self._read_map_info_batch(
+            RPCDefs.TYPE_RASTER3D,
+            [(name, mapset, None) for name, mapset in maps],
+            "read_raster3d_info_batch",
+        )
+
     def read_raster3d_history(self, name, mapset):
         """Read the 3D raster map history from the file system and store the content
         into a dictionary
@@ -1819,6 +2036,23 @@ class CLibrariesInterface(RPCServerBase):
         )
         return self.safe_receive("read_vector_info")
 
+    def read_vector_info_batch(self, maps):
+        """Read existence, history, metadata and timestamps of many vector
+        maps with batch requests
+
+        The batches are read in parallel if nprocs is larger than one.
+
+        :param maps: A list of (name, mapset, layer) tuples
+        :returns: A list with one entry per map, None in case the map does
+                  not exist, otherwise a dictionary with the keys "history",
+                  "info", "timestamp" and "semantic_label"
+        """
+        return self._read_map_info_batch(
+            RPCDefs.TYPE_VECTOR,
+            [tuple(item) for item in maps],
+            "read_vector_info_batch",
+        )
+
     def read_vector_full_info(self, name, mapset):
         """Read vector info using PyGRASS VectorTopo
         and return a dictionary.
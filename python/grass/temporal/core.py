@@ -59,6 +59,24 @@ except ImportError:
 import atexit
 from datetime import datetime
 
+# Maximum number of placeholders in a single statement, lower than the
+# default SQLITE_MAX_VARIABLE_NUMBER of older SQLite versions
+SQL_MAX_VARIABLES = 500
+
+###############################################################################
+
+
+def _sqlite_parameters(args):
+    """Convert datetime objects in SQL statement arguments to strings
+
+    The strings have the same format as in the mogrified SQL statements.
+    This avoids the deprecated default datetime adapter of sqlite3.
+    """
+    return tuple(
+        value.isoformat(" ") if isinstance(value, datetime) else value for value in args
+    )
+
+
 ###############################################################################
 
 
@@ -286,7 +304,11 @@ def _init_tgis_c_library_interface() -> None:
     """
     global c_library_interface
     if c_library_interface is None:
-        c_library_interface = CLibrariesInterface()
+        try:
+            nprocs = int(os.getenv("GRASS_TGIS_NPROCS", "1"))
+        except ValueError:
+            nprocs = 1
+        c_library_interface = CLibrariesInterface(nprocs=nprocs)
 
 
 def get_tgis_c_library_interface():
@@ -545,6 +567,8 @@ def init(raise_fatal_error: bool = False, skip_db_version_check: bool = False):
 
     - GRASS_TGIS_PROFILE (True, False, 1, 0)
     - GRASS_TGIS_RAISE_ON_ERROR (True, False, 1, 0)
+    - GRASS_TGIS_NPROCS (number of C-library interface processes reading
+      map metadata in parallel, 1 by default)
 
     .. warning::
 
@@ -1029,6 +1053,125 @@ def _create_tgis_metadata_table(content, dbif=None) -> None:
 ###############################################################################
 
 
+class SQLStatementBatch:
+    """A list of SQL statements with their arguments
+
+    The statements are collected in database specific style with place
+    holders and executed with native parameter binding by
+    :meth:`SQLDatabaseInterfaceConnection.execute_transaction`.
+    Consecutive statements with the same SQL string are executed with
+    executemany. Plain SQL strings can be added to a batch, they are
+    executed as SQL scripts without arguments. Batches can be concatenated
+    with strings and other batches using the + operator, so that code
+    which gathers SQL statements as strings works unchanged.
+
+    Usage:
+
+    .. code-block:: pycon
+
+        >>> batch = SQLStatementBatch()
+        >>> batch.append("INSERT INTO a (id) VALUES (?);\\n", ("x",))
+        >>> batch += "DROP TABLE b;\\n"
+        >>> statement = "" + batch
+        >>> statement.append("INSERT INTO a (id) VALUES (?);\\n", ("y",))
+        >>> len(statement)
+        3
+        >>> statement.batches()  # doctest: +NORMALIZE_WHITESPACE
+        [('INSERT INTO a (id) VALUES (?);\\n', [('x',)]),
+         ('DROP TABLE b;\\n', None),
+         ('INSERT INTO a (id) VALUES (?);\\n', [('y',)])]
+    """
+
+    def __init__(self, statements=None) -> None:
+        """Constructor of a batch
+
+        :param statements: A list of (sql, args) tuples, args is None for
+                           plain SQL scripts
+        """
+        self.statements = list(statements) if statements else []
+
+    def append(self, sql, args=None) -> None:
+        """Append a SQL statement
+
+        :param sql: The SQL statement with DBMI specific place holders
+        :param args: The argument list or None for a plain SQL script
+        """
+        if args is None:
+            if sql:
+                self.statements.append((sql, None))
+        else:
+            self.statements.append((sql, tuple(args)))
+
+    def extend(self, other) -> None:
+        """Append the statements of a batch or a plain SQL string
+
+        :param other: A SQLStatementBatch object or a SQL string
+        """
+        if isinstance(other, SQLStatementBatch):
+            self.statements.extend(other.statements)
+        elif isinstance(other, bytes):
+            self.append(decode(other))
+        elif other is not None:
+            self.append(other)
+
+    def batches(self):
+        """Group consecutive statements with the same SQL string
+
+        :return: A list of (sql, args) tuples, args is a list of argument
+                 tuples or None for plain SQL scripts
+        """
+        batches = []
+        for sql, args in self.statements:
+            if args is None:
+                batches.append((sql, None))
+            elif batches and batches[-1][0] == sql and batches[-1][1] is not None:
+                batches[-1][1].append(args)
+            else:
+                batches.append((sql, [args]))
+        return batches
+
+    def __add__(self, other):
+        batch = SQLStatementBatch(self.statements)
+        batch.extend(other)
+        return batch
+
+    def __radd__(self, other):
+        batch = SQLStatementBatch()
+        batch.extend(other)
+        batch.extend(self)
+        return batch
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def __iter__(self):
+        return iter(self.statements)
+
+    def __eq__(self, other):
+        if isinstance(other, SQLStatementBatch):
+            return self.statements == other.statements
+        if isinstance(other, str):
+            # Compatibility with code which compares with empty strings
+            return not self.statements and not other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return "SQLStatementBatch(%r)" % self.statements
+
+    def __str__(self) -> str:
+        return "".join(
+            sql if args is None else "%s -- %r\n" % (sql.rstrip(), args)
+            for sql, args in self.statements
+        )
+
+
+###############################################################################
+
+
 class SQLDatabaseInterfaceConnection:
     def __init__(self) -> None:
         self.tgis_mapsets = get_available_temporal_mapsets()
@@ -1194,7 +1337,8 @@ class SQLDatabaseInterfaceConnection:
         The BEGIN and END TRANSACTION statements will be added automatically
         to the sql statement
 
-        :param statement: The executable SQL statement or SQL script
+        :param statement: The executable SQL statement or SQL script,
+                          or a SQLStatementBatch object
         """
         if mapset is None:
             mapset = self.current_mapset
@@ -1210,6 +1354,66 @@ class SQLDatabaseInterfaceConnection:
 
         return self.connections[mapset].execute_transaction(statement)
 
+    def executemany(self, statement, args, mapset=None):
+        """Execute a parametrized SQL statement for each entry of an argument
+        list in a single transaction
+
+        :param statement: The SQL statement with DBMI specific place holders
+        :param args: A list of argument tuples
+        :param mapset: The mapset of the abstract dataset or temporal
+                       database location, if None the current mapset
+                       will be used
+        """
+        return self.execute_batches([(statement, args)], mapset=mapset)
+
+    def execute_batches(self, batches, mapset=None):
+        """Execute batches of parametrized SQL statements in a single
+        transaction
+
+        :param batches: A list of (statement, args) tuples, args is a list
+                        of argument tuples for the statement
+        :param mapset: The mapset of the abstract dataset or temporal
+                       database location, if None the current mapset
+                       will be used
+        """
+        if mapset is None:
+            mapset = self.current_mapset
+
+        mapset = decode(mapset)
+        if mapset not in self.tgis_mapsets.keys():
+            self.msgr.fatal(
+                _(
+                    "Unable to execute transaction. "
+                    + self._create_mapset_error_message(mapset)
+                )
+            )
+
+        return self.connections[mapset].execute_batches(batches)
+
+    def select_by_ids(self, table, ids, columns: str = "id", mapset=None):
+        """Select the rows of many identifiers from a table
+
+        The identifiers are queried in chunks using the IN operator.
+
+        :param table: The name of the table
+        :param ids: A list of identifiers
+        :param columns: The columns to select, separated by comma
+        :param mapset: The mapset of the abstract dataset or temporal
+                       database location, if None the current mapset
+                       will be used
+        :return: A list of the selected rows
+        """
+        if mapset is None:
+            mapset = self.current_mapset
+
+        mapset = decode(mapset)
+        if mapset not in self.tgis_mapsets.keys():
+            self.msgr.fatal(
+                _("Unable to select rows. " + self._create_mapset_error_message(mapset))
+            )
+
+        return self.connections[mapset].select_by_ids(table, ids, columns)
+
     def _create_mapset_error_message(self, mapset) -> str:
         return (
             "You have no permission to "
@@ -1402,50 +1606,24 @@ class DBConnection:
             # and do it by ourself. :(
             # Doors are open for SQL injection because of the
             # limited python sqlite3 implementation!!!
-            pos = 0
-            count = 0
-            maxcount = 100
-            statement = sql
-
-            while count < maxcount:
-                pos = statement.find("?", pos + 1)
-                if pos == -1:
-                    break
-
-                if args[count] is None:
-                    statement = "%sNULL%s" % (
-                        statement[0:pos],
-                        statement[pos + 1 :],
-                    )
+            # Use SQLStatementBatch to execute statements with arguments.
+            parts = sql.split("?")
+            tokens = [parts[0]]
+            for count, part in enumerate(parts[1:]):
+                if count >= len(args):
+                    tokens.append("?")
+                elif args[count] is None:
+                    tokens.append("NULL")
                 elif isinstance(args[count], int):
-                    statement = "%s%d%s" % (
-                        statement[0:pos],
-                        args[count],
-                        statement[pos + 1 :],
-                    )
+                    tokens.append("%d" % args[count])
                 elif isinstance(args[count], float):
-                    statement = "%s%f%s" % (
-                        statement[0:pos],
-                        args[count],
-                        statement[pos + 1 :],
-                    )
-                elif isinstance(args[count], datetime):
-                    statement = "%s'%s'%s" % (
-                        statement[0:pos],
-                        str(args[count]),
-                        statement[pos + 1 :],
-                    )
+                    tokens.append("%f" % args[count])
                 else:
                     # Default is a string, this works for datetime
                     # objects too
-                    statement = "%s'%s'%s" % (
-                        statement[0:pos],
-                        str(args[count]),
-                        statement[pos + 1 :],
-                    )
-                count += 1
-
-            return statement
+                    tokens.append("'%s'" % str(args[count]))
+                tokens.append(part)
+            return "".join(tokens)
 
     def check_table(self, table_name: str):
         """Check if a table exists in the temporal database
@@ -1498,6 +1676,8 @@ class DBConnection:
             connected = True
         try:
             if args:
+                if self.dbmi.__name__ == "sqlite3":
+                    args = _sqlite_parameters(args)
                 self.cursor.execute(statement, args)
             else:
                 self.cursor.execute(statement)
@@ -1526,18 +1706,18 @@ class DBConnection:
         The BEGIN and END TRANSACTION statements will be added automatically
         to the sql statement
 
-        :param statement: The executable SQL statement or SQL script
+        :param statement: The executable SQL statement or SQL script,
+                          or a SQLStatementBatch object
         """
+        if isinstance(statement, SQLStatementBatch):
+            self.execute_batches(statement.batches())
+            return
+
         connected = False
         if not self.connected:
             self.connect()
             connected = True
 
-        sql_script = ""
-        sql_script += "BEGIN TRANSACTION;\n"
-        sql_script += statement
-        sql_script += "END TRANSACTION;"
-
         try:
             if self.dbmi.__name__ == "sqlite3":
                 self.cursor.executescript(statement)
@@ -1555,6 +1735,97 @@ class DBConnection:
         if connected:
             self.close()
 
+    def execute_batches(self, batches):
+        """Execute batches of parametrized SQL statements in a single
+        transaction
+
+        The statements are executed with native parameter binding using
+        executemany, the transaction is rolled back in case of an error.
+        Statements without argument list are executed as SQL scripts,
+        in case of sqlite the pending transaction is committed before.
+
+        :param batches: A list of (statement, args) tuples, args is a list
+                        of argument tuples for the statement or None
+        """
+        connected = False
+        if not self.connected:
+            self.connect()
+            connected = True
+
+        statement = None
+        try:
+            if self.dbmi.__name__ == "sqlite3":
+                in_transaction = False
+                for statement, args in batches:
+                    if args is None:
+                        # executescript() commits the pending transaction
+                        self.cursor.executescript(statement)
+                        in_transaction = False
+                        continue
+                    if not in_transaction:
+                        self.cursor.execute("BEGIN TRANSACTION")
+                        in_transaction = True
+                    self.cursor.executemany(
+                        statement, (_sqlite_parameters(row) for row in args)
+                    )
+                if in_transaction:
+                    self.cursor.execute("COMMIT")
+            else:
+                for statement, args in batches:
+                    if args is None:
+                        self.cursor.execute(statement)
+                    else:
+                        self.dbmi.extras.execute_batch(self.cursor, statement, args)
+                self.connection.commit()
+        except db_errors:
+            self.connection.rollback()
+            if connected:
+                self.close()
+            self.msgr.error(
+                _("Unable to execute transaction:\n %(sql)s") % {"sql": statement}
+            )
+            raise
+
+        if connected:
+            self.close()
+
+    def select_by_ids(self, table, ids, columns: str = "id"):
+        """Select the rows of many identifiers from a table
+
+        :param table: The name of the table
+        :param ids: A list of identifiers
+        :param columns: The columns to select, separated by comma
+        :return: A list of the selected rows
+        """
+        connected = False
+        if not self.connected:
+            self.connect()
+            connected = True
+
+        placeholder = "?" if self.dbmi.paramstyle == "qmark" else "%s"
+        ids = list(ids)
+        rows = []
+        for start in range(0, len(ids), SQL_MAX_VARIABLES):
+            chunk = ids[start : start + SQL_MAX_VARIABLES]
+            sql = "SELECT %s FROM %s WHERE id IN (%s)" % (
+                columns,
+                table,
+                ",".join([placeholder] * len(chunk)),
+            )
+            try:
+                self.cursor.execute(sql, chunk)
+            except db_errors:
+                if connected:
+                    self.close()
+                self.msgr.error(_("Unable to execute :\n %(sql)s") % {"sql": sql})
+                raise
+            rows.extend(self.cursor.fetchall())
+
+        if connected:
+            self.close()
+
+        return rows
+
 
 ###############################################################################
 
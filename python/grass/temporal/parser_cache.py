@@ -0,0 +1,353 @@
+"""
+Cache of lexers and parsing tables of the temporal algebra
+
+The temporal algebra parsers are created with PLY. Building a PLY parser
+computes the LALR parsing tables from the grammar which takes more than
+a second for the raster algebra grammar. The tables only depend on the
+grammar, so they are computed once per grammar, kept in memory for the
+whole process and stored on disk so that they are shared between processes.
+The lexer master regular expressions are compiled once per lexer class.
+
+The cache key is a hash of the grammar (start symbol, tokens, precedence,
+and the rule docstrings) and of the PLY version, so the tables are
+recomputed whenever the grammar changes.
+
+Usage:
+
+::
+
+    from grass.temporal.parser_cache import build_lexer, build_parser
+
+    # in a lexer class
+    self.lexer = build_lexer(self)
+    # in a parser class
+    self.parser = build_parser(self, debug=self.debug)
+
+The on-disk cache is stored in the directory given by the
+``GRASS_PARSER_CACHE_DIR`` environment variable. When the variable is set
+to an empty string, only the in-memory cache is used.
+
+(C) 2025 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from grass.script.interface_cache import user_cache_directory
+
+from .ply import __version__ as ply_version
+from .ply import lex, yacc
+
+CACHE_DIR_VARIABLE = "GRASS_PARSER_CACHE_DIR"
+
+
+def default_cache_directory(env: dict | None = None) -> str | None:
+    """Get the directory for the on-disk cache of parsing tables
+
+    The directory is given by the ``GRASS_PARSER_CACHE_DIR`` variable.
+    If the variable is not set, a directory in the user cache directory is used.
+
+    :param env: environment (defaults to ``os.environ``)
+    :return: path to the directory or None when the on-disk cache is disabled
+    """
+    if env is None:
+        env = os.environ
+    if CACHE_DIR_VARIABLE in env:
+        return env[CACHE_DIR_VARIABLE] or None
+    base = user_cache_directory(env)
+    if not base:
+        return None
+    return os.path.join(base, "parser")
+
+
+def _module_dict(module) -> dict:
+    """Get the attributes of an object the same way as PLY does"""
+    return {name: getattr(module, name) for name in dir(module)}
+
+
+def grammar_signature(module, start: str | None = None) -> str:
+    """Get a hash identifying the grammar defined by a parser object
+
+    :param module: object with the ``p_`` rules, ``tokens`` and ``precedence``
+    :param start: start symbol overriding the one of the object
+    :return: hexadecimal digest
+    """
+    pdict = _module_dict(module)
+    if start is not None:
+        pdict["start"] = start
+    pinfo = yacc.ParserReflect(pdict, log=yacc.NullLogger())
+    pinfo.get_all()
+    parts = [
+        ply_version,
+        repr(pinfo.start),
+        repr(pinfo.tokens),
+        repr(pinfo.prec),
+        bool(pinfo.error_func),
+    ]
+    parts.extend(f"{name}:{doc}" for _line, _module, name, doc in pinfo.pfuncs)
+    return hashlib.sha256("\n".join(map(str, parts)).encode("utf-8")).hexdigest()
+
+
+class CachedProduction:
+    """Grammar production with the information needed by the parser
+
+    Unlike the PLY production, instances do not keep the LR items used
+    to build the tables and they are bound to a single parser object.
+    """
+
+    __slots__ = ("callable", "func", "len", "name", "str")
+
+    def __init__(self, name: str, length: int, func: str | None, text: str):
+        self.name = name
+        self.len = length
+        self.func = func
+        self.str = text
+        self.callable = None
+
+    def __str__(self) -> str:
+        return self.str
+
+    def __repr__(self) -> str:
+        return f"CachedProduction({self.str})"
+
+    def bound(self, module) -> CachedProduction:
+        """Get a copy of the production bound to the rules of *module*"""
+        production = CachedProduction(self.name, self.len, self.func, self.str)
+        if self.func:
+            production.callable = getattr(module, self.func)
+        return production
+
+
+class ParsingTables:
+    """LALR parsing tables in the form used by the PLY parser
+
+    :param productions: list of productions
+    :param action: action table
+    :param goto: goto table
+    """
+
+    def __init__(
+        self, productions: list[CachedProduction], action: dict, goto: dict
+    ) -> None:
+        self.lr_productions = productions
+        self.lr_action = action
+        self.lr_goto = goto
+
+    @classmethod
+    def from_parser(cls, parser: yacc.LRParser) -> ParsingTables:
+        """Create tables from a parser built by PLY"""
+        productions = [
+            CachedProduction(p.name, p.len, p.func, p.str) for p in parser.productions
+        ]
+        return cls(productions, parser.action, parser.goto)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ParsingTables:
+        """Create tables from a dictionary created by :meth:`to_dict`"""
+        productions = [CachedProduction(*item) for item in data["productions"]]
+        # JSON stores the state numbers as strings.
+        action = {int(state): row for state, row in data["action"].items()}
+        goto = {int(state): row for state, row in data["goto"].items()}
+        return cls(productions, action, goto)
+
+    def to_dict(self) -> dict:
+        """Get tables as a dictionary which can be stored as JSON"""
+        return {
+            "productions": [
+                [p.name, p.len, p.func, p.str] for p in self.lr_productions
+            ],
+            "action": self.lr_action,
+            "goto": self.lr_goto,
+        }
+
+    def parser(self, module) -> yacc.LRParser:
+        """Create a parser which calls the rules of *module*
+
+        The tables are shared between parsers, only the productions
+        are copied, so creating a parser is cheap.
+        """
+        tables = ParsingTables(
+            [p.bound(module) for p in self.lr_productions],
+            self.lr_action,
+            self.lr_goto,
+        )
+        return yacc.LRParser(tables, getattr(module, "p_error", None))
+
+
+class ParserCache:
+    """Process-wide and on-disk cache of parsing tables and lexers
+
+    :param directory: directory for the on-disk cache,
+                      None to use only the in-memory cache
+    """
+
+    def __init__(self, directory: str | None = None) -> None:
+        self.directory = directory
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._tables: dict[str, ParsingTables] = {}
+        self._lexers: dict[tuple, lex.Lexer] = {}
+        self._lock = threading.Lock()
+
+    def _disk_path(self, signature: str) -> str:
+        return os.path.join(self.directory, signature + ".json")
+
+    def _read_disk(self, signature: str) -> ParsingTables | None:
+        if not self.directory:
+            return None
+        try:
+            with open(self._disk_path(signature)) as cache_file:
+                return ParsingTables.from_dict(json.load(cache_file))
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing or damaged entries are simply recomputed.
+            return None
+
+    def _write_disk(self, signature: str, tables: ParsingTables) -> None:
+        if not self.directory:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file first, so that concurrent processes
+            # never read a partially written file.
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as cache_file:
+                json.dump(tables.to_dict(), cache_file)
+            Path(tmp_name).replace(self._disk_path(signature))
+        except OSError:
+            # The on-disk cache is only an optimization.
+            pass
+
+    def tables(self, module, start: str | None = None) -> ParsingTables:
+        """Get parsing tables for the grammar defined by *module*
+
+        :param module: object with the ``p_`` rules, ``tokens`` and ``precedence``
+        :param start: start symbol overriding the one of the object
+        """
+        signature = grammar_signature(module, start=start)
+        with self._lock:
+            tables = self._tables.get(signature)
+            if tables is not None:
+                self.hits += 1
+                return tables
+        tables = self._read_disk(signature)
+        if tables is not None:
+            with self._lock:
+                self.disk_hits += 1
+                self._tables[signature] = tables
+            return tables
+        # Let PLY validate the grammar and report problems in the usual way.
+        parser = yacc.yacc(module=module, start=start, debug=False)
+        tables = ParsingTables.from_parser(parser)
+        with self._lock:
+            self.misses += 1
+            self._tables[signature] = tables
+        self._write_disk(signature, tables)
+        return tables
+
+    def lexer(self, module, **kwargs) -> lex.Lexer:
+        """Get a lexer which calls the rules of *module*
+
+        The lexer is built once for each class and the rules of the cached
+        lexer are bound to *module* for each call.
+
+        :param module: object with the ``t_`` rules and ``tokens``
+        :param kwargs: additional arguments for PLY lex
+        """
+        key = (type(module), *sorted(kwargs.items()))
+        with self._lock:
+            template = self._lexers.get(key)
+        if template is None:
+            template = lex.lex(module=module, debug=0, **kwargs)
+            with self._lock:
+                self._lexers[key] = template
+        lexer = template.clone(module)
+        # The clone shares the state of the cached lexer and the rules of
+        # the current state are still bound to the object it was built for.
+        lexer.lexstateeoff = {
+            state: getattr(module, function.__name__)
+            for state, function in template.lexstateeoff.items()
+        }
+        lexer.lexstatestack = []
+        lexer.lineno = 1
+        lexer.begin("INITIAL")
+        return lexer
+
+    def stats(self) -> dict[str, int]:
+        """Get cache counters
+
+        :return: dictionary with number of hits, disk hits, and misses
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._tables),
+            }
+
+    def clear(self, disk: bool = False) -> None:
+        """Remove all cached entries and reset counters
+
+        :param disk: also remove files from the on-disk cache
+        """
+        with self._lock:
+            self._tables.clear()
+            self._lexers.clear()
+            self.hits = self.disk_hits = self.misses = 0
+        if disk and self.directory and os.path.isdir(self.directory):
+            for path in Path(self.directory).glob("*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_parser_cache() -> ParserCache:
+    """Get the process-wide cache of parsing tables"""
+    global _cache  # pylint: disable=global-statement
+    with _cache_lock:
+        if _cache is None:
+            _cache = ParserCache(directory=default_cache_directory())
+        return _cache
+
+
+def build_parser(module, debug: bool = False, start: str | None = None):
+    """Create a PLY parser for the grammar defined by *module*
+
+    This replaces ``yacc.yacc(module=module)``. The parsing tables are
+    taken from the cache. With *debug*, the parser is built by PLY directly,
+    so that the debugging output is produced.
+
+    :param module: object with the ``p_`` rules, ``tokens`` and ``precedence``
+    :param debug: build the parser with PLY debugging enabled
+    :param start: start symbol overriding the one of the object
+    """
+    if debug:
+        return yacc.yacc(module=module, start=start, debug=debug)
+    return get_parser_cache().tables(module, start=start).parser(module)
+
+
+def build_lexer(module, **kwargs):
+    """Create a PLY lexer for the rules defined by *module*
+
+    This replaces ``lex.lex(module=module)``. The lexer of the same class
+    is reused and bound to *module*.
+
+    :param module: object with the ``t_`` rules and ``tokens``
+    :param kwargs: additional arguments for PLY lex
+    """
+    return get_parser_cache().lexer(module, **kwargs)
@@ -0,0 +1,228 @@
+"""
+Sampling of raster maps at the positions of vector points
+
+Usage:
+
+.. code-block:: python
+
+    import grass.temporal as tgis
+
+    sampler = tgis.PointSampler("stations", layer=1)
+    values = sampler.sample(["temp_1@PERMANENT", "temp_2@PERMANENT"], nprocs=4)
+    sampler.update_table(["temp_1", "temp_2"], values, ["DCELL", "DCELL"])
+
+(C) 2025 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+from multiprocessing import Pool
+
+import numpy as np
+
+import grass.script as gs
+from grass.pygrass.gis.region import Region
+from grass.pygrass.raster import RasterRow
+from grass.pygrass.raster.buffer import Buffer
+
+# Null value of CELL maps
+CELL_NULL = np.iinfo(np.int32).min
+# Number of significant digits of values written to the attribute table
+# as v.what.rast does
+VALUE_DIGITS = {"CELL": None, "FCELL": 7, "DCELL": 15}
+
+
+def points_to_cells(x, y, region):
+    """Return the row and column of the cells of the points in the region
+
+    :param x: array of easting of the points
+    :param y: array of northing of the points
+    :param region: the region of the raster maps
+    :type region: Region object
+    :return: tuple with arrays of rows and columns, points outside the
+             region have row and column set to -1
+
+    >>> from collections import namedtuple
+    >>> Window = namedtuple("Window", "north west nsres ewres rows cols")
+    >>> rows, cols = points_to_cells(
+    ...     np.array([0.5, 9.5, 10.5]),
+    ...     np.array([9.5, 0.5, 5.0]),
+    ...     Window(north=10, west=0, nsres=1, ewres=1, rows=10, cols=10),
+    ... )
+    >>> rows.tolist(), cols.tolist()
+    ([0, 9, -1], [0, 9, -1])
+    """
+    rows = np.floor((region.north - y) / region.nsres).astype(np.int64)
+    cols = np.floor((x - region.west) / region.ewres).astype(np.int64)
+    outside = (rows < 0) | (rows >= region.rows) | (cols < 0) | (cols >= region.cols)
+    rows[outside] = -1
+    cols[outside] = -1
+    return rows, cols
+
+
+def sample_raster(name, rows, cols):
+    """Return values of a raster map in the cells
+
+    Only the rows of the raster map which contain a cell are read.
+    The current computational region is used.
+
+    :param name: the name of the raster map
+    :param rows: array of rows of the cells, rows must be inside the region
+    :param cols: array of columns of the cells
+    :return: array of float values with NaN for null cells
+    """
+    region = Region()
+    region.set_raster_region()
+    values = np.full(len(rows), np.nan)
+    with RasterRow(name) as raster:
+        buffer = Buffer((region.cols,), raster.mtype)
+        order = np.argsort(rows, kind="stable")
+        sorted_rows = rows[order]
+        starts = np.flatnonzero(np.r_[True, sorted_rows[1:] != sorted_rows[:-1]])
+        ends = np.r_[starts[1:], len(order)]
+        for start, end in zip(starts, ends):
+            raster.get_row(int(sorted_rows[start]), buffer)
+            indices = order[start:end]
+            row_values = buffer[cols[indices]]
+            if raster.mtype == "CELL":
+                valid = row_values != CELL_NULL
+                values[indices[valid]] = row_values[valid]
+            else:
+                values[indices] = row_values
+    return values
+
+
+class PointSampler:
+    """Sample raster maps at the positions of the points of a vector map
+
+    The points are read once and their positions are converted into
+    cells of the current computational region, so sampling of a raster
+    map reads only the rows which contain a point. Values of all sampled
+    raster maps are returned as one matrix which can be written into
+    the attribute table in a single transaction.
+
+    The results are the same as the results of v.what.rast: points outside
+    the computational region are not updated and points sharing their
+    category with other points are set to NULL.
+
+    :param vector: the name of the vector map
+    :param layer: the layer of the categories of the points
+    :param type: the feature type of the points, point or centroid
+    :param env: environment
+    """
+
+    def __init__(self, vector, layer=1, type="point", env=None):
+        self.vector = vector
+        self.layer = int(layer)
+        self.env = env
+
+        x, y, cats = [], [], []
+        ascii = gs.read_command(
+            "v.out.ascii",
+            input=vector,
+            layer=layer,
+            type=type,
+            format="point",
+            separator="pipe",
+            precision=17,
+            env=env,
+        )
+        for line in ascii.splitlines():
+            fields = line.split("|")
+            if len(fields) < 3:
+                continue
+            x.append(float(fields[0]))
+            y.append(float(fields[1]))
+            cats.append(int(fields[-1]))
+
+        rows, cols = points_to_cells(np.array(x), np.array(y), Region())
+        inside = rows >= 0
+        if not inside.all():
+            gs.warning(
+                _("%d points outside current region were skipped")
+                % np.count_nonzero(~inside)
+            )
+        cats = np.array(cats, dtype=np.int64)[inside]
+        self.cats, index, counts = np.unique(
+            cats, return_index=True, return_counts=True
+        )
+        for cat, count in zip(self.cats[counts > 1], counts[counts > 1]):
+            gs.warning(
+                _("Multiple points (%d) of category %d, value set to 'NULL'")
+                % (count, cat)
+            )
+        self._duplicate = counts > 1
+        self.rows = rows[inside][index]
+        self.cols = cols[inside][index]
+
+    def sample(self, rasters, nprocs=1):
+        """Sample raster maps at the points
+
+        :param rasters: list of names of raster maps
+        :param nprocs: number of processes used to sample the maps
+        :return: array with a row for each raster map and a column for each
+                 category in :attr:`cats`, null values are NaN
+        """
+        values = np.full((len(rasters), len(self.cats)), np.nan)
+        if not len(rasters) or not len(self.cats):
+            return values
+        arguments = [(name, self.rows, self.cols) for name in rasters]
+        if nprocs > 1 and len(rasters) > 1:
+            with Pool(min(nprocs, len(rasters))) as pool:
+                results = pool.starmap(sample_raster, arguments)
+        else:
+            results = [sample_raster(*args) for args in arguments]
+        for index, result in enumerate(results):
+            values[index] = result
+        values[:, self._duplicate] = np.nan
+        return values
+
+    def update_table(self, columns, values, mtypes, where=None, layer=None):
+        """Write sampled values into the attribute table in one transaction
+
+        :param columns: list of names of existing columns
+        :param values: array with a row of values for each column as returned
+                       by :meth:`sample`
+        :param mtypes: list of types of the sampled raster maps
+        :param where: SQL where condition which limits the updated records
+        :param layer: layer of the attribute table with the same categories
+                      as the points, the layer of the points by default
+        """
+        if not len(columns) or not len(self.cats):
+            return
+        fi = gs.vector_db(self.vector, env=self.env)[int(layer or self.layer)]
+        formats = []
+        for mtype in mtypes:
+            digits = VALUE_DIGITS[mtype]
+            formats.append("%d" if digits is None else "%.{}g".format(digits))
+
+        sqlfile = gs.tempfile(env=self.env)
+        with open(sqlfile, "w") as f:
+            f.write("{0}\n".format(gs.db_begin_transaction(fi["driver"])))
+            for index, cat in enumerate(self.cats):
+                assignments = []
+                for column, value, value_format in zip(
+                    columns, values[:, index], formats
+                ):
+                    value = "NULL" if np.isnan(value) else value_format % value
+                    assignments.append("%s = %s" % (column, value))
+                condition = "%s = %d" % (fi["key"], cat)
+                if where:
+                    condition += " AND %s" % where
+                f.write(
+                    "UPDATE %s SET %s WHERE %s;\n"
+                    % (fi["table"], ", ".join(assignments), condition)
+                )
+            f.write("{0}\n".format(gs.db_commit_transaction(fi["driver"])))
+
+        try:
+            gs.run_command(
+                "db.execute",
+                input=sqlfile,
+                database=fi["database"],
+                driver=fi["driver"],
+                env=self.env,
+            )
+        finally:
+            gs.try_remove(sqlfile)
@@ -22,7 +22,13 @@ from datetime import datetime
 import grass.script as gs
 
 from .abstract_map_dataset import AbstractMapDataset
-from .core import get_current_mapset, get_tgis_message_interface, init_dbif
+from .c_libraries_interface import RPCDefs
+from .core import (
+    get_current_mapset,
+    get_enable_timestamp_write,
+    get_tgis_message_interface,
+    init_dbif,
+)
 from .datetime_math import (
     check_datetime_string,
     increment_datetime_by_string,
@@ -31,6 +37,9 @@ from .datetime_math import (
 from .factory import dataset_factory
 from .open_stds import open_old_stds
 
+# Number of maps which are read and inserted with bulk requests
+REGISTER_CHUNK_SIZE = 500
+
 ###############################################################################
 
 
@@ -236,121 +245,62 @@ def register_maps_in_space_time_dataset(
 
     msgr.debug(2, "Gathering map information...")
 
-    for count, row in enumerate(maplist):
-        if count % 50 == 0:
-            msgr.percent(count, num_maps, 1)
-
-        # Get a new instance of the map type
-        map_object = dataset_factory(type, row["id"])
-
-        map_object_id = map_object.get_map_id()
-        map_object_layer = map_object.get_layer()
-        map_object_type = map_object.get_type()
-        if not map_object.map_exists():
-            msgr.fatal(
-                _("Unable to update {t} map <{mid}>. The map does not exist.").format(
-                    t=map_object_type, mid=map_object_id
-                )
+    # The maps are processed in chunks, the existence and metadata of
+    # all maps of a chunk are read with a single request to the C-library
+    # interface and the new maps are inserted with one statement per table
+    for chunk_start in range(0, num_maps, REGISTER_CHUNK_SIZE):
+        msgr.percent(chunk_start, num_maps, 1)
+
+        chunk = maplist[chunk_start : chunk_start + REGISTER_CHUNK_SIZE]
+        chunk_objects = [dataset_factory(type, row["id"]) for row in chunk]
+        chunk_info = _read_map_info_batch(chunk_objects)
+        in_db_ids = {
+            row[0]
+            for row in dbif.select_by_ids(
+                chunk_objects[0].base.get_table_name(),
+                [map_object.get_id() for map_object in chunk_objects],
+                mapset=mapset,
             )
+        }
+        new_map_objects = []
+
+        for chunk_count, (row, map_object, info) in enumerate(
+            zip(chunk, chunk_objects, chunk_info)
+        ):
+            count = chunk_start + chunk_count
+
+            map_object_id = map_object.get_map_id()
+            map_object_layer = map_object.get_layer()
+            map_object_type = map_object.get_type()
+            if info is None:
+                msgr.fatal(
+                    _(
+                        "Unable to update {t} map <{mid}>. The map does not exist."
+                    ).format(t=map_object_type, mid=map_object_id)
+                )
 
-        # Use the time data from file
-        if "start" in row:
-            start = row["start"]
-        if "end" in row:
-            end = row["end"]
-
-        # Use the semantic label from file
-        semantic_label = row.get("semantic_label", None)
-
-        is_in_db = map_object.is_in_db(dbif, mapset)
-
-        # Put the map into the database of the current mapset
-        if not is_in_db:
-            # Break in case no valid time is provided
-            if (start == "" or start is None) and not map_object.has_grass_timestamp():
-                dbif.close()
-                if map_object_layer:
-                    msgr.fatal(
-                        _(
-                            "Unable to register {t} map <{mid}> with "
-                            "layer {l}. The map has timestamp and "
-                            "the start time is not set."
-                        ).format(
-                            t=map_object_type,
-                            mid=map_object_id,
-                            l=map_object_layer,
-                        )
-                    )
-                else:
-                    msgr.fatal(
-                        _(
-                            "Unable to register {t} map <{mid}>. The"
-                            " map has no timestamp and the start time "
-                            "is not set."
-                        ).format(t=map_object_type, mid=map_object_id)
-                    )
-            if start != "" and start is not None:
-                # We need to check if the time is absolute and the unit was specified
-                time_object = check_datetime_string(start)
-                if isinstance(time_object, datetime) and unit:
-                    msgr.fatal(_("unit can only be set for relative time"))
-                if not isinstance(time_object, datetime) and not unit:
-                    msgr.fatal(_("unit must be set in case of relative time stamps"))
-
-                if unit:
-                    map_object.set_time_to_relative()
-                else:
-                    map_object.set_time_to_absolute()
-
-        else:
-            # Check the overwrite flag
-            if not overwrite:
-                if map_object_layer:
-                    msgr.warning(
-                        _(
-                            "Map is already registered in temporal "
-                            "database. Unable to update {t} map "
-                            "<{mid}> with layer {l}. Overwrite flag"
-                            " is not set."
-                        ).format(
-                            t=map_object_type,
-                            mid=map_object_id,
-                            l=str(map_object_layer),
-                        )
-                    )
-                else:
-                    msgr.warning(
-                        _(
-                            "Map is already registered in temporal "
-                            "database. Unable to update {t} map "
-                            "<{mid}>. Overwrite flag is not set."
-                        ).format(t=map_object_type, mid=map_object_id)
-                    )
-
-                # Simple registration is allowed
-                if name:
-                    map_object_list.append(map_object)
-                # Jump to next map
-                continue
+            # Use the time data from file
+            if "start" in row:
+                start = row["start"]
+            if "end" in row:
+                end = row["end"]
 
-            # Reload properties from database
-            map_object.select(dbif)
+            # Use the semantic label from file
+            semantic_label = row.get("semantic_label", None)
 
-            # Save the datasets that must be updated
-            datasets = map_object.get_registered_stds(dbif)
-            if datasets is not None:
-                for dataset in datasets:
-                    if dataset != "":
-                        datatsets_to_modify[dataset] = dataset
+            is_in_db = map_object.get_id() in in_db_ids
 
-                if name and map_object.get_temporal_type() != sp.get_temporal_type():
+            # Put the map into the database of the current mapset
+            if not is_in_db:
+                # Break in case no valid time is provided
+                if (start == "" or start is None) and info["timestamp"] is None:
                     dbif.close()
                     if map_object_layer:
                         msgr.fatal(
                             _(
-                                "Unable to update {t} map <{id}> "
-                                "with layer {l}. The temporal types "
-                                "are different."
+                                "Unable to register {t} map <{mid}> with "
+                                "layer {l}. The map has timestamp and "
+                                "the start time is not set."
                             ).format(
                                 t=map_object_type,
                                 mid=map_object_id,
@@ -360,80 +310,161 @@ def register_maps_in_space_time_dataset(
                     else:
                         msgr.fatal(
                             _(
-                                "Unable to update {t} map <{mid}>. "
-                                "The temporal types are different."
+                                "Unable to register {t} map <{mid}>. The"
+                                " map has no timestamp and the start time "
+                                "is not set."
                             ).format(t=map_object_type, mid=map_object_id)
                         )
+                if start != "" and start is not None:
+                    # We need to check if the time is absolute and the unit was
+                    # specified
+                    time_object = check_datetime_string(start)
+                    if isinstance(time_object, datetime) and unit:
+                        msgr.fatal(_("unit can only be set for relative time"))
+                    if not isinstance(time_object, datetime) and not unit:
+                        msgr.fatal(
+                            _("unit must be set in case of relative time stamps")
+                        )
 
-        # Load the data from the grass file database
-        map_object.load()
-
-        # Try to read an existing time stamp from the grass spatial database
-        # in case this map wasn't already registered in the temporal database
-        # Read the spatial database time stamp only, if no time stamp was provided for
-        # this map
-        # as method argument or in the input file
-        if not is_in_db and not start:
-            map_object.read_timestamp_from_grass()
-
-        # Set the valid time
-        if start:
-            # In case the time is in the input file we ignore the increment
-            # counter
-            if start_time_in_file:
-                count = 1
-            assign_valid_time_to_map(
-                ttype=map_object.get_temporal_type(),
-                map_object=map_object,
-                start=start,
-                end=end,
-                unit=unit,
-                increment=increment,
-                mult=count,
-                interval=interval,
+                    if unit:
+                        map_object.set_time_to_relative()
+                    else:
+                        map_object.set_time_to_absolute()
+
+            else:
+                # Check the overwrite flag
+                if not overwrite:
+                    if map_object_layer:
+                        msgr.warning(
+                            _(
+                                "Map is already registered in temporal "
+                                "database. Unable to update {t} map "
+                                "<{mid}> with layer {l}. Overwrite flag"
+                                " is not set."
+                            ).format(
+                                t=map_object_type,
+                                mid=map_object_id,
+                                l=str(map_object_layer),
+                            )
+                        )
+                    else:
+                        msgr.warning(
+                            _(
+                                "Map is already registered in temporal "
+                                "database. Unable to update {t} map "
+                                "<{mid}>. Overwrite flag is not set."
+                            ).format(t=map_object_type, mid=map_object_id)
+                        )
+
+                    # Simple registration is allowed
+                    if name:
+                        # The registration requires the content of the
+                        # temporal database
+                        map_object.select(dbif, mapset=mapset)
+                        map_object_list.append(map_object)
+                    # Jump to next map
+                    continue
+
+                # Reload properties from database
+                map_object.select(dbif)
+
+                # Save the datasets that must be updated
+                datasets = map_object.get_registered_stds(dbif)
+                if datasets is not None:
+                    for dataset in datasets:
+                        if dataset != "":
+                            datatsets_to_modify[dataset] = dataset
+
+                    if (
+                        name
+                        and map_object.get_temporal_type() != sp.get_temporal_type()
+                    ):
+                        dbif.close()
+                        if map_object_layer:
+                            msgr.fatal(
+                                _(
+                                    "Unable to update {t} map <{id}> "
+                                    "with layer {l}. The temporal types "
+                                    "are different."
+                                ).format(
+                                    t=map_object_type,
+                                    mid=map_object_id,
+                                    l=map_object_layer,
+                                )
+                            )
+                        else:
+                            msgr.fatal(
+                                _(
+                                    "Unable to update {t} map <{mid}>. "
+                                    "The temporal types are different."
+                                ).format(t=map_object_type, mid=map_object_id)
+                            )
+
+            # Load the data from the grass file database, the semantic label
+            # stored in the grass file database is loaded as well
+            map_object.load_from_info(
+                info["history"], info["info"], info["semantic_label"]
             )
 
-        # Set the semantic label (only raster type supported)
-        if semantic_label:
-            # semantic label defined in input file
-            # -> update raster metadata
-            # -> write band identifier to GRASS data base
-            map_object.set_semantic_label(semantic_label)
-        else:
-            # Try to read semantic label from GRASS data base if defined
-            map_object.read_semantic_label_from_grass()
+            # Use an existing time stamp from the grass spatial database
+            # in case this map wasn't already registered in the temporal database
+            # Use the spatial database time stamp only, if no time stamp was
+            # provided for this map as method argument or in the input file
+            if not is_in_db and not start:
+                _set_time_from_grass_timestamp(map_object, info["timestamp"])
+
+            # Set the valid time
+            if start:
+                # In case the time is in the input file we ignore the increment
+                # counter
+                if start_time_in_file:
+                    count = 1
+                assign_valid_time_to_map(
+                    ttype=map_object.get_temporal_type(),
+                    map_object=map_object,
+                    start=start,
+                    end=end,
+                    unit=unit,
+                    increment=increment,
+                    mult=count,
+                    interval=interval,
+                )
 
-        if is_in_db:
-            #  Gather the SQL update statement
-            statement += map_object.update_all(dbif=dbif, execute=False)
-        else:
-            #  Gather the SQL insert statement
-            statement += map_object.insert(dbif=dbif, execute=False)
+            # Set the semantic label (only raster type supported)
+            if semantic_label:
+                # semantic label defined in input file
+                # -> update raster metadata
+                # -> write band identifier to GRASS data base
+                map_object.set_semantic_label(semantic_label)
 
-        # Sqlite3 performance is better for huge datasets when committing in
-        # small chunks
-        if dbif.get_dbmi().__name__ == "sqlite3":
-            if count % 100 == 0:
-                if statement is not None and statement != "":
-                    dbif.execute_transaction(statement)
-                    statement = ""
+            if is_in_db:
+                #  Gather the SQL update statement
+                statement += map_object.update_all(dbif=dbif, execute=False)
+            else:
+                #  Gather the map for the bulk insert
+                new_map_objects.append(map_object)
 
-        # Store the maps in a list to register in a space time dataset
-        if name:
-            map_object_list.append(map_object)
+            # Store the maps in a list to register in a space time dataset
+            if name:
+                map_object_list.append(map_object)
 
-    msgr.percent(num_maps, num_maps, 1)
+        if statement is not None and statement != "":
+            dbif.execute_transaction(statement)
+            statement = ""
 
-    if statement is not None and statement != "":
-        dbif.execute_transaction(statement)
+        _insert_maps(dbif, new_map_objects, mapset)
+
+    msgr.percent(num_maps, num_maps, 1)
 
     # Finally Register the maps in the space time dataset
     if name and map_object_list:
         num_maps = len(map_object_list)
-        for count, map_object in enumerate(map_object_list):
-            if count % 50 == 0:
-                msgr.percent(count, num_maps, 1)
-            sp.register_map(map=map_object, dbif=dbif)
+        for chunk_start in range(0, num_maps, REGISTER_CHUNK_SIZE):
+            msgr.percent(chunk_start, num_maps, 1)
+            sp.register_maps(
+                map_object_list[chunk_start : chunk_start + REGISTER_CHUNK_SIZE],
+                dbif=dbif,
+            )
 
     # Update the space time tables
     if name and map_object_list:
@@ -462,6 +493,126 @@ def register_maps_in_space_time_dataset(
 ###############################################################################
 
 
+def _read_map_info_batch(map_objects):
+    """Read existence, history, metadata and timestamps of maps of the
+    same type with a single request to the C-library interface
+
+    :param map_objects: A list of map dataset objects
+    :return: A list with one entry per map, None for maps which do not exist
+    """
+    if not map_objects:
+        return []
+    ciface = map_objects[0].ciface
+    map_type = map_objects[0].get_type()
+    if map_type == "vector":
+        return ciface.read_vector_info_batch(
+            [
+                (map_object.get_name(), map_object.get_mapset(), map_object.get_layer())
+                for map_object in map_objects
+            ]
+        )
+    maps = [
+        (map_object.get_name(), map_object.get_mapset()) for map_object in map_objects
+    ]
+    if map_type == "raster3d":
+        return ciface.read_raster3d_info_batch(maps)
+    return ciface.read_raster_info_batch(maps)
+
+
+def _set_time_from_grass_timestamp(map_object, timestamp) -> bool:
+    """Set the valid time of a map from a timestamp read from the grass
+    file system based database
+
+    :param map_object: The map dataset object
+    :param timestamp: The tuple (check, dates) as read by the C-library
+                      interface or None in case the map has no timestamp
+    :return: True if success, False on error
+    """
+    if timestamp is None:
+        return False
+
+    check, dates = timestamp
+    if check < 1:
+        get_tgis_message_interface().error(
+            _("Unable to read timestamp file for {t} map <{mid}>").format(
+                t=map_object.get_type(), mid=map_object.get_map_id()
+            )
+        )
+        return False
+
+    if len(dates) == 2:
+        map_object.set_absolute_time(dates[0], dates[1])
+    else:
+        map_object.set_relative_time(dates[0], dates[1], dates[2])
+
+    return True
+
+
+def _insert_maps(dbif, map_objects, mapset) -> None:
+    """Insert maps in the temporal database
+
+    The INSERT statements of all maps are grouped by table and executed
+    with executemany in a single transaction.
+
+    :param dbif: The database interface to be used
+    :param map_objects: A list of map dataset objects
+    :param mapset: The mapset of the temporal database
+    """
+    if not map_objects:
+        return
+
+    if get_enable_timestamp_write():
+        _write_timestamps(map_objects)
+    batches = {}
+    for map_object in map_objects:
+        for position, (sql, args) in enumerate(map_object.get_insert_statements()):
+            batches.setdefault((position, sql), []).append(args)
+
+    # The base table must be filled first because of the foreign keys,
+    # the keys are unique hence the sorting uses only the table position
+    dbif.execute_batches(
+        [(sql, args) for (position, sql), args in sorted(batches.items())],
+        mapset=mapset,
+    )
+
+
+def _write_timestamps(map_objects) -> None:
+    """Write timestamps of maps of the same type with batch requests to the
+    C-library interface
+
+    Timestamps which could not be written are written again one by one
+    to report the error.
+
+    :param map_objects: A list of map dataset objects
+    """
+    ciface = map_objects[0].ciface
+    map_type = map_objects[0].get_type()
+    if map_type == "vector":
+        rpc_type = RPCDefs.TYPE_VECTOR
+    elif map_type == "raster3d":
+        rpc_type = RPCDefs.TYPE_RASTER3D
+    else:
+        rpc_type = RPCDefs.TYPE_RASTER
+    checks = ciface.write_timestamp_batch(
+        rpc_type,
+        [
+            (
+                map_object.get_name(),
+                map_object.get_mapset(),
+                map_object.get_layer() if map_type == "vector" else None,
+                map_object._convert_timestamp(),
+            )
+            for map_object in map_objects
+        ],
+    )
+    for map_object, check in zip(map_objects, checks):
+        if check != 1:
+            map_object.write_timestamp_to_grass()
+
+
+###############################################################################
+
+
 def assign_valid_time_to_map(
     ttype, map_object, start, end, unit, increment=None, mult=1, interval: bool = False
 ) -> None:
@@ -15,8 +15,6 @@ import getpass
 from datetime import datetime
 from typing import Literal
 
-import grass.script.array as garray
-
 from .abstract_map_dataset import AbstractMapDataset
 from .abstract_space_time_dataset import AbstractSpaceTimeDataset
 from .base import (
@@ -251,10 +249,11 @@ class RasterDataset(AbstractMapDataset):
         You need to call the write function to write the memmap
         array back into grass.
         """
+        import grass.script.array as garray
 
         if self.map_exists():
-            return garray.array(self.get_map_id())
-        return garray.array()
+            return garray.array(self.get_map_id(), direct=True)
+        return garray.array(direct=True)
 
     def reset(self, ident) -> None:
         """Reset the internal structure and set the identifier"""
@@ -415,8 +414,25 @@ class RasterDataset(AbstractMapDataset):
         if self.map_exists() is not True:
             return False
 
+        history = self.ciface.read_raster_history(self.get_name(), self.get_mapset())
+        info = self.ciface.read_raster_info(self.get_name(), self.get_mapset())
+        semantic_label = self.ciface.read_raster_semantic_label(
+            self.get_name(), self.get_mapset()
+        )
+        return self.load_from_info(history, info, semantic_label)
+
+    def load_from_info(self, history, info, semantic_label=None) -> bool:
+        """Fill the internal structure from map history and map info
+        which were read from the grass file system based database
+
+        :param history: The key value pairs of the map history
+        :param info: The key value pairs of the map specific metadata
+        :param semantic_label: The semantic label of the map or None
+        :return: True if the metadata was filled successfully,
+                 False otherwise
+        """
         # Fill base information
-        kvp = self.ciface.read_raster_history(self.get_name(), self.get_mapset())
+        kvp = history
 
         if kvp:
             self.base.set_creator(kvp["creator"])
@@ -427,7 +443,7 @@ class RasterDataset(AbstractMapDataset):
             self.base.set_creator(str(getpass.getuser()))
             self.base.set_ctime()
 
-        kvp = self.ciface.read_raster_info(self.get_name(), self.get_mapset())
+        kvp = info
 
         if not kvp:
             return False
@@ -453,9 +469,6 @@ class RasterDataset(AbstractMapDataset):
         self.metadata.set_number_of_cells(ncells)
 
         # Fill semantic label if defined
-        semantic_label = self.ciface.read_raster_semantic_label(
-            self.get_name(), self.get_mapset()
-        )
         if semantic_label:
             self.metadata.set_semantic_label(semantic_label)
 
@@ -687,6 +700,7 @@ class Raster3DDataset(AbstractMapDataset):
         You need to call the write function to write the memmap
         array back into grass.
         """
+        import grass.script.array as garray
 
         if self.map_exists():
             return garray.array3d(self.get_map_id())
@@ -809,8 +823,23 @@ class Raster3DDataset(AbstractMapDataset):
         if self.map_exists() is not True:
             return False
 
+        history = self.ciface.read_raster3d_history(self.get_name(), self.get_mapset())
+        info = self.ciface.read_raster3d_info(self.get_name(), self.get_mapset())
+        return self.load_from_info(history, info)
+
+    def load_from_info(self, history, info, semantic_label=None) -> bool:
+        """Fill the internal structure from map history and map info
+        which were read from the grass file system based database
+
+        :param history: The key value pairs of the map history
+        :param info: The key value pairs of the map specific metadata
+        :param semantic_label: Ignored, semantic labels are supported
+                               for raster maps only
+        :return: True if the metadata was filled successfully,
+                 False otherwise
+        """
         # Fill base information
-        kvp = self.ciface.read_raster3d_history(self.get_name(), self.get_mapset())
+        kvp = history
 
         if kvp:
             self.base.set_creator(kvp["creator"])
@@ -822,7 +851,7 @@ class Raster3DDataset(AbstractMapDataset):
             self.base.set_ctime()
 
         # Fill spatial extent
-        kvp = self.ciface.read_raster3d_info(self.get_name(), self.get_mapset())
+        kvp = info
 
         if not kvp:
             return False
@@ -1147,8 +1176,23 @@ class VectorDataset(AbstractMapDataset):
         if self.map_exists() is not True:
             return False
 
+        history = self.ciface.read_vector_history(self.get_name(), self.get_mapset())
+        info = self.ciface.read_vector_info(self.get_name(), self.get_mapset())
+        return self.load_from_info(history, info)
+
+    def load_from_info(self, history, info, semantic_label=None) -> bool:
+        """Fill the internal structure from map history and map info
+        which were read from the grass file system based database
+
+        :param history: The key value pairs of the map history
+        :param info: The key value pairs of the map specific metadata
+        :param semantic_label: Ignored, semantic labels are supported
+                               for raster maps only
+        :return: True if the metadata was filled successfully,
+                 False otherwise
+        """
         # Fill base information
-        kvp = self.ciface.read_vector_history(self.get_name(), self.get_mapset())
+        kvp = history
 
         if kvp:
             self.base.set_creator(kvp["creator"])
@@ -1160,7 +1204,7 @@ class VectorDataset(AbstractMapDataset):
             self.base.set_ctime()
 
         # Get the data from an existing vector map
-        kvp = self.ciface.read_vector_info(self.get_name(), self.get_mapset())
+        kvp = info
 
         if not kvp:
             return False
@@ -18,7 +18,7 @@ for details.
 :authors: Soeren Gebbert
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from grass.lib import gis, rtree, vector
 
@@ -26,6 +26,27 @@ from .abstract_dataset import AbstractDatasetComparisonKeyStartTime
 from .core import init_dbif
 from .datetime_math import time_delta_to_relative_time_seconds
 
+# Number of maps from which the sweep-line method is used instead of the R-tree
+SWEEP_THRESHOLD = 1000
+
+# Temporal relations in the order in which TemporalExtent.temporal_relation()
+# tests them
+TEMPORAL_RELATIONS = (
+    "equal",
+    "during",
+    "contains",
+    "overlaps",
+    "overlapped",
+    "after",
+    "before",
+    "starts",
+    "finishes",
+    "started",
+    "finished",
+    "follows",
+    "precedes",
+)
+
 ###############################################################################
 
 
@@ -515,7 +536,7 @@ class SpatioTemporalTopologyBuilder:
 
         return tree
 
-    def build(self, mapsA, mapsB=None, spatial=None) -> None:
+    def build(self, mapsA, mapsB=None, spatial=None, method=None) -> None:
         """Build the spatio-temporal topology structure between
         one or two unordered lists of abstract dataset objects
 
@@ -530,6 +551,12 @@ class SpatioTemporalTopologyBuilder:
         The implemented iterator assures
         the chronological iteration over the mapsA.
 
+        Related maps are found either with an R*-Tree or with a sweep over
+        the maps sorted by start time which classifies the temporal
+        relations with NumPy. Both methods create the same topology.
+        The sweep is used for lists with at least SWEEP_THRESHOLD maps
+        when all maps have the same temporal type (and relative time unit).
+
         :param mapsA: A list of abstract_dataset
                       objects with initiated spatio-temporal extent
         :param mapsB: An optional list of abstract_dataset
@@ -538,6 +565,8 @@ class SpatioTemporalTopologyBuilder:
                         as well: spatial can be None (no spatial topology),
                         "2D" using west, east, south, north or "3D" using
                         west, east, south, north, bottom, top
+        :param method: The method to find related maps, "rtree" or "sweep",
+                       None to select it based on the number of maps
         """
 
         identical = False
@@ -555,6 +584,34 @@ class SpatioTemporalTopologyBuilder:
             for map_ in mapsB:
                 map_.reset_topology()
 
+        if method is None:
+            if len(mapsA) + len(mapsB) >= SWEEP_THRESHOLD and _sweep_supported(
+                mapsA, mapsB
+            ):
+                method = "sweep"
+            else:
+                method = "rtree"
+
+        if method == "sweep":
+            self._build_sweep_relations(mapsA, mapsB, spatial, identical)
+        elif method == "rtree":
+            self._build_rtree_relations(mapsA, mapsB, spatial)
+        else:
+            msg = f"Unknown topology build method <{method}>"
+            raise ValueError(msg)
+
+        self._build_internal_iteratable(mapsA, spatial)
+        if not identical and mapsB is not None:
+            self._build_iteratable(mapsB, spatial)
+
+    def _build_rtree_relations(self, mapsA, mapsB, spatial=None) -> None:
+        """Set the relations between the maps found with an R*-Tree
+
+        :param spatial: This indicates if the spatial topology is created
+                        as well: spatial can be None (no spatial topology),
+                        "2D" using west, east, south, north or "3D" using
+                        west, east, south, north, bottom, top
+        """
         tree = self._build_rtree(mapsA, spatial)
 
         list_ = gis.G_new_ilist()
@@ -578,14 +635,67 @@ class SpatioTemporalTopologyBuilder:
                     relation = mapsB[j].spatial_relation(mapsA[i])
                     set_spatial_relationship(A, B, relation)
 
-        self._build_internal_iteratable(mapsA, spatial)
-        if not identical and mapsB is not None:
-            self._build_iteratable(mapsB, spatial)
-
         gis.G_free_ilist(list_)
 
         rtree.RTreeDestroyTree(tree)
 
+    def _build_sweep_relations(self, mapsA, mapsB, spatial, identical) -> None:
+        """Set the relations between the maps found with a sweep over the
+        start times
+
+        The maps must fulfill the conditions checked by _sweep_supported().
+        Temporal relations are classified with NumPy, spatial relations
+        of the related maps are computed by the map objects.
+
+        :param spatial: This indicates if the spatial topology is created
+                        as well: spatial can be None (no spatial topology),
+                        "2D" using west, east, south, north or "3D" using
+                        west, east, south, north, bottom, top
+        :param identical: True if mapsA and mapsB are the same list
+        """
+        a_start, a_end, a_has_end = _temporal_extent_arrays(mapsA, self._timeref)
+        if identical:
+            b_start, b_end, b_has_end = a_start, a_end, a_has_end
+        else:
+            b_start, b_end, b_has_end = _temporal_extent_arrays(mapsB, self._timeref)
+
+        i, j = _overlapping_intervals(a_start, a_end, b_start, b_end)
+
+        if identical:
+            # A map is not related to itself and the temporal relation
+            # of each pair is set for both maps at once.
+            keep = i < j
+            i = i[keep]
+            j = j[keep]
+
+        if spatial is not None:
+            extentsA = _spatial_extent_array(mapsA, spatial)
+            extentsB = extentsA if identical else _spatial_extent_array(mapsB, spatial)
+            keep = _overlapping_extents(extentsA, extentsB, i, j)
+            i = i[keep]
+            j = j[keep]
+
+        codes = classify_temporal_relations(
+            b_start[j],
+            b_end[j],
+            b_has_end[j],
+            a_start[i],
+            a_end[i],
+            a_has_end[i],
+        )
+
+        for i_, j_, code in zip(i.tolist(), j.tolist(), codes.tolist()):
+            A = mapsA[i_]
+            B = mapsB[j_]
+            if code >= 0:
+                set_temporal_relationship(A, B, TEMPORAL_RELATIONS[code])
+            if spatial is not None:
+                set_spatial_relationship(A, B, B.spatial_relation(A))
+                if identical:
+                    # The spatial relations are not always symmetric,
+                    # so both directions are computed as with the R*-Tree.
+                    set_spatial_relationship(B, A, A.spatial_relation(B))
+
     def __iter__(self):
         start_ = self._first
         while start_ is not None:
@@ -605,6 +715,224 @@ class SpatioTemporalTopologyBuilder:
 ###############################################################################
 
 
+def _sweep_supported(mapsA, mapsB) -> bool:
+    """Check if the sweep-line method can be used for the map lists
+
+    All maps must have a start time and the same temporal type, maps with
+    relative time must have the same unit. Otherwise the relations are
+    computed by the map objects.
+    """
+    units = set()
+    absolute = set()
+    for map_ in (*mapsA, *mapsB):
+        if map_.get_temporal_extent_as_tuple()[0] is None:
+            return False
+        is_absolute = bool(map_.is_time_absolute())
+        absolute.add(is_absolute)
+        if not is_absolute:
+            if not map_.is_time_relative():
+                return False
+            units.add(map_.get_relative_time_unit())
+    return len(absolute) == 1 and len(units) <= 1 and None not in units
+
+
+def _temporal_extent_arrays(maps, timeref):
+    """Get the start and end times of the maps as NumPy arrays
+
+    Absolute time is converted to microseconds since *timeref*
+    so that it is represented exactly. The end time of time instances
+    is set to the start time.
+
+    :return: A tuple of start, end and a boolean array which is True for
+             maps with an end time
+    """
+    import numpy as np
+
+    starts = []
+    ends = []
+    has_end = []
+    microsecond = timedelta(microseconds=1)
+    for map_ in maps:
+        start, end = map_.get_temporal_extent_as_tuple()
+        if isinstance(start, datetime):
+            start = (start - timeref) // microsecond
+            if end is not None:
+                end = (end - timeref) // microsecond
+        starts.append(start)
+        has_end.append(end is not None)
+        ends.append(start if end is None else end)
+    return np.array(starts), np.array(ends), np.array(has_end, dtype=bool)
+
+
+def _spatial_extent_array(maps, spatial):
+    """Get the spatial extents of the maps as array
+
+    :return: Array with columns west, east, south, north and for "3D"
+             bottom and top
+    """
+    import numpy as np
+
+    extents = []
+    for map_ in maps:
+        north, south, east, west, top, bottom = map_.get_spatial_extent_as_tuple()
+        if spatial == "3D":
+            extents.append((west, east, south, north, bottom, top))
+        else:
+            extents.append((west, east, south, north))
+    return np.array(extents, dtype=float).reshape(len(maps), -1)
+
+
+def _overlapping_extents(extentsA, extentsB, i, j):
+    """Return a mask of the pairs (i, j) whose spatial extents intersect or
+    meet, the same way as the R*-Tree search
+
+    :param extentsA: array created by _spatial_extent_array()
+    :param extentsB: array created by _spatial_extent_array()
+    """
+    import numpy as np
+
+    mask = np.ones(len(i), dtype=bool)
+    for low in range(0, extentsA.shape[1], 2):
+        high = low + 1
+        mask &= extentsA[i, low] <= extentsB[j, high]
+        mask &= extentsB[j, low] <= extentsA[i, high]
+    return mask
+
+
+def _overlapping_intervals(a_start, a_end, b_start, b_end):
+    """Find all pairs of intervals from A and B which intersect or meet
+
+    The intervals of A are sorted by start time and grouped by their
+    length in powers of two. In each group, the intervals which can
+    intersect an interval of B form a contiguous range in the sorted
+    order which is found by binary search. The candidates are then
+    checked against the end time.
+
+    :return: Two arrays of indices into A and B, sorted by B and A
+    """
+    import numpy as np
+
+    if len(a_start) == 0 or len(b_start) == 0:
+        empty = np.array([], dtype=np.intp)
+        return empty, empty
+
+    duration = a_end - a_start
+    groups = np.zeros(len(a_start), dtype=np.intp)
+    positive = duration > 0
+    groups[positive] = np.floor(np.log2(duration[positive].astype(float))) + 1
+
+    result_i = []
+    result_j = []
+    for group in np.unique(groups):
+        members = np.flatnonzero(groups == group)
+        order = members[np.argsort(a_start[members], kind="stable")]
+        sorted_start = a_start[order]
+        max_duration = duration[order].max()
+
+        low = np.searchsorted(sorted_start, b_start - max_duration, side="left")
+        high = np.searchsorted(sorted_start, b_end, side="right")
+        counts = np.maximum(high - low, 0)
+        total = int(counts.sum())
+        if total == 0:
+            continue
+
+        j = np.repeat(np.arange(len(b_start)), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        i = order[np.repeat(low, counts) + offsets]
+
+        keep = a_end[i] >= b_start[j]
+        result_i.append(i[keep])
+        result_j.append(j[keep])
+
+    if not result_i:
+        empty = np.array([], dtype=np.intp)
+        return empty, empty
+
+    i = np.concatenate(result_i)
+    j = np.concatenate(result_j)
+    order = np.lexsort((i, j))
+    return i[order], j[order]
+
+
+def classify_temporal_relations(
+    self_start, self_end, self_has_end, other_start, other_end, other_has_end
+):
+    """Classify the temporal relations of pairs of temporal extents
+
+    This is the vectorized form of TemporalExtent.temporal_relation().
+    The relation of the first extent (self) to the second (other) is
+    computed for each pair. The end time of time instances must be set
+    to the start time and marked in the has_end arrays.
+
+    .. code-block:: pycon
+
+        >>> import numpy as np
+        >>> start = np.array([0, 0, 2, 5, 3])
+        >>> end = np.array([10, 5, 4, 5, 3])
+        >>> has_end = np.array([True, True, True, False, False])
+        >>> codes = classify_temporal_relations(
+        ...     start,
+        ...     end,
+        ...     has_end,
+        ...     start[[0, 0, 1, 0, 1]],
+        ...     end[[0, 0, 1, 0, 1]],
+        ...     has_end[[0, 0, 1, 0, 1]],
+        ... )
+        >>> [TEMPORAL_RELATIONS[code] for code in codes]
+        ['equal', 'starts', 'during', 'during', 'during']
+        >>> codes = classify_temporal_relations(
+        ...     start[[3]], end[[3]], has_end[[3]], start[[1]], end[[1]], has_end[[1]]
+        ... )
+        >>> [TEMPORAL_RELATIONS[code] for code in codes]
+        ['follows']
+
+    :return: Array with the index of the relation in TEMPORAL_RELATIONS
+             or -1 if there is no relation
+    """
+    import numpy as np
+
+    s1, e1, h1 = self_start, self_end, self_has_end
+    s2, e2, h2 = other_start, other_end, other_has_end
+    both = h1 & h2
+
+    equal = np.where(both, (s1 == s2) & (e1 == e2), ~h1 & ~h2 & (s1 == s2))
+    during = h2 & np.where(h1, (s1 > s2) & (e1 < e2), (s1 >= s2) & (s1 < e2))
+    contains = h1 & np.where(h2, (s1 < s2) & (e1 > e2), (s1 <= s2) & (e1 > s2))
+    overlaps = both & (s1 < s2) & (e1 < e2) & (e1 > s2)
+    overlapped = both & (s1 > s2) & (e1 > e2) & (s1 < e2)
+    after = np.where(h2, s1 > e2, s1 > s2)
+    before = np.where(h1, e1 < s2, s1 < s2)
+    starts = both & (s1 == s2) & (e1 < e2)
+    finishes = both & (e1 == e2) & (s1 > s2)
+    started = both & (s1 == s2) & (e1 > e2)
+    finished = both & (e1 == e2) & (s1 < s2)
+    follows = h2 & (s1 == e2)
+    precedes = h1 & (e1 == s2)
+
+    return np.select(
+        [
+            equal,
+            during,
+            contains,
+            overlaps,
+            overlapped,
+            after,
+            before,
+            starts,
+            finishes,
+            started,
+            finished,
+            follows,
+            precedes,
+        ],
+        list(range(len(TEMPORAL_RELATIONS))),
+        default=-1,
+    )
+
+
+###############################################################################
+
+
 def set_temporal_relationship(A, B, relation) -> None:
     if relation in {"equal", "equals"}:
         if A != B:
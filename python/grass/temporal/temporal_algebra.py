@@ -467,7 +467,7 @@ from .datetime_math import (
 )
 from .factory import dataset_factory
 from .open_stds import open_new_stds, open_old_stds
-from .ply import lex, yacc
+from .parser_cache import build_lexer, build_parser
 from .space_time_datasets import RasterDataset
 from .spatio_temporal_relationships import SpatioTemporalTopologyBuilder
 from .temporal_granularity import (
@@ -688,7 +688,7 @@ class TemporalAlgebraLexer:
 
     # Build the lexer
     def build(self, **kwargs) -> None:
-        self.lexer = lex.lex(module=self, debug=0, **kwargs)
+        self.lexer = build_lexer(self, **kwargs)
 
     # Just for testing
     def test(self, data) -> None:
@@ -974,7 +974,7 @@ class TemporalAlgebraParser:
         """
         self.lexer = TemporalAlgebraLexer()
         self.lexer.build()
-        self.parser = yacc.yacc(module=self, debug=self.debug)
+        self.parser = build_parser(self, debug=self.debug)
 
         self.overwrite = overwrite
         self.count = 0
@@ -140,7 +140,7 @@ for details.
 
 """  # noqa: E501
 
-from .ply import lex, yacc
+from .parser_cache import build_lexer, build_parser
 
 
 class TemporalOperatorLexer:
@@ -266,7 +266,7 @@ class TemporalOperatorLexer:
 
     # Build the lexer
     def build(self, **kwargs) -> None:
-        self.lexer = lex.lex(module=self, debug=0, **kwargs)
+        self.lexer = build_lexer(self, **kwargs)
 
     # Just for testing
     def test(self, data) -> None:
@@ -289,7 +289,7 @@ class TemporalOperatorParser:
     def __init__(self) -> None:
         self.lexer = TemporalOperatorLexer()
         self.lexer.build()
-        self.parser = yacc.yacc(module=self, debug=False)
+        self.parser = build_parser(self)
         self.relations = None  # Temporal relations (equals, contain, during, ...)
         self.temporal = None  # Temporal operation (intersect, left, right, ...)
         self.function = None  # Actual operation (+, -, /, *, ... )
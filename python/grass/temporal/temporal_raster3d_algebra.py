@@ -15,7 +15,7 @@ from __future__ import annotations
 
 import grass.pygrass.modules as pymod
 
-from .ply import yacc
+from .parser_cache import build_parser
 from .space_time_datasets import Raster3DDataset
 from .temporal_raster_base_algebra import (
     TemporalRasterAlgebraLexer,
@@ -66,7 +66,7 @@ class TemporalRaster3DAlgebraParser(TemporalRasterBaseAlgebraParser):
 
         self.lexer = TemporalRasterAlgebraLexer()
         self.lexer.build()
-        self.parser = yacc.yacc(module=self, debug=self.debug)
+        self.parser = build_parser(self, debug=self.debug)
 
         self.overwrite = overwrite
         self.count = 0
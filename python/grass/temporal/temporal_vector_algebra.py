@@ -51,7 +51,7 @@ import grass.pygrass.modules as pygrass
 from .abstract_dataset import AbstractDatasetComparisonKeyStartTime
 from .core import get_current_mapset, init_dbif
 from .open_stds import open_new_stds
-from .ply import yacc
+from .parser_cache import build_parser
 from .space_time_datasets import VectorDataset
 from .spatio_temporal_relationships import SpatioTemporalTopologyBuilder
 from .temporal_algebra import (
@@ -171,7 +171,7 @@ class TemporalVectorAlgebraParser(TemporalAlgebraParser):
 
         self.lexer = TemporalVectorAlgebraLexer()
         self.lexer.build()
-        self.parser = yacc.yacc(module=self, debug=self.debug)
+        self.parser = build_parser(self, debug=self.debug)
 
         self.overwrite = overwrite
         self.count = 0
@@ -0,0 +1,66 @@
+"""Test how much is imported at startup of temporal tools"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+
+def imported_modules(code):
+    """Run code in a new interpreter and return names of imported modules"""
+    code += "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    stdout = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(stdout.splitlines()[-1])
+
+
+def test_import_package():
+    """Importing the package does not import its submodules"""
+    modules = imported_modules("import grass.temporal")
+    assert "grass.temporal" in modules
+    assert not [name for name in modules if name.startswith("grass.temporal.")]
+    assert "numpy" not in modules
+
+
+@pytest.mark.parametrize(
+    "names",
+    [
+        # t.info
+        ["init", "init_dbif", "get_tgis_metadata", "dataset_factory"],
+        # t.rast.list and similar tools
+        ["init", "open_old_stds", "get_dataset_list", "string_to_datetime"],
+    ],
+)
+def test_tool_imports(names):
+    """Tools working with datasets do not import parsers and import/export"""
+    code = "import grass.temporal as tgis\n" + "\n".join(
+        f"tgis.{name}" for name in names
+    )
+    modules = imported_modules(code)
+    assert "grass.temporal.core" in modules
+    for module in (
+        "grass.script.array",
+        "grass.temporal.gui_support",
+        "grass.temporal.ply",
+        "grass.temporal.stds_export",
+        "grass.temporal.stds_import",
+        "grass.temporal.temporal_algebra",
+        "grass.temporal.temporal_operator",
+        "grass.temporal.temporal_raster_algebra",
+        "grass.temporal.temporal_vector_algebra",
+    ):
+        assert module not in modules
+
+
+def test_names_unchanged():
+    """All names in __all__ are available and submodules are attributes"""
+    import grass.temporal as tgis
+
+    for name in tgis.__all__:
+        assert getattr(tgis, name) is not None
+    assert tgis.core.init is tgis.init
+    assert "open_old_stds" in dir(tgis)
+    with pytest.raises(AttributeError):
+        tgis.no_such_function  # noqa: B018
@@ -0,0 +1,107 @@
+"""Tests of grass.temporal.parser_cache"""
+
+from grass.temporal.parser_cache import ParserCache, grammar_signature
+
+
+class CalcLexer:
+    tokens = ("NUMBER", "PLUS", "TIMES")
+    t_PLUS = r"\+"
+    t_TIMES = r"\*"
+    t_ignore = " "
+
+    def t_NUMBER(self, t):
+        r"""\d+"""
+        t.value = int(t.value)
+        return t
+
+    def t_error(self, t):
+        raise SyntaxError(t.value)
+
+
+class CalcParser:
+    tokens = CalcLexer.tokens
+    precedence = (("left", "PLUS"), ("left", "TIMES"))
+
+    def p_sum(self, t):
+        """expr : expr PLUS expr"""
+        t[0] = t[1] + t[3]
+
+    def p_product(self, t):
+        """expr : expr TIMES expr"""
+        t[0] = t[1] * t[3]
+
+    def p_number(self, t):
+        """expr : NUMBER"""
+        t[0] = t[1]
+
+    def p_error(self, t):
+        raise SyntaxError(t)
+
+
+class CalcParserWithMinus(CalcParser):
+    tokens = ("NUMBER", "PLUS", "TIMES", "MINUS")
+
+    def p_negative(self, t):
+        """expr : MINUS expr"""
+        t[0] = -t[2]
+
+
+def parse(cache, expression):
+    lexer = cache.lexer(CalcLexer())
+    parser = cache.tables(CalcParser()).parser(CalcParser())
+    return parser.parse(expression, lexer=lexer)
+
+
+def test_memory_hits():
+    """Tables are computed once per process"""
+    cache = ParserCache()
+    assert parse(cache, "1 + 2 * 3") == 7
+    assert parse(cache, "2 * 3 + 1") == 7
+    assert cache.stats() == {"hits": 1, "disk_hits": 0, "misses": 1, "entries": 1}
+
+
+def test_disk_hits(tmp_path):
+    """Tables stored on disk are used by another cache instance"""
+    parse(ParserCache(directory=str(tmp_path)), "1")
+    cache = ParserCache(directory=str(tmp_path))
+    assert parse(cache, "4 * 5 + 1") == 21
+    assert cache.stats()["disk_hits"] == 1
+    assert cache.stats()["misses"] == 0
+
+
+def test_damaged_disk_entry(tmp_path):
+    """Unreadable entries are recomputed"""
+    cache = ParserCache(directory=str(tmp_path))
+    parse(cache, "1")
+    for path in tmp_path.iterdir():
+        path.write_text("{")
+    cache = ParserCache(directory=str(tmp_path))
+    assert parse(cache, "1 + 1") == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_grammar_change_invalidates():
+    """Different grammars have different signatures"""
+    assert grammar_signature(CalcParser()) == grammar_signature(CalcParser())
+    assert grammar_signature(CalcParser()) != grammar_signature(CalcParserWithMinus())
+
+
+def test_rules_bound_to_object():
+    """Parsers created from the same tables call rules of their own object"""
+
+    class RecordingParser(CalcParser):
+        def p_number(self, t):
+            """expr : NUMBER"""
+            self.numbers.append(t[1])
+            t[0] = t[1]
+
+    cache = ParserCache()
+    first = RecordingParser()
+    second = RecordingParser()
+    first.numbers = []
+    second.numbers = []
+    cache.tables(first).parser(first).parse("1 + 2", lexer=cache.lexer(CalcLexer()))
+    cache.tables(second).parser(second).parse("3", lexer=cache.lexer(CalcLexer()))
+    assert first.numbers == [1, 2]
+    assert second.numbers == [3]
+    assert cache.stats()["hits"] == 1
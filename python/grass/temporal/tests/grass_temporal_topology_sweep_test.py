@@ -0,0 +1,106 @@
+"""Tests of the sweep-line method of SpatioTemporalTopologyBuilder"""
+
+import itertools
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+import grass.temporal as tgis
+from grass.temporal.spatio_temporal_relationships import (
+    TEMPORAL_RELATIONS,
+    SpatioTemporalTopologyBuilder,
+    classify_temporal_relations,
+)
+from grass.temporal.temporal_extent import TemporalExtent
+
+
+def extents():
+    """All intervals and time instances with values from 0 to 3"""
+    for start in range(4):
+        yield start, None
+        for end in range(start + 1, 4):
+            yield start, end
+
+
+def test_classification_matches_temporal_relation():
+    """Vectorized classification gives the relation of TemporalExtent"""
+    pairs = list(itertools.product(extents(), repeat=2))
+    arrays = []
+    for index in (0, 1):
+        start = np.array([pair[index][0] for pair in pairs])
+        end = np.array([pair[index][1] for pair in pairs], dtype=object)
+        has_end = end != None  # noqa: E711
+        end[~has_end] = start[~has_end]
+        arrays.extend([start, end.astype(int), has_end])
+    codes = classify_temporal_relations(*arrays)
+    for (first, second), code in zip(pairs, codes):
+        expected = TemporalExtent(start_time=first[0], end_time=first[1])
+        relation = expected.temporal_relation(
+            TemporalExtent(start_time=second[0], end_time=second[1])
+        )
+        assert (TEMPORAL_RELATIONS[code] if code >= 0 else None) == relation
+
+
+def create_maps(prefix, count, seed):
+    generator = random.Random(seed)
+    start_time = datetime(2001, 1, 1)
+    maps = []
+    for i in range(count):
+        map_ = tgis.RasterDataset(f"{prefix}{i}@PERMANENT")
+        start = generator.randint(0, 100)
+        end = None
+        if generator.random() > 0.2:
+            end = start + generator.choice([1, 1, 2, 5, 30])
+        map_.set_absolute_time(
+            start_time + timedelta(days=start),
+            None if end is None else start_time + timedelta(days=end),
+        )
+        west = generator.randint(0, 10)
+        south = generator.randint(0, 10)
+        map_.set_spatial_extent_from_values(
+            north=south + generator.randint(0, 5),
+            south=south,
+            east=west + generator.randint(0, 5),
+            west=west,
+            top=0,
+            bottom=0,
+        )
+        maps.append(map_)
+    return maps
+
+
+def topology(maps):
+    result = {}
+    for map_ in maps:
+        relations = {
+            key: sorted(related.get_id() for related in value)
+            for key, value in map_.get_temporal_relations().items()
+            if key not in {"NEXT", "PREV"}
+        }
+        relations.update(
+            {
+                f"spatial_{key}": sorted(related.get_id() for related in value)
+                for key, value in map_.get_spatial_relations().items()
+            }
+        )
+        for key in ("NEXT", "PREV"):
+            related = map_.get_temporal_relations().get(key)
+            relations[key] = related.get_id() if related else None
+        result[map_.get_id()] = relations
+    return result
+
+
+@pytest.mark.parametrize("spatial", [None, "2D"])
+@pytest.mark.parametrize("two_lists", [False, True])
+def test_sweep_matches_rtree(spatial, two_lists):
+    """Both methods create the same topology"""
+    mapsA = create_maps("a", 150, seed=1)
+    mapsB = create_maps("b", 100, seed=2) if two_lists else None
+    maps = mapsA + (mapsB or [])
+
+    SpatioTemporalTopologyBuilder().build(mapsA, mapsB, spatial, method="rtree")
+    expected = topology(maps)
+    SpatioTemporalTopologyBuilder().build(mapsA, mapsB, spatial, method="sweep")
+    assert topology(maps) == expected
@@ -0,0 +1,127 @@
+"""Tests of univariate statistics computed in the current process"""
+
+import numpy as np
+import pytest
+
+from grass.temporal.univar_statistics import CELL_NULL, RasterUnivarStatistics
+
+
+def reference(values, percentile):
+    """Statistics computed as r.univar does"""
+    values = np.sort(values)
+    n = len(values)
+
+    def position(fraction):
+        return max(int(n * fraction - 0.5), 0)
+
+    if n % 2:
+        median = float(values[n // 2])
+    else:
+        median = float(values[n // 2 - 1] + values[n // 2]) / 2.0
+    return {
+        "n": str(n),
+        "min": "%.15g" % values.min(),
+        "max": "%.15g" % values.max(),
+        "first_quartile": "%g" % values[position(0.25)],
+        "median": "%g" % median,
+        "third_quartile": "%g" % values[position(0.75)],
+        "percentiles": ["%g" % values[position(perc / 100)] for perc in percentile],
+    }
+
+
+def random_map(mtype, seed):
+    generator = np.random.default_rng(seed)
+    if mtype == "CELL":
+        values = generator.integers(-50, 500, size=(120, 70)).astype(np.int32)
+        values[generator.random(values.shape) < 0.1] = CELL_NULL
+    else:
+        dtype = np.float32 if mtype == "FCELL" else np.float64
+        values = generator.normal(10, 3, size=(120, 70)).astype(dtype)
+        values[generator.random(values.shape) < 0.1] = np.nan
+    zones = generator.integers(2, 5, size=values.shape).astype(np.int32)
+    zones[generator.random(values.shape) < 0.05] = CELL_NULL
+    return values, zones
+
+
+def accumulate(values, zones, **kwargs):
+    stats = RasterUnivarStatistics(**kwargs)
+    for first in range(0, len(values), 32):
+        stats.add(
+            values[first : first + 32],
+            None if zones is None else zones[first : first + 32],
+        )
+    return dict(stats.statistics())
+
+
+@pytest.mark.parametrize("mtype", ["CELL", "FCELL", "DCELL"])
+@pytest.mark.parametrize("use_zones", [False, True])
+def test_exact_statistics(mtype, use_zones):
+    """Statistics match the statistics computed from all values"""
+    values, zones = random_map(mtype, seed=1)
+    if not use_zones:
+        zones[:] = 2
+    percentile = [10, 97.5]
+    result = accumulate(
+        values,
+        zones if use_zones else None,
+        mtype=mtype,
+        zone_range=(2, 4) if use_zones else None,
+        extended=True,
+        percentile=percentile,
+    )
+    assert sorted(result) == ([2, 3, 4] if use_zones else [None])
+    for zone, stats in result.items():
+        selected = values[zones == (zone or 2)]
+        if mtype == "CELL":
+            valid = selected[selected != CELL_NULL]
+        else:
+            valid = selected[~np.isnan(selected)]
+        expected = reference(valid, percentile)
+        for key, value in expected.items():
+            assert stats[key] == value
+        assert int(stats["null_cells"]) == len(selected) - len(valid)
+        assert float(stats["mean"]) == pytest.approx(valid.astype(float).mean())
+        assert float(stats["stddev"]) == pytest.approx(valid.astype(float).std())
+
+
+def test_approximate_percentiles():
+    """Percentiles from the histogram are exact for integer maps with a small
+    range and close to exact values for floating point maps
+    """
+    for mtype in ("CELL", "DCELL"):
+        values, zones = random_map(mtype, seed=2)
+        kwargs = {
+            "mtype": mtype,
+            "zone_range": (2, 4),
+            "extended": True,
+            "percentile": [5, 50, 90],
+        }
+        exact = accumulate(values, zones, **kwargs)
+        valid = values[values != CELL_NULL] if mtype == "CELL" else values
+        approximate = accumulate(
+            values,
+            zones,
+            value_range=(np.nanmin(valid), np.nanmax(valid)),
+            approximate=True,
+            **kwargs,
+        )
+        for zone, stats in exact.items():
+            if mtype == "CELL":
+                assert approximate[zone] == stats
+            else:
+                for key in ("first_quartile", "median", "third_quartile"):
+                    assert float(approximate[zone][key]) == pytest.approx(
+                        float(stats[key]), abs=0.01
+                    )
+
+
+def test_null_map():
+    """Map with only null cells has no valid statistics"""
+    stats = RasterUnivarStatistics("DCELL", extended=True)
+    stats.add(np.full((3, 3), np.nan))
+    ((zone, result),) = stats.statistics()
+    assert zone is None
+    assert result["n"] == "0"
+    assert result["null_cells"] == "9"
+    assert result["mean"] == "nan"
+    assert result["median"] == "nan"
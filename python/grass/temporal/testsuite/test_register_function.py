@@ -11,6 +11,7 @@ for details.
 
 import datetime
 import os
+import sqlite3
 
 import grass.script as gs
 from grass.gunittest.case import TestCase
@@ -832,6 +833,102 @@ class TestVectorRegisterFunctions(TestCase):
         self.assertEqual(map_3.map_exists(), False)
 
 
+class TestBulkRegisterFunctions(TestCase):
+    """Registration of more maps than fit into a single bulk request"""
+
+    map_names = [f"bulk_register_map_{i}" for i in range(5)]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Initiate the temporal GIS and set the region"""
+        os.putenv("GRASS_OVERWRITE", "1")
+        cls.runModule("g.gisenv", set="TGIS_USE_CURRENT_MAPSET=1")
+        tgis.init()
+        cls.use_temp_region()
+        cls.runModule("g.region", n=80.0, s=0.0, e=120.0, w=0.0, t=1.0, b=0.0, res=10.0)
+        for i, name in enumerate(cls.map_names):
+            cls.runModule(
+                "r.mapcalc", overwrite=True, quiet=True, expression=f"{name} = {i}"
+            )
+        cls.chunk_size = tgis.register.REGISTER_CHUNK_SIZE
+        tgis.register.REGISTER_CHUNK_SIZE = 2
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Remove the maps and the temporary region"""
+        tgis.register.REGISTER_CHUNK_SIZE = cls.chunk_size
+        cls.runModule(
+            "g.remove", flags="f", type="raster", name=cls.map_names, quiet=True
+        )
+        cls.del_temp_region()
+
+    def setUp(self) -> None:
+        """Create the space time raster dataset"""
+        self.strds = tgis.open_new_stds(
+            name="bulk_register_test",
+            type="strds",
+            temporaltype="absolute",
+            title="Test strds",
+            descr="Test strds",
+            semantic="field",
+            overwrite=True,
+        )
+
+    def tearDown(self) -> None:
+        """Remove maps from temporal database"""
+        self.runModule("t.unregister", type="raster", maps=self.map_names, quiet=True)
+        self.strds.delete()
+
+    def test_absolute_time_chunks(self) -> None:
+        """Maps of all chunks are inserted and registered"""
+        tgis.register_maps_in_space_time_dataset(
+            type="raster",
+            name=self.strds.get_name(),
+            maps=",".join(self.map_names),
+            start="2001-01-01",
+            increment="1 day",
+            interval=True,
+        )
+
+        for i, name in enumerate(self.map_names):
+            map = tgis.RasterDataset(name + "@" + tgis.get_current_mapset())
+            map.select()
+            start, end = map.get_absolute_time()
+            self.assertEqual(start, datetime.datetime(2001, 1, 1 + i))
+            self.assertEqual(end, datetime.datetime(2001, 1, 2 + i))
+            self.assertEqual(map.metadata.get_min(), i)
+            self.assertEqual(map.get_registered_stds(), [self.strds.get_id()])
+
+        self.strds.select()
+        start, end = self.strds.get_absolute_time()
+        self.assertEqual(start, datetime.datetime(2001, 1, 1))
+        self.assertEqual(end, datetime.datetime(2001, 1, 6))
+        self.assertEqual(self.strds.metadata.get_number_of_maps(), 5)
+        # datetime values are converted without a process-wide adapter
+        self.assertNotIn((datetime.datetime, sqlite3.PrepareProtocol), sqlite3.adapters)
+
+    def test_register_maps_skips_registered(self) -> None:
+        """Maps which are already registered are skipped"""
+        tgis.register_maps_in_space_time_dataset(
+            type="raster",
+            name=None,
+            maps=",".join(self.map_names),
+            start="2001-01-01",
+            increment="1 day",
+        )
+        maps = []
+        for name in self.map_names:
+            map = tgis.RasterDataset(name + "@" + tgis.get_current_mapset())
+            map.select()
+            maps.append(map)
+
+        self.assertEqual(self.strds.register_maps(maps[:2]), 2)
+        self.assertEqual(self.strds.register_maps(maps), 3)
+        self.strds.update_from_registered_maps()
+        self.strds.select()
+        self.assertEqual(self.strds.metadata.get_number_of_maps(), 5)
+
+
 class TestRegisterFails(TestCase):
     def test_error_handling_1(self) -> None:
         # start option is missing
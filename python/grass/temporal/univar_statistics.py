@@ -24,8 +24,15 @@ for details.
 from multiprocessing import Pool
 from subprocess import PIPE
 
+import numpy as np
+
 import grass.script as gs
+from grass.exceptions import OpenError
+from grass.pygrass.gis.region import Region
 from grass.pygrass.modules import Module
+from grass.pygrass.raster import RasterRow
+from grass.pygrass.raster.buffer import Buffer
+from grass.pygrass.raster.raster_type import TYPE as RTYPE
 
 from .core import SQLDatabaseInterfaceConnection, get_current_mapset
 from .factory import dataset_factory
@@ -112,6 +119,375 @@ def compute_univar_stats(
     return string
 
 
+# Null value of CELL maps
+CELL_NULL = np.iinfo(np.int32).min
+# Variance below this value is reported as zero (GRASS_EPSILON)
+VARIANCE_EPSILON = 1.0e-15
+# Number of cells read from a map at once
+BLOCK_CELLS = 2**20
+# Number of histogram bins used for approximate percentiles
+SKETCH_BINS = 10000
+
+
+def _quantile_position(n, fraction):
+    """Return index of the quantile in sorted values as r.univar does"""
+    return max(int(n * fraction - 0.5), 0)
+
+
+class RasterUnivarStatistics:
+    """Accumulate univariate statistics of raster cells in zones
+
+    Blocks of raster rows are added with :meth:`add` and the statistics are
+    updated with vectorized operations, so the map is never held in memory
+    unless exact percentiles are requested. The statistics and their
+    formatting follow r.univar.
+
+    Percentiles are computed exactly from all values of the zone, or with
+    *approximate*, from a histogram of the values which needs a constant
+    amount of memory. The histogram has a bin for each value of integer maps
+    with a range smaller than the number of bins, so the percentiles of
+    such maps are exact.
+
+    :param mtype: the type of the raster map: CELL, FCELL or DCELL
+    :param zone_range: tuple with minimum and maximum zone, None for no zones
+    :param extended: compute quartiles and percentiles
+    :param percentile: list of percentiles to compute
+    :param value_range: tuple with minimum and maximum value of the map used
+                        for approximate percentiles
+    :param approximate: compute approximate percentiles
+
+    >>> stats = RasterUnivarStatistics("DCELL", extended=True)
+    >>> stats.add(np.array([[1.0, 2.0], [np.nan, 5.0]]))
+    >>> zone, values = next(stats.statistics())
+    >>> values["n"], values["null_cells"], values["mean"], values["median"]
+    ('3', '1', '2.66666666666667', '2')
+    """
+
+    def __init__(
+        self,
+        mtype,
+        zone_range=None,
+        extended=False,
+        percentile=None,
+        value_range=None,
+        approximate=False,
+    ):
+        self.mtype = mtype
+        self.zone_min, zone_max = zone_range or (0, 0)
+        self.zones = zone_range is not None
+        zone_count = zone_max - self.zone_min + 1
+        self.extended = extended
+        self.percentile = percentile or []
+        self.approximate = approximate
+
+        self.size = np.zeros(zone_count, dtype=np.int64)
+        self.n = np.zeros(zone_count, dtype=np.int64)
+        self.min = np.full(zone_count, np.finfo(np.float64).max)
+        self.max = np.full(zone_count, -np.finfo(np.float64).max)
+        self._sums = np.zeros((3, zone_count))
+        # compensation of the Kahan summation used for floating point maps
+        self._compensation = np.zeros((3, zone_count))
+
+        self._values = []
+        self._value_zones = []
+        self._histogram = None
+        if extended and approximate:
+            low, high = value_range or (0, 0)
+            if low is None or high is None:
+                low = high = 0
+            self._low = float(low)
+            if mtype == "CELL" and high - low < SKETCH_BINS:
+                self._bins = int(high - low) + 1
+                self._width = 1.0
+            else:
+                self._bins = SKETCH_BINS
+                self._width = (high - low) / SKETCH_BINS
+            self._histogram = np.zeros((zone_count, self._bins), dtype=np.int64)
+
+    def add(self, values, zones=None):
+        """Add raster cells to the statistics
+
+        :param values: array with raster values, nulls included
+        :param zones: array of the same shape with zones, cells with
+                      null zone are skipped
+        """
+        valid = values != CELL_NULL if self.mtype == "CELL" else ~np.isnan(values)
+        zone_count = len(self.size)
+        if self.zones:
+            inside = zones != CELL_NULL
+            index = zones[inside].astype(np.intp) - self.zone_min
+            values = values[inside]
+            valid = valid[inside]
+            self.size += np.bincount(index, minlength=zone_count)
+            index = index[valid]
+        else:
+            self.size[0] += values.size
+            index = None
+        values = values[valid]
+        if not values.size:
+            return
+        data = values.astype(np.float64)
+
+        if index is None:
+            self.n[0] += data.size
+            sums = np.array([[data.sum()], [(data * data).sum()], [abs(data).sum()]])
+            self.min[0] = min(self.min[0], data.min())
+            self.max[0] = max(self.max[0], data.max())
+        else:
+            self.n += np.bincount(index, minlength=zone_count)
+            sums = np.array(
+                [
+                    np.bincount(index, weights=weights, minlength=zone_count)
+                    for weights in (data, data * data, abs(data))
+                ]
+            )
+            np.minimum.at(self.min, index, data)
+            np.maximum.at(self.max, index, data)
+        if self.mtype == "CELL":
+            self._sums += sums
+        else:
+            corrected = sums - self._compensation
+            total = self._sums + corrected
+            self._compensation = (total - self._sums) - corrected
+            self._sums = total
+
+        if not self.extended:
+            return
+        if self._histogram is None:
+            self._values.append(values)
+            if index is not None:
+                self._value_zones.append(index)
+            return
+        if self._width:
+            bins = ((data - self._low) / self._width).astype(np.intp)
+            np.clip(bins, 0, self._bins - 1, out=bins)
+        else:
+            bins = np.zeros(data.size, dtype=np.intp)
+        if index is not None:
+            bins += index * self._bins
+        self._histogram += np.bincount(bins, minlength=self._histogram.size).reshape(
+            self._histogram.shape
+        )
+
+    def _zone_values(self):
+        """Return arrays with values of all zones"""
+        if not self._values:
+            return [np.empty(0)] * len(self.size)
+        values = np.concatenate(self._values)
+        if not self.zones:
+            return [values]
+        index = np.concatenate(self._value_zones)
+        order = np.argsort(index, kind="stable")
+        bounds = np.cumsum(np.bincount(index, minlength=len(self.size)))[:-1]
+        return np.split(values[order], bounds)
+
+    @staticmethod
+    def _exact_quantiles(values, fractions):
+        """Return median and values at the quantiles from unsorted values"""
+        n = len(values)
+        positions = [_quantile_position(n, fraction) for fraction in fractions]
+        middle = [n // 2] if n % 2 else [n // 2 - 1, n // 2]
+        values = np.partition(values, sorted(set(positions + middle)))
+        if n % 2:
+            median = float(values[n // 2])
+        else:
+            # the sum is computed in the type of the map as r.univar does
+            median = float(values[n // 2 - 1] + values[n // 2]) / 2.0
+        return median, [float(values[position]) for position in positions]
+
+    def _sketch_value(self, cumulative, counts, position):
+        """Return value at the position of sorted values estimated from
+        the histogram
+        """
+        index = int(np.searchsorted(cumulative, position, side="right"))
+        if self._width == 1.0 and self.mtype == "CELL":
+            return self._low + index
+        before = cumulative[index - 1] if index else 0
+        fraction = (position - before + 0.5) / counts[index]
+        return self._low + (index + fraction) * self._width
+
+    def _sketch_quantiles(self, counts, fractions):
+        """Return median and values at the quantiles from the histogram"""
+        n = int(counts.sum())
+        cumulative = np.cumsum(counts)
+        if n % 2:
+            median = self._sketch_value(cumulative, counts, n // 2)
+        else:
+            median = (
+                self._sketch_value(cumulative, counts, n // 2 - 1)
+                + self._sketch_value(cumulative, counts, n // 2)
+            ) / 2.0
+        return median, [
+            self._sketch_value(cumulative, counts, _quantile_position(n, fraction))
+            for fraction in fractions
+        ]
+
+    def statistics(self):
+        """Return statistics of zones with cells
+
+        :return: generator of (zone, dict) tuples where the dict contains
+                 the statistics formatted as printed by r.univar -g,
+                 zone is None without zones
+        """
+        fractions = [0.25, 0.75] + [perc / 100.0 for perc in self.percentile]
+        zone_values = None
+        if self.extended and self._histogram is None:
+            zone_values = self._zone_values()
+        for index in np.flatnonzero(self.size):
+            n = int(self.n[index])
+            total, total_sq, total_abs = self._sums[:, index]
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                mean = np.float64(total) / n
+                variance = (total_sq - total * total / n) / n
+                if variance < VARIANCE_EPSILON:
+                    variance = 0.0
+                stddev = np.sqrt(variance)
+                coeff_var = (stddev / mean) * 100.0
+                if n == 0:
+                    total = total_abs = np.nan
+                mean_of_abs = np.float64(total_abs) / n
+                value_range = self.max[index] - self.min[index]
+            stats = {
+                "n": str(n),
+                "null_cells": str(int(self.size[index]) - n),
+                "cells": str(int(self.size[index])),
+                "min": "%.15g" % self.min[index],
+                "max": "%.15g" % self.max[index],
+                "range": "%.15g" % value_range,
+                "mean": "%.15g" % mean,
+                "mean_of_abs": "%.15g" % mean_of_abs,
+                "stddev": "%.15g" % stddev,
+                "variance": "%.15g" % variance,
+                "coeff_var": "%.15g" % coeff_var,
+                "sum": "%.15g" % total,
+            }
+            if self.extended:
+                if n == 0:
+                    median, quantiles = np.nan, [np.nan] * len(fractions)
+                elif zone_values is not None:
+                    median, quantiles = self._exact_quantiles(
+                        zone_values[index], fractions
+                    )
+                else:
+                    median, quantiles = self._sketch_quantiles(
+                        self._histogram[index], fractions
+                    )
+                stats["first_quartile"] = "%g" % quantiles[0]
+                stats["median"] = "%g" % median
+                stats["third_quartile"] = "%g" % quantiles[1]
+                stats["percentiles"] = ["%g" % value for value in quantiles[2:]]
+            yield (index + self.zone_min if self.zones else None), stats
+
+
+def compute_raster_univar_stats(
+    registered_map_info,
+    fs,
+    rast_region: bool = False,
+    zones=None,
+    extended: bool = False,
+    percentile=None,
+    approximate: bool = False,
+):
+    """Compute univariate statistics for a map of a space time raster dataset
+    in the current process
+
+    Rows of the map are read with the raster library and the statistics
+    are accumulated with :class:`RasterUnivarStatistics`, so no r.univar
+    process is started for the map. The result has the same format as the
+    result of :func:`compute_univar_stats`.
+
+    :param registered_map_info: dict or db row with tgis info for a registered map
+    :param fs: Field separator
+    :param rast_region: If set True ignore the current region settings
+           and use the raster map region for univar statistical calculation.
+    :param zones: raster map with zones to calculate statistics for
+    :param extended: If True compute extended statistics
+    :param percentile: List of percentiles to compute
+    :param approximate: If True compute approximate quartiles and percentiles
+    """
+    id = registered_map_info["id"]
+    start = registered_map_info["start_time"]
+    end = registered_map_info["end_time"]
+    semantic_label = registered_map_info["semantic_label"] or ""
+
+    region = Region()
+    if rast_region:
+        region.from_rast(id)
+    region.set_raster_region()
+
+    raster = RasterRow(id)
+    try:
+        raster.open("r")
+    except OpenError:
+        gs.warning(_("Unable to get statistics for raster map <%s>") % id)
+        return None
+    zone_raster = None
+    try:
+        zone_range = None
+        if zones:
+            zone_raster = RasterRow(zones)
+            zone_raster.open("r")
+            if zone_raster.mtype != "CELL":
+                msg = _(
+                    "Raster map <{name}> used for zoning must be of type CELL"
+                ).format(name=zones)
+                raise ValueError(msg)
+            zone_range = zone_raster.info.range
+            if None in zone_range or CELL_NULL in zone_range:
+                # no zones in the zoning raster
+                return None
+        stats = RasterUnivarStatistics(
+            raster.mtype,
+            zone_range=zone_range,
+            extended=extended,
+            percentile=percentile,
+            value_range=raster.info.range,
+            approximate=approximate,
+        )
+        rows, cols = region.rows, region.cols
+        block_rows = max(1, min(rows, BLOCK_CELLS // max(cols, 1)))
+        blocks = [np.empty((block_rows, cols), dtype=RTYPE[raster.mtype]["numpy"])]
+        if zone_raster is not None:
+            blocks.append(np.empty((block_rows, cols), dtype=RTYPE["CELL"]["numpy"]))
+        buffers = [
+            [
+                Buffer((cols,), mtype, buffer=block, offset=row * block.strides[0])
+                for row in range(block_rows)
+            ]
+            for block, mtype in zip(blocks, (raster.mtype, "CELL"))
+        ]
+        for first in range(0, rows, block_rows):
+            count = min(block_rows, rows - first)
+            for row in range(count):
+                raster.get_row(first + row, buffers[0][row])
+                if zone_raster is not None:
+                    zone_raster.get_row(first + row, buffers[1][row])
+            stats.add(*(block[:count] for block in blocks))
+    finally:
+        raster.close()
+        if zone_raster is not None and zone_raster.is_open():
+            zone_raster.close()
+
+    lines = []
+    for zone, values in stats.statistics():
+        string = f"{id}{fs}{semantic_label}{fs}{start}{fs}{end}"
+        if zone is not None:
+            string += f"{fs}{zone}"
+        string += f"{fs}{values['mean']}{fs}{values['min']}"
+        string += f"{fs}{values['max']}{fs}{values['mean_of_abs']}"
+        string += f"{fs}{values['stddev']}{fs}{values['variance']}"
+        string += f"{fs}{values['coeff_var']}{fs}{values['sum']}"
+        string += f"{fs}{values['null_cells']}{fs}{values['n']}"
+        string += f"{fs}{values['n']}"
+        if extended:
+            string += f"{fs}{values['first_quartile']}{fs}{values['median']}"
+            string += f"{fs}{values['third_quartile']}"
+            for perc_value in values["percentiles"]:
+                string += f"{fs}{perc_value}"
+        lines.append(string)
+    return "\n".join(lines)
+
+
 def print_gridded_dataset_univar_statistics(
     type,
     input,
@@ -125,12 +501,17 @@ def print_gridded_dataset_univar_statistics(
     zones=None,
     percentile=None,
     nprocs: int = 1,
+    approximate: bool = False,
 ) -> None:
     """Print univariate statistics for a space time raster or raster3d dataset.
 
     Returns None if the space time raster dataset is empty or if applied
     filters (where, region_relation) do not return any maps to process.
 
+    Statistics of raster maps are computed in the current process (or in
+    a pool of *nprocs* processes) by :func:`compute_raster_univar_stats`,
+    statistics of 3D raster maps are computed by r3.univar.
+
     :param type: Type of Space-Time-Dataset, must be either strds or str3ds
     :param input: The name of the space time dataset
     :param output: Name of the optional output file, if None stdout is used
@@ -150,6 +531,8 @@ def print_gridded_dataset_univar_statistics(
            - "is_contained": maps that are fully within the provided spatial extent
            - "contains": maps that contain (fully cover) the provided spatial extent
     :param zones: raster map with zones to calculate statistics for
+    :param approximate: If True compute approximate quartiles and percentiles
+           of raster maps using a fixed amount of memory
     """
     # We need a database interface
     dbif = SQLDatabaseInterfaceConnection()
@@ -232,38 +615,36 @@ def print_gridded_dataset_univar_statistics(
         else:
             out_file.write(string + "\n")
 
-    # Define flags
-    flag = "g"
-    if extended is True:
-        flag += "e"
-    if type == "strds" and rast_region is True and not zones:
-        flag += "r"
-
-    # Setup pygrass module to use for computation
-    univar_module = Module(
-        "r.univar" if type == "strds" else "r3.univar",
-        flags=flag,
-        zones=zones,
-        percentile=percentile,
-        stdout_=PIPE,
-        run_=False,
-    )
+    if type == "strds":
+        function = compute_raster_univar_stats
+        arguments = (fs, rast_region, zones, extended, percentile, approximate)
+    else:
+        # Setup pygrass module to use for computation
+        function = compute_univar_stats
+        arguments = (
+            Module(
+                "r3.univar",
+                flags="ge" if extended is True else "g",
+                zones=zones,
+                percentile=percentile,
+                stdout_=PIPE,
+                run_=False,
+            ),
+            fs,
+        )
 
     nprocs = max(nprocs, 1)
-    if nprocs == 1:
-        strings = [
-            compute_univar_stats(
-                row,
-                univar_module,
-                fs,
-            )
-            for row in rows
-        ]
-    else:
-        with Pool(min(nprocs, len(rows))) as pool:
-            strings = pool.starmap(
-                compute_univar_stats, [(dict(row), univar_module, fs) for row in rows]
-            )
+    try:
+        if nprocs == 1:
+            strings = [function(row, *arguments) for row in rows]
+        else:
+            with Pool(min(nprocs, len(rows))) as pool:
+                strings = pool.starmap(
+                    function, [(dict(row), *arguments) for row in rows]
+                )
+    except ValueError as error:
+        dbif.close()
+        gs.fatal(str(error))
 
     if output is None:
         print("\n".join(filter(None, strings)))
@@ -84,8 +84,10 @@ class ParameterConverter:
 
     def translate_objects_to_data(self, kwargs, env):
         """Convert NumPy arrays to GRASS data"""
+        # The arrays are read and written using the C library when the tools run
+        # in the session of this process, the names are generated here.
         for name, value in self._numpy_inputs.values():
-            map2d = ga.array(env=env)
+            map2d = ga.array(env=env, direct=True)
             map2d[:] = value
             map2d.write(name)
             self.temporary_rasters.append(name)
@@ -99,7 +101,7 @@ class ParameterConverter:
         output_arrays = []
         output_arrays_dict = {}
         for name, key, unused in self._numpy_outputs:
-            output_array = ga.array(name, env=env)
+            output_array = ga.array(name, env=env, direct=True)
             output_arrays.append(output_array)
             output_arrays_dict[key] = output_array
             self.temporary_rasters.append(name)
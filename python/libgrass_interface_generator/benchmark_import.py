@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark import time of grass.lib modules
+
+Each module is imported in a new Python process as it is by pygrass
+(lazily bound symbols stay unbound) and with all its symbols bound,
+which is what happened on import before symbols were bound lazily.
+
+Usage (in a GRASS session):
+
+    python benchmark_import.py [--repeat N] [module ...]
+
+(C) 2025 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULES = ["gis", "raster", "vector", "raster3d", "dbmi", "imagery", "temporal"]
+
+TIMER = """
+import time
+start = time.perf_counter()
+import grass.lib.{module} as module
+if {bind_all}:
+    getattr(module, "__all__", None)
+print(time.perf_counter() - start)
+"""
+
+
+def import_time(module, bind_all):
+    """Return time of importing the module in a new process in seconds"""
+    output = subprocess.run(
+        [sys.executable, "-c", TIMER.format(module=module, bind_all=bind_all)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return float(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=MODULES, help="grass.lib modules")
+    parser.add_argument("--repeat", type=int, default=5, help="number of imports")
+    args = parser.parse_args()
+
+    print(f"{'module':<12}{'lazy [s]':>12}{'all bound [s]':>16}{'speedup':>10}")
+    for module in args.modules:
+        lazy = statistics.median(
+            import_time(module, bind_all=False) for unused in range(args.repeat)
+        )
+        eager = statistics.median(
+            import_time(module, bind_all=True) for unused in range(args.repeat)
+        )
+        print(f"{module:<12}{lazy:>12.4f}{eager:>16.4f}{eager / lazy:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -146,6 +146,15 @@ def main(givenargs=None):
         "Defining --output as a file and --output-language to "
         "Python is a prerequisite.",
     )
+    op.add_option(
+        "",
+        "--lazy-symbols",
+        action="store_true",
+        dest="lazy_symbols",
+        default=False,
+        help="Bind functions and variables when they are accessed for the "
+        "first time instead of when the output module is imported.",
+    )
 
     # Parser options
     op.add_option(
@@ -380,6 +389,12 @@ def main(givenargs=None):
     if len(options.libraries) == 0:
         msgs.warning_message("No libraries specified", cls="usage")
 
+    if options.lazy_symbols and options.strip_prefixes:
+        msgs.error_message(
+            "--lazy-symbols cannot be combined with --strip-prefix", cls="usage"
+        )
+        sys.exit(1)
+
     # Check output language
     printer = None
     if options.output_language.startswith("py"):
@@ -1,5 +1,7 @@
+import io
 import os
 import os.path
+import re
 import sys
 import time
 import shutil
@@ -15,6 +17,8 @@ PREAMBLE_PATH = os.path.join(THIS_DIR, "preamble.py")
 DEFAULTHEADER_PATH = os.path.join(THIS_DIR, "defaultheader.py")
 LIBRARYLOADER_PATH = os.path.join(CTYPESGEN_DIR, "libraryloader.py")
 
+IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
 
 class WrapperPrinter:
     def __init__(self, outpath, options, data):
@@ -54,11 +58,21 @@ class WrapperPrinter:
             "undef": self.print_undef,
         }
 
+        lazy_names = self.lazy_names(data) if self.options.lazy_symbols else set()
+        if lazy_names:
+            self.print_lazy_support()
+
         for kind, desc in data.output_order:
             if desc.included:
-                method_table[kind](desc)
+                if kind in ("function", "variable") and desc.py_name() in lazy_names:
+                    self.print_lazy(desc, method_table[kind])
+                else:
+                    method_table[kind](desc)
                 self.file.write("\n")
 
+        if lazy_names:
+            self.file.write("del _bind\n\n")
+
         self.print_group(self.options.inserted_files, "inserted files", self.insert_file)
         self.strip_prefixes()
 
@@ -208,6 +222,85 @@ class WrapperPrinter:
         )
         self.file.write("\n")
 
+    def lazy_names(self, data):
+        """Return names of functions and variables which can be bound lazily.
+
+        Module level code (macros, constants and undefs) can't trigger the module
+        __getattr__, so symbols it refers to are bound eagerly, as well as names
+        which are defined more than once.
+        """
+        definitions = {}
+        referenced = set()
+        for kind, desc in data.output_order:
+            if not desc.included:
+                continue
+            if kind in ("function", "variable", "macro", "constant", "typedef", "struct"):
+                name = desc.py_name()
+                definitions[name] = definitions.get(name, 0) + 1
+            if kind == "macro":
+                referenced.update(IDENTIFIER.findall(desc.expr.py_string(True)))
+            elif kind == "constant":
+                referenced.update(IDENTIFIER.findall(desc.value.py_string(False)))
+            elif kind == "undef":
+                referenced.update(IDENTIFIER.findall(desc.macro.py_string(False)))
+        return {
+            desc.py_name()
+            for kind, desc in data.output_order
+            if desc.included
+            and kind in ("function", "variable")
+            and definitions[desc.py_name()] == 1
+            and desc.py_name() not in referenced
+        }
+
+    def print_lazy_support(self):
+        self.file.write(
+            "# Begin lazy symbols\n"
+            "\n"
+            "import threading as _threading\n"
+            "\n"
+            "_lazy_symbols = {}\n"
+            "_lazy_lock = _threading.RLock()\n"
+            "\n"
+            "\n"
+            "def _bind_lazy_symbol(name):\n"
+            "    with _lazy_lock:\n"
+            "        bind = _lazy_symbols.pop(name, None)\n"
+            "        if bind is not None:\n"
+            "            bind()\n"
+            "    return name in globals()\n"
+            "\n"
+            "\n"
+            "def __getattr__(name):\n"
+            '    if name == "__all__":\n'
+            "        for symbol in list(_lazy_symbols):\n"
+            "            _bind_lazy_symbol(symbol)\n"
+            '        return [symbol for symbol in globals() if not symbol.startswith("_")]\n'
+            "    if _bind_lazy_symbol(name):\n"
+            "        return globals()[name]\n"
+            '    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))\n'
+            "\n"
+            "\n"
+            "def __dir__():\n"
+            "    return sorted(set(globals()) | set(_lazy_symbols))\n"
+            "\n"
+            "# End lazy symbols\n"
+            "\n"
+        )
+
+    def print_lazy(self, desc, function):
+        """Print the symbol definition in a function called on first access"""
+        output = self.file
+        self.file = io.StringIO()
+        try:
+            function(desc)
+            code = self.file.getvalue()
+        finally:
+            self.file = output
+        self.file.write("def _bind():\n    global %s\n" % desc.py_name())
+        for line in code.splitlines():
+            self.file.write("    %s\n" % line if line else "\n")
+        self.file.write('_lazy_symbols["%s"] = _bind\n' % desc.py_name())
+
     def print_library(self, library):
         self.file.write('_libs["%s"] = load_library("%s")\n' % (library, library))
 
@@ -99,11 +99,18 @@
 # %end
 # %option G_OPT_MEMORYMB
 # %end
+# %option G_OPT_M_NPROCS
+# % description: Number of holes filled in parallel with RST (0: number of CPUs; <0: number of CPUs minus nprocs)
+# % guisection: RST options
+# %end
 
 
+import math
 import os
 import atexit
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 
 import grass.script as gs
 from grass.exceptions import CalledModuleError
@@ -113,6 +120,13 @@ tmp_vmaps = []
 usermask = None
 mapset = None
 
+# holes with buffered regions smaller than that are filled together in one task
+MIN_BATCH_CELLS = 100000
+# maximal number of tasks, larger batches are used for large maps
+MAX_BATCHES = 250
+# maximal number of maps patched by one r.patch run
+MAX_PATCH_INPUTS = 250
+
 # what to do in case of user break:
 
 
@@ -128,6 +142,239 @@ def cleanup():
         )
 
 
+def patch_maps(maps, output, tmp_prefix, env=None, quiet=True):
+    """Patch raster maps into the output map
+
+    Maps are patched in several steps when there are more maps than
+    MAX_PATCH_INPUTS.
+    """
+    step = 0
+    while len(maps) > MAX_PATCH_INPUTS:
+        patched = []
+        for start in range(0, len(maps), MAX_PATCH_INPUTS):
+            chunk = maps[start : start + MAX_PATCH_INPUTS]
+            if len(chunk) == 1:
+                patched.extend(chunk)
+                continue
+            name = "%spatch_%d" % (tmp_prefix, step)
+            step += 1
+            tmp_rmaps.append(name)
+            gs.run_command("r.patch", input=chunk, output=name, quiet=True, env=env)
+            patched.append(name)
+        maps = patched
+    gs.run_command(
+        "r.patch", input=maps, output=output, overwrite=True, quiet=quiet, env=env
+    )
+
+
+def split_holes(holes, ns_res, ew_res):
+    """Split holes into batches of neighboring holes
+
+    Holes are sorted by strips from north to south and from west to east
+    in each strip. Small holes are grouped to batches with at least
+    MIN_BATCH_CELLS cells in their regions, large holes are alone in
+    their batches.
+
+    :param holes: list of dictionaries with bounding boxes of holes
+    :return: list of lists of holes
+    """
+
+    def cells(hole):
+        return round(
+            (hole["north"] - hole["south"])
+            / ns_res
+            * (hole["east"] - hole["west"])
+            / ew_res
+        )
+
+    if not holes:
+        return []
+    target = max(MIN_BATCH_CELLS, sum(cells(hole) for hole in holes) / MAX_BATCHES)
+    strip = math.sqrt(target) * ns_res
+    top = max(hole["north"] for hole in holes)
+
+    batches = []
+    batch = []
+    batch_cells = 0
+    for hole in sorted(
+        holes,
+        key=lambda hole: (
+            (top - (hole["north"] + hole["south"]) / 2) // strip,
+            hole["west"] + hole["east"],
+        ),
+    ):
+        batch.append(hole)
+        batch_cells += cells(hole)
+        if batch_cells >= target:
+            batches.append(batch)
+            batch = []
+            batch_cells = 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def fill_holes(holes, input, prefix, tension, smooth, segmax, npmin, nprocs, quiet):
+    """Fill holes by RST interpolation of values around them
+
+    Each hole is processed in its own region passed to modules in the
+    environment, so several batches of holes can be filled at the same time.
+
+    :param holes: list of dictionaries with categories of holes and
+                  bounding boxes of regions
+    :return: name of raster map with filled holes or None if no hole was
+             filled, and list of names of maps of failed holes
+    """
+    filled = []
+    failed = []
+    for hole in holes:
+        cat = hole["category"]
+        holename = prefix + "hole_%d" % cat
+        env = os.environ.copy()
+        env["GRASS_REGION"] = gs.region_env(
+            n=hole["north"],
+            s=hole["south"],
+            e=hole["east"],
+            w=hole["west"],
+            align=input,
+        )
+        gs.verbose(_("Filling hole %d") % cat)
+
+        # copy only data around hole, edges are cells of the hole system
+        # which are not NULL
+        gs.mapcalc(
+            '$out = if($clumped == $catn && isnull($holes), "$dem", null())',
+            out=holename + "_edges",
+            clumped=prefix + "clumped",
+            holes=prefix + "holes",
+            catn=cat,
+            dem=input,
+            env=env,
+        )
+        tmp_rmaps.append(holename + "_edges")
+
+        # convert to points for interpolation
+        tmp_vmaps.append(holename)
+        try:
+            gs.run_command(
+                "r.to.vect",
+                input=holename + "_edges",
+                output=holename,
+                type="point",
+                flags="z",
+                quiet=quiet,
+                env=env,
+            )
+        except CalledModuleError:
+            gs.fatal(
+                _("abandoned. Removing temporary maps, restoring user mask if needed:")
+            )
+
+        # count number of points to control segmax parameter for interpolation:
+        pointsnumber = gs.vector_info_topo(map=holename, env=env)["points"]
+        gs.verbose(_("Interpolating %d points") % pointsnumber)
+
+        if pointsnumber < 2:
+            gs.verbose(_("No points to interpolate"))
+            failed.append(holename)
+            continue
+
+        # Avoid v.surf.rst warnings
+        if pointsnumber < segmax:
+            use_npmin = pointsnumber
+            use_segmax = pointsnumber * 2
+        else:
+            use_npmin = npmin
+            use_segmax = segmax
+
+        # holes are filled in parallel, do not start threads for each of them
+        kwargs = {"nprocs": 1} if nprocs > 1 else {}
+
+        # launch v.surf.rst
+        tmp_rmaps.append(holename + "_dem")
+        try:
+            gs.run_command(
+                "v.surf.rst",
+                quiet=quiet,
+                input=holename,
+                elev=holename + "_dem",
+                tension=tension,
+                smooth=smooth,
+                segmax=use_segmax,
+                npmin=use_npmin,
+                env=env,
+                **kwargs,
+            )
+        except CalledModuleError:
+            # GTC Hole is NULL area in a raster map
+            gs.fatal(_("Failed to fill hole %s") % cat)
+
+        # v.surf.rst sometimes fails with exit code 0
+        # related bug #1813
+        if not gs.find_file(holename + "_dem")["file"]:
+            try:
+                tmp_rmaps.remove(holename + "_edges")
+                tmp_rmaps.remove(holename + "_dem")
+                tmp_vmaps.remove(holename)
+            except ValueError:
+                pass
+            gs.warning(
+                _(
+                    "Filling has failed silently. Leaving temporary maps "
+                    "with prefix <%s> for debugging."
+                )
+                % holename
+            )
+            failed.append(holename)
+            continue
+
+        # keep interpolated values only in the hole
+        tmp_rmaps.append(holename + "_filled")
+        gs.mapcalc(
+            "$out = if($holes == $catn, $dem, null())",
+            out=holename + "_filled",
+            holes=prefix + "holes",
+            catn=cat,
+            dem=holename + "_dem",
+            env=env,
+        )
+        filled.append(holename + "_filled")
+
+        # remove temporary maps to not overfill disk
+        tmp_rmaps.remove(holename + "_edges")
+        tmp_rmaps.remove(holename + "_dem")
+        tmp_vmaps.remove(holename)
+        try:
+            gs.run_command(
+                "g.remove",
+                quiet=quiet,
+                flags="fb",
+                type="raster",
+                name=(holename + "_edges", holename + "_dem"),
+            )
+            gs.run_command(
+                "g.remove", quiet=quiet, flags="fb", type="vector", name=holename
+            )
+        except CalledModuleError:
+            gs.fatal(
+                _("abandoned. Removing temporary maps, restoring user mask if needed:")
+            )
+
+    if len(filled) < 2:
+        return (filled[0] if filled else None), failed
+
+    # merge holes of the batch in region covering all of them
+    output = prefix + "filled_%d" % holes[0]["category"]
+    tmp_rmaps.append(output)
+    env = os.environ.copy()
+    env["GRASS_REGION"] = gs.region_env(raster=filled, align=input)
+    patch_maps(filled, output, output + "_", env=env)
+    for name in filled:
+        tmp_rmaps.remove(name)
+    gs.run_command("g.remove", quiet=quiet, flags="fb", type="raster", name=filled)
+    return output, failed
+
+
 def main():
     global usermask, mapset, tmp_rmaps, tmp_vmaps
 
@@ -141,6 +388,9 @@ def main():
     npmin = int(options["npmin"])
     lambda_ = float(options["lambda"])
     memory = options["memory"]
+    nprocs = int(options["nprocs"])
+    if nprocs <= 0:
+        nprocs = max(1, (os.cpu_count() or 1) + nprocs)
     quiet = True  # FIXME
     mapset = gs.gisenv()["MAPSET"]
     unique = str(os.getpid())  # Shouldn't we use temp name?
@@ -164,7 +414,6 @@ def main():
     if method == "rst":
         # idea: filter all NULLS and grow that area(s) by 3 pixel, then
         # interpolate from these surrounding 3 pixel edge
-        filling = prefix + "filled"
 
         gs.use_temp_region()
         gs.run_command("g.region", align=input, quiet=quiet)
@@ -256,27 +505,28 @@ def main():
             )
         tmp_vmaps.append(prefix + "holes")
 
-        # get a list of unique hole cat's
-        cats_file_name = gs.tempfile(False)
-        gs.run_command(
-            "v.db.select",
-            flags="c",
-            map=prefix + "holes",
-            columns="cat",
-            file=cats_file_name,
-            quiet=quiet,
-        )
-        cat_list = []
-        with open(cats_file_name) as cats_file:
-            for line in cats_file:
-                cat_list.append(line.rstrip("\n"))
-        os.remove(cats_file_name)
+        # get bounding boxes of holes
+        holes = [
+            record
+            for record in gs.parse_command(
+                "v.to.db",
+                flags="p",
+                map=prefix + "holes",
+                option="bbox",
+                format="json",
+                quiet=quiet,
+            )["records"]
+            if record["category"] > 0
+        ]
 
-        if len(cat_list) < 1:
+        fillings = []
+        if len(holes) < 1:
             # no holes found in current region
+            tmp_rmaps.append(prefix + "filled")
             gs.run_command(
                 "g.copy", raster="%s,%sfilled" % (input, prefix), overwrite=True
             )
+            fillings.append(prefix + "filled")
             gs.warning(
                 _(
                     "Input map <%s> has no holes. Copying to output without "
@@ -285,276 +535,38 @@ def main():
                 % (input,)
             )
 
-        # GTC Hole is NULL area in a raster map
-        gs.message(_("Processing %d map holes") % len(cat_list))
-        first = True
-        hole_n = 1
-        for cat in cat_list:
-            holename = prefix + "hole_" + cat
-            # GTC Hole is a NULL area in a raster map
-            gs.message(_("Filling hole %s of %s") % (hole_n, len(cat_list)))
-            hole_n += 1
-            # cut out only CAT hole for processing
-            try:
-                gs.run_command(
-                    "v.extract",
-                    input=prefix + "holes",
-                    output=holename + "_pol",
-                    cats=cat,
-                    quiet=quiet,
-                )
-            except CalledModuleError:
-                gs.fatal(
-                    _(
-                        "abandoned. Removing temporary maps, restoring "
-                        "user mask if needed:"
-                    )
-                )
-            tmp_vmaps.append(holename + "_pol")
-
-            # zoom to specific hole with a buffer of two cells around the hole to
-            # remove rest of data
-            try:
-                gs.run_command(
-                    "g.region",
-                    vector=holename + "_pol",
-                    align=input,
-                    w="w-%d" % (edge * 2 * ew_res),
-                    e="e+%d" % (edge * 2 * ew_res),
-                    n="n+%d" % (edge * 2 * ns_res),
-                    s="s-%d" % (edge * 2 * ns_res),
-                    quiet=quiet,
-                )
-            except CalledModuleError:
-                gs.fatal(
-                    _(
-                        "abandoned. Removing temporary maps, restoring "
-                        "user mask if needed:"
-                    )
-                )
-
-            # remove temporary map to not overfill disk
-            try:
-                gs.run_command(
-                    "g.remove",
-                    flags="fb",
-                    type="vector",
-                    name=holename + "_pol",
-                    quiet=quiet,
-                )
-            except CalledModuleError:
-                gs.fatal(
-                    _(
-                        "abandoned. Removing temporary maps, restoring "
-                        "user mask if needed:"
-                    )
-                )
-            tmp_vmaps.remove(holename + "_pol")
-
-            # copy only data around hole
-            gs.mapcalc(
-                "$out = if($inp == $catn, $inp, null())",
-                out=holename,
-                inp=prefix + "holes",
-                catn=cat,
-            )
-            tmp_rmaps.append(holename)
-
-            # If here loop is split into two, next part of loop can be run in parallel
-            # (except final result patching)
-            # Downside - on large maps such approach causes large disk usage
-
-            # grow hole border to get it's edge area
-            tmp_rmaps.append(holename + "_grown")
-            try:
-                gs.run_command(
-                    "r.grow",
-                    input=holename,
-                    radius=edge + 0.01,
-                    old=-1,
-                    out=holename + "_grown",
-                    quiet=quiet,
-                )
-            except CalledModuleError:
-                gs.fatal(
-                    _(
-                        "abandoned. Removing temporary map, restoring "
-                        "user mask if needed:"
-                    )
-                )
-
-            # no idea why r.grow old=-1 doesn't replace existing values with NULL
-            gs.mapcalc(
-                '$out = if($inp == -1, null(), "$dem")',
-                out=holename + "_edges",
-                inp=holename + "_grown",
-                dem=input,
-            )
-            tmp_rmaps.append(holename + "_edges")
-
-            # convert to points for interpolation
-            tmp_vmaps.append(holename)
-            try:
-                gs.run_command(
-                    "r.to.vect",
-                    input=holename + "_edges",
-                    output=holename,
-                    type="point",
-                    flags="z",
-                    quiet=quiet,
-                )
-            except CalledModuleError:
-                gs.fatal(
-                    _(
-                        "abandoned. Removing temporary maps, restoring "
-                        "user mask if needed:"
-                    )
-                )
-
-            # count number of points to control segmax parameter for interpolation:
-            pointsnumber = gs.vector_info_topo(map=holename)["points"]
-            gs.verbose(_("Interpolating %d points") % pointsnumber)
-
-            if pointsnumber < 2:
-                gs.verbose(_("No points to interpolate"))
-                failed_list.append(holename)
-                continue
-
-            # Avoid v.surf.rst warnings
-            if pointsnumber < segmax:
-                use_npmin = pointsnumber
-                use_segmax = pointsnumber * 2
-            else:
-                use_npmin = npmin
-                use_segmax = segmax
+        # zoom to specific hole with a buffer of two cells around the hole to
+        # remove rest of data
+        for hole in holes:
+            hole["north"] += edge * 2 * ns_res
+            hole["south"] -= edge * 2 * ns_res
+            hole["east"] += edge * 2 * ew_res
+            hole["west"] -= edge * 2 * ew_res
 
-            # launch v.surf.rst
-            tmp_rmaps.append(holename + "_dem")
-            try:
-                gs.run_command(
-                    "v.surf.rst",
-                    quiet=quiet,
-                    input=holename,
-                    elev=holename + "_dem",
-                    tension=tension,
-                    smooth=smooth,
-                    segmax=use_segmax,
-                    npmin=use_npmin,
-                )
-            except CalledModuleError:
-                # GTC Hole is NULL area in a raster map
-                gs.fatal(_("Failed to fill hole %s") % cat)
-
-            # v.surf.rst sometimes fails with exit code 0
-            # related bug #1813
-            if not gs.find_file(holename + "_dem")["file"]:
-                try:
-                    tmp_rmaps.remove(holename)
-                    tmp_rmaps.remove(holename + "_grown")
-                    tmp_rmaps.remove(holename + "_edges")
-                    tmp_rmaps.remove(holename + "_dem")
-                    tmp_vmaps.remove(holename)
-                except ValueError:
-                    pass
-                gs.warning(
-                    _(
-                        "Filling has failed silently. Leaving temporary maps "
-                        "with prefix <%s> for debugging."
-                    )
-                    % holename
-                )
-                failed_list.append(holename)
-                continue
-
-            # append hole result to interpolated version later used to patch into
-            # original DEM
-            if first:
-                tmp_rmaps.append(filling)
-                gs.run_command(
-                    "g.region", align=input, raster=holename + "_dem", quiet=quiet
-                )
-                gs.mapcalc(
-                    "$out = if(isnull($inp), null(), $dem)",
-                    out=filling,
-                    inp=holename,
-                    dem=holename + "_dem",
-                )
-                first = False
-            else:
-                tmp_rmaps.append(filling + "_tmp")
-                gs.run_command(
-                    "g.region",
-                    align=input,
-                    raster=(filling, holename + "_dem"),
-                    quiet=quiet,
-                )
-                gs.mapcalc(
-                    "$out = if(isnull($inp), if(isnull($fill), null(), $fill), $dem)",
-                    out=filling + "_tmp",
-                    inp=holename,
-                    dem=holename + "_dem",
-                    fill=filling,
-                )
-                try:
-                    gs.run_command(
-                        "g.rename",
-                        raster=(filling + "_tmp", filling),
-                        overwrite=True,
-                        quiet=quiet,
-                    )
-                except CalledModuleError:
-                    gs.fatal(
-                        _(
-                            "abandoned. Removing temporary maps, restoring user "
-                            "mask if needed:"
-                        )
-                    )
-                # this map has been removed. No need for later cleanup.
-                tmp_rmaps.remove(filling + "_tmp")
-
-            # remove temporary maps to not overfill disk
-            try:
-                tmp_rmaps.remove(holename)
-                tmp_rmaps.remove(holename + "_grown")
-                tmp_rmaps.remove(holename + "_edges")
-                tmp_rmaps.remove(holename + "_dem")
-            except ValueError:
-                pass
-            try:
-                gs.run_command(
-                    "g.remove",
-                    quiet=quiet,
-                    flags="fb",
-                    type="raster",
-                    name=(
-                        holename,
-                        holename + "_grown",
-                        holename + "_edges",
-                        holename + "_dem",
-                    ),
-                )
-            except CalledModuleError:
-                gs.fatal(
-                    _(
-                        "abandoned. Removing temporary maps, restoring "
-                        "user mask if needed:"
-                    )
-                )
-            try:
-                tmp_vmaps.remove(holename)
-            except ValueError:
-                pass
-            try:
-                gs.run_command(
-                    "g.remove", quiet=quiet, flags="fb", type="vector", name=holename
-                )
-            except CalledModuleError:
-                gs.fatal(
-                    _(
-                        "abandoned. Removing temporary maps, restoring user mask if "
-                        "needed:"
-                    )
-                )
+        # GTC Hole is NULL area in a raster map
+        gs.message(_("Processing %d map holes") % len(holes))
+        batches = split_holes(holes, ns_res, ew_res)
+        fill = partial(
+            fill_holes,
+            input=input,
+            prefix=prefix,
+            tension=tension,
+            smooth=smooth,
+            segmax=segmax,
+            npmin=npmin,
+            nprocs=nprocs,
+            quiet=quiet,
+        )
+        with ThreadPoolExecutor(max_workers=nprocs) as executor:
+            futures = [executor.submit(fill, batch) for batch in batches]
+            for done, future in enumerate(as_completed(futures), start=1):
+                gs.percent(done, len(futures), 1)
+                filling, failed = future.result()
+                if filling:
+                    fillings.append(filling)
+                failed_list.extend(failed)
+        if holes and not fillings:
+            gs.fatal(_("Failed to fill any hole"))
 
     # check if method is different from rst to use r.resamp.bspline
     if method != "rst":
@@ -567,6 +579,7 @@ def main():
         reg = gs.region()
         # launch r.resamp.bspline
         tmp_rmaps.append(prefix + "filled")
+        fillings = [prefix + "filled"]
         # If there are no NULL cells, r.resamp.bslpine call
         # will end with an error although for our needs it's fine
         # Only problem - this state must be read from stderr
@@ -654,9 +667,7 @@ def main():
     # patch orig and fill map
     gs.message(_("Patching fill data into NULL areas..."))
     # we can use --o here as g.parser already checks on startup
-    gs.run_command(
-        "r.patch", input=(input, prefix + "filled"), output=output, overwrite=True
-    )
+    patch_maps([input, *fillings], output, prefix, quiet=False)
 
     # restore the real region
     gs.del_temp_region()
@@ -65,6 +65,30 @@ class TestRFillNulls(TestCase):
             precision=1e-6,
         )
 
+    def test_basic_nprocs(self):
+        """Test that holes filled in parallel are the same"""
+        module = SimpleModule(
+            self.module,
+            input=self.mapNameCalc,
+            output=self.mapComplete,
+            segmax=1200,
+            npmin=50,
+            tension=150,
+            nprocs=4,
+            overwrite=True,
+        )
+        self.assertModule(module)
+        self.assertRasterFitsUnivar(
+            raster=self.mapComplete,
+            reference={
+                "null_cells": float(0),
+                "max": 130.913299,
+                "range": 73.624588,
+                "variance": 288.817309,
+            },
+            precision=1e-6,
+        )
+
     def test_bicubic(self):
         """Test using bicubic interpolation"""
         module = SimpleModule(
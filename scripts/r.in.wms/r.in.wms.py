@@ -121,6 +121,22 @@ This program is free software under the GNU General Public License
 # % guisection: Connection
 # %end
 
+# %option
+# % key: nprocs
+# % type: integer
+# % description: Number of tiles to download in parallel
+# % answer: 1
+# % required: no
+# % guisection: Connection
+# %end
+
+# %option G_OPT_M_DIR
+# % key: cache
+# % required: no
+# % description: Directory for caching downloaded tiles between runs
+# % guisection: Connection
+# %end
+
 # %option
 # % key: method
 # % type: string
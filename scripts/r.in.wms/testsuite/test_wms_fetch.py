@@ -0,0 +1,122 @@
+"""Test concurrent download of tiles in r.in.wms
+
+Tiles are downloaded from a local HTTP server standing in for a WMS server.
+"""
+
+import importlib
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+
+from grass.gunittest.case import TestCase
+from grass.gunittest.main import test
+
+
+class TileHandler(BaseHTTPRequestHandler):
+    """Return the request path as tile data, fail on first requests of /fail"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.connections.add(self.client_address)
+            attempt = server.requests.count(self.path)
+        if self.path.startswith("/fail") and attempt <= server.failures:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path.startswith("/missing"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        data = self.path.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTileFetcher(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.module_dir = os.path.join(os.path.dirname(__file__), "..")
+        sys.path.append(cls.module_dir)
+        cls.wms_fetch = importlib.import_module("wms_fetch")
+
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), TileHandler)
+        cls.server.lock = threading.Lock()
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.url = "http://127.0.0.1:%d" % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        sys.path.pop(sys.path.index(cls.module_dir))
+
+    def setUp(self):
+        self.server.requests = []
+        self.server.connections = set()
+        self.server.failures = 0
+
+    def tiles(self, count, prefix="tile"):
+        return [("%s/%s%d" % (self.url, prefix, i), {"i": i}) for i in range(count)]
+
+    def test_all_tiles_fetched(self):
+        """Every tile is returned once with its reference"""
+        fetcher = self.wms_fetch.TileFetcher(nprocs=4)
+        result = list(fetcher.FetchTiles(self.tiles(50)))
+        self.assertEqual(len(result), 50)
+        for url, tile_ref, data, cached in result:
+            self.assertEqual(data, ("/tile%d" % tile_ref["i"]).encode())
+            self.assertFalse(cached)
+
+    def test_connections_reused(self):
+        """Connections are kept alive between requests"""
+        fetcher = self.wms_fetch.TileFetcher(nprocs=2)
+        list(fetcher.FetchTiles(self.tiles(40)))
+        self.assertEqual(len(self.server.requests), 40)
+        self.assertLessEqual(len(self.server.connections), 2)
+
+    def test_retry(self):
+        """Requests failing with a temporary error are repeated"""
+        self.server.failures = 2
+        fetcher = self.wms_fetch.TileFetcher(nprocs=2, backoff=0.01)
+        result = list(fetcher.FetchTiles(self.tiles(3, prefix="fail")))
+        self.assertEqual(len(result), 3)
+        self.assertEqual(len(self.server.requests), 9)
+
+    def test_error(self):
+        """Errors which are not temporary are raised"""
+        fetcher = self.wms_fetch.TileFetcher(nprocs=2, backoff=0.01)
+        with self.assertRaises(HTTPError):
+            list(fetcher.FetchTiles(self.tiles(3, prefix="missing")))
+        # failed requests are not repeated
+        self.assertEqual(len(self.server.requests), len(set(self.server.requests)))
+
+    def test_cache(self):
+        """Cached tiles are not requested again"""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = self.wms_fetch.TileCache(directory)
+            fetcher = self.wms_fetch.TileFetcher(nprocs=2, cache=cache)
+            for url, tile_ref, data, cached in fetcher.FetchTiles(self.tiles(5)):
+                cache.Put(url, data)
+            self.server.requests = []
+            result = list(fetcher.FetchTiles(self.tiles(6)))
+            self.assertEqual(self.server.requests, ["/tile5"])
+            self.assertEqual(sum(cached for *_, cached in result), 5)
+
+
+if __name__ == "__main__":
+    test()
@@ -74,6 +74,11 @@ class WMSBase:
         for key in ["password", "username", "urlparams"]:
             self.params[key] = options[key]
 
+        self.params["cache"] = options["cache"]
+        self.params["nprocs"] = int(options["nprocs"])
+        if self.params["nprocs"] < 1:
+            gs.fatal(_("Number of parallel downloads must be greater than 0"))
+
         if (self.params["password"] and self.params["username"] == "") or (
             self.params["password"] == "" and self.params["username"]
         ):
@@ -196,7 +201,7 @@ class WMSBase:
             if (
                 i_param in options
                 and options[i_param]
-                and i_param not in {"srs", "wms_version", "format"}
+                and i_param not in {"srs", "wms_version", "format", "nprocs"}
             ):  # params with default value
                 not_relevant_params.append("<" + i_param + ">")
 
@@ -728,6 +733,8 @@ class WMSDriversInfo:
             "capfile_output",
             "username",
             "password",
+            "nprocs",
+            "cache",
         ]
         props["req_multiple_layers"] = True
 
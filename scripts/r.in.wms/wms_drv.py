@@ -17,8 +17,7 @@ This program is free software under the GNU General Public License
 @author Stepan Turek <stepan.turek seznam.cz> (Mentor: Martin Landa)
 """
 
-import socket
-from time import sleep
+import os
 
 import grass.script as gs
 
@@ -42,6 +41,7 @@ import numpy as np
 from srs import Srs
 from wms_base import GetEpsg, GetSRSParamVal, WMSBase
 from wms_cap_parsers import OnEarthCapabilitiesTree, WMTSCapabilitiesTree
+from wms_fetch import TileCache, TileFetcher
 
 
 class WMSDrv(WMSBase):
@@ -84,159 +84,89 @@ class WMSDrv(WMSBase):
         init = True
         temp_map = None
 
-        fetch_try = 0
-
-        # iterate through all tiles and download them
-        while True:
-            if fetch_try == 0:
-                # get url for request the tile and information for placing the tile into
-                # raster with other tiles
-                tile = req_mgr.GetNextTile()
-
-            # if last tile has been already downloaded
-            if not tile:
-                break
-
-            # url for request the tile
-            query_url = tile[0]
-
-            # the tile size and offset in pixels for placing it into raster where tiles
-            # are joined
-            tile_ref = tile[1]
-            gs.debug(query_url, 2)
-            try:
-                wms_data = self._fetchDataFromServer(
-                    query_url, self.params["username"], self.params["password"]
-                )
-            except (OSError, HTTPException) as e:
-                if isinstance(e, HTTPError) and e.code == 401:
-                    gs.fatal(
-                        _("Authorization failed to '%s' when fetching data.\n%s")
-                        % (self.params["url"], str(e))
-                    )
-                else:
-                    gs.fatal(
-                        _("Unable to fetch data from: '%s'\n%s")
-                        % (self.params["url"], str(e))
-                    )
+        cache = None
+        if self.params["cache"]:
+            cache = TileCache(self.params["cache"])
+        fetcher = TileFetcher(
+            nprocs=self.params["nprocs"],
+            username=self.params["username"],
+            password=self.params["password"],
+            cache=cache,
+        )
 
-            temp_tile = self._tempfile()
+        # get url for request the tile and information for placing the tile into
+        # raster with other tiles, some managers reuse the tile_ref dictionary
+        # so it is copied before the next tile is requested
+        tiles = (
+            (query_url, dict(tile_ref))
+            for query_url, tile_ref in iter(req_mgr.GetNextTile, None)
+        )
 
-            # download data into temporary file
-            try:
-                temp_tile_opened = open(temp_tile, "wb")
-                temp_tile_opened.write(wms_data.read())
-            except OSError as e:
-                # some servers are not happy with many subsequent requests for tiles
-                # done immediately, if immediate request was unsuccessful, try to
-                # repeat the request after 5s and 30s breaks
-                # TODO probably servers can return more kinds of errors related to this
-                # problem (not only 104)
-                if isinstance(e, socket.error) and e[0] == 104 and fetch_try < 2:
-                    fetch_try += 1
-
-                    if fetch_try == 1:
-                        sleep_time = 5
-                    elif fetch_try == 2:
-                        sleep_time = 30
-
-                    gs.warning(
-                        _(
-                            "Server refused to send data for a tile.\nRequest will be "
-                            "repeated after %d s."
+        # tiles are downloaded in parallel and merged as soon as they arrive
+        try:
+            for query_url, tile_ref, wms_data, cached in fetcher.FetchTiles(tiles):
+                gs.debug(query_url, 2)
+                tile_dataset, temp_tiles = self._openTile(wms_data, server_url)
+
+                # initialization of temp_map_dataset, where all tiles are merged
+                if init:
+                    temp_map = self._tempfile()
+
+                    driver = gdal.GetDriverByName(self.gdal_drv_format)
+                    metadata = driver.GetMetadata()
+                    if (
+                        gdal.DCAP_CREATE not in metadata
+                        or metadata[gdal.DCAP_CREATE] == "NO"
+                    ):
+                        gs.fatal(
+                            _("Driver %s does not supports Create() method")
+                            % self.gdal_drv_format
                         )
-                        % sleep_time
+                    self.temp_map_bands_num = tile_dataset.RasterCount
+                    temp_map_dataset = driver.Create(
+                        temp_map,
+                        map_region["cols"],
+                        map_region["rows"],
+                        self.temp_map_bands_num,
+                        tile_dataset.GetRasterBand(1).DataType,
                     )
+                    init = False
+
+                # tile is written into temp_map
+                tile_to_temp_map = tile_dataset.ReadRaster(
+                    0,
+                    0,
+                    tile_ref["sizeX"],
+                    tile_ref["sizeY"],
+                    tile_ref["sizeX"],
+                    tile_ref["sizeY"],
+                )
 
-                    sleep(sleep_time)
-                    continue
-                gs.fatal(_("Unable to write data into tempfile.\n%s") % str(e))
-            finally:
-                temp_tile_opened.close()
-
-            fetch_try = 0
-
-            tile_dataset_info = gdal.Open(temp_tile, gdal.GA_ReadOnly)
-            if tile_dataset_info is None:
-                # print error xml returned from server
-                try:
-                    error_xml_opened = open(temp_tile, "rb")
-                    err_str = error_xml_opened.read()
-                except OSError as e:
-                    gs.fatal(_("Unable to read data from tempfile.\n%s") % str(e))
-                finally:
-                    error_xml_opened.close()
-
-                if err_str is not None:
-                    gs.fatal(_("WMS server error: %s") % err_str)
-                else:
-                    gs.fatal(_("WMS server unknown error"))
-
-            temp_tile_pct2rgb = None
-            if tile_dataset_info.RasterCount < 1:
+                temp_map_dataset.WriteRaster(
+                    tile_ref["t_cols_offset"],
+                    tile_ref["t_rows_offset"],
+                    tile_ref["sizeX"],
+                    tile_ref["sizeY"],
+                    tile_to_temp_map,
+                )
+
+                tile_dataset = None
+                for temp_tile in temp_tiles:
+                    gdal.Unlink(temp_tile)
+                # only valid tiles are stored in the cache
+                if cache is not None and not cached:
+                    cache.Put(query_url, wms_data)
+        except (OSError, HTTPException) as e:
+            if isinstance(e, HTTPError) and e.code == 401:
                 gs.fatal(
-                    _(
-                        "WMS server error: no band(s) received. Is server URL correct? "
-                        "<%s>"
-                    )
-                    % server_url
+                    _("Authorization failed to '%s' when fetching data.\n%s")
+                    % (self.params["url"], str(e))
                 )
-            if (
-                tile_dataset_info.RasterCount == 1
-                and tile_dataset_info.GetRasterBand(1).GetRasterColorTable() is not None
-            ):
-                # expansion of color table into bands
-                temp_tile_pct2rgb = self._tempfile()
-                tile_dataset = self._pct2rgb(temp_tile, temp_tile_pct2rgb)
             else:
-                tile_dataset = tile_dataset_info
-
-            # initialization of temp_map_dataset, where all tiles are merged
-            if init:
-                temp_map = self._tempfile()
-
-                driver = gdal.GetDriverByName(self.gdal_drv_format)
-                metadata = driver.GetMetadata()
-                if (
-                    gdal.DCAP_CREATE not in metadata
-                    or metadata[gdal.DCAP_CREATE] == "NO"
-                ):
-                    gs.fatal(
-                        _("Driver %s does not supports Create() method")
-                        % self.gdal_drv_format
-                    )
-                self.temp_map_bands_num = tile_dataset.RasterCount
-                temp_map_dataset = driver.Create(
-                    temp_map,
-                    map_region["cols"],
-                    map_region["rows"],
-                    self.temp_map_bands_num,
-                    tile_dataset.GetRasterBand(1).DataType,
+                gs.fatal(
+                    _("Unable to fetch data from: '%s'\n%s")
+                    % (self.params["url"], str(e))
                 )
-                init = False
-
-            # tile is written into temp_map
-            tile_to_temp_map = tile_dataset.ReadRaster(
-                0,
-                0,
-                tile_ref["sizeX"],
-                tile_ref["sizeY"],
-                tile_ref["sizeX"],
-                tile_ref["sizeY"],
-            )
-
-            temp_map_dataset.WriteRaster(
-                tile_ref["t_cols_offset"],
-                tile_ref["t_rows_offset"],
-                tile_ref["sizeX"],
-                tile_ref["sizeY"],
-                tile_to_temp_map,
-            )
-
-            tile_dataset = None
-            tile_dataset_info = None
-            gs.try_remove(temp_tile)
-            gs.try_remove(temp_tile_pct2rgb)
 
         if not temp_map:
             return temp_map
@@ -267,6 +197,41 @@ class WMSDrv(WMSBase):
 
         return temp_map
 
+    def _openTile(self, wms_data, server_url):
+        """!Open downloaded tile data as GDAL dataset
+
+        The data are read from GDAL in-memory file system, tiles with
+        color table are expanded into bands.
+
+        @return tile dataset and list of in-memory files to remove after
+        the dataset is closed
+        """
+        temp_tile = "/vsimem/r_in_wms_%d_tile" % os.getpid()
+        gdal.FileFromMemBuffer(temp_tile, wms_data)
+        tile_dataset_info = gdal.Open(temp_tile, gdal.GA_ReadOnly)
+        if tile_dataset_info is None:
+            gdal.Unlink(temp_tile)
+            # print error xml returned from server
+            if wms_data:
+                gs.fatal(_("WMS server error: %s") % gs.decode(wms_data))
+            else:
+                gs.fatal(_("WMS server unknown error"))
+
+        if tile_dataset_info.RasterCount < 1:
+            gs.fatal(
+                _("WMS server error: no band(s) received. Is server URL correct? <%s>")
+                % server_url
+            )
+        if (
+            tile_dataset_info.RasterCount == 1
+            and tile_dataset_info.GetRasterBand(1).GetRasterColorTable() is not None
+        ):
+            # expansion of color table into bands
+            temp_tile_pct2rgb = "/vsimem/r_in_wms_%d_pct2rgb" % os.getpid()
+            tile_dataset = self._pct2rgb(temp_tile, temp_tile_pct2rgb)
+            return tile_dataset, [temp_tile, temp_tile_pct2rgb]
+        return tile_dataset_info, [temp_tile]
+
     def _pct2rgb(self, src_filename, dst_filename):
         """!Create new dataset with data in dst_filename with bands according to
         src_filename
@@ -0,0 +1,237 @@
+"""!
+@brief Concurrent download of tiles used by the GRASS drivers.
+
+List of classes:
+ - wms_fetch::TileCache
+ - wms_fetch::TileFetcher
+
+(C) 2025 by the GRASS Development Team
+
+This program is free software under the GNU General Public License
+(>=v2). Read the file COPYING that comes with GRASS for details.
+"""
+
+import base64
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+
+# HTTP status codes of responses after which the request is repeated
+RETRY_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class TileCache:
+    """!Persistent cache of downloaded tiles keyed by the request URL."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, url):
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def Get(self, url):
+        """!Get data of the request
+
+        @return data or None when the request is not cached
+        """
+        try:
+            return Path(self._path(url)).read_bytes()
+        except OSError:
+            return None
+
+    def Put(self, url, data):
+        """!Store data of the request
+
+        Data are written into a temporary file which replaces the cached
+        file, so other processes never read partially written tiles.
+        """
+        path = self._path(url)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, "wb") as temp_file:
+                temp_file.write(data)
+            Path(temp_path).replace(path)
+        except OSError:
+            # the cache is only an optimization
+            pass
+
+
+class TileFetcher:
+    """!Download tiles concurrently
+
+    Each worker thread keeps its own persistent (keep-alive) connections
+    to the servers. Failed requests are repeated with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        nprocs=1,
+        username=None,
+        password=None,
+        cache=None,
+        retries=3,
+        backoff=1.0,
+        timeout=60,
+    ):
+        """!
+        @param nprocs number of tiles downloaded in parallel
+        @param username username for server connection
+        @param password password for server connection
+        @param cache TileCache instance or None
+        @param retries number of times a failed request is repeated
+        @param backoff delay in seconds before the first repeated request,
+        doubled for each next one
+        @param timeout timeout of connections in seconds
+        """
+        self.nprocs = max(1, nprocs)
+        self.cache = cache
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self._headers = {}
+        if username and password:
+            credentials = base64.b64encode(
+                ("%s:%s" % (username, password)).encode("utf-8")
+            )
+            self._headers["Authorization"] = "Basic %s" % credentials.decode()
+
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def _connection(self, scheme, netloc):
+        """!Get a connection of the current thread to the server"""
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        connection = connections.get((scheme, netloc))
+        if connection is None:
+            connection_class = HTTPSConnection if scheme == "https" else HTTPConnection
+            connection = connection_class(netloc, timeout=self.timeout)
+            connections[(scheme, netloc)] = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _dropConnection(self, scheme, netloc):
+        connection = self._local.connections.pop((scheme, netloc))
+        connection.close()
+
+    def _urlopen(self, url):
+        """!Fetch data using urllib which handles proxies and redirects"""
+        request = Request(url, headers=self._headers)
+        with urlopen(request, timeout=self.timeout) as response:
+            return response.read()
+
+    def _request(self, url):
+        """!Fetch data of one request"""
+        parts = urlsplit(url)
+        if parts.scheme not in {"http", "https"} or (
+            parts.scheme in getproxies() and not proxy_bypass(parts.hostname)
+        ):
+            return self._urlopen(url)
+
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        while True:
+            reused = (parts.scheme, parts.netloc) in getattr(
+                self._local, "connections", {}
+            )
+            connection = self._connection(parts.scheme, parts.netloc)
+            try:
+                connection.request("GET", path, headers=self._headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (OSError, HTTPException):
+                self._dropConnection(parts.scheme, parts.netloc)
+                if reused:
+                    # the server closed the idle connection, open a new one
+                    continue
+                raise
+            break
+
+        if response.will_close:
+            self._dropConnection(parts.scheme, parts.netloc)
+        if response.status in {301, 302, 303, 307, 308}:
+            return self._urlopen(url)
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, response.msg, None)
+        return data
+
+    def Fetch(self, url):
+        """!Fetch data of the request, repeating failed requests
+
+        @return data
+        """
+        attempt = 0
+        while True:
+            try:
+                return self._request(url)
+            except HTTPError as e:
+                if e.code not in RETRY_STATUS or attempt >= self.retries:
+                    raise
+            except (OSError, HTTPException):
+                if attempt >= self.retries:
+                    raise
+            time.sleep(self.backoff * 2**attempt)
+            attempt += 1
+
+    def _fetchTile(self, url):
+        if self.cache is not None:
+            data = self.cache.Get(url)
+            if data is not None:
+                return data, True
+        return self.Fetch(url), False
+
+    def FetchTiles(self, tiles):
+        """!Fetch tiles concurrently
+
+        At most two tiles per worker are requested in advance, so the
+        tiles can be processed while other tiles are downloaded
+        without keeping all of them in memory.
+
+        @param tiles iterable of (url, tile reference) pairs
+
+        @return generator of (url, tile reference, data, cached) tuples
+        in the order in which downloads finish
+        """
+        tiles = iter(tiles)
+        executor = ThreadPoolExecutor(max_workers=self.nprocs)
+        pending = {}
+        try:
+            while True:
+                while len(pending) < 2 * self.nprocs:
+                    tile = next(tiles, None)
+                    if tile is None:
+                        break
+                    url, tile_ref = tile
+                    pending[executor.submit(self._fetchTile, url)] = tile
+                if not pending:
+                    return
+                done, _not_done = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, tile_ref = pending.pop(future)
+                    data, cached = future.result()
+                    yield url, tile_ref, data, cached
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.Close()
+
+    def Close(self):
+        """!Close all connections"""
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
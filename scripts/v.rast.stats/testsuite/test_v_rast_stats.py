@@ -92,6 +92,25 @@ class TestRastStats(TestCase):
         self.runModule(v_db_select)
         self.assertLooksLike(univar_string, str(v_db_select.outputs.stdout))
 
+    def test_multiple_rasters(self):
+        output_str = """cat|value|label|a_minimum|a_sum|b_minimum|b_sum
+1|1||102|265905|1|17100
+2|2||121|1281195|20|351450
+"""
+        self.assertModule(
+            "v.rast.stats",
+            map="zone_map",
+            raster=["map_a", "row_map"],
+            method=["minimum", "sum"],
+            flags="c",
+            column_prefix=["a", "b"],
+            nprocs=2,
+        )
+        v_db_select = SimpleModule("v.db.select", map="zone_map")
+
+        self.runModule(v_db_select)
+        self.assertLooksLike(output_str, str(v_db_select.outputs.stdout))
+
     def test_line_d(self):
         output_str = """cat|name|a_median|a_number|a_range
 1|first|192|3|1
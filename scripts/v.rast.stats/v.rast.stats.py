@@ -72,10 +72,15 @@
 # % answer: 90
 # % required : no
 # %end
+# %option G_OPT_M_NPROCS
+# % description: Number of raster maps processed in parallel (0: number of CPUs; <0: number of CPUs minus nprocs)
+# %end
 
 import sys
 import os
 import atexit
+from concurrent.futures import ThreadPoolExecutor
+
 import grass.script as gs
 from grass.script.utils import decode
 from grass.exceptions import CalledModuleError
@@ -198,53 +203,74 @@ def main():
         flags["c"],
     )
 
-    # calculate statistics:
-    gs.message(_("Processing input data (%d categories)...") % number)
-
-    for i in range(len(rasters)):
-        raster = rasters[i]
+    nprocs = int(options["nprocs"])
+    if nprocs <= 0:
+        nprocs = max(1, (os.cpu_count() or 1) + nprocs)
 
+    # create columns for all raster maps before calculating statistics
+    columns = []
+    for colprefix in colprefixes:
         colprefix, variables_dbf, variables, colnames, extstat = set_up_columns(
-            vector, layer, percentile, colprefixes[i], basecols, dbfdriver, flags["c"]
+            vector, layer, percentile, colprefix, basecols, dbfdriver, flags["c"]
         )
-
-        # get rid of any earlier attempts
-        gs.try_remove(sqltmp)
-
-        # do the stats
-        perform_stats(
-            raster,
-            percentile,
-            fi,
-            dbfdriver,
-            colprefix,
-            variables_dbf,
-            variables,
-            colnames,
-            extstat,
+        indices = get_column_indices(
+            colnames, colprefix, variables_dbf, variables, dbfdriver
         )
+        columns.append((colnames, indices, extstat))
 
-        gs.message(_("Updating the database ..."))
-        exitcode = 0
+    # calculate statistics:
+    gs.message(_("Processing input data (%d categories)...") % number)
+
+    connection, placeholder = connect_database(fi)
+    database_errors = connection.Error if connection else ()
+    exitcode = 0
+    # r.univar runs for several raster maps in parallel while results
+    # of finished runs are written to the database
+    with ThreadPoolExecutor(max_workers=nprocs) as executor:
+        outputs = executor.map(
+            compute_stats,
+            rasters,
+            [percentile] * len(rasters),
+            [extstat for colnames, indices, extstat in columns],
+        )
         try:
-            gs.run_command(
-                "db.execute", input=sqltmp, database=fi["database"], driver=fi["driver"]
-            )
-            gs.verbose(
-                _(
-                    "Statistics calculated from raster map <{raster}>"
-                    " and uploaded to attribute table"
-                    " of vector map <{vector}>."
-                ).format(raster=raster, vector=vector)
-            )
-        except CalledModuleError:
+            for raster, (colnames, indices, extstat), output in zip(
+                rasters, columns, outputs
+            ):
+                gs.message(_("Updating the database ..."))
+                if connection:
+                    update_table(connection, placeholder, fi, colnames, indices, output)
+                else:
+                    upload_stats(fi, colnames, indices, output)
+                gs.verbose(
+                    _(
+                        "Statistics calculated from raster map <{raster}>"
+                        " and uploaded to attribute table"
+                        " of vector map <{vector}>."
+                    ).format(raster=raster, vector=vector)
+                )
+            if connection:
+                connection.commit()
+        except CalledModuleError as error:
+            if error.module == "r.univar":
+                gs.fatal(_("Failed to calculate statistics"))
             gs.warning(
                 _("Failed to upload statistics to attribute table of vector map <%s>.")
                 % vector
             )
             exitcode = 1
-
-            sys.exit(exitcode)
+        except database_errors as error:
+            gs.warning(
+                _(
+                    "Failed to upload statistics to attribute table"
+                    " of vector map <{vector}>: {error}"
+                ).format(vector=vector, error=error)
+            )
+            exitcode = 1
+        finally:
+            if connection:
+                connection.close()
+    sys.exit(exitcode)
 
 
 def prepare_base_raster(vector, layer, rastertmp, vtypes, where):
@@ -431,59 +457,119 @@ def set_up_columns(vector, layer, percentile, colprefix, basecols, dbfdriver, c)
     return colprefix, variables_dbf, variables, colnames, extstat
 
 
-def perform_stats(
-    raster,
-    percentile,
-    fi,
-    dbfdriver,
-    colprefix,
-    variables_dbf,
-    variables,
-    colnames,
-    extstat,
-):
-    with open(sqltmp, "w") as f:
-        # do the stats
-        p = gs.pipe_command(
-            "r.univar",
-            flags="t" + extstat,
-            map=raster,
-            zones=rastertmp,
-            percentile=percentile,
-            sep=";",
-        )
+def get_column_indices(colnames, colprefix, variables_dbf, variables, dbfdriver):
+    """Get positions of values of columns in "r.univar -t" output
 
-        first_line = 1
+    :param colnames: names of columns as returned by set_up_columns()
+    :return: list of positions of values for each column
+    """
+    indices = []
+    for colname in colnames:
+        variable = colname.replace("%s_" % colprefix, "", 1)
+        if dbfdriver:
+            variable = variables_dbf[variable]
+        indices.append(variables[variable])
+    return indices
 
-        f.write("{0}\n".format(gs.db_begin_transaction(fi["driver"])))
-        for line in p.stdout:
-            if first_line:
-                first_line = 0
-                continue
-
-            vars = decode(line).rstrip("\r\n").split(";")
-
-            f.write("UPDATE %s SET" % fi["table"])
-            first_var = 1
-            for colname in colnames:
-                variable = colname.replace("%s_" % colprefix, "", 1)
-                if dbfdriver:
-                    variable = variables_dbf[variable]
-                i = variables[variable]
-                value = vars[i]
-                # convert nan, +nan, -nan, inf, +inf, -inf, Infinity, +Infinity,
-                # -Infinity to NULL
-                if value.lower().endswith("nan") or "inf" in value.lower():
-                    value = "NULL"
-                if not first_var:
-                    f.write(" , ")
-                else:
-                    first_var = 0
-                f.write(" %s=%s" % (colname, value))
 
-            f.write(" WHERE %s=%s;\n" % (fi["key"], vars[0]))
+def compute_stats(raster, percentile, extstat):
+    """Calculate statistics of the raster map for all zones
+
+    :return: lines of "r.univar -t" output without the header
+    """
+    output = gs.read_command(
+        "r.univar",
+        flags="t" + extstat,
+        map=raster,
+        zones=rastertmp,
+        percentile=percentile,
+        sep=";",
+    )
+    return output.splitlines()[1:]
+
+
+def parse_value(value):
+    """Convert value from r.univar output to a number or None
+
+    nan, +nan, -nan, inf, +inf, -inf, Infinity, +Infinity, -Infinity
+    are converted to None (NULL).
+    """
+    if value.lower().endswith("nan") or "inf" in value.lower():
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def connect_database(fi):
+    """Connect to the database of the attribute table using DB-API
+
+    Only SQLite and PostgreSQL (with psycopg2 installed) are supported.
+
+    :param fi: database connection as returned by vector_db()
+    :return: connection and parameter placeholder or (None, None)
+             when the driver is not supported
+    """
+    connection = gs.vector_db_connect(
+        fi["driver"], fi["database"], readonly=False, timeout=60
+    )
+    if connection is None:
+        return None, None
+    return connection, "?" if fi["driver"] == "sqlite" else "%s"
+
+
+def update_table(connection, placeholder, fi, colnames, indices, output):
+    """Update rows of the attribute table using parameterized statements
+
+    The changes are not committed.
+    """
+    sql = "UPDATE %s SET %s WHERE %s=%s" % (
+        fi["table"],
+        ", ".join("%s=%s" % (colname, placeholder) for colname in colnames),
+        fi["key"],
+        placeholder,
+    )
+    params = (
+        [parse_value(values[i]) for i in indices] + [int(values[0])]
+        for values in (line.split(";") for line in output)
+    )
+    cursor = connection.cursor()
+    try:
+        if fi["driver"] == "pg":
+            from psycopg2.extras import execute_batch
+
+            execute_batch(cursor, sql, params, page_size=1000)
+        else:
+            cursor.executemany(sql, params)
+    finally:
+        cursor.close()
+
+
+def upload_stats(fi, colnames, indices, output):
+    """Update rows of the attribute table using db.execute"""
+    # get rid of any earlier attempts
+    gs.try_remove(sqltmp)
+
+    with open(sqltmp, "w") as f:
+        f.write("{0}\n".format(gs.db_begin_transaction(fi["driver"])))
+        for line in output:
+            vars = line.split(";")
+            assignments = []
+            for colname, i in zip(colnames, indices):
+                value = parse_value(vars[i])
+                assignments.append(
+                    " %s=%s" % (colname, "NULL" if value is None else vars[i])
+                )
+            f.write(
+                "UPDATE %s SET%s WHERE %s=%s;\n"
+                % (fi["table"], " ,".join(assignments), fi["key"], vars[0])
+            )
         f.write("{0}\n".format(gs.db_commit_transaction(fi["driver"])))
-        p.wait()
+
+    gs.run_command(
+        "db.execute", input=sqltmp, database=fi["database"], driver=fi["driver"]
+    )
 
 
 if __name__ == "__main__":
@@ -43,6 +43,9 @@
 # % key: t_where
 # %end
 
+# %option G_OPT_M_NPROCS
+# %end
+
 # %flag
 # % key: u
 # % label: Update attribute table of input vector map
@@ -96,7 +99,6 @@ def main():
     # lazy imports
     import grass.temporal as tgis
     from grass.pygrass.utils import copy as gcopy
-    from grass.pygrass.messages import Messenger
     from grass.pygrass.vector import Vector
 
     # Get the options
@@ -105,6 +107,7 @@ def main():
     strds = options["strds"]
     where = options["where"]
     tempwhere = options["t_where"]
+    nprocs = int(options["nprocs"])
 
     if output and flags["u"]:
         gs.fatal(_("Cannot combine 'output' option and 'u' flag"))
@@ -120,11 +123,6 @@ def main():
 
     overwrite = gs.overwrite()
 
-    quiet = True
-
-    if gs.verbosity() > 2:
-        quiet = False
-
     # Check the number of sample strds and the number of columns
     strds_names = strds.split(",")
 
@@ -218,9 +216,6 @@ def main():
     else:
         output = input
 
-    msgr = Messenger()
-    perc_curr = 0
-    perc_tot = len(samples)
     pymap = Vector(output)
     try:
         pymap.open("r")
@@ -238,55 +233,56 @@ def main():
     if pymap.is_open():
         pymap.close()
 
+    # Collect the columns of all raster maps, a later map of the same column
+    # replaces the values of the previous one
+    columns = {}
     for sample in samples:
-        raster_names = sample.raster_names
-        # Call v.what.rast for each raster map
-
-        for name in raster_names:
+        for name in sample.raster_names:
             coltype = "DOUBLE PRECISION"
             # Get raster map type
             raster_map = tgis.RasterDataset(name)
             raster_map.load()
-            if raster_map.metadata.get_datatype() == "CELL":
+            datatype = raster_map.metadata.get_datatype()
+            if datatype == "CELL":
                 coltype = "INT"
-            day = sample.printDay()
-            column_name = "%s_%s" % (sample.strds_name, day)
-            column_string = "%s %s" % (column_name, coltype)
-            column_string.replace(".", "_")
-            try:
-                gs.run_command(
-                    "v.db.addcolumn",
-                    map=output,
-                    column=column_string,
-                    overwrite=overwrite,
-                )
-            except CalledModuleError:
-                dbif.close()
-                gs.fatal(
-                    _("Unable to add column %s to vector map <%s> ")
-                    % (column_string, output)
-                )
-            try:
-                gs.run_command(
-                    "v.what.rast",
-                    map=output,
-                    raster=name,
-                    column=column_name,
-                    where=where,
-                    quiet=quiet,
-                )
-            except CalledModuleError:
-                dbif.close()
-                gs.fatal(
-                    _(
-                        "Unable to run v.what.rast for vector map"
-                        " <%s> and raster map <%s>"
-                    )
-                    % (output, str(raster_names))
-                )
+            column_name = "%s_%s" % (sample.strds_name, sample.printDay())
+            columns.pop(column_name, None)
+            columns[column_name] = (name, coltype, datatype)
+
+    column_string = ",".join(
+        "%s %s" % (column_name, coltype)
+        for column_name, (name, coltype, datatype) in columns.items()
+    )
+    try:
+        gs.run_command(
+            "v.db.addcolumn",
+            map=output,
+            column=column_string,
+            overwrite=overwrite,
+        )
+    except CalledModuleError:
+        dbif.close()
+        gs.fatal(
+            _("Unable to add column %s to vector map <%s> ") % (column_string, output)
+        )
 
-        msgr.percent(perc_curr, perc_tot, 1)
-        perc_curr += 1
+    # Sample all raster maps at once and update the table in one transaction
+    raster_names = [name for name, coltype, datatype in columns.values()]
+    try:
+        sampler = tgis.PointSampler(output)
+        values = sampler.sample(raster_names, nprocs=nprocs)
+        sampler.update_table(
+            list(columns),
+            values,
+            [datatype for name, coltype, datatype in columns.values()],
+            where=where,
+        )
+    except CalledModuleError:
+        dbif.close()
+        gs.fatal(
+            _("Unable to sample vector map <%s> with raster maps <%s>")
+            % (output, ",".join(raster_names))
+        )
 
     dbif.close()
 
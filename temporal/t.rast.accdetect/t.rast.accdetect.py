@@ -124,6 +124,15 @@
 # % multiple: no
 # %end
 
+# %option
+# % key: nprocs
+# % type: integer
+# % description: Number of r.mapcalc processes to run in parallel
+# % required: no
+# % multiple: no
+# % answer: 1
+# %end
+
 # %flag
 # % key: n
 # % description: Register empty maps in the output space time raster dataset, otherwise they will be deleted
@@ -134,6 +143,9 @@
 # % description: Reverse time direction in cyclic accumulation
 # %end
 
+from copy import deepcopy
+from subprocess import PIPE
+
 import grass.script as gs
 
 # lazy imports at the end of the file
@@ -161,6 +173,7 @@ def main():
     register_null = flags["n"]
     reverse = flags["r"]
     time_suffix = options["suffix"]
+    nprocs = int(options["nprocs"])
 
     gs.set_raise_on_error(True)
 
@@ -307,6 +320,18 @@ def main():
     indi_count = 1
     occurrence_maps = {}
     indicator_maps = {}
+    # Occurrence maps are independent of each other, indicator maps are
+    # computed from the occurrence maps after all of them are finished
+    occurrence_modules = []
+    indicator_modules = []
+    mapcalc_module = pymod.Module(
+        "r.mapcalc",
+        expression="dummy",
+        overwrite=True,
+        run_=False,
+        finish_=False,
+        stderr_=PIPE,
+    )
 
     while input_strds_end > start and stop > start:
         # Make sure that the cyclic computation will stop at the correct time
@@ -328,6 +353,8 @@ def main():
 
         count = compute_occurrence(
             occurrence_maps,
+            occurrence_modules,
+            mapcalc_module,
             input_strds,
             input_maps,
             start,
@@ -488,7 +515,9 @@ def main():
                     subexpr3,
                 )
                 gs.debug(expression)
-                gs.mapcalc(expression, overwrite=True)
+                mod = deepcopy(mapcalc_module)
+                mod(expression=expression)
+                indicator_modules.append(mod)
 
                 map_start, map_end = map.get_temporal_extent_as_tuple()
 
@@ -514,6 +543,9 @@ def main():
                 start = end + offset
             end = start + cycle
 
+    run_modules(occurrence_modules, nprocs, dbif)
+    run_modules(indicator_modules, nprocs, dbif)
+
     empty_maps = []
 
     create_strds_register_maps(
@@ -534,10 +566,42 @@ def main():
 
     # Remove empty maps
     if len(empty_maps) > 0:
-        for map in empty_maps:
-            gs.run_command(
-                "g.remove", flags="f", type="raster", name=map.get_name(), quiet=True
+        gs.run_command(
+            "g.remove",
+            flags="f",
+            type="raster",
+            name=[map.get_name() for map in empty_maps],
+            quiet=True,
+        )
+
+
+############################################################################
+
+
+def run_modules(modules, nprocs, dbif):
+    """Run independent modules in parallel and wait for them to finish"""
+    process_queue = pymod.ParallelModuleQueue(nprocs)
+    for mod in modules:
+        process_queue.put(mod)
+
+    # Wait for unfinished processes
+    process_queue.wait()
+    proc_list = process_queue.get_finished_modules()
+
+    # Check return status of all finished modules
+    error = 0
+    for proc in proc_list:
+        if proc.returncode != 0:
+            gs.error(
+                _("Error running module: {mod}\n    stderr: {error}").format(
+                    mod=proc.get_bash(), error=proc.outputs.stderr
+                )
             )
+            error += 1
+
+    if error > 0:
+        dbif.close()
+        gs.fatal(_("Error running modules."))
 
 
 ############################################################################
@@ -584,6 +648,8 @@ def create_strds_register_maps(
 
 def compute_occurrence(
     occurrence_maps,
+    occurrence_modules,
+    mapcalc_module,
     input_strds,
     input_maps,
     start,
@@ -681,7 +747,9 @@ def compute_occurrence(
             days,
         )
         gs.debug(expression)
-        gs.mapcalc(expression, overwrite=True)
+        mod = deepcopy(mapcalc_module)
+        mod(expression=expression)
+        occurrence_modules.append(mod)
 
         map_start, map_end = map.get_temporal_extent_as_tuple()
 
@@ -705,6 +773,7 @@ def compute_occurrence(
 if __name__ == "__main__":
     options, flags = gs.parser()
     # lazy imports
+    import grass.pygrass.modules as pymod
     import grass.temporal as tgis
 
     main()
@@ -97,6 +97,27 @@ class TestRasterExtraction(TestCase):
             module=info, reference=tinfo_string, precision=2, sep="="
         )
 
+    def test_nprocs(self):
+        self.assertModule(
+            "t.rast.accdetect",
+            input="A",
+            occurrence="B",
+            indicator="C",
+            start="2001-01-01",
+            cycle="12 months",
+            basename="result",
+            range=(1, 8),
+            nprocs=4,
+        )
+        tinfo_string = """start_time='2001-01-01 00:00:00'
+        end_time='2009-05-01 00:00:00'
+        number_of_maps=100"""
+        for strds in ("B", "C"):
+            info = SimpleModule("t.info", flags="g", type="strds", input=strds)
+            self.assertModuleKeyValue(
+                module=info, reference=tinfo_string, precision=2, sep="="
+            )
+
     def test_stop(self):
         self.assertModule(
             "t.rast.accdetect",
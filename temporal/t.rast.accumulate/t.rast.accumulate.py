@@ -142,6 +142,15 @@
 # % multiple: no
 # %end
 
+# %option
+# % key: nprocs
+# % type: integer
+# % description: Number of cycles to compute in parallel
+# % required: no
+# % multiple: no
+# % answer: 1
+# %end
+
 # %flag
 # % key: n
 # % description: Register empty maps in the output space time raster dataset, otherwise they will be deleted
@@ -151,7 +160,8 @@
 # % key: r
 # % description: Reverse time direction in cyclic accumulation
 # %end
-from copy import copy
+from copy import copy, deepcopy
+from subprocess import PIPE
 
 import grass.script as gs
 
@@ -161,7 +171,7 @@ import grass.script as gs
 def main():
     # lazy imports
     import grass.temporal as tgis
-    from grass.pygrass.modules import Module
+    import grass.pygrass.modules as pymod
 
     # Get the options
     input = options["input"]
@@ -181,6 +191,7 @@ def main():
     register_null = flags["n"]
     reverse = flags["r"]
     time_suffix = options["suffix"]
+    nprocs = int(options["nprocs"])
 
     # Make sure the temporal database exists
     tgis.init()
@@ -293,6 +304,18 @@ def main():
     count = 1
     output_maps = []
 
+    accumulate_module = pymod.Module(
+        "r.series.accumulate",
+        input="dummy",
+        output="dummy",
+        run_=False,
+        finish_=False,
+        stderr_=PIPE,
+    )
+    # Granules of a cycle depend on each other and are computed in serial,
+    # cycles are computed in parallel
+    process_queue = pymod.ParallelModuleQueue(nprocs)
+
     while input_strds_end > start and stop > start:
         # Make sure that the cyclic computation will stop at the correct time
         if stop and end > stop:
@@ -344,6 +367,7 @@ def main():
             gran_upper_topo.build(gran_list_up, upper_maps)
 
         old_map_name = None
+        cycle_modules = []
 
         # Aggregate
         num_maps = len(gran_list)
@@ -433,12 +457,8 @@ def main():
                 input_map_names.append(input_map.get_id())
 
             # Set up the module
-            accmod = Module(
-                "r.series.accumulate",
-                input=input_map_names,
-                output=output_map_name,
-                run_=False,
-            )
+            accmod = deepcopy(accumulate_module)
+            accmod(input=input_map_names, output=output_map_name)
 
             if old_map_name:
                 accmod.inputs["basemap"].value = old_map_name
@@ -458,16 +478,16 @@ def main():
             if method:
                 accmod.inputs["method"].value = method
 
-            accmod.run()
-
-            if accmod.returncode != 0:
-                dbif.close()
-                gs.fatal(_("Error running r.series.accumulate"))
+            gs.verbose(accmod.get_bash())
+            cycle_modules.append(accmod)
 
             output_maps.append(output_map)
             old_map_name = output_map_name
             count += 1
 
+        if cycle_modules:
+            process_queue.put(pymod.MultiModule(cycle_modules, sync=False))
+
         # Increment the cycle
         start = end
         if input_strds.is_time_absolute():
@@ -481,6 +501,25 @@ def main():
                 start = end + offset
             end = start + cycle
 
+    # Wait for unfinished processes
+    process_queue.wait()
+    proc_list = process_queue.get_finished_modules()
+
+    # Check return status of all finished modules
+    error = 0
+    for proc in proc_list:
+        if proc.returncode != 0:
+            gs.error(
+                _("Error running module: {mod}\n    stderr: {error}").format(
+                    mod=proc.get_bash(), error=proc.outputs.stderr
+                )
+            )
+            error += 1
+
+    if error > 0:
+        dbif.close()
+        gs.fatal(_("Error running r.series.accumulate"))
+
     # Insert the maps into the output space time dataset
     if output_strds.is_in_db(dbif):
         if gs.overwrite():
@@ -522,10 +561,13 @@ def main():
 
     # Remove empty maps
     if len(empty_maps) > 0:
-        for map in empty_maps:
-            gs.run_command(
-                "g.remove", flags="f", type="raster", name=map.get_name(), quiet=True
-            )
+        gs.run_command(
+            "g.remove",
+            flags="f",
+            type="raster",
+            name=[map.get_name() for map in empty_maps],
+            quiet=True,
+        )
 
 
 if __name__ == "__main__":
@@ -283,6 +283,27 @@ class TestAccumulate(TestCase):
         self.assertEqual(D.check_temporal_topology(), True)
         self.assertEqual(D.get_granularity(), "1 day")
 
+    def test_nprocs(self):
+        """Cycles computed in parallel give the same result"""
+        kwargs = {
+            "input": "A",
+            "output": "B",
+            "limits": [0, 40],
+            "method": "gdd",
+            "start": "2001-01-01",
+            "cycle": "2 days",
+            "basename": "b",
+            "overwrite": True,
+        }
+        self.assertModule("t.rast.accumulate", **kwargs)
+        D = tgis.open_old_stds("B", type="strds")
+        expected = (D.metadata.get_min_min(), D.metadata.get_max_max())
+
+        self.assertModule("t.rast.accumulate", nprocs=3, **kwargs)
+        D = tgis.open_old_stds("B", type="strds")
+        self.assertEqual(D.metadata.get_number_of_maps(), 7)
+        self.assertEqual((D.metadata.get_min_min(), D.metadata.get_max_max()), expected)
+
     def test_count_suffix(self):
         self.assertModule(
             "t.rast.accumulate",
@@ -78,6 +78,11 @@
 # % description: Calculate extended statistics
 # %end
 
+# %flag
+# % key: a
+# % description: Calculate approximate quartiles and percentiles using less memory (requires extended statistics flag)
+# %end
+
 # %flag
 # % key: r
 # % description: Use the raster map regions for univar statistical calculation instead of the current region
@@ -91,6 +96,7 @@
 
 # %rules
 # % requires: percentile,-e
+# % requires: -a,-e
 # %end
 
 import grass.script as gs
@@ -113,6 +119,7 @@ def main():
     where = options["where"]
     region_relation = options["region_relation"]
     extended = flags["e"]
+    approximate = flags["a"]
     no_header = flags["u"]
     rast_region = bool(flags["r"])
     separator = gs.separator(options["separator"])
@@ -150,6 +157,7 @@ def main():
         rast_region=rast_region,
         region_relation=region_relation,
         nprocs=nprocs,
+        approximate=approximate,
     )
 
 
@@ -301,6 +301,33 @@ a_4@testing||2001-10-01 00:00:00|2002-01-01 00:00:00|400|400|400|400|0|0|0|38400
                 res_line = res.split("|", 1)[1]
                 self.assertLooksLike(ref_line, res_line)
 
+    def test_approximate_extended_statistics(self):
+        """Test approximate percentiles of integer maps are exact"""
+        t_rast_univar = SimpleModule(
+            "t.rast.univar",
+            input="A",
+            flags="ea",
+            where="start_time >= '2001-03-01'",
+            percentile=[10.0, 97.5],
+            overwrite=True,
+            verbose=True,
+        )
+        self.runModule("g.region", **self.default_region, res=10)
+        self.assertModule(t_rast_univar)
+
+        univar_text = """id|semantic_label|start|end|mean|min|max|mean_of_abs|stddev|variance|coeff_var|sum|null_cells|cells|non_null_cells|first_quartile|median|third_quartile|percentile_10|percentile_97_5
+a_2@testing||2001-04-01 00:00:00|2001-07-01 00:00:00|200|200|200|200|0|0|0|19200|0|96|96|200|200|200|200|200
+a_3@testing||2001-07-01 00:00:00|2001-10-01 00:00:00|300|300|300|300|0|0|0|28800|0|96|96|300|300|300|300|300
+a_4@testing||2001-10-01 00:00:00|2002-01-01 00:00:00|400|400|400|400|0|0|0|38400|0|96|96|400|400|400|400|400
+"""
+        for ref, res in zip(
+            univar_text.split("\n"), t_rast_univar.outputs.stdout.split("\n")
+        ):
+            if ref and res:
+                ref_line = ref.split("|", 1)[1]
+                res_line = res.split("|", 1)[1]
+                self.assertLooksLike(ref_line, res_line)
+
     def test_error_handling_empty_strds(self):
         # Empty strds
         self.assertModule(
@@ -316,6 +343,18 @@ a_4@testing||2001-10-01 00:00:00|2002-01-01 00:00:00|400|400|400|400|0|0|0|38400
         # No input
         self.assertModuleFail("t.rast.univar", output="out.txt")
 
+    def test_error_handling_float_zones(self):
+        # Zones must be integers
+        self.runModule("r.mapcalc", expression="float_zones = 1.5", overwrite=True)
+        self.assertModuleFail(
+            "t.rast.univar",
+            input="A",
+            zones="float_zones",
+            output="univar_output.txt",
+            overwrite=True,
+        )
+        self.runModule("g.remove", flags="f", type="raster", name="float_zones")
+
     def test_with_zones(self):
         """Test use of zones"""
 
@@ -54,6 +54,9 @@
 # %option G_OPT_DB_WHERE
 # %end
 
+# %option G_OPT_M_NPROCS
+# %end
+
 import grass.script as gs
 from grass.exceptions import CalledModuleError
 
@@ -91,6 +94,7 @@ def main():
     strds = options["strds"]
     where = options["where"]
     columns = options["columns"]
+    nprocs = int(options["nprocs"])
 
     if where in {"", " ", "\n"}:
         where = None
@@ -249,13 +253,8 @@ def main():
 
     dummy = out_sp.get_new_map_instance(None)
 
-    # Sample the space time raster dataset with the vector
-    # map at specific layer with v.what.rast
-    count = 1
     for sample in samples:
-        raster_names = sample.raster_names
-
-        if len(raster_names) != len(column_names):
+        if len(sample.raster_names) != len(column_names):
             gs.fatal(
                 _(
                     "The number of raster maps in a granule must "
@@ -263,15 +262,22 @@ def main():
                 )
             )
 
+    # Store the samples in the vector map at specific layer
+    count = 1
+    for sample in samples:
+        raster_names = sample.raster_names
+
         # Create the columns creation string
         columns_string = ""
+        datatypes = []
         for name, column in zip(raster_names, column_names):
             # The column is by default double precision
             coltype = "DOUBLE PRECISION"
             # Get raster map type
             raster_map = tgis.RasterDataset(name)
             raster_map.load()
-            if raster_map.metadata.get_datatype() == "CELL":
+            datatypes.append(raster_map.metadata.get_datatype())
+            if datatypes[-1] == "CELL":
                 coltype = "INT"
 
             tmp_string = "%s %s," % (column, coltype)
@@ -314,26 +320,26 @@ def main():
                     % (vectmap, count)
                 )
 
-        # Call v.what.rast for each raster map
-        for name, column in zip(raster_names, column_names):
-            try:
-                gs.run_command(
-                    "v.what.rast",
-                    map=vectmap,
-                    layer=count,
-                    raster=name,
-                    column=column,
-                    where=where,
-                )
-            except CalledModuleError:
-                dbif.close()
-                gs.fatal(
-                    _(
-                        "Unable to run v.what.rast for vector map <%s> "
-                        "with layer %i and raster map <%s>"
-                    )
-                    % (vectmap, count, str(raster_names))
-                )
+        # Sample all raster maps of the granule at once using the categories
+        # of the layer, layers which existed before can have other categories
+        try:
+            sampler = tgis.PointSampler(vectmap, layer=count)
+            values = sampler.sample(raster_names, nprocs=nprocs)
+        except CalledModuleError:
+            dbif.close()
+            gs.fatal(
+                _("Unable to sample vector map <%s> with layer %i") % (vectmap, count)
+            )
+
+        # Write the sampled values of all raster maps in one transaction
+        try:
+            sampler.update_table(column_names, values, datatypes, where=where)
+        except CalledModuleError:
+            dbif.close()
+            gs.fatal(
+                _("Unable to update vector map <%s> with layer %i and raster map <%s>")
+                % (vectmap, count, str(raster_names))
+            )
 
         vect = out_sp.get_new_map_instance(dummy.build_id(vectmap, mapset, str(count)))
         vect.load()
@@ -64,11 +64,13 @@
 # %option G_OPT_T_SAMPLE
 # %end
 
+# %option G_OPT_M_NPROCS
+# %end
+
 import os
 
 import grass.script as gs
 from grass.exceptions import CalledModuleError
-from grass.script import raster
 
 ############################################################################
 
@@ -85,6 +87,7 @@ def main():
     method = options["method"]
     tempwhere = options["t_where"]
     sampling = options["sampling"]
+    nprocs = int(options["nprocs"])
 
     if where in {"", " ", "\n"}:
         where = None
@@ -125,8 +128,11 @@ def main():
         dbif.close()
         gs.fatal(_("Space time vector dataset <%s> is empty") % sp.get_id())
 
-    # Sample the raster dataset with the vector dataset and run v.what.rast
-    for row in rows:
+    # Sample the raster dataset with the vector dataset, collect the raster
+    # maps and columns of each vector map and layer
+    vector_samples = {}
+    aggregated_maps = []
+    for index, row in enumerate(rows):
         start = row["start_time"]
         end = row["end_time"]
         vectmap = row["name"] + "@" + row["mapset"]
@@ -134,110 +140,95 @@ def main():
 
         raster_maps = tgis.collect_map_names(strds_sp, dbif, start, end, sampling)
 
-        aggreagated_map_name = None
-
-        if raster_maps:
-            # Aggregation
-            if method != "disabled" and len(raster_maps) > 1:
-                # Generate the temporary map name
-                aggreagated_map_name = "aggreagated_map_name_" + str(os.getpid())
-                new_map = tgis.aggregate_raster_maps(
-                    raster_maps,
-                    aggreagated_map_name,
-                    start,
-                    end,
-                    0,
-                    method,
-                    False,
-                    dbif,
-                )
-                aggreagated_map_name += "_0"
-                if new_map is None:
-                    continue
-                # We overwrite the raster_maps list
-                raster_maps = (new_map.get_id(),)
-
-            for rastermap in raster_maps:
-                # Create a new column with the SQL compliant
-                # name of the sampled raster map if not column
-                col_name = column or rastermap.split("@")[0].replace(".", "_")
-
-                coltype = "DOUBLE PRECISION"
-                # Get raster type
-                rasterinfo = raster.raster_info(rastermap)
-                if rasterinfo["datatype"] == "CELL":
-                    coltype = "INT"
-
-                try:
-                    if layer:
-                        gs.run_command(
-                            "v.db.addcolumn",
-                            map=vectmap,
-                            layer=layer,
-                            column="%s %s" % (col_name, coltype),
-                            overwrite=gs.overwrite(),
-                        )
-                    else:
-                        gs.run_command(
-                            "v.db.addcolumn",
-                            map=vectmap,
-                            column="%s %s" % (col_name, coltype),
-                            overwrite=gs.overwrite(),
-                        )
-                except CalledModuleError:
-                    dbif.close()
-                    gs.fatal(
-                        _("Unable to add column %s to vector map <%s>")
-                        % (col_name, vectmap)
-                    )
-
-                # Call v.what.rast
-                try:
-                    if layer:
-                        gs.run_command(
-                            "v.what.rast",
-                            map=vectmap,
-                            layer=layer,
-                            raster=rastermap,
-                            column=col_name,
-                            where=where,
-                        )
-                    else:
-                        gs.run_command(
-                            "v.what.rast",
-                            map=vectmap,
-                            raster=rastermap,
-                            column=col_name,
-                            where=where,
-                        )
-                except CalledModuleError:
-                    dbif.close()
-                    gs.fatal(
-                        _(
-                            "Unable to run v.what.rast for vector map "
-                            "<%s> and raster map <%s>"
-                        )
-                        % (vectmap, rastermap)
-                    )
-
-                if aggreagated_map_name:
-                    try:
-                        gs.run_command(
-                            "g.remove",
-                            flags="f",
-                            type="raster",
-                            name=aggreagated_map_name,
-                        )
-                    except CalledModuleError:
-                        dbif.close()
-                        gs.fatal(
-                            _("Unable to remove raster map <%s>")
-                            % (aggreagated_map_name)
-                        )
-
-                # Use the first map in case a column names was provided
-                if column:
-                    break
+        if not raster_maps:
+            continue
+
+        # Aggregation
+        if method != "disabled" and len(raster_maps) > 1:
+            # Generate the temporary map name
+            aggreagated_map_name = "aggreagated_map_name_%i_%i" % (os.getpid(), index)
+            new_map = tgis.aggregate_raster_maps(
+                raster_maps,
+                aggreagated_map_name,
+                start,
+                end,
+                0,
+                method,
+                False,
+                dbif,
+            )
+            if new_map is None:
+                continue
+            aggregated_maps.append(aggreagated_map_name + "_0")
+            # We overwrite the raster_maps list
+            raster_maps = (new_map.get_id(),)
+
+        columns = vector_samples.setdefault((vectmap, layer), {})
+        for rastermap in raster_maps:
+            # Create a new column with the SQL compliant
+            # name of the sampled raster map if not column
+            col_name = column or rastermap.split("@")[0].replace(".", "_")
+            # A later raster map replaces values of the same column
+            columns.pop(col_name, None)
+            # Get raster type
+            raster_map = tgis.RasterDataset(rastermap)
+            raster_map.load()
+            columns[col_name] = (rastermap, raster_map.metadata.get_datatype())
+
+            # Use the first map in case a column names was provided
+            if column:
+                break
+
+    for (vectmap, layer), columns in vector_samples.items():
+        column_string = ",".join(
+            "%s %s" % (col_name, "INT" if mtype == "CELL" else "DOUBLE PRECISION")
+            for col_name, (rastermap, mtype) in columns.items()
+        )
+        try:
+            gs.run_command(
+                "v.db.addcolumn",
+                map=vectmap,
+                layer=layer or 1,
+                column=column_string,
+                overwrite=gs.overwrite(),
+            )
+        except CalledModuleError:
+            dbif.close()
+            gs.fatal(
+                _("Unable to add column %s to vector map <%s>")
+                % (column_string, vectmap)
+            )
+
+        # Sample all raster maps at once and update the table
+        # in one transaction
+        raster_maps = [rastermap for rastermap, mtype in columns.values()]
+        try:
+            sampler = tgis.PointSampler(vectmap, layer=layer or 1)
+            values = sampler.sample(raster_maps, nprocs=nprocs)
+            sampler.update_table(
+                list(columns),
+                values,
+                [mtype for rastermap, mtype in columns.values()],
+                where=where,
+            )
+        except CalledModuleError:
+            dbif.close()
+            gs.fatal(
+                _("Unable to sample vector map <%s> with raster maps <%s>")
+                % (vectmap, ",".join(raster_maps))
+            )
+
+    if aggregated_maps:
+        try:
+            gs.run_command(
+                "g.remove",
+                flags="f",
+                type="raster",
+                name=",".join(aggregated_maps),
+            )
+        except CalledModuleError:
+            dbif.close()
+            gs.fatal(_("Unable to remove raster map <%s>") % ",".join(aggregated_maps))
 
     dbif.close()
 